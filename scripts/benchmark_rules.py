@@ -0,0 +1,106 @@
+"""커스텀 추론 규칙 벤치마크.
+
+CUSTOM_RULES 각각을 기존 경로(쿼리 문자열을 매번 SPARQL로 파싱/평가)와
+rule_compiler 경로(컴파일된 인덱스 조회 또는 미리 파싱한 SPARQL)로 실행해 시간과 결과를 비교합니다.
+IFC 파일 없이 합성 그래프를 사용합니다.
+
+Usage:
+    python scripts/benchmark_rules.py [--elements 12000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rdflib import Graph, Literal, RDF
+
+from src.converter.namespace_manager import AWP, BIM, INST
+from src.inference.reasoner import CUSTOM_RULES
+from src.inference.rule_compiler import compile_rule
+
+CATEGORIES = ["Beam", "Column", "Pipe", "Valve", "Duct", "Stair", "Hanger",
+              "PipeFitting", "Flange", "Equipment", "Other"]
+STATUSES = ["Ordered", "Shipped", "OnSite", "Installed"]
+
+
+def build_graph(elements: int) -> Graph:
+    """건물 1개, 층 10개, 요소 N개, IWP N/50개의 합성 그래프."""
+    g = Graph()
+    building = INST["building"]
+    g.add((building, RDF.type, BIM.Building))
+    storeys = [INST[f"storey_{i}"] for i in range(10)]
+    for storey in storeys:
+        g.add((storey, RDF.type, BIM.BuildingStorey))
+        g.add((building, BIM.aggregates, storey))
+    for i in range(elements):
+        elem = INST[f"elem_{i}"]
+        g.add((elem, RDF.type, BIM.PhysicalElement))
+        g.add((elem, BIM.hasCategory, Literal(CATEGORIES[i % len(CATEGORIES)])))
+        g.add((elem, BIM.hasDeliveryStatus, Literal(STATUSES[i % len(STATUSES)])))
+        g.add((storeys[i % len(storeys)], BIM.containsElement, elem))
+        iwp = INST[f"iwp_{i // 50}"]
+        g.add((iwp, AWP.includesElement, elem))
+        if i % 50 == 0:
+            g.add((iwp, RDF.type, AWP.InstallationWorkPackage))
+            g.add((iwp, AWP.hasConstraintStatus, Literal("AllCleared")))
+    return g
+
+
+def benchmark_rule(graph: Graph, name: str, repeat: int) -> dict:
+    construct = CUSTOM_RULES[name]["construct"]
+    evaluator = compile_rule(construct)
+
+    t0 = time.time()
+    for _ in range(repeat):
+        expected = set(graph.query(construct))
+    sparql_time = (time.time() - t0) / repeat
+
+    t0 = time.time()
+    for _ in range(repeat):
+        actual = set(evaluator.evaluate(graph))
+    compiled_time = (time.time() - t0) / repeat
+
+    return {
+        "rule": name,
+        "compiled": evaluator.compiled,
+        "triples": len(actual),
+        "identical": actual == expected,
+        "sparql_ms": sparql_time * 1000,
+        "compiled_ms": compiled_time * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CUSTOM_RULES SPARQL vs 컴파일 경로 벤치마크")
+    parser.add_argument("--elements", type=int, default=12000, help="합성 요소 수")
+    parser.add_argument("--repeat", type=int, default=3, help="규칙별 반복 횟수")
+    args = parser.parse_args()
+
+    print("BIM Ontology - Custom Rule Benchmark")
+    print(f"{'='*60}")
+    graph = build_graph(args.elements)
+    print(f"Graph: {len(graph):,} triples ({args.elements:,} elements)")
+
+    results = [benchmark_rule(graph, name, args.repeat) for name in CUSTOM_RULES]
+
+    print(f"\n{'rule':<30} {'mode':<9} {'triples':>8} {'SPARQL':>10} {'compiled':>10} {'speedup':>8}")
+    for r in results:
+        mode = "compiled" if r["compiled"] else "sparql"
+        speedup = r["sparql_ms"] / r["compiled_ms"] if r["compiled_ms"] else float("inf")
+        flag = "" if r["identical"] else "  MISMATCH"
+        print(f"{r['rule']:<30} {mode:<9} {r['triples']:>8,} {r['sparql_ms']:>8.1f}ms "
+              f"{r['compiled_ms']:>8.1f}ms {speedup:>7.1f}x{flag}")
+
+    total_sparql = sum(r["sparql_ms"] for r in results)
+    total_compiled = sum(r["compiled_ms"] for r in results)
+    print(f"\nTotal: {total_sparql:.0f}ms → {total_compiled:.0f}ms "
+          f"({total_sparql / total_compiled:.1f}x)")
+    if not all(r["identical"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,23 @@
 """건물 관련 REST API."""
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 
-from ..models.response import BuildingInfo, StoreyInfo, ElementInfo
-from ..utils.query_executor import execute_sparql
+from ..models.response import BuildingInfo, ElementInfo, ErrorResponse, StoreyInfo
+from ..utils.pagination import CATEGORY_ELEMENT_KEY, ELEMENT_KEY, decode_cursor, encode_cursor
+from ..utils.query_executor import (
+    execute_sparql_async,
+    get_store,
+    query_index,
+    run_in_pool,
+    run_read_cancellable,
+)
 from ..queries.templates import (
     get_all_buildings,
     get_spaces_by_storey,
     get_all_elements_by_category,
 )
+from ...converter import columnar_export
+from ...storage.graph_index import category_element_row_key, element_row_key
 
 router = APIRouter()
 
@@ -19,7 +28,7 @@ router = APIRouter()
     summary="모든 건물 조회",
 )
 async def list_buildings():
-    results = execute_sparql(get_all_buildings())
+    results = await execute_sparql_async(get_all_buildings())
     return [
         BuildingInfo(
             uri=r.get("uri", ""),
@@ -45,7 +54,7 @@ async def get_building(global_id: str):
         OPTIONAL {{ ?uri bim:hasName ?name }}
     }}
     """
-    results = execute_sparql(query)
+    results = await execute_sparql_async(query)
     if not results:
         raise HTTPException(status_code=404, detail=f"Building {global_id} not found")
     r = results[0]
@@ -71,7 +80,9 @@ async def list_storeys():
     }
     GROUP BY ?uri ?name ?globalId ?elevation
     """
-    results = execute_sparql(query)
+    results = await query_index("storey_rows")
+    if results is None:
+        results = await execute_sparql_async(query)
     return [
         StoreyInfo(
             uri=r.get("uri", ""),
@@ -84,33 +95,95 @@ async def list_storeys():
     ]
 
 
+@router.get(
+    "/elements/export",
+    summary="요소 테이블 컬럼 포맷 내보내기",
+    description=(
+        "물리 요소를 한 행씩 평탄화한 테이블(uri, object_id, global_id, name, category, level, "
+        "hierarchy_path, bbox_*/centroid_*/volume, sp3d_* 속성 피벗)을 Arrow IPC 스트림"
+        "(format=arrow) 또는 Parquet(format=parquet)으로 반환합니다. 요소 순회에는 "
+        "BIM_QUERY_TIMEOUT이 적용되며 pyarrow가 필요합니다."
+    ),
+    responses={
+        200: {"content": {media: {} for media in columnar_export.MEDIA_TYPES.values()}},
+        501: {"model": ErrorResponse},
+        504: {"model": ErrorResponse},
+    },
+)
+async def export_elements(
+    format: str = Query(columnar_export.ARROW, pattern="^(arrow|parquet)$", description="arrow 또는 parquet"),
+):
+    try:
+        columnar_export.require_pyarrow()
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    store = get_store()
+    if not hasattr(store, "union_graph"):
+        raise HTTPException(status_code=501, detail="현재 스토어는 요소 테이블 내보내기를 지원하지 않습니다")
+
+    columns = await run_read_cancellable(
+        lambda cancel_event: columnar_export.element_columns(store.union_graph(), cancel_event)
+    )
+    body = await run_in_pool(columnar_export.to_bytes, columns, format)
+    return Response(content=body, media_type=columnar_export.MEDIA_TYPES[format])
+
+
 @router.get(
     "/elements",
     response_model=list[ElementInfo],
     summary="카테고리별 요소 조회",
+    description=(
+        "정렬된 요소 인덱스에서 커서 기반으로 페이지를 읽습니다. 다음 페이지 커서는 "
+        "`X-Next-Cursor`, 전체 행 수는 `X-Total-Count` 응답 헤더로 반환하며, "
+        "`cursor`를 주면 `offset`은 무시합니다."
+    ),
 )
 async def list_elements(
+    response: Response,
     category: str | None = Query(None, description="BIM 카테고리 (Pipe, Beam, Slab 등)"),
     limit: int = Query(100, ge=1, le=10000),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="직전 응답의 X-Next-Cursor 값"),
 ):
+    after = None
+    if cursor:
+        after, offset = decode_cursor(cursor, CATEGORY_ELEMENT_KEY if category else ELEMENT_KEY)
+        offset = offset or 0
+
     if category:
-        query = get_all_elements_by_category(category, limit, offset)
+        results = await query_index("elements_by_category", category, limit, offset, after)
+        total = await query_index("category_element_count", category)
+        row_key = category_element_row_key
+    else:
+        results = await query_index("element_rows", limit, offset, after)
+        total = await query_index("element_count")
+        row_key = element_row_key
+
+    if results is not None:
+        response.headers["X-Total-Count"] = str(total)
+        if len(results) == limit:
+            response.headers["X-Next-Cursor"] = encode_cursor(after=row_key(results[-1]))
     else:
-        query = f"""
-        PREFIX bim: <http://example.org/bim-ontology/schema#>
-        SELECT ?uri ?name ?category ?originalType
-        WHERE {{
-            ?uri a bim:PhysicalElement .
-            OPTIONAL {{ ?uri bim:hasName ?name }}
-            OPTIONAL {{ ?uri bim:hasCategory ?category }}
-            OPTIONAL {{ ?uri bim:hasOriginalType ?originalType }}
-        }}
-        ORDER BY ?category ?name
-        LIMIT {limit}
-        OFFSET {offset}
-        """
-    results = execute_sparql(query)
+        # 인덱스가 없는 백엔드: 커서에 오프셋을 담는다
+        if category:
+            query = get_all_elements_by_category(category, limit, offset)
+        else:
+            query = f"""
+            PREFIX bim: <http://example.org/bim-ontology/schema#>
+            SELECT ?uri ?name ?category ?originalType
+            WHERE {{
+                ?uri a bim:PhysicalElement .
+                OPTIONAL {{ ?uri bim:hasName ?name }}
+                OPTIONAL {{ ?uri bim:hasCategory ?category }}
+                OPTIONAL {{ ?uri bim:hasOriginalType ?originalType }}
+            }}
+            ORDER BY ?category ?name
+            LIMIT {limit}
+            OFFSET {offset}
+            """
+        results = await execute_sparql_async(query)
+        if len(results) == limit:
+            response.headers["X-Next-Cursor"] = encode_cursor(offset=offset + limit)
     return [
         ElementInfo(
             uri=r.get("uri", ""),
@@ -0,0 +1,35 @@
+"""백그라운드 작업 조회/취소 API.
+
+작업 제출은 각 기능 엔드포인트의 ``?background=true``로 한다
+(``POST /api/reasoning``, ``POST /api/reasoning/validate``, ``POST /api/lean/inject/*``).
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from ..utils.jobs import get_job_manager
+
+router = APIRouter()
+
+
+@router.get("/jobs", summary="작업 목록 조회")
+async def list_jobs():
+    return [job.to_dict() for job in get_job_manager().list()]
+
+
+@router.get("/jobs/{job_id}", summary="작업 상태/진행률/결과 조회")
+async def get_job(job_id: str):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.to_dict()
+
+
+@router.post("/jobs/{job_id}/cancel", summary="작업 취소")
+async def cancel_job(job_id: str):
+    manager = get_job_manager()
+    job = manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job.finished:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} already {job.status}")
+    return manager.cancel(job_id).to_dict()
@@ -3,16 +3,22 @@
 Schedule, AWP, Status, Equipment 데이터 주입 및 조회 엔드포인트.
 """
 
+import functools
+import io
 import logging
+import shutil
 import tempfile
 from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, Query, UploadFile, File
 from pydantic import BaseModel
 
-from ..utils.query_executor import get_store
+from ..utils.jobs import get_job_manager, job_accepted
+from ..utils.query_executor import (
+    execute_sparql_rows_async, get_store, run_in_pool, run_read, run_write,
+)
 from ...converter.lean_layer_injector import LeanLayerInjector
 
 logger = logging.getLogger(__name__)
@@ -34,21 +40,111 @@ def _get_injector() -> LeanLayerInjector:
     return LeanLayerInjector(store.graph)
 
 
-async def _save_upload(upload: UploadFile) -> str:
-    """업로드된 파일을 임시 파일로 저장한다."""
-    content = await upload.read()
+def _write_injector(graph) -> LeanLayerInjector:
+    """쓰기 잠금 하에서 스토어의 식별자 인덱스를 공유하는 주입기를 만든다.
+
+    인덱스는 스토어에 상주하므로 요청마다 주입기를 새로 만들어도 요소 조회에 SPARQL을 쓰지 않는다.
+    상태 변경은 ``store.apply_delta``로 반영해 증분 추론 등 변경 리스너가 델타를 받게 한다.
+    """
+    store = get_store()
+    apply_delta = getattr(store, "apply_delta", None)
+    return LeanLayerInjector(
+        graph,
+        identifiers=getattr(store, "identifiers", None),
+        apply_delta=(
+            functools.partial(apply_delta, identifiers_changed=False) if apply_delta else None
+        ),
+    )
+
+
+def _inject_csv(method: str, source, progress=None) -> dict:
+    """Lean 스키마와 CSV 트리플을 스테이징한 뒤 한 번의 벌크 쓰기로 반영한다 (작업 풀 대상).
+
+    CSV 파싱과 요소 조회 동안에는 잠금을 잡지 않으므로 대시보드 조회가 막히지 않고,
+    커밋은 쓰기 잠금 하의 단일 addN이므로 조회가 절반만 주입된 상태를 볼 수 없다.
+    """
+    store = get_store()
+    with store.reading():
+        identifiers = store.identifiers
+    injector = LeanLayerInjector(
+        store.graph, identifiers=identifiers, commit=store.bulk_insert, progress=progress,
+    )
+    injector.load_lean_schema(commit=False)
+    return getattr(injector, method)(source)
+
+
+def _inject_upload(method: str, upload: UploadFile) -> dict:
+    """업로드 본문을 메모리에 다시 읽어 들이지 않고 CSV 리더로 흘려 주입한다 (작업 풀 대상).
+
+    멀티파트 파일 본문은 Starlette가 SpooledTemporaryFile(일정 크기 이상은 디스크)로
+    받아 두므로, 그 파일 객체를 텍스트 스트림으로 감싸 행 단위로 읽는다.
+    """
+    raw = upload.file
+    raw.seek(0)
+    name = upload.filename or "upload.csv"
+
+    def progress(rows: int) -> None:
+        if upload.size:
+            logger.info("%s 주입 진행: %d행 (%.0f%%)", name, rows,
+                        min(raw.tell() / upload.size, 1.0) * 100)
+        else:
+            logger.info("%s 주입 진행: %d행", name, rows)
+
+    stream = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    try:
+        return _inject_csv(method, stream, progress)
+    finally:
+        # UploadFile은 요청 종료 시 Starlette가 닫는다
+        stream.detach()
+
+
+def _spool_upload(upload: UploadFile) -> str:
+    """업로드 본문을 청크 단위로 임시 파일에 복사한다 (요청이 끝난 뒤 실행되는 작업용)."""
+    upload.file.seek(0)
     suffix = Path(upload.filename or "data.csv").suffix
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-    tmp.write(content)
-    tmp.close()
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(upload.file, tmp)
     return tmp.name
 
 
+def _injection_job(job, method: str, csv_path: str) -> dict:
+    """백그라운드 CSV 주입 작업. 커밋 전까지 진행률을 보고하고 취소 요청을 확인한다.
+
+    취소되면 커밋 전에 중단되므로 그래프에는 아무것도 반영되지 않는다.
+    """
+    def progress(rows: int) -> None:
+        job.report(rows=rows)
+        job.check_cancelled()
+
+    try:
+        return _inject_csv(method, csv_path, progress)
+    finally:
+        Path(csv_path).unlink(missing_ok=True)
+
+
+async def _inject(method: str, file: UploadFile, background: bool, label: str):
+    """CSV 주입 엔드포인트 공통 처리. background면 작업으로 제출하고 202를 반환한다."""
+    try:
+        if background:
+            csv_path = await run_in_pool(_spool_upload, file)
+            return job_accepted(
+                get_job_manager().submit("lean_inject", _injection_job, method, csv_path)
+            )
+        return await run_in_pool(_inject_upload, method, file)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.exception("%s injection failed", label)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ── CSV Injection Endpoints ──
 
+_BACKGROUND = Query(False, description="true면 작업으로 제출하고 202와 job id를 반환")
+
 
 @router.post("/inject/schedule")
-async def inject_schedule(file: UploadFile = File(...)):
+async def inject_schedule(file: UploadFile = File(...), background: bool = _BACKGROUND):
     """일정 CSV를 주입한다.
 
     CSV 컬럼:
@@ -57,87 +153,39 @@ async def inject_schedule(file: UploadFile = File(...)):
     - 기간/비용: Duration, PlannedDuration, ActualDuration, UnitCost, Cost
     - 기타: PlannedInstallDate, DeliveryStatus, CWP_ID
     """
-    tmp_path = await _save_upload(file)
-    try:
-        injector = _get_injector()
-        injector.load_lean_schema()
-        result = injector.inject_schedule_csv(tmp_path)
-        return result
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        logger.exception("Schedule injection failed")
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    return await _inject("inject_schedule_csv", file, background, "Schedule")
 
 
 @router.post("/inject/awp")
-async def inject_awp(file: UploadFile = File(...)):
+async def inject_awp(file: UploadFile = File(...), background: bool = _BACKGROUND):
     """AWP CSV를 주입한다.
 
     CSV 컬럼:
     - 식별자: GlobalId | ObjectId | SyncID
     - AWP: CWA_ID, CWP_ID, IWP_ID, IWP_StartDate, IWP_EndDate, ConstraintStatus
     """
-    tmp_path = await _save_upload(file)
-    try:
-        injector = _get_injector()
-        injector.load_lean_schema()
-        result = injector.inject_awp_csv(tmp_path)
-        return result
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        logger.exception("AWP injection failed")
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    return await _inject("inject_awp_csv", file, background, "AWP")
 
 
 @router.post("/inject/status")
-async def inject_status(file: UploadFile = File(...)):
+async def inject_status(file: UploadFile = File(...), background: bool = _BACKGROUND):
     """상태 CSV를 주입한다.
 
     CSV 컬럼:
     - 식별자: GlobalId | ObjectId | SyncID
     - 상태: StatusValue, StatusDate, DeliveryStatus
     """
-    tmp_path = await _save_upload(file)
-    try:
-        injector = _get_injector()
-        injector.load_lean_schema()
-        result = injector.inject_status_csv(tmp_path)
-        return result
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        logger.exception("Status injection failed")
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    return await _inject("inject_status_csv", file, background, "Status")
 
 
 @router.post("/inject/equipment")
-async def inject_equipment(file: UploadFile = File(...)):
+async def inject_equipment(file: UploadFile = File(...), background: bool = _BACKGROUND):
     """장비 CSV를 주입한다.
 
     CSV 컬럼: EquipmentID, Name, Width, Height, TurningRadius,
               BoomLength, LoadCapacity, AccessZone_CWA_ID
     """
-    tmp_path = await _save_upload(file)
-    try:
-        injector = _get_injector()
-        injector.load_lean_schema()
-        result = injector.inject_equipment_csv(tmp_path)
-        return result
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        logger.exception("Equipment injection failed")
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    return await _inject("inject_equipment_csv", file, background, "Equipment")
 
 
 # ── Status Update Endpoint ──
@@ -158,9 +206,10 @@ async def update_status(global_id: str, req: StatusUpdateRequest):
             status_code=400,
             detail=f"Invalid status_value. Must be one of: {valid_statuses}")
 
-    injector = _get_injector()
-    result = injector.update_element_status(
-        global_id, req.status_value, req.delivery_status)
+    result = await run_write(
+        lambda graph: _write_injector(graph).update_element_status(
+            global_id, req.status_value, req.delivery_status),
+        identifiers_changed=False, changes_tracked=True)
 
     if not result.get("success"):
         raise HTTPException(status_code=404, detail=result.get("error", "Unknown error"))
@@ -176,7 +225,6 @@ async def get_todays_work(target_date: Optional[str] = None):
     if not target_date:
         target_date = date.today().isoformat()
 
-    store = get_store()
     query = _PREFIXES + f"""
     SELECT ?iwp ?iwpName ?cwpName ?cwaName ?startDate ?endDate
            ?constraintStatus ?isExecutable
@@ -203,7 +251,7 @@ async def get_todays_work(target_date: Optional[str] = None):
              ?constraintStatus ?isExecutable
     ORDER BY ?cwaName ?cwpName ?iwpName
     """
-    results = list(store.graph.query(query))
+    results = await execute_sparql_rows_async(query)
     return {
         "target_date": target_date,
         "iwp_count": len(results),
@@ -229,7 +277,6 @@ async def get_delayed_elements(reference_date: Optional[str] = None):
     if not reference_date:
         reference_date = date.today().isoformat()
 
-    store = get_store()
     query = _PREFIXES + f"""
     SELECT ?elem ?name ?category ?plannedDate ?deliveryStatus ?isDelayed
     WHERE {{
@@ -245,7 +292,7 @@ async def get_delayed_elements(reference_date: Optional[str] = None):
     ORDER BY ?plannedDate
     LIMIT 200
     """
-    results = list(store.graph.query(query))
+    results = await execute_sparql_rows_async(query)
     return {
         "reference_date": reference_date,
         "delayed_count": len(results),
@@ -265,7 +312,6 @@ async def get_delayed_elements(reference_date: Optional[str] = None):
 @router.get("/iwp/{iwp_id}/constraints")
 async def get_iwp_constraints(iwp_id: str):
     """IWP의 제약 조건 및 포함 요소를 조회한다."""
-    store = get_store()
     query = _PREFIXES + f"""
     SELECT ?iwpName ?startDate ?endDate ?constraintStatus ?isExecutable
            ?elem ?elemName ?elemCategory ?deliveryStatus ?isReady
@@ -287,7 +333,7 @@ async def get_iwp_constraints(iwp_id: str):
     }}
     ORDER BY ?elemName
     """
-    results = list(store.graph.query(query))
+    results = await execute_sparql_rows_async(query)
     if not results:
         raise HTTPException(status_code=404, detail=f"IWP not found: {iwp_id}")
 
@@ -316,4 +362,4 @@ async def get_iwp_constraints(iwp_id: str):
 async def get_lean_stats():
     """Lean Layer 주입 현황 통계를 반환한다."""
     injector = _get_injector()
-    return injector.get_lean_layer_stats()
+    return await run_read(injector.get_lean_layer_stats)
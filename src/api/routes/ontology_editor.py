@@ -8,7 +8,7 @@ import logging
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
-from ..utils.query_executor import get_store
+from ..utils.query_executor import get_store, run_read, run_write
 from ...ontology.schema_manager import OntologySchemaManager
 
 logger = logging.getLogger(__name__)
@@ -66,14 +66,15 @@ class UpdateRulesRequest(BaseModel):
 @router.get("/ontology/types")
 async def list_types():
     mgr = _get_manager()
-    types = mgr.list_object_types()
+    types = await run_read(mgr.list_object_types)
     return [{"name": t.name, "parent_class": t.parent_class, "label": t.label, "description": t.description} for t in types]
 
 
 @router.post("/ontology/types")
 async def create_type(req: CreateTypeRequest):
     mgr = _get_manager()
-    info = mgr.create_object_type(req.name, req.parent_class, req.label, req.description)
+    info = await run_write(
+        lambda _: mgr.create_object_type(req.name, req.parent_class, req.label, req.description))
     return {"name": info.name, "parent_class": info.parent_class, "label": info.label}
 
 
@@ -82,7 +83,7 @@ async def update_type(name: str, req: UpdateTypeRequest):
     mgr = _get_manager()
     try:
         kwargs = {k: v for k, v in req.model_dump().items() if v is not None}
-        info = mgr.update_object_type(name, **kwargs)
+        info = await run_write(lambda _: mgr.update_object_type(name, **kwargs))
         return {"name": info.name, "parent_class": info.parent_class, "label": info.label}
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Type '{name}' not found")
@@ -91,7 +92,7 @@ async def update_type(name: str, req: UpdateTypeRequest):
 @router.delete("/ontology/types/{name}")
 async def delete_type(name: str):
     mgr = _get_manager()
-    if mgr.delete_object_type(name):
+    if await run_write(lambda _: mgr.delete_object_type(name)):
         return {"deleted": True, "name": name}
     raise HTTPException(status_code=404, detail=f"Type '{name}' not found")
 
@@ -101,14 +102,15 @@ async def delete_type(name: str):
 @router.get("/ontology/properties")
 async def list_properties():
     mgr = _get_manager()
-    props = mgr.list_property_types()
+    props = await run_read(mgr.list_property_types)
     return [{"name": p.name, "domain": p.domain, "range_type": p.range_type, "label": p.label} for p in props]
 
 
 @router.post("/ontology/properties")
 async def create_property(req: CreatePropertyRequest):
     mgr = _get_manager()
-    info = mgr.create_property_type(req.name, req.domain, req.range_type, req.label)
+    info = await run_write(
+        lambda _: mgr.create_property_type(req.name, req.domain, req.range_type, req.label))
     return {"name": info.name, "domain": info.domain, "range_type": info.range_type}
 
 
@@ -117,14 +119,15 @@ async def create_property(req: CreatePropertyRequest):
 @router.get("/ontology/links")
 async def list_links():
     mgr = _get_manager()
-    links = mgr.list_link_types()
+    links = await run_read(mgr.list_link_types)
     return [{"name": l.name, "domain": l.domain, "range_class": l.range_class, "inverse_name": l.inverse_name} for l in links]
 
 
 @router.post("/ontology/links")
 async def create_link(req: CreateLinkRequest):
     mgr = _get_manager()
-    info = mgr.create_link_type(req.name, req.domain, req.range_class, req.inverse_name, req.label)
+    info = await run_write(
+        lambda _: mgr.create_link_type(req.name, req.domain, req.range_class, req.inverse_name, req.label))
     return {"name": info.name, "domain": info.domain, "range_class": info.range_class}
 
 
@@ -148,9 +151,8 @@ async def update_rules(req: UpdateRulesRequest):
 @router.post("/ontology/apply")
 async def apply_schema():
     mgr = _get_manager()
-    store = get_store()
-    added = mgr.apply_schema_to_graph(store.graph)
-    return {"triples_added": added, "total_triples": len(store)}
+    added = await run_write(mgr.apply_schema_to_graph)
+    return {"triples_added": added, "total_triples": len(get_store())}
 
 
 @router.get("/ontology/export")
@@ -166,5 +168,6 @@ async def import_schema(request: Request):
     if not schema_data:
         raise HTTPException(status_code=400, detail="schema field required")
     mgr = _get_manager()
-    mgr.import_schema(schema_data if isinstance(schema_data, str) else json.dumps(schema_data))
+    data = schema_data if isinstance(schema_data, str) else json.dumps(schema_data)
+    await run_write(lambda _: mgr.import_schema(data))
     return {"imported": True}
@@ -8,7 +8,7 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
 
-from ..utils.query_executor import get_store
+from ..utils.query_executor import execute_sparql_async
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +18,7 @@ router = APIRouter()
 @router.get("/properties/{global_id}")
 async def get_element_properties(global_id: str):
     """특정 요소의 모든 PropertySet을 반환한다."""
-    store = get_store()
-    rows = store.query(f"""
+    rows = await execute_sparql_async(f"""
         PREFIX bim: <http://example.org/bim-ontology/schema#>
         PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 
@@ -52,10 +51,8 @@ async def get_element_properties(global_id: str):
 @router.get("/properties/plant-data")
 async def get_plant_data():
     """Smart3D Plant 데이터 요약을 반환한다."""
-    store = get_store()
-
     # PlantPropertySet 통계
-    plant_psets = store.query("""
+    plant_psets = await execute_sparql_async("""
         PREFIX bim: <http://example.org/bim-ontology/schema#>
         PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 
@@ -70,14 +67,14 @@ async def get_plant_data():
     """)
 
     # 전체 PropertySet 수
-    total = store.query("""
+    total = await execute_sparql_async("""
         PREFIX bim: <http://example.org/bim-ontology/schema#>
         PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
         SELECT (COUNT(DISTINCT ?pset) AS ?num)
         WHERE { ?pset rdf:type bim:PropertySet }
     """)
 
-    plant_total = store.query("""
+    plant_total = await execute_sparql_async("""
         PREFIX bim: <http://example.org/bim-ontology/schema#>
         PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
         SELECT (COUNT(DISTINCT ?pset) AS ?num)
@@ -100,8 +97,6 @@ async def search_properties(
     limit: int = Query(50, ge=1, le=500),
 ):
     """속성 키/값으로 검색한다."""
-    store = get_store()
-
     filters = [f'?prop bim:hasName "{key}"']
     if value:
         filters.append(f'FILTER(STR(?val) = "{value}")')
@@ -112,7 +107,7 @@ async def search_properties(
 
     filter_str = " .\n            ".join(filters)
 
-    rows = store.query(f"""
+    rows = await execute_sparql_async(f"""
         PREFIX bim: <http://example.org/bim-ontology/schema#>
         PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
 
@@ -1,17 +1,33 @@
 """OWL/RDFS 추론 및 SHACL 검증 API 라우트."""
 
+import itertools
 import logging
+import os
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
-
-from ..utils.query_executor import get_store
-from ...inference.reasoner import OWLReasoner
-from ...inference.shacl_validator import validate as shacl_validate
-from ...storage.triple_store import TripleStore
+from fastapi import APIRouter, HTTPException, Query
+from rdflib import Graph, URIRef
+
+from ..utils.jobs import get_job_manager, job_accepted
+from ..utils.pagination import SUBJECT_KEY, decode_cursor, encode_cursor
+from ..utils.query_executor import (
+    execute_sparql_async,
+    get_store,
+    run_in_pool,
+    run_read,
+    run_write,
+)
+from ...cache import GraphRegistry
+from ...inference.incremental import IncrementalReasoner
+from ...inference.reasoner import materialize_inferred
+from ...inference.validation_report import run_validation_checks, summarize
+from ...inference.shacl_validator import IncrementalValidator, validate as shacl_validate
+from ...storage.triple_store import INFERRED_GRAPH, TripleStore, UnionGraph
+from ...storage.snapshot import INFERRED_SUFFIX, SNAPSHOT_SUFFIX, inferred_path_for, load_with_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -29,233 +45,241 @@ PREFIX ifc:  <https://standards.buildingsmart.org/IFC/DEV/IFC4/ADD2/OWL#>
 """
 
 
+def _reasoning_job(job) -> dict:
+    """백그라운드 추론 작업. 복사본에서 추론한 뒤 교체 직전에 취소 여부를 확인한다."""
+    job.check_cancelled()
+    job.report(phase="reasoning")
+    return _refresh_inferred(before_swap=job.check_cancelled)
+
+
+# 변경된 노드만 다시 검증하는 SHACL 검증기 (POST /reasoning/validate?incremental=true)
+_validator: IncrementalValidator | None = None
+_validator_lock = threading.Lock()
+
+
+def _validate_store(store, workers: int | None = None, incremental: bool = False) -> dict:
+    """스토어의 단언 + 추론 트리플을 검증한다 (읽기 잠금 하).
+
+    incremental이면 스토어가 추적한 dirty 노드만 다시 검증해 캐시된 전체 보고서를 갱신한다.
+    """
+    global _validator
+    if not incremental:
+        return shacl_validate(store.union_graph(), workers=workers)
+    # dirty 노드를 가져간 순서대로 보고서에 반영되도록 증분 검증은 한 번에 하나만 실행한다
+    with _validator_lock:
+        if _validator is None:
+            _validator = IncrementalValidator()
+        dirty = store.take_dirty() if hasattr(store, "take_dirty") else None
+        return _validator.validate(store.union_graph(), dirty)
+
+
+def _validation_job(job, workers: int | None = None, incremental: bool = False) -> dict:
+    """백그라운드 SHACL 검증 작업."""
+    store = get_store()
+    with store.reading():
+        job.check_cancelled()
+        job.report(phase="validating")
+        return _validate_store(store, workers, incremental)
+
+
 @router.post("/reasoning")
-async def run_reasoning():
-    """OWL/RDFS 추론을 실행하고 결과를 반환한다."""
+async def run_reasoning(
+    background: bool = Query(False, description="true면 작업으로 제출하고 202와 job id를 반환"),
+):
+    """OWL/RDFS 추론을 실행하고 결과를 반환한다.
+
+    추론 결과는 단언 그래프와 분리된 추론 그래프에 담겨 한 번에 교체되며,
+    조회는 두 그래프의 합집합을 본다. background=true면 진행 중인 추론 작업이 있을 때
+    새로 실행하지 않고 그 작업을 반환한다.
+    """
+    if background:
+        return job_accepted(
+            get_job_manager().submit("reasoning", _reasoning_job, dedupe_key="reasoning")
+        )
     try:
-        store = get_store()
-        reasoner = OWLReasoner(store.graph)
-        result = reasoner.run_all()
-        return result
+        return await run_in_pool(_refresh_inferred)
     except Exception as e:
         logger.error("추론 실행 실패: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# 전역 스토어에 붙은 증분 추론기 (POST /reasoning/incremental로 활성화)
+_incremental: IncrementalReasoner | None = None
+
+
+def _detach_incremental(store) -> None:
+    """증분 추론기를 스토어에서 떼어낸다 (추론 그래프를 통째로 교체/삭제할 때)."""
+    global _incremental
+    if _incremental is not None and hasattr(store, "remove_change_listener"):
+        store.remove_change_listener(_incremental.apply_delta)
+    _incremental = None
+
+
+def _refresh_inferred(before_swap=None) -> dict:
+    """전체 추론으로 추론 그래프를 다시 만든다. 증분 추론기는 새 그래프와 맞지 않으므로 떼어낸다."""
+    store = get_store()
+
+    def swap():
+        if before_swap is not None:
+            before_swap()
+        _detach_incremental(store)
+
+    return materialize_inferred(store, before_swap=swap)
+
+
+def _enable_incremental(graph) -> dict:
+    """현재 스토어에 증분 추론기를 붙이고 전체 유도를 한 번 실행한다 (쓰기 잠금 하).
+
+    추론 트리플은 스토어의 추론 그래프에 기록하고, 규칙은 단언+추론 합집합을 읽는다.
+    이후 Lean 상태 업데이트와 CSV 주입은 스토어 변경 리스너로 델타만 추론한다.
+    이미 붙어 있으면 기존 추론 결과를 지우고 다시 유도한다 (NOW() 규칙 갱신 등).
+    """
+    global _incremental
+    store = get_store()
+    if store.inferred is None:
+        store.swap_inferred(Graph(identifier=INFERRED_GRAPH))
+    target = store.inferred
+    reasoner = _incremental
+    if reasoner is not None:
+        store.remove_change_listener(reasoner.apply_delta)
+    if reasoner is None or reasoner.target is not target:
+        reasoner = IncrementalReasoner(UnionGraph(graph, target), target=target,
+                                       on_change=store.mark_dirty)
+    stats = reasoner.materialize()
+    store.add_change_listener(reasoner.apply_delta)
+    _incremental = reasoner
+    return stats
+
+
+@router.post("/reasoning/incremental")
+async def enable_incremental_reasoning():
+    """증분 추론을 활성화하고 subClassOf 타입 추론과 커스텀 규칙 결과를 유도한다."""
+    if not hasattr(get_store(), "add_change_listener"):
+        raise HTTPException(status_code=501, detail="현재 스토어는 증분 추론을 지원하지 않습니다")
+    try:
+        return await run_write(_enable_incremental, identifiers_changed=False)
+    except Exception as e:
+        logger.error("증분 추론 활성화 실패: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/reasoning/incremental")
+async def get_incremental_reasoning():
+    """증분 추론 활성 여부와 유지 중인 추론 트리플 수를 반환한다."""
+    reasoner = _incremental
+    store = get_store()
+    enabled = reasoner is not None and reasoner.target is getattr(store, "inferred", None)
+    return {
+        "enabled": enabled,
+        "inferred_triples": len(reasoner.inferred) if enabled else 0,
+    }
+
+
+def _require_inferred_support():
+    store = get_store()
+    if not hasattr(store, "swap_inferred"):
+        raise HTTPException(status_code=501, detail="현재 스토어는 별도 추론 그래프를 지원하지 않습니다")
+    return store
+
+
+@router.get("/reasoning/inferred")
+async def get_inferred_graph():
+    """단언 그래프와 추론 그래프의 트리플 수를 반환한다."""
+    _require_inferred_support()
+    return await run_read(_inferred_counts, get_store())
+
+
+def _inferred_counts(store) -> dict:
+    asserted = len(store.graph)
+    inferred = len(store.inferred) if store.inferred is not None else 0
+    return {
+        "asserted_triples": asserted,
+        "inferred_triples": inferred,
+        # 추론 그래프는 단언되지 않은 트리플로 만들어지므로 합집합을 순회하지 않고 더한다
+        "total_triples": asserted + inferred,
+    }
+
+
+@router.delete("/reasoning/inferred")
+async def drop_inferred_graph():
+    """추론 그래프를 버린다. 단언 트리플은 그대로 남는다."""
+    store = _require_inferred_support()
+
+    def drop() -> int:
+        _detach_incremental(store)
+        previous = store.swap_inferred(None)
+        return len(previous) if previous is not None else 0
+
+    return {"removed_triples": await run_in_pool(drop)}
+
+
+@router.post("/reasoning/inferred/save")
+async def save_inferred_graph(
+    file_name: str = Query(..., description="추론 그래프를 함께 저장할 TTL 파일명 (data/rdf 기준)"),
+):
+    """추론 그래프를 TTL 옆 사이드카 파일로 저장한다. 다음 로드 때 함께 복원된다."""
+    store = _require_inferred_support()
+    if store.inferred is None:
+        raise HTTPException(status_code=404, detail="저장할 추론 그래프가 없습니다")
+    source = _RDF_DIR / file_name
+    if source.suffix != ".ttl" or source.parent != _RDF_DIR:
+        raise HTTPException(status_code=400, detail=f"잘못된 파일명: {file_name}")
+    path = inferred_path_for(source)
+    try:
+        await run_in_pool(store.save_inferred, path)
+    except Exception as e:
+        logger.error("추론 그래프 저장 실패: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"file": path.name, "inferred_triples": len(store.inferred)}
+
+
 @router.post("/reasoning/validate")
-async def run_shacl_validation():
-    """SHACL 형상 검증을 실행하고 결과를 반환한다."""
+async def run_shacl_validation(
+    background: bool = Query(False, description="true면 작업으로 제출하고 202와 job id를 반환"),
+    workers: int | None = Query(None, ge=1, le=64, description="초점 노드 샤드 병렬 검증 워커 수"),
+    incremental: bool = Query(False, description="true면 마지막 검증 이후 바뀐 노드만 다시 검증"),
+):
+    """SHACL 형상 검증을 실행하고 결과를 반환한다 (단언 + 추론 트리플 대상).
+
+    workers를 주면 초점 노드를 샤드로 나눠 프로세스 풀에서 병렬 검증한다.
+    incremental=true면 Lean 상태 업데이트/CSV 주입 등으로 바뀐 노드와 그 노드를 참조하는
+    노드만 다시 검증하고, 캐시된 전체 보고서를 갱신해 반환한다 (첫 호출은 전체 검증).
+    """
+    if background:
+        return job_accepted(
+            get_job_manager().submit("validate", _validation_job, workers, incremental,
+                                     dedupe_key="validate")
+        )
     try:
-        store = get_store()
-        result = shacl_validate(store.graph)
-        return result
+        return await run_read(_validate_store, get_store(), workers, incremental)
     except Exception as e:
         logger.error("SHACL 검증 실패: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _run_query(store, sparql: str) -> list[dict[str, Any]]:
-    """프리픽스가 포함된 SPARQL 쿼리를 실행한다."""
-    return store.query(_PREFIXES + sparql)
+@router.get("/reasoning/validate/report")
+async def get_incremental_validation_report():
+    """증분 SHACL 검증이 유지하는 마지막 전체 보고서를 반환한다."""
+    report = _validator.report if _validator is not None else None
+    if report is None:
+        raise HTTPException(status_code=404, detail="증분 검증 보고서가 없습니다. incremental=true로 검증을 먼저 실행하세요")
+    return report
+
+
+async def _query(store, sparql: str) -> list[dict[str, Any]]:
+    """프리픽스가 포함된 SPARQL 쿼리를 작업 풀에서 실행한다.
+
+    전역 스토어는 캐시를 거치고, 파일별로 임시 로드한 스토어는 직접 실행한다.
+    """
+    if store is get_store():
+        return await execute_sparql_async(_PREFIXES + sparql)
+    return await run_in_pool(store.query, _PREFIXES + sparql)
 
 
 def _run_validation_checks(store) -> list[dict[str, Any]]:
-    """모든 검증 항목을 실행하고 결과 리스트를 반환한다."""
-    checks = []
-
-    # 1. Schema Completeness
-    classes = _run_query(store, """
-        SELECT ?class WHERE {
-            ?class a owl:Class .
-            FILTER(STRSTARTS(STR(?class), "http://example.org/bim-ontology/schema#"))
-        }
-    """)
-    data_props = _run_query(store, """
-        SELECT ?prop WHERE { ?prop a owl:DatatypeProperty }
-    """)
-    obj_props = _run_query(store, """
-        SELECT ?prop WHERE { ?prop a owl:ObjectProperty }
-    """)
-    checks.append({
-        "name": "schema_completeness",
-        "status": "pass" if len(classes) >= 8 and len(data_props) >= 6 else "fail",
-        "details": {
-            "owl_classes": len(classes),
-            "data_properties": len(data_props),
-            "object_properties": len(obj_props),
-        },
-    })
-
-    # 2. Spatial Hierarchy
-    chain = _run_query(store, """
-        SELECT ?project ?site ?building ?storey WHERE {
-            ?project a bim:Project .
-            ?project bim:aggregates ?site .
-            ?site a bim:Site .
-            ?site bim:aggregates ?building .
-            ?building a bim:Building .
-            ?building bim:aggregates ?storey .
-            ?storey a bim:BuildingStorey .
-        }
-    """)
-    storeys = _run_query(store, """
-        SELECT (COUNT(?s) AS ?c) WHERE { ?s a bim:BuildingStorey }
-    """)
-    checks.append({
-        "name": "spatial_hierarchy",
-        "status": "pass" if len(chain) > 0 else "fail",
-        "details": {
-            "complete_chains": len(chain),
-            "storeys": storeys[0]["c"] if storeys else 0,
-        },
-    })
-
-    # 3. Element Statistics
-    total = _run_query(store, """
-        SELECT (COUNT(?e) AS ?total) WHERE { ?e a bim:PhysicalElement }
-    """)
-    categories = _run_query(store, """
-        SELECT ?category (COUNT(?e) AS ?count) WHERE {
-            ?e bim:hasCategory ?category
-        } GROUP BY ?category ORDER BY DESC(?count)
-    """)
-    total_elem = total[0]["total"] if total else 0
-    checks.append({
-        "name": "element_statistics",
-        "status": "info",
-        "details": {
-            "total_elements": total_elem,
-            "category_count": len(categories),
-            "categories": [
-                {"name": r["category"], "count": r["count"]}
-                for r in categories
-            ],
-        },
-    })
-
-    # 4. URI Consistency
-    orphans = _run_query(store, """
-        SELECT (COUNT(?o) AS ?count) WHERE {
-            ?o bim:isContainedIn ?s .
-            FILTER NOT EXISTS { ?o a bim:PhysicalElement }
-        }
-    """)
-    unlinked = _run_query(store, """
-        SELECT (COUNT(?u) AS ?count) WHERE {
-            ?u a bim:PhysicalElement .
-            FILTER NOT EXISTS { ?u bim:isContainedIn ?any }
-        }
-    """)
-    orphan_count = orphans[0]["count"] if orphans else 0
-    unlinked_count = unlinked[0]["count"] if unlinked else 0
-    uri_status = "pass" if orphan_count == 0 and unlinked_count == 0 else (
-        "fail" if orphan_count > 0 else "warn"
-    )
-    checks.append({
-        "name": "uri_consistency",
-        "status": uri_status,
-        "details": {
-            "orphan_elements": orphan_count,
-            "unlinked_elements": unlinked_count,
-        },
-    })
-
-    # 5. PropertySet Coverage
-    psets = _run_query(store, """
-        SELECT (COUNT(?ps) AS ?total) WHERE { ?ps a bim:PropertySet }
-    """)
-    plant_psets = _run_query(store, """
-        SELECT (COUNT(?ps) AS ?total) WHERE { ?ps a bim:PlantPropertySet }
-    """)
-    coverage = _run_query(store, """
-        SELECT (COUNT(DISTINCT ?wp) AS ?withPSet) WHERE {
-            ?wp a bim:PhysicalElement .
-            ?wp bim:hasPropertySet ?ps .
-        }
-    """)
-    total_psets = psets[0]["total"] if psets else 0
-    with_pset = coverage[0]["withPSet"] if coverage else 0
-    cov_ratio = with_pset / total_elem if total_elem > 0 else 0
-    pset_status = "fail" if total_psets == 0 else ("warn" if cov_ratio < 0.3 else "pass")
-    checks.append({
-        "name": "property_set_coverage",
-        "status": pset_status,
-        "details": {
-            "total_property_sets": total_psets,
-            "plant_property_sets": plant_psets[0]["total"] if plant_psets else 0,
-            "elements_with_pset": with_pset,
-            "total_elements": total_elem,
-            "coverage_ratio": round(cov_ratio, 3),
-        },
-    })
-
-    # 6. Required Properties
-    no_gid = _run_query(store, """
-        SELECT (COUNT(?e) AS ?count) WHERE {
-            ?e a bim:PhysicalElement .
-            FILTER NOT EXISTS { ?e bim:hasGlobalId ?id }
-        }
-    """)
-    missing_gid = no_gid[0]["count"] if no_gid else 0
-    checks.append({
-        "name": "required_properties",
-        "status": "pass" if missing_gid == 0 else "fail",
-        "details": {"missing_global_id": missing_gid},
-    })
-
-    # 7. Classification Quality
-    other_q = _run_query(store, """
-        SELECT (COUNT(?e) AS ?count) WHERE {
-            ?e a bim:PhysicalElement .
-            ?e bim:hasCategory "Other" .
-        }
-    """)
-    total_cat = _run_query(store, """
-        SELECT (COUNT(?e) AS ?count) WHERE { ?e bim:hasCategory ?c }
-    """)
-    other_count = other_q[0]["count"] if other_q else 0
-    total_categorized = total_cat[0]["count"] if total_cat else 0
-    other_ratio = other_count / total_categorized if total_categorized > 0 else 0
-    cls_status = "pass" if other_ratio <= 0.15 else ("warn" if other_ratio <= 0.30 else "fail")
-    checks.append({
-        "name": "classification_quality",
-        "status": cls_status,
-        "details": {
-            "other_count": other_count,
-            "total_categorized": total_categorized,
-            "other_ratio": round(other_ratio, 4),
-        },
-    })
-
-    # 8. Relationship Integrity
-    contains = _run_query(store, """
-        SELECT (COUNT(*) AS ?c) WHERE { ?s bim:containsElement ?e }
-    """)
-    contained_in = _run_query(store, """
-        SELECT (COUNT(*) AS ?c) WHERE { ?e bim:isContainedIn ?s }
-    """)
-    asymmetric = _run_query(store, """
-        SELECT (COUNT(?e) AS ?c) WHERE {
-            ?e bim:isContainedIn ?s .
-            FILTER NOT EXISTS { ?s bim:containsElement ?e }
-        }
-    """)
-    contains_n = contains[0]["c"] if contains else 0
-    contained_n = contained_in[0]["c"] if contained_in else 0
-    asym_n = asymmetric[0]["c"] if asymmetric else 0
-    symmetric = contains_n == contained_n and asym_n == 0
-    checks.append({
-        "name": "relationship_integrity",
-        "status": "pass" if symmetric and contains_n > 0 else "warn",
-        "details": {
-            "contains_element": contains_n,
-            "is_contained_in": contained_n,
-            "asymmetric_pairs": asym_n,
-            "symmetric": symmetric,
-        },
-    })
-
-    return checks
+    """모든 검증 항목을 단언 + 추론 트리플에 대해 한 번의 그래프 순회로 계산한다."""
+    with store.reading():
+        return run_validation_checks(store.union_graph())
 
 
 # ── URI prefix 축약 ──
@@ -288,15 +312,27 @@ def _expand_uri(short: str) -> str:
     return short
 
 
+def _load_file_store(path: Path) -> TripleStore:
+    """레지스트리 로더. 최신 스냅샷이 있으면 사용하되 새로 만들지는 않는다."""
+    store = TripleStore()
+    load_with_snapshot(store, path, write=False)
+    return store
+
+
+# ttl_file로 지정한 파일의 스토어를 요청마다 다시 파싱하지 않도록 보관 (메모리 예산 MB)
+_file_stores = GraphRegistry(
+    _load_file_store,
+    budget_bytes=int(os.getenv("BIM_GRAPH_REGISTRY_MB", "2048")) * 2**20,
+)
+
+
 def _get_store_for_file(ttl_file: str | None):
     """ttl_file이 지정되면 해당 파일을 로드한 스토어를, 아니면 전역 스토어를 반환."""
     if ttl_file:
         filepath = _RDF_DIR / ttl_file
         if not filepath.is_file():
             raise HTTPException(status_code=404, detail=f"파일 없음: {ttl_file}")
-        store = TripleStore()
-        store.load(str(filepath))
-        return store
+        return _file_stores.get(filepath)
     return get_store()
 
 
@@ -309,7 +345,7 @@ async def list_ttl_files():
     try:
         files = []
         for p in sorted(_RDF_DIR.glob("*.ttl*")):
-            if p.is_file():
+            if p.is_file() and not p.name.endswith((SNAPSHOT_SUFFIX, INFERRED_SUFFIX)):
                 stat = p.stat()
                 files.append({
                     "name": p.name,
@@ -327,18 +363,56 @@ async def list_ttl_files():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/reasoning/ttl-files/cache")
+async def get_ttl_file_cache():
+    """ttl_file 조회용으로 메모리에 보관 중인 파일 스토어 통계를 반환한다."""
+    return _file_stores.stats
+
+
+@router.delete("/reasoning/ttl-files/cache")
+async def clear_ttl_file_cache():
+    """보관 중인 파일 스토어를 모두 비운다."""
+    return {"removed": _file_stores.invalidate()}
+
+
+# 마지막으로 제출한 재로드 작업 id (GET /reasoning/reload에서 진행 상황 조회)
+_reload_job_id: str | None = None
+
+
+def _reload(ttl_path: Path, progress=None, before_swap=None) -> int:
+    """새 스토어를 백그라운드에서 로딩한 뒤 교체한다. 이전 스토어의 증분 추론기는 떼어낸다."""
+    from ..utils.query_executor import reload_store
+
+    old_store = get_store()
+    triples = reload_store(str(ttl_path), progress=progress, before_swap=before_swap)
+    _detach_incremental(old_store)
+    return triples
+
+
+def _reload_job(job, ttl_path: Path) -> dict:
+    """재로드 작업. 로딩/인덱싱 동안 기존 스토어가 계속 쿼리를 처리한다."""
+    triples = _reload(ttl_path, progress=job.report, before_swap=job.check_cancelled)
+    return {"status": "success", "file": ttl_path.name, "triples": triples}
+
+
 @router.post("/reasoning/reload")
-async def reload_ttl_file(file_name: str):
+async def reload_ttl_file(
+    file_name: str,
+    background: bool = Query(False, description="true면 작업으로 제출하고 202와 job id를 반환"),
+):
     """지정된 TTL 파일로 스토어를 다시 로드한다.
 
+    새 스토어를 따로 로딩하는 동안 기존 스토어가 계속 쿼리를 처리하고, 진행 중인 쿼리가
+    끝나면 한 번에 교체한다. background=true면 재로드 작업을 제출하고 바로 응답하며,
+    진행 상황은 ``GET /reasoning/reload``로 조회한다. 재로드 작업이 진행 중이면 그 작업을 반환한다.
+
     Args:
         file_name: 로드할 TTL 파일명 (data/rdf/ 내)
 
     Returns:
         로드 결과 (파일명, 트리플 수)
     """
-    from ..utils.query_executor import reload_store
-
+    global _reload_job_id
     try:
         ttl_path = _RDF_DIR / file_name
         if not ttl_path.exists():
@@ -347,7 +421,12 @@ async def reload_ttl_file(file_name: str):
         if not (file_name.endswith(".ttl") or file_name.endswith(".ttl.bak")):
             raise HTTPException(status_code=400, detail="TTL 파일만 로드할 수 있습니다")
 
-        triple_count = reload_store(str(ttl_path))
+        if background:
+            job = get_job_manager().submit("reload", _reload_job, ttl_path, dedupe_key="reload")
+            _reload_job_id = job.id
+            return job_accepted(job)
+
+        triple_count = await run_in_pool(_reload, ttl_path)
         return {
             "status": "success",
             "file": file_name,
@@ -360,39 +439,42 @@ async def reload_ttl_file(file_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/reasoning/reload")
+async def get_reload_status():
+    """현재 스토어 상태와 마지막 재로드 작업의 진행 상황을 반환한다."""
+    store = get_store()
+    job = get_job_manager().get(_reload_job_id) if _reload_job_id else None
+    return {
+        "triples": await run_in_pool(store.count),
+        "generation": getattr(store, "generation", None),
+        "job": job.to_dict() if job is not None else None,
+    }
+
+
 @router.get("/reasoning/validation-report")
 async def get_validation_report(ttl_file: str | None = None):
     """RDF 그래프 품질 검증 리포트를 반환한다.
 
-    8개 카테고리의 SPARQL 기반 검증을 실행하고 JSON 리포트를 반환합니다.
+    8개 카테고리 검증을 한 번의 그래프 순회로 계산하고 JSON 리포트를 반환합니다.
 
     Args:
         ttl_file: 검증할 TTL 파일명. None이면 현재 로딩된 스토어 사용.
     """
     try:
-        if ttl_file:
-            filepath = _RDF_DIR / ttl_file
-            if not filepath.is_file():
-                raise HTTPException(status_code=404, detail=f"파일 없음: {ttl_file}")
-            store = TripleStore()
-            store.load(str(filepath))
-        else:
-            store = get_store()
+        store = await run_in_pool(_get_store_for_file, ttl_file)
+        if not hasattr(store, "union_graph"):
+            raise HTTPException(status_code=501, detail="현재 스토어는 로컬 그래프 검증을 지원하지 않습니다")
 
         start = time.time()
-        checks = _run_validation_checks(store)
+        checks = await run_in_pool(_run_validation_checks, store)
         elapsed = time.time() - start
 
-        summary = {"pass": 0, "warn": 0, "info": 0, "fail": 0}
-        for c in checks:
-            summary[c["status"]] += 1
-
         return {
             "ttl_file": ttl_file,
             "total_triples": store.count(),
             "validation_time": round(elapsed, 2),
             "checks": checks,
-            "summary": summary,
+            "summary": summarize(checks),
         }
     except HTTPException:
         raise
@@ -411,21 +493,14 @@ async def get_other_elements(
     """Other로 분류된 요소들의 상세 정보를 반환한다."""
     import re as _re
     try:
-        if ttl_file:
-            filepath = _RDF_DIR / ttl_file
-            if not filepath.is_file():
-                raise HTTPException(status_code=404, detail=f"파일 없음: {ttl_file}")
-            store = TripleStore()
-            store.load(str(filepath))
-        else:
-            store = get_store()
+        store = await run_in_pool(_get_store_for_file, ttl_file)
 
         filter_clause = ""
         if name_pattern:
             safe = name_pattern.replace('"', '\\"')
             filter_clause = f'FILTER(CONTAINS(LCASE(STR(?name)), LCASE("{safe}")))'
 
-        elements_q = _run_query(store, f"""
+        elements_q = await _query(store, f"""
             SELECT ?name ?type ?gid ?storey_name WHERE {{
                 ?e a bim:PhysicalElement .
                 ?e bim:hasCategory "Other" .
@@ -505,8 +580,8 @@ async def get_other_elements(
 async def get_node_types(ttl_file: str | None = None):
     """TTL 내 모든 고유 rdf:type 값과 인스턴스 수를 반환한다."""
     try:
-        store = _get_store_for_file(ttl_file)
-        rows = _run_query(store, """
+        store = await run_in_pool(_get_store_for_file, ttl_file)
+        rows = await _query(store, """
             SELECT ?type (COUNT(?s) AS ?count) WHERE {
                 ?s a ?type .
             } GROUP BY ?type ORDER BY DESC(?count)
@@ -531,8 +606,8 @@ async def get_node_types(ttl_file: str | None = None):
 async def get_node_predicates(ttl_file: str | None = None):
     """TTL 내 모든 고유 predicate와 사용 횟수를 반환한다."""
     try:
-        store = _get_store_for_file(ttl_file)
-        rows = _run_query(store, """
+        store = await run_in_pool(_get_store_for_file, ttl_file)
+        rows = await _query(store, """
             SELECT ?pred (COUNT(*) AS ?count) WHERE {
                 ?s ?pred ?o .
             } GROUP BY ?pred ORDER BY DESC(?count)
@@ -553,98 +628,145 @@ async def get_node_predicates(ttl_file: str | None = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _browse_nodes_sparql(store, col_list, type_filter, search, limit, offset) -> tuple[list, int]:
+    """인덱스가 없는 스토어용 노드 조회 (ORDER BY/LIMIT/OFFSET + COUNT 쿼리)."""
+    # 타입 필터 조건
+    type_clause = ""
+    if type_filter:
+        expanded = _expand_uri(type_filter)
+        type_clause = f"?subject a <{expanded}> ."
+
+    # 검색 조건
+    search_clause = ""
+    if search:
+        safe = search.replace('"', '\\"')
+        search_clause = f'FILTER(CONTAINS(LCASE(STR(?subject)), LCASE("{safe}")))'
+        # hasName이 컬럼에 있으면 이름으로도 검색
+        if col_list:
+            search_clause = (
+                f'FILTER(CONTAINS(LCASE(STR(?subject)), LCASE("{safe}"))'
+                f' || CONTAINS(LCASE(STR(?col0)), LCASE("{safe}")))'
+            )
+
+    # OPTIONAL 컬럼 패턴 생성
+    optional_clauses = []
+    select_vars = ["?subject"]
+    for i, col in enumerate(col_list):
+        var = f"?col{i}"
+        select_vars.append(var)
+        expanded_col = _expand_uri(col)
+        optional_clauses.append(f"OPTIONAL {{ ?subject <{expanded_col}> {var} }}")
+
+    # 노드 조회 쿼리
+    sparql = f"""
+        SELECT {" ".join(select_vars)} WHERE {{
+            {type_clause}
+            {chr(10).join(optional_clauses)}
+            {search_clause}
+        }} ORDER BY ?subject LIMIT {limit} OFFSET {offset}
+    """
+    rows = await _query(store, sparql)
+
+    # total count 별도 쿼리
+    count_sparql = f"""
+        SELECT (COUNT(DISTINCT ?subject) AS ?total) WHERE {{
+            {type_clause}
+            {search_clause if not col_list else ""}
+        }}
+    """
+    # 검색이 컬럼 값에도 걸리는 경우 count에도 반영
+    if search and col_list:
+        col0_expanded = _expand_uri(col_list[0])
+        safe = search.replace('"', '\\"')
+        count_sparql = f"""
+            SELECT (COUNT(DISTINCT ?subject) AS ?total) WHERE {{
+                {type_clause}
+                OPTIONAL {{ ?subject <{col0_expanded}> ?col0 }}
+                FILTER(CONTAINS(LCASE(STR(?subject)), LCASE("{safe}"))
+                 || CONTAINS(LCASE(STR(?col0)), LCASE("{safe}")))
+            }}
+        """
+    count_rows = await _query(store, count_sparql)
+    total = int(count_rows[0]["total"]) if count_rows else 0
+
+    result_rows = []
+    for r in rows:
+        values = []
+        for i in range(len(col_list)):
+            val = r.get(f"col{i}")
+            values.append(str(val) if val is not None else "")
+        result_rows.append((str(r.get("subject", "")), values))
+    return result_rows, total
+
+
+def _browse_nodes_indexed(store, col_list, type_filter, search, limit, offset, after) -> tuple[list, int, str | None]:
+    """정렬된 subject 인덱스에서 커서 다음 limit개 subject의 행을 만든다.
+
+    검색은 SPARQL 버전과 같이 subject URI 또는 첫 번째 컬럼 값에 대해 대소문자 무시 부분 일치이다.
+    """
+    col_uris = [URIRef(_expand_uri(c)) for c in col_list]
+    type_uri = URIRef(_expand_uri(type_filter)) if type_filter else None
+    needle = search.lower() if search else None
+    with store.reading():
+        subjects, total = store.subject_index.page(
+            type_uri, search, col_uris[0] if col_uris else None,
+            limit=limit, offset=offset, after=after,
+        )
+        graph = store.union_graph()
+        rows = []
+        for subject in subjects:
+            subject_match = needle is None or needle in str(subject).lower()
+            columns = [list(graph.objects(subject, p)) or [None] for p in col_uris]
+            for values in itertools.product(*columns):
+                # 첫 번째 컬럼 값으로만 검색에 걸린 subject는 일치하는 값의 행만 남긴다
+                if not subject_match and (values[0] is None or needle not in str(values[0]).lower()):
+                    continue
+                rows.append((str(subject), ["" if v is None else str(v) for v in values]))
+    next_cursor = encode_cursor(after=str(subjects[-1])) if len(subjects) == limit else None
+    return rows, total, next_cursor
+
+
 @router.get("/reasoning/nodes")
 async def browse_nodes(
     ttl_file: str | None = None,
     type_filter: str | None = None,
     columns: str | None = None,
     search: str | None = None,
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=10000),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="직전 응답의 next_cursor 값 (주면 offset 무시)"),
 ):
-    """노드 타입 필터 + 선택한 predicate 컬럼으로 노드 테이블 데이터를 반환한다."""
+    """노드 타입 필터 + 선택한 predicate 컬럼으로 노드 테이블 데이터를 반환한다.
+
+    로컬 스토어는 타입 필터별로 정렬된 subject 인덱스에서 페이지를 읽으므로 깊은 페이지도
+    첫 페이지와 비용이 같고, 필터별 전체 개수는 인덱스에 캐시된다. limit은 subject 수이며
+    (다중 값 컬럼은 subject 하나가 여러 행이 된다), 다음 페이지는 ``next_cursor``로 요청한다.
+    """
     try:
-        store = _get_store_for_file(ttl_file)
+        store = await run_in_pool(_get_store_for_file, ttl_file)
 
         col_list = [c.strip() for c in columns.split(",") if c.strip()] if columns else []
-
-        # 타입 필터 조건
-        type_clause = ""
-        if type_filter:
-            expanded = _expand_uri(type_filter)
-            type_clause = f"?subject a <{expanded}> ."
-
-        # 검색 조건
-        search_clause = ""
-        if search:
-            safe = search.replace('"', '\\"')
-            search_clause = f'FILTER(CONTAINS(LCASE(STR(?subject)), LCASE("{safe}")))'
-            # hasName이 컬럼에 있으면 이름으로도 검색
-            if col_list:
-                search_clause = (
-                    f'FILTER(CONTAINS(LCASE(STR(?subject)), LCASE("{safe}"))'
-                    f' || CONTAINS(LCASE(STR(?col0)), LCASE("{safe}")))'
-                )
-
-        # OPTIONAL 컬럼 패턴 생성
-        optional_clauses = []
-        select_vars = ["?subject"]
-        for i, col in enumerate(col_list):
-            var = f"?col{i}"
-            select_vars.append(var)
-            expanded_col = _expand_uri(col)
-            optional_clauses.append(f"OPTIONAL {{ ?subject <{expanded_col}> {var} }}")
-
-        # 노드 조회 쿼리
-        sparql = f"""
-            SELECT {" ".join(select_vars)} WHERE {{
-                {type_clause}
-                {chr(10).join(optional_clauses)}
-                {search_clause}
-            }} ORDER BY ?subject LIMIT {limit} OFFSET {offset}
-        """
-        rows = _run_query(store, sparql)
-
-        # total count 별도 쿼리
-        count_sparql = f"""
-            SELECT (COUNT(DISTINCT ?subject) AS ?total) WHERE {{
-                {type_clause}
-                {search_clause if not col_list else ""}
-            }}
-        """
-        # 검색이 컬럼 값에도 걸리는 경우 count에도 반영
-        if search and col_list:
-            col0_expanded = _expand_uri(col_list[0])
-            safe = search.replace('"', '\\"')
-            count_sparql = f"""
-                SELECT (COUNT(DISTINCT ?subject) AS ?total) WHERE {{
-                    {type_clause}
-                    OPTIONAL {{ ?subject <{col0_expanded}> ?col0 }}
-                    FILTER(CONTAINS(LCASE(STR(?subject)), LCASE("{safe}"))
-                     || CONTAINS(LCASE(STR(?col0)), LCASE("{safe}")))
-                }}
-            """
-        count_rows = _run_query(store, count_sparql)
-        total = int(count_rows[0]["total"]) if count_rows else 0
-
-        # 결과 포맷
-        result_rows = []
-        for r in rows:
-            subj = str(r.get("subject", ""))
-            values = []
-            for i in range(len(col_list)):
-                val = r.get(f"col{i}")
-                values.append(str(val) if val is not None else "")
-            result_rows.append({
-                "subject": _shorten_uri(subj),
-                "subject_uri": subj,
-                "values": values,
-            })
+        after = None
+        if cursor:
+            after, offset = decode_cursor(cursor, SUBJECT_KEY)
+            offset = offset or 0
+
+        if hasattr(store, "subject_index"):
+            rows, total, next_cursor = await run_in_pool(
+                _browse_nodes_indexed, store, col_list, type_filter, search, limit, offset, after,
+            )
+        else:
+            rows, total = await _browse_nodes_sparql(store, col_list, type_filter, search, limit, offset)
+            next_cursor = encode_cursor(offset=offset + limit) if len(rows) == limit else None
 
         return {
             "total": total,
             "columns": [_shorten_uri(c) if ":" not in c or c.startswith("http") else c for c in col_list],
-            "rows": result_rows,
+            "rows": [
+                {"subject": _shorten_uri(subj), "subject_uri": subj, "values": values}
+                for subj, values in rows
+            ],
+            "next_cursor": next_cursor,
         }
     except HTTPException:
         raise
@@ -660,9 +782,9 @@ async def get_node_detail(
 ):
     """특정 subject의 모든 (predicate, object) 쌍을 반환한다."""
     try:
-        store = _get_store_for_file(ttl_file)
+        store = await run_in_pool(_get_store_for_file, ttl_file)
         expanded = _expand_uri(subject)
-        rows = _run_query(store, f"""
+        rows = await _query(store, f"""
             SELECT ?pred ?obj WHERE {{
                 <{expanded}> ?pred ?obj .
             }} ORDER BY ?pred
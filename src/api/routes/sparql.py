@@ -1,10 +1,20 @@
 """SPARQL 쿼리 엔드포인트."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from ..models.request import SPARQLRequest
 from ..models.response import SPARQLResponse, ErrorResponse
-from ..utils.query_executor import execute_sparql
+from ..utils.query_executor import (
+    cache_stats,
+    execute_select_async,
+    execute_sparql_async,
+    get_store,
+    run_in_pool,
+    stream_sparql_async,
+)
+from ..utils.result_formats import STREAMING_TYPES, negotiate
+from ...converter import columnar_export
 
 router = APIRouter()
 
@@ -12,17 +22,85 @@ router = APIRouter()
 @router.post(
     "/sparql",
     response_model=SPARQLResponse,
-    responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    responses={
+        200: {"content": {media: {} for media in STREAMING_TYPES}},
+        400: {"model": ErrorResponse},
+        406: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        504: {"model": ErrorResponse},
+    },
     summary="SPARQL 쿼리 실행",
-    description="SPARQL SELECT 쿼리를 실행하고 결과를 JSON으로 반환합니다.",
+    description="SPARQL SELECT 쿼리를 실행하고 결과를 JSON으로 반환합니다. "
+                "제한 시간(BIM_QUERY_TIMEOUT)을 넘기면 쿼리를 취소하고 504를 반환합니다. "
+                "Accept 헤더가 application/x-ndjson, text/csv, text/tab-separated-values, "
+                "application/sparql-results+json이면 결과를 해당 포맷으로 청크 단위로 스트리밍합니다 "
+                "(BIM_STREAM_IDLE_TIMEOUT초 동안 읽지 않는 연결은 끊음).",
 )
-async def post_sparql(request: SPARQLRequest):
+async def post_sparql(request: SPARQLRequest, accept: str | None = Header(None)):
     try:
-        results = execute_sparql(request.query)
+        media_type = negotiate(accept)
+        if media_type is not None:
+            if not hasattr(get_store(), "select_rows"):
+                raise HTTPException(status_code=406, detail="현재 스토어는 스트리밍 결과를 지원하지 않습니다")
+            try:
+                body = await stream_sparql_async(request.query, media_type)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return StreamingResponse(body, media_type=f"{media_type}; charset=utf-8")
+
+        results = await execute_sparql_async(request.query)
         return SPARQLResponse(
             status="success",
             results=results,
             count=len(results),
         )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post(
+    "/sparql/export",
+    responses={
+        200: {"content": {media: {} for media in columnar_export.MEDIA_TYPES.values()}},
+        400: {"model": ErrorResponse},
+        501: {"model": ErrorResponse},
+        504: {"model": ErrorResponse},
+    },
+    summary="SPARQL 결과 컬럼 포맷 내보내기",
+    description="SPARQL SELECT 결과를 Arrow IPC 스트림(format=arrow) 또는 Parquet(format=parquet)으로 "
+                "반환합니다. 변수마다 한 컬럼이며 값 타입은 JSON 응답과 같습니다. 쿼리에는 "
+                "BIM_QUERY_TIMEOUT이 적용되며 pyarrow가 필요합니다.",
+)
+async def export_sparql(
+    request: SPARQLRequest,
+    format: str = Query(columnar_export.ARROW, pattern="^(arrow|parquet)$", description="arrow 또는 parquet"),
+):
+    try:
+        columnar_export.require_pyarrow()
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    if not hasattr(get_store(), "select_rows"):
+        raise HTTPException(status_code=501, detail="현재 스토어는 컬럼 내보내기를 지원하지 않습니다")
+    try:
+        variables, rows = await execute_select_async(request.query)
+        body = await run_in_pool(
+            lambda: columnar_export.to_bytes(columnar_export.rows_to_columns(variables, rows), format)
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    return Response(content=body, media_type=columnar_export.MEDIA_TYPES[format])
+
+
+@router.get(
+    "/cache/stats",
+    summary="쿼리 캐시 통계",
+    description="SPARQL 결과 캐시의 크기, 적중률, 무효화 횟수와 현재 그래프 세대를 반환합니다.",
+)
+async def get_cache_stats():
+    return cache_stats()
@@ -3,7 +3,7 @@
 from fastapi import APIRouter
 
 from ..models.response import OverallStats, CategoryStat, HierarchyNode
-from ..utils.query_executor import execute_sparql, get_store
+from ..utils.query_executor import execute_sparql_async, get_store, query_index
 from ..queries.templates import (
     get_component_statistics,
     get_building_hierarchy,
@@ -13,6 +13,23 @@ from ..queries.templates import (
 router = APIRouter()
 
 
+async def _category_rows() -> list[dict]:
+    """카테고리별 요소 수. 인덱스가 있으면 SPARQL 없이 계산한다."""
+    rows = await query_index("category_counts")
+    if rows is None:
+        rows = await execute_sparql_async(get_component_statistics())
+    return rows
+
+
+async def _overall_row() -> dict | None:
+    """전체 요소/카테고리/건물/층 수. 인덱스가 있으면 SPARQL 없이 계산한다."""
+    row = await query_index("overall_counts")
+    if row is None:
+        results = await execute_sparql_async(get_overall_statistics())
+        row = results[0] if results else None
+    return row
+
+
 @router.get(
     "/statistics",
     response_model=OverallStats,
@@ -23,16 +40,14 @@ async def overall_statistics():
     total_triples = store.count()
 
     # 카테고리별 통계
-    cat_results = execute_sparql(get_component_statistics())
     categories = [
         CategoryStat(category=r["category"], count=r["num"])
-        for r in cat_results
+        for r in await _category_rows()
     ]
 
     # 전체 통계
-    stats_results = execute_sparql(get_overall_statistics())
-    if stats_results:
-        s = stats_results[0]
+    s = await _overall_row()
+    if s:
         return OverallStats(
             total_triples=total_triples,
             total_elements=s.get("totalElements", 0),
@@ -57,10 +72,9 @@ async def overall_statistics():
     summary="카테고리별 통계",
 )
 async def category_statistics():
-    results = execute_sparql(get_component_statistics())
     return [
         CategoryStat(category=r["category"], count=r["num"])
-        for r in results
+        for r in await _category_rows()
     ]
 
 
@@ -69,7 +83,7 @@ async def category_statistics():
     summary="건물 계층 구조 조회",
 )
 async def building_hierarchy():
-    results = execute_sparql(get_building_hierarchy())
+    results = await execute_sparql_async(get_building_hierarchy())
     return results
 
 
@@ -87,7 +101,7 @@ async def graph_metadata():
         OPTIONAL { ?meta navis:totalPropertyValues ?totalProps }
     }
     '''
-    results = execute_sparql(query)
+    results = await execute_sparql_async(query)
     if results:
         r = results[0]
         return {
@@ -102,7 +116,7 @@ async def graph_metadata():
         ?obj navis:hasLevel ?level .
     }
     '''
-    fallback = execute_sparql(count_query)
+    fallback = await execute_sparql_async(count_query)
     if fallback:
         fb = fallback[0]
         return {
@@ -14,9 +14,9 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 
 from .routes import sparql, buildings, statistics
-from .routes import reasoning, properties, ontology_editor, lean_layer
+from .routes import reasoning, properties, ontology_editor, lean_layer, jobs
 from .utils.query_executor import init_store
-from ..storage import TripleStore
+from ..storage import TripleStore, create_store, load_with_snapshot
 
 # Optional imports for IFC processing (requires ifcopenshell)
 try:
@@ -35,17 +35,19 @@ import os
 # 기본 파일 경로 (환경변수로 오버라이드 가능)
 DEFAULT_IFC_PATH = os.getenv("BIM_IFC_PATH", "references/nwd4op-12.ifc")
 DEFAULT_RDF_PATH = os.getenv("BIM_RDF_PATH", "data/rdf/navis-via-csv-v3.ttl")
+# 로컬 스토어 백엔드 ("compact"이면 정수 ID 인코딩 저메모리 스토어)
+STORE_BACKEND = os.getenv("TRIPLESTORE_BACKEND", "local")
 
 
 def load_data(ifc_path: str | None = None, rdf_path: str | None = None) -> TripleStore:
     """IFC 파일 또는 기존 RDF 파일에서 데이터를 로딩한다."""
-    store = TripleStore()
+    store = create_store("compact") if STORE_BACKEND == "compact" else TripleStore()
 
-    # 기존 RDF 파일이 있으면 직접 로딩 (빠름)
+    # 기존 RDF 파일이 있으면 직접 로딩 (빠름, 최신 스냅샷이 있으면 스냅샷 사용)
     rdf_file = Path(rdf_path) if rdf_path else Path(DEFAULT_RDF_PATH)
     if rdf_file.exists():
         logger.info("기존 RDF 파일 로딩: %s", rdf_file)
-        store.load(str(rdf_file))
+        load_with_snapshot(store, rdf_file)
         return store
 
     # IFC 파일에서 변환 (ifcopenshell 필요)
@@ -119,6 +121,7 @@ def create_app(store: TripleStore | None = None) -> FastAPI:
     app.include_router(properties.router, prefix="/api", tags=["Properties"])
     app.include_router(ontology_editor.router, prefix="/api", tags=["Ontology"])
     app.include_router(lean_layer.router, prefix="/api", tags=["Lean Layer"])
+    app.include_router(jobs.router, prefix="/api", tags=["Jobs"])
 
     @app.get("/health", tags=["Health"])
     async def health():
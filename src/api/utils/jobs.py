@@ -0,0 +1,201 @@
+"""백그라운드 작업(job) 관리.
+
+추론, SHACL 검증, Lean CSV 주입은 대형 그래프에서 수 분이 걸리므로 요청 안에서 실행하면
+프록시 타임아웃에 걸리고, 운영자가 재시도하면서 같은 작업이 두 번 실행됩니다.
+JobManager는 작업을 전용 작업 풀(쿼리 풀과 별도)에 제출하고 job id를 돌려주며,
+``GET /api/jobs/{id}``로 상태/진행률/결과를 조회하고 취소할 수 있게 합니다.
+
+- 같은 dedupe 키(예: "reasoning")의 작업이 대기/실행 중이면 새로 실행하지 않고 기존 작업을 반환
+- 대기 중인 작업은 즉시 취소되고, 실행 중인 작업은 ``Job.check_cancelled()`` 지점에서 중단
+- 완료된 작업은 최근 BIM_JOB_HISTORY개까지만 보관
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("BIM_JOB_WORKERS", "2"))
+JOB_HISTORY = int(os.getenv("BIM_JOB_HISTORY", "100"))
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobCancelled(RuntimeError):
+    """실행 중인 작업이 취소 요청을 확인하고 중단할 때 발생한다."""
+
+
+@dataclass
+class Job:
+    kind: str
+    dedupe_key: Optional[str] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = PENDING
+    progress: dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    _future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def report(self, **progress) -> None:
+        """진행 상황을 갱신한다 (예: ``job.report(rows=10000)``)."""
+        self.progress = {**self.progress, **progress}
+
+    def check_cancelled(self) -> None:
+        """취소가 요청되었으면 JobCancelled를 발생시킨다. 작업 함수의 체크포인트에서 호출한다."""
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def to_dict(self) -> dict[str, Any]:
+        info = {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": self.progress,
+            "cancel_requested": self.cancel_requested,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.status == SUCCEEDED:
+            info["result"] = self.result
+        if self.error is not None:
+            info["error"] = self.error
+        return info
+
+
+class JobManager:
+    """작업 풀 기반 백그라운드 작업 관리자."""
+
+    def __init__(self, workers: int = JOB_WORKERS, history: int = JOB_HISTORY):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self._history = history
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self, kind: str, fn: Callable, *args, dedupe_key: Optional[str] = None,
+    ) -> Job:
+        """fn(job, *args)를 백그라운드에서 실행하는 작업을 제출한다.
+
+        Args:
+            kind: 작업 종류 ("reasoning", "validate", "lean_inject" 등)
+            fn: 실행할 함수. 첫 인자로 Job을 받아 report/check_cancelled를 호출할 수 있다.
+            dedupe_key: 같은 키의 작업이 대기/실행 중이면 그 작업을 그대로 반환한다.
+
+        Returns:
+            제출된 (또는 진행 중인 기존) Job
+        """
+        with self._lock:
+            if dedupe_key is not None:
+                for job in self._jobs.values():
+                    if job.dedupe_key == dedupe_key and not job.finished:
+                        logger.info("작업 중복 제출: %s → 기존 작업 %s 반환", kind, job.id)
+                        return job
+            job = Job(kind=kind, dedupe_key=dedupe_key)
+            self._jobs[job.id] = job
+            self._prune()
+            job._future = self._executor.submit(self._run, job, fn, args)
+        logger.info("작업 제출: %s (%s)", job.id, kind)
+        return job
+
+    def _run(self, job: Job, fn: Callable, args: tuple) -> None:
+        with self._lock:
+            if job.finished:
+                return
+            job.status = RUNNING
+            job.started_at = time.time()
+        try:
+            job.check_cancelled()
+            result = fn(job, *args)
+        except JobCancelled:
+            status, result, error = CANCELLED, None, None
+            logger.info("작업 취소됨: %s (%s)", job.id, job.kind)
+        except Exception as e:
+            status, result, error = FAILED, None, str(e) or type(e).__name__
+            logger.exception("작업 실패: %s (%s)", job.id, job.kind)
+        else:
+            status, error = SUCCEEDED, None
+        with self._lock:
+            job.result = result
+            job.error = error
+            job.finished_at = time.time()
+            job.status = status
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> list[Job]:
+        """작업 목록 (최근 제출 순)."""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """작업 취소를 요청한다. 대기 중이면 즉시 취소되고, 실행 중이면 체크포인트에서 중단된다."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+            job._cancel_event.set()
+            if job.status == PENDING and job._future is not None and job._future.cancel():
+                job.status = CANCELLED
+                job.finished_at = time.time()
+        logger.info("작업 취소 요청: %s (%s)", job_id, job.status)
+        return job
+
+    def wait(self, job_id: str, timeout: float | None = None) -> Optional[Job]:
+        """작업이 끝날 때까지 기다린다 (테스트/CLI용)."""
+        job = self.get(job_id)
+        if job is not None and job._future is not None and not job._future.cancelled():
+            job._future.result(timeout)
+        return job
+
+    def _prune(self) -> None:
+        """완료된 작업을 오래된 순으로 지워 보관 개수를 제한한다 (잠금 보유 상태에서 호출)."""
+        finished = [j for j in self._jobs.values() if j.finished]
+        excess = len(finished) - self._history
+        if excess > 0:
+            finished.sort(key=lambda j: j.finished_at or 0)
+            for job in finished[:excess]:
+                del self._jobs[job.id]
+
+
+_manager = JobManager()
+
+
+def get_job_manager() -> JobManager:
+    """전역 JobManager 인스턴스를 반환한다."""
+    return _manager
+
+
+def job_accepted(job: Job) -> JSONResponse:
+    """작업 제출 응답 (HTTP 202 + 상태 조회 URL)."""
+    return JSONResponse(
+        status_code=202,
+        content={**job.to_dict(), "status_url": f"/api/jobs/{job.id}"},
+    )
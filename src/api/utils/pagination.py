@@ -0,0 +1,77 @@
+"""커서(keyset) 페이지네이션 토큰.
+
+``LIMIT/OFFSET`` 페이지는 매번 앞선 행을 모두 건너뛰어야 하므로, 목록 API는 직전 페이지
+마지막 행의 정렬 키를 불투명한 ``next_cursor`` 토큰으로 돌려주고 다음 요청에서 그 키 다음부터
+이어 읽습니다. 토큰은 정렬 키 JSON을 base64url로 인코딩한 것이며, 인덱스가 없는 백엔드에서는
+정렬 키 대신 오프셋을 담습니다.
+"""
+
+import base64
+import json
+from typing import Any
+
+from fastapi import HTTPException
+
+
+def encode_cursor(after: Any = None, offset: int | None = None) -> str:
+    """정렬 키(after) 또는 오프셋을 커서 토큰으로 인코딩한다."""
+    payload = {"offset": offset} if after is None else {"after": after}
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _string(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _sort_value(value: Any) -> bool:
+    """graph_index의 정렬 값 (0, "") 또는 (1, 문자열)."""
+    return (isinstance(value, tuple) and len(value) == 2 and type(value[0]) is int
+            and value[0] in (0, 1) and isinstance(value[1], str))
+
+
+# 커서 정렬 키 형태: 검사 함수 또는 검사 함수의 튜플
+ELEMENT_KEY = (_sort_value, _sort_value, _string, _sort_value)   # graph_index.element_row_key
+CATEGORY_ELEMENT_KEY = (_sort_value, _string, _sort_value)       # graph_index.category_element_row_key
+SUBJECT_KEY = _string                                            # SubjectIndex.page (subject URI)
+
+
+def _matches(value: Any, shape) -> bool:
+    if callable(shape):
+        return shape(value)
+    return (isinstance(value, tuple) and len(value) == len(shape)
+            and all(_matches(v, s) for v, s in zip(value, shape)))
+
+
+def decode_cursor(token: str, after_shape=None) -> tuple[Any, int | None]:
+    """커서 토큰을 (정렬 키, 오프셋)으로 디코딩한다. 둘 중 하나만 값이 있다.
+
+    정렬 키 안의 리스트는 인덱스의 튜플 키와 비교할 수 있도록 튜플로 되돌리고, 인덱스에서
+    비교 오류가 나지 않도록 after_shape(ELEMENT_KEY 등)와 형태가 같은지 검사한다.
+    after_shape가 None이면 정렬 키 커서는 받지 않는다.
+
+    Raises:
+        HTTPException: 토큰 형식이나 정렬 키 형태가 올바르지 않을 때 (400)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token.encode("ascii") + b"=" * (-len(token) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        if not isinstance(payload, dict):
+            raise ValueError(payload)
+        if "after" in payload:
+            after = _to_tuple(payload["after"])
+            if after_shape is None or not _matches(after, after_shape):
+                raise ValueError(after)
+            return after, None
+        offset = payload["offset"]
+        if type(offset) is not int or offset < 0:
+            raise ValueError(offset)
+        return None, offset
+    except (ValueError, KeyError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다") from None
+
+
+def _to_tuple(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_to_tuple(v) for v in value)
+    return value
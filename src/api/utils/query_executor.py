@@ -1,18 +1,65 @@
 """SPARQL 쿼리 실행 유틸리티.
 
 TripleStore에 대한 쿼리 실행과 결과 포맷팅을 담당합니다.
+
+라우트 핸들러는 ``async def``이므로 rdflib 쿼리를 이벤트 루프에서 직접 실행하면
+무거운 쿼리 하나가 /health를 포함한 모든 요청을 막습니다. ``*_async`` 함수들은
+쿼리를 제한된 크기의 작업 스레드 풀에서 실행하고, 쿼리별 제한 시간을 넘기면
+협조적으로 취소한 뒤 QueryTimeoutError(HTTP 504)를 발생시킵니다.
+(그래프가 프로세스 메모리에 있으므로 프로세스 풀 대신 스레드 풀을 사용합니다.)
 """
 
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import Any
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import HTTPException
 
-from ...storage import TripleStore
+from ...cache import QueryCache
+from .result_formats import serialize_chunks
+from ...storage import QueryCancelled, TripleStore, load_with_snapshot
 
 logger = logging.getLogger(__name__)
 
 # 전역 스토어 인스턴스 (서버 시작 시 초기화)
 _store: TripleStore | None = None
 
+# 쿼리 결과 캐시: 스토어 세대(generation)가 바뀌면 한 번에 무효화되므로 TTL은 기본 비활성
+_cache = QueryCache(
+    max_size=int(os.getenv("BIM_QUERY_CACHE_SIZE", "256")),
+    ttl=int(os.getenv("BIM_QUERY_CACHE_TTL", "0")),
+)
+_cache_generation: int | None = None
+_cache_lock = threading.Lock()
+
+# 쿼리 작업 풀: 동시 실행 수와 쿼리별 제한 시간(초, 0이면 무제한)
+QUERY_WORKERS = int(os.getenv("BIM_QUERY_WORKERS", "4"))
+QUERY_TIMEOUT = float(os.getenv("BIM_QUERY_TIMEOUT", "30"))
+_executor = ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix="sparql")
+# 스트리밍 응답: 직렬화 전용 풀 크기, 미리 만들어 두는 최대 청크 수,
+# 클라이언트가 읽지 않을 때 직렬화를 중단하기까지의 시간(초, 0이면 무제한)
+STREAM_WORKERS = int(os.getenv("BIM_STREAM_WORKERS", "4"))
+STREAM_QUEUE_CHUNKS = int(os.getenv("BIM_STREAM_QUEUE_CHUNKS", "8"))
+STREAM_IDLE_TIMEOUT = float(os.getenv("BIM_STREAM_IDLE_TIMEOUT", "60"))
+_stream_executor = ThreadPoolExecutor(max_workers=STREAM_WORKERS, thread_name_prefix="sparql-stream")
+
+
+class QueryTimeoutError(HTTPException):
+    """쿼리가 제한 시간을 초과했을 때 발생한다 (HTTP 504)."""
+
+    def __init__(self, timeout: float):
+        super().__init__(
+            status_code=504,
+            detail=f"쿼리 실행 시간이 제한({timeout:g}초)을 초과했습니다",
+        )
+
 
 def get_store() -> TripleStore:
     """현재 TripleStore 인스턴스를 반환한다."""
@@ -25,27 +72,355 @@ def init_store(store: TripleStore):
     """전역 TripleStore를 설정한다."""
     global _store
     _store = store
+    invalidate_cache()
     logger.info("TripleStore 초기화 완료: %d 트리플", len(store))
 
 
+# ---------- 쿼리 캐시 ----------
+
+def invalidate_cache():
+    """쿼리 캐시를 비운다 (스토어 교체 시)."""
+    global _cache_generation
+    with _cache_lock:
+        _cache.invalidate()
+        _cache_generation = None
+
+
+def _sync_cache_generation(store) -> int | None:
+    """스토어 세대가 바뀌었으면 캐시를 한 번 무효화하고 현재 세대를 반환한다."""
+    global _cache_generation
+    generation = getattr(store, "generation", None)
+    if generation is not None and generation != _cache_generation:
+        if _cache_generation is not None:
+            _cache.invalidate()
+            logger.debug("쿼리 캐시 무효화: 세대 %s → %s", _cache_generation, generation)
+        _cache_generation = generation
+    return generation
+
+
+def _cache_lookup(store, key: str) -> tuple[int | None, Any]:
+    """(현재 세대, 캐시된 결과 또는 None)을 반환한다. 세대가 None이면 캐시하지 않는다."""
+    with _cache_lock:
+        generation = _sync_cache_generation(store)
+        if generation is None:
+            return None, None
+        return generation, _cache.get(key)
+
+
+def _cache_store(store, generation: int | None, key: str, result):
+    # 실행 중 그래프가 변경되었거나 스토어가 교체되었으면 결과를 캐시하지 않는다
+    if generation is not None and store.generation == generation:
+        with _cache_lock:
+            if store is _store:
+                _cache.put(key, result)
+
+
+def _cached(key: str, run: Callable):
+    """현재 스토어 세대 기준으로 캐시를 조회하고, 없으면 run(store)를 실행해 저장한다."""
+    store = get_store()
+    generation, cached = _cache_lookup(store, key)
+    if cached is not None:
+        return cached
+    result = run(store)
+    _cache_store(store, generation, key, result)
+    return result
+
+
 def execute_sparql(query: str) -> list[dict[str, Any]]:
-    """SPARQL 쿼리를 실행하고 결과를 반환한다."""
+    """SPARQL 쿼리를 실행하고 결과를 반환한다.
+
+    동일 쿼리는 그래프가 변경되기 전까지 캐시된 결과를 재사용한다.
+    """
+    return _cached(query, lambda store: store.query(query))
+
+
+def execute_sparql_rows(query: str) -> list:
+    """SPARQL 쿼리를 실행하고 rdflib ResultRow 리스트를 반환한다 (캐시 적용)."""
+    return _cached("rows:" + query, lambda store: store.query_rows(query))
+
+
+def cache_stats() -> dict[str, Any]:
+    """쿼리 캐시 통계와 현재 스토어 세대를 반환한다."""
+    with _cache_lock:
+        return {**_cache.stats, "generation": _cache_generation}
+
+
+# ---------- 작업 풀 실행 ----------
+
+async def run_in_pool(fn: Callable, *args, timeout: float | None = None):
+    """블로킹 함수를 쿼리 작업 풀에서 실행한다.
+
+    Args:
+        fn: 실행할 함수
+        timeout: 제한 시간(초). None 또는 0이면 무제한.
+
+    Raises:
+        QueryTimeoutError: 제한 시간 초과
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_executor, functools.partial(fn, *args))
+    if not timeout:
+        return await future
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        raise QueryTimeoutError(timeout) from None
+
+
+async def run_read(fn: Callable, *args):
+    """전역 스토어의 읽기 잠금을 잡고 fn을 작업 풀에서 실행한다.
+
+    SPARQL이 아닌 방식으로 ``store.graph``를 직접 순회하는 코드(SHACL, 스키마 조회 등)에 사용한다.
+    """
+    store = get_store()
+
+    def task():
+        with store.reading():
+            return fn(*args)
+
+    return await run_in_pool(task)
+
+
+async def run_write(
+    fn: Callable, *args, identifiers_changed: bool = True, changes_tracked: bool = False,
+):
+    """전역 스토어의 쓰기 잠금 하에 fn(graph, *args)을 작업 풀에서 실행한다.
+
+    실행 후 스토어 세대가 증가하므로 쿼리 캐시와 인덱스가 한 번 무효화된다.
+    identifiers_changed=False면 식별자 인덱스는 유지한다 (Lean 주입 등).
+    changes_tracked=True면 fn이 store.apply_delta로만 변경한다고 보고 dirty 노드 추적을 유지한다.
+    """
+    store = get_store()
+
+    def task():
+        with store.writing(identifiers_changed=identifiers_changed,
+                           changes_tracked=changes_tracked) as graph:
+            return fn(graph, *args)
+
+    return await run_in_pool(task)
+
+
+async def query_index(method: str, *args):
+    """GraphIndex 메서드를 읽기 잠금 하에 작업 풀에서 실행한다.
+
+    인덱스를 제공하지 않는 스토어면 None을 반환하며, 호출 측은 SPARQL로 대체한다.
+    """
     store = get_store()
-    return store.query(query)
+    if not hasattr(store, "index"):
+        return None
 
+    def task():
+        with store.reading():
+            return getattr(store.index, method)(*args)
 
-def reload_store(ttl_path: str) -> int:
+    return await run_in_pool(task)
+
+
+async def _execute_async(key: str, method: str, query: str, timeout: float | None):
+    store = get_store()
+    generation, cached = _cache_lookup(store, key)
+    if cached is not None:
+        return cached
+
+    if isinstance(store, TripleStore):
+        run = getattr(store, method)
+    else:
+        run = _ignore_cancel_event(getattr(store, method))
+    result = await _run_cancellable(run, query, timeout=timeout)
+
+    _cache_store(store, generation, key, result)
+    return result
+
+
+def _ignore_cancel_event(fn: Callable) -> Callable:
+    """cancel_event를 받지 않는 스토어 메서드를 감싼다."""
+    def run(*args, cancel_event=None):
+        return fn(*args)
+    return run
+
+
+async def _run_cancellable(fn: Callable, *args, timeout: float | None):
+    """fn(*args, cancel_event=...)을 작업 풀에서 제한 시간 안에 실행한다.
+
+    제한 시간을 넘기거나 요청이 취소되면 cancel_event를 설정해 작업 스레드도 중단시킨다.
+    """
+    timeout = QUERY_TIMEOUT if timeout is None else timeout
+    cancel_event = threading.Event()
+    try:
+        return await run_in_pool(functools.partial(fn, *args, cancel_event=cancel_event), timeout=timeout)
+    except QueryTimeoutError:
+        cancel_event.set()
+        logger.warning("쿼리 시간 초과 (%.1f초), 취소 요청", timeout)
+        raise
+    except asyncio.CancelledError:
+        # 클라이언트 연결 종료 등으로 요청이 취소되면 작업 스레드도 중단시킨다
+        cancel_event.set()
+        raise
+    except QueryCancelled:
+        raise QueryTimeoutError(timeout) from None
+
+
+async def run_read_cancellable(fn: Callable, *args, timeout: float | None = None):
+    """전역 스토어의 읽기 잠금 하에 fn(*args, cancel_event=...)을 쿼리와 같은 제한 시간/취소로 실행한다.
+
+    요소 테이블 내보내기처럼 SPARQL 없이 그래프를 오래 순회하는 작업에 사용하며, fn은
+    cancel_event가 설정되면 QueryCancelled를 발생시켜야 한다.
+
+    Raises:
+        QueryTimeoutError: 제한 시간 초과 (HTTP 504)
+    """
+    store = get_store()
+
+    def task(*task_args, cancel_event):
+        with store.reading():
+            return fn(*task_args, cancel_event=cancel_event)
+
+    return await _run_cancellable(task, *args, timeout=timeout)
+
+
+async def execute_sparql_async(query: str, timeout: float | None = None) -> list[dict[str, Any]]:
+    """execute_sparql의 비동기 버전. 작업 풀에서 제한 시간 내에 실행한다.
+
+    Args:
+        query: SPARQL 쿼리
+        timeout: 제한 시간(초). None이면 BIM_QUERY_TIMEOUT, 0이면 무제한.
+
+    Raises:
+        QueryTimeoutError: 제한 시간 초과 (HTTP 504)
+    """
+    return await _execute_async(query, "query", query, timeout)
+
+
+async def execute_sparql_rows_async(query: str, timeout: float | None = None) -> list:
+    """execute_sparql_rows의 비동기 버전."""
+    return await _execute_async("rows:" + query, "query_rows", query, timeout)
+
+
+async def execute_select_async(query: str, timeout: float | None = None) -> tuple[list[str], list[tuple]]:
+    """SELECT 결과를 (변수명 리스트, rdflib 용어 행 튜플 리스트)로 반환한다.
+
+    execute_sparql_async와 같은 작업 풀/제한 시간/취소/캐시 경로를 사용하며, 행 dict 변환이
+    없으므로 스트리밍 응답과 컬럼 내보내기가 잠금 밖에서 결과를 직렬화할 때 사용한다.
+
+    Raises:
+        QueryTimeoutError: 제한 시간 초과 (HTTP 504)
+        ValueError: SELECT 쿼리가 아닐 때
+    """
+    return await _execute_async("select:" + query, "select_rows", query, timeout)
+
+
+async def stream_sparql_async(
+    query: str, media_type: str, timeout: float | None = None,
+) -> AsyncIterator[bytes]:
+    """SELECT 결과를 포맷(result_formats)에 맞춰 청크 단위로 내보내는 비동기 이터레이터를 반환한다.
+
+    쿼리는 execute_select_async로 제한 시간 안에 평가하므로 쿼리 오류와 시간 초과는 응답 헤더를
+    보내기 전에 발생한다. 읽기 잠금과 쿼리 풀 스레드는 평가가 끝나면 놓고, 직렬화는 스트리밍 전용
+    풀(STREAM_WORKERS) 스레드가 최대 STREAM_QUEUE_CHUNKS개 청크를 담는 큐로 넘긴다. 따라서 느린
+    클라이언트는 쓰기 작업이나 다른 쿼리를 막지 않으며, 클라이언트가 STREAM_IDLE_TIMEOUT초 동안
+    읽지 않거나 연결을 끊으면 직렬화를 중단한다.
+
+    Raises:
+        QueryTimeoutError: 제한 시간 초과 (HTTP 504)
+        ValueError: SELECT 쿼리가 아닐 때
+    """
+    variables, rows = await execute_select_async(query, timeout)
+    cancel_event = threading.Event()
+    chunks: queue.Queue = queue.Queue(maxsize=STREAM_QUEUE_CHUNKS)
+
+    def put(item) -> bool:
+        """큐에 넣는다. 클라이언트가 유휴 제한 시간 동안 읽지 않으면 취소하고 False를 반환한다."""
+        deadline = time.monotonic() + STREAM_IDLE_TIMEOUT
+        while not cancel_event.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if STREAM_IDLE_TIMEOUT and time.monotonic() > deadline:
+                    logger.warning("SPARQL 스트리밍 클라이언트가 %.0f초 동안 읽지 않아 중단합니다",
+                                   STREAM_IDLE_TIMEOUT)
+                    cancel_event.set()
+        return False
+
+    def produce():
+        try:
+            for chunk in serialize_chunks(media_type, variables, rows):
+                if not put(("chunk", chunk.encode("utf-8"))):
+                    return
+            end = ("done", None)
+        except Exception as e:
+            end = ("error", e)
+        put(end)
+
+    def get():
+        while True:
+            try:
+                return chunks.get(timeout=0.1)
+            except queue.Empty:
+                if cancel_event.is_set():
+                    return "error", QueryCancelled()
+
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(_stream_executor, produce)
+
+    async def body():
+        try:
+            while True:
+                kind, value = await loop.run_in_executor(None, get)
+                if kind == "done":
+                    return
+                if kind == "error":
+                    # 헤더를 이미 보냈으므로 연결을 끊어 응답이 잘렸음을 알린다
+                    logger.error("SPARQL 스트리밍 중단: %r", value)
+                    raise value
+                yield value
+        finally:
+            cancel_event.set()
+
+    return body()
+
+
+def reload_store(
+    ttl_path: str,
+    progress: Callable[..., None] | None = None,
+    before_swap: Callable[[], None] | None = None,
+) -> int:
     """새로운 TTL 파일로 스토어를 다시 로드한다.
 
+    새 스토어는 잠금 없이 따로 로딩하고 인덱스까지 미리 만들어 두므로, 그동안 기존 스토어가
+    계속 쿼리를 처리한다. 교체 시에는 기존 스토어의 진행 중인 쿼리가 끝나기를 기다린 뒤
+    (drain) 전역 스토어와 쿼리 캐시를 한 번에 바꾼다.
+
     Args:
         ttl_path: 로드할 TTL 파일의 절대 경로
+        progress: 단계별 진행 상황을 받는 함수 (``progress(phase=..., ...)``)
+        before_swap: 교체 직전에 호출되는 함수. 예외를 던지면 교체하지 않는다 (작업 취소 등).
 
     Returns:
         로드된 트리플 수
     """
-    global _store
-    new_store = TripleStore()
-    new_store.load(ttl_path)
-    _store = new_store
-    logger.info("TripleStore 재로드 완료: %s (%d 트리플)", ttl_path, len(new_store))
+    global _store, _cache_generation
+    report = progress or (lambda **kw: None)
+    old_store = _store
+    # 현재 스토어와 동일한 백엔드(TripleStore/CompactTripleStore)로 로드
+    new_store = type(old_store)() if old_store is not None else TripleStore()
+
+    report(phase="loading", file=ttl_path)
+    start = time.time()
+    load_with_snapshot(new_store, ttl_path)
+    report(phase="indexing", triples=len(new_store), load_time=round(time.time() - start, 2))
+    if hasattr(new_store, "index"):
+        new_store.index
+
+    if before_swap is not None:
+        before_swap()
+    report(phase="draining")
+    drain = old_store.draining() if hasattr(old_store, "draining") else contextlib.nullcontext()
+    with drain, _cache_lock:
+        _store = new_store
+        _cache.invalidate()
+        _cache_generation = None
+    report(phase="swapped")
+    logger.info("TripleStore 재로드 완료: %s (%d 트리플, %.2f초)",
+                ttl_path, len(new_store), time.time() - start)
     return len(new_store)
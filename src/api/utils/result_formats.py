@@ -0,0 +1,168 @@
+"""SPARQL SELECT 결과 스트리밍 포맷.
+
+``Accept`` 헤더로 다음 포맷을 고르며, 결과 행을 모으지 않고 CHUNK_ROWS 행마다 문자열 청크로
+내보냅니다. 지원하지 않는 Accept(``application/json``, ``*/*`` 등)는 기존 JSON 응답을 사용합니다.
+
+- application/x-ndjson: 한 줄에 한 행 ``{변수: 값}`` (기존 JSON 응답의 results 항목과 같은 값)
+- text/csv: SPARQL 1.1 CSV (URI/리터럴의 문자열 값)
+- text/tab-separated-values: SPARQL 1.1 TSV (``?변수`` 헤더, N-Triples 표기 값)
+- application/sparql-results+json: SPARQL 1.1 JSON 결과 포맷
+"""
+
+import csv
+import io
+import json
+from typing import Callable, Iterable, Iterator
+
+from rdflib import BNode, Literal, URIRef
+
+from ...storage.graph_index import to_python_value
+
+NDJSON = "application/x-ndjson"
+CSV = "text/csv"
+TSV = "text/tab-separated-values"
+SPARQL_JSON = "application/sparql-results+json"
+STREAMING_TYPES = (NDJSON, CSV, TSV, SPARQL_JSON)
+
+# 한 번에 내보내는 행 수
+CHUNK_ROWS = 1000
+
+
+def negotiate(accept: str | None) -> str | None:
+    """Accept 헤더에서 q 값이 가장 높은 스트리밍 포맷을 고른다. 없으면 None (기존 JSON 응답)."""
+    if not accept:
+        return None
+    best, best_q = None, 0.0
+    for part in accept.split(","):
+        media, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        media = media.lower()
+        # 더 높은 q만 교체하므로 같은 q면 먼저 나온 타입이 이긴다
+        if q > best_q and media in STREAMING_TYPES:
+            best, best_q = media, q
+        elif q > best_q and media in ("application/json", "*/*", "application/*"):
+            best, best_q = None, q
+    return best
+
+
+def _json_value(value):
+    return value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+
+
+def _ndjson(variables: list[str]) -> tuple[str, Callable, str]:
+    def row(values: tuple) -> str:
+        return json.dumps(
+            {var: _json_value(to_python_value(v)) for var, v in zip(variables, values)},
+            ensure_ascii=False,
+        ) + "\n"
+    return "", row, ""
+
+
+def _delimited(variables: list[str], delimiter: str, header: list[str], cell: Callable) -> tuple[str, Callable, str]:
+    buf = io.StringIO()
+    if delimiter == ",":
+        writer = csv.writer(buf, lineterminator="\r\n")
+    else:
+        writer = csv.writer(buf, delimiter=delimiter, lineterminator="\n",
+                            quoting=csv.QUOTE_NONE, escapechar=None, quotechar=None)
+
+    def line(values: list[str]) -> str:
+        writer.writerow(values)
+        text = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return text
+
+    return line(header), lambda values: line([cell(v) for v in values]), ""
+
+
+def _csv_cell(value) -> str:
+    return "" if value is None else str(value)
+
+
+_NT_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+def _tsv_cell(value) -> str:
+    """N-Triples 표기. 리터럴의 탭/줄바꿈은 이스케이프하므로 한 행이 한 줄에 유지된다."""
+    if value is None:
+        return ""
+    if isinstance(value, Literal):
+        text = '"' + str(value).translate(_NT_ESCAPES) + '"'
+        if value.language:
+            return f"{text}@{value.language}"
+        if value.datatype:
+            return f"{text}^^<{value.datatype}>"
+        return text
+    return value.n3()
+
+
+def _sparql_json_term(value) -> dict:
+    if isinstance(value, URIRef):
+        return {"type": "uri", "value": str(value)}
+    if isinstance(value, BNode):
+        return {"type": "bnode", "value": str(value)}
+    term = {"type": "literal", "value": str(value)}
+    if isinstance(value, Literal):
+        if value.language:
+            term["xml:lang"] = value.language
+        elif value.datatype:
+            term["datatype"] = str(value.datatype)
+    return term
+
+
+def _sparql_json(variables: list[str]) -> tuple[str, Callable, str]:
+    head = json.dumps({"head": {"vars": variables}}, ensure_ascii=False)[:-1]
+    first = True
+
+    def row(values: tuple) -> str:
+        nonlocal first
+        binding = {var: _sparql_json_term(v) for var, v in zip(variables, values) if v is not None}
+        text = ("" if first else ",") + json.dumps(binding, ensure_ascii=False)
+        first = False
+        return text
+
+    return head + ',"results":{"bindings":[', row, "]}}"
+
+
+def _writer(media_type: str, variables: list[str]) -> tuple[str, Callable, str]:
+    if media_type == NDJSON:
+        return _ndjson(variables)
+    if media_type == CSV:
+        return _delimited(variables, ",", variables, _csv_cell)
+    if media_type == TSV:
+        return _delimited(variables, "\t", [f"?{v}" for v in variables], _tsv_cell)
+    if media_type == SPARQL_JSON:
+        return _sparql_json(variables)
+    raise ValueError(f"지원하지 않는 결과 포맷: {media_type}")
+
+
+def serialize_chunks(
+    media_type: str, variables: list[str], rows: Iterable[tuple], chunk_rows: int = CHUNK_ROWS,
+) -> Iterator[str]:
+    """결과 행을 포맷에 맞춰 청크 문자열로 내보낸다. 첫 행은 바로 내보내 응답을 빨리 시작한다.
+
+    Args:
+        media_type: STREAMING_TYPES 중 하나
+        variables: SELECT 변수명
+        rows: 변수 순서대로 rdflib 용어(미바인딩은 None) 튜플
+    """
+    head, row, tail = _writer(media_type, variables)
+    buffer = [head]
+    pending = 0
+    flushed = False
+    for values in rows:
+        buffer.append(row(values))
+        pending += 1
+        if pending >= chunk_rows or not flushed:
+            yield "".join(buffer)
+            buffer, pending, flushed = [], 0, True
+    buffer.append(tail)
+    yield "".join(buffer)
@@ -1,3 +1,4 @@
+from .graph_registry import GraphRegistry
 from .query_cache import QueryCache
 
-__all__ = ["QueryCache"]
+__all__ = ["GraphRegistry", "QueryCache"]
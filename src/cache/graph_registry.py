@@ -0,0 +1,171 @@
+"""로딩된 RDF 파일 레지스트리.
+
+``ttl_file`` 파라미터로 다른 파일을 조회할 때마다 TTL을 다시 파싱하지 않도록,
+파일별로 로딩한 스토어를 메모리 예산 안에서 LRU로 보관합니다.
+
+- 키는 (절대 경로, mtime_ns, 크기)이므로 파일이 바뀌면 자동으로 다시 로딩합니다.
+- 메모리 사용량은 트리플 수 x BYTES_PER_TRIPLE로 추정하고, 예산을 넘으면 가장 오래
+  사용되지 않은 항목부터 내보냅니다. 방금 로딩한 항목은 예산보다 커도 내보내지 않습니다.
+- 같은 파일을 동시에 요청하면 첫 요청만 로딩하고 나머지는 같은 Future를 기다립니다.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# rdflib 메모리 스토어 + 인덱스의 트리플당 대략적인 메모리 사용량 (바이트)
+BYTES_PER_TRIPLE = 1500
+
+
+@dataclass
+class _Entry:
+    store: Any
+    key: tuple
+    triples: int
+    estimated_bytes: int
+    load_time: float
+    loaded_at: float
+    hits: int = 0
+
+
+class GraphRegistry:
+    """메모리 예산 기반 LRU 파일 스토어 레지스트리.
+
+    Args:
+        loader: 파일 경로를 받아 로딩된 스토어를 반환하는 함수
+        budget_bytes: 보관할 스토어의 추정 메모리 합계 상한
+        bytes_per_triple: 트리플당 추정 메모리 사용량
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Path], Any],
+        budget_bytes: int,
+        bytes_per_triple: int = BYTES_PER_TRIPLE,
+    ):
+        self._loader = loader
+        self._budget = budget_bytes
+        self._bytes_per_triple = bytes_per_triple
+        self._entries: OrderedDict[Path, _Entry] = OrderedDict()
+        self._loading: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._shared_loads = 0
+        self._evictions = 0
+
+    def get(self, path: str | Path):
+        """파일의 스토어를 반환한다. 없거나 파일이 바뀌었으면 로딩한다.
+
+        Raises:
+            FileNotFoundError: 파일이 없을 때
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (path, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.key == key:
+                self._entries.move_to_end(path)
+                entry.hits += 1
+                self._hits += 1
+                return entry.store
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._loading[key] = future
+                self._misses += 1
+            else:
+                self._shared_loads += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            start = time.time()
+            store = self._loader(path)
+            elapsed = time.time() - start
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+
+        triples = len(store)
+        inferred = getattr(store, "inferred", None)
+        if inferred is not None:
+            triples += len(inferred)
+        entry = _Entry(
+            store=store,
+            key=key,
+            triples=triples,
+            estimated_bytes=triples * self._bytes_per_triple,
+            load_time=elapsed,
+            loaded_at=time.time(),
+        )
+        with self._lock:
+            self._entries.pop(path, None)
+            self._entries[path] = entry
+            self._evict(keep=path)
+            del self._loading[key]
+        future.set_result(store)
+        logger.info("그래프 레지스트리 로딩: %s (%d 트리플, %.2f초)", path.name, triples, elapsed)
+        return store
+
+    def _evict(self, keep: Path):
+        """예산을 넘는 동안 LRU 항목을 내보낸다. (락 보유 상태에서 호출)"""
+        used = sum(e.estimated_bytes for e in self._entries.values())
+        while used > self._budget:
+            path = next(iter(self._entries))
+            if path == keep:
+                break
+            used -= self._entries.pop(path).estimated_bytes
+            self._evictions += 1
+            logger.info("그래프 레지스트리 제거 (메모리 예산 초과): %s", path.name)
+
+    def invalidate(self, path: str | Path | None = None) -> int:
+        """지정 파일(None이면 전체) 항목을 제거하고 제거한 항목 수를 반환한다."""
+        with self._lock:
+            if path is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            return 1 if self._entries.pop(Path(path).resolve(), None) is not None else 0
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            entries = [
+                {
+                    "file": path.name,
+                    "triples": e.triples,
+                    "estimated_mb": round(e.estimated_bytes / 2**20, 1),
+                    "hits": e.hits,
+                    "load_time": round(e.load_time, 2),
+                    "loaded_at": e.loaded_at,
+                }
+                for path, e in reversed(self._entries.items())
+            ]
+            used = sum(e.estimated_bytes for e in self._entries.values())
+            total = self._hits + self._misses
+            return {
+                "size": len(entries),
+                "budget_mb": round(self._budget / 2**20, 1),
+                "used_mb": round(used / 2**20, 1),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": f"{self._hits / total if total else 0.0:.1%}",
+                "shared_loads": self._shared_loads,
+                "evictions": self._evictions,
+                "loading": len(self._loading),
+                "entries": entries,
+            }
@@ -5,12 +5,23 @@
 
 import hashlib
 import logging
+import re
 import time
 from collections import OrderedDict
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# 캐시 키 정규화용 토큰: 문자열 리터럴과 IRI는 그대로 두고, 그 밖의 공백/주석만 공백 하나로 줄인다
+_KEY_TOKEN = re.compile(
+    r'''(?P<keep>"""(?:[^"\\]|\\.|"(?!""))*"""'''
+    r"""|'''(?:[^'\\]|\\.|'(?!''))*'''"""
+    r'''|"(?:[^"\\\n]|\\.)*"'''
+    r"""|'(?:[^'\\\n]|\\.)*'"""
+    r"""|<[^<>"{}|^`\\\s]*>)"""
+    r"""|(?P<space>(?:\s|\#[^\n]*)+)"""
+)
+
 
 class QueryCache:
     """LRU 기반 SPARQL 쿼리 결과 캐시.
@@ -26,6 +37,7 @@ class QueryCache:
         self._ttl = ttl
         self._hits = 0
         self._misses = 0
+        self._invalidations = 0
 
     def get(self, query: str) -> Any | None:
         """캐시에서 쿼리 결과를 조회한다."""
@@ -54,6 +66,7 @@ class QueryCache:
     def invalidate(self):
         """전체 캐시를 초기화한다."""
         self._cache.clear()
+        self._invalidations += 1
 
     @property
     def size(self) -> int:
@@ -72,8 +85,11 @@ class QueryCache:
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": f"{self.hit_rate:.1%}",
+            "invalidations": self._invalidations,
         }
 
     def _key(self, query: str) -> str:
-        normalized = " ".join(query.split())
+        normalized = _KEY_TOKEN.sub(
+            lambda m: m.group("keep") if m.group("keep") is not None else " ", query
+        ).strip()
         return hashlib.sha256(normalized.encode()).hexdigest()[:16]
@@ -10,7 +10,7 @@ from typing import Any
 import httpx
 
 from ...parser import IFCParser
-from ...converter import RDFConverter
+from ...converter import RDFConverter, columnar_export
 from ...storage import TripleStore
 from ...api.queries.templates import (
     PREFIXES,
@@ -92,6 +92,24 @@ class BIMOntologyClient:
             return self._store.query(sparql)
         return self._api_query(sparql)
 
+    def query_table(self, sparql: str):
+        """SPARQL SELECT 결과를 pyarrow Table로 반환한다 (pyarrow 필요).
+
+        원격 모드는 /api/sparql/export의 Arrow IPC 스트림을 받으므로 행별 JSON 변환이 없다.
+        ``.to_pandas()``로 DataFrame을 만들 수 있다.
+        """
+        pa = columnar_export.require_pyarrow()
+        if self._store:
+            return columnar_export.to_table(columnar_export.select_columns(self._store, sparql))
+        r = httpx.post(
+            f"{self._api_url}/api/sparql/export",
+            params={"format": columnar_export.ARROW},
+            json={"query": sparql},
+            timeout=30,
+        )
+        r.raise_for_status()
+        return pa.ipc.open_stream(r.content).read_all()
+
     def get_buildings(self) -> list[dict]:
         """모든 건물을 조회한다."""
         return self.query(get_all_buildings())
@@ -0,0 +1,255 @@
+"""SPARQL 결과와 요소 테이블의 컬럼 포맷(Arrow IPC / Parquet) 내보내기.
+
+분석 도구가 /api/sparql JSON이나 BIMOntologyClient.query로 데이터를 받으면 행마다 dict를
+만들고 JSON으로 인코딩/디코딩하는 비용이 듭니다. 이 모듈은 결과를 변수(컬럼)별 리스트로 모은 뒤
+pyarrow Table로 만들어 Arrow IPC 스트림 또는 Parquet으로 씁니다 (pandas에서는
+``pyarrow.ipc.open_stream(...).read_pandas()`` / ``pandas.read_parquet``로 바로 읽음).
+
+- select_columns: SELECT 결과 → 컬럼
+- element_columns: 물리 요소 평탄화 테이블 (ObjectId, 이름, 카테고리, 레벨, 계층 경로,
+  BoundingBox, SP3D 속성 피벗) → 컬럼
+
+pyarrow는 선택 의존성이며 테이블을 만들거나 쓸 때만 import합니다.
+
+Usage:
+    python -m src.converter.columnar_export elements data/rdf/model.ttl elements.parquet
+    python -m src.converter.columnar_export query data/rdf/model.ttl result.arrow --query "SELECT ..."
+"""
+
+import io
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable
+
+from rdflib import Graph, Literal, RDF
+
+from .navis_to_rdf import BIM, BSO, NAVIS, SP3D
+from ..storage.graph_index import to_python_value
+from ..storage.triple_store import QueryCancelled
+
+logger = logging.getLogger(__name__)
+
+ARROW = "arrow"
+PARQUET = "parquet"
+MEDIA_TYPES = {
+    ARROW: "application/vnd.apache.arrow.stream",
+    PARQUET: "application/vnd.apache.parquet",
+}
+_SUFFIX_FORMATS = {".arrow": ARROW, ".arrows": ARROW, ".parquet": PARQUET}
+
+# 요소 테이블의 BoundingBox 컬럼 (bso 프레디킷)
+_BBOX_COLUMNS = (
+    ("bbox_min_x", BSO.minX), ("bbox_min_y", BSO.minY), ("bbox_min_z", BSO.minZ),
+    ("bbox_max_x", BSO.maxX), ("bbox_max_y", BSO.maxY), ("bbox_max_z", BSO.maxZ),
+    ("centroid_x", BSO.centroidX), ("centroid_y", BSO.centroidY), ("centroid_z", BSO.centroidZ),
+    ("volume", BSO.volume),
+)
+# 계층 경로 구분자 (SP3D System Path와 동일)
+PATH_SEPARATOR = "\\"
+_MAX_PATH_DEPTH = 64
+
+
+def require_pyarrow():
+    """pyarrow 모듈을 반환한다. 없으면 설치 안내와 함께 ImportError를 낸다."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "pyarrow not installed. Install with: pip install 'bim-ontology[columnar]'"
+        ) from None
+    return pyarrow
+
+
+def format_for_path(path: str | Path) -> str:
+    """출력 파일 확장자(.arrow/.arrows/.parquet)에서 포맷을 정한다."""
+    suffix = Path(path).suffix.lower()
+    if suffix not in _SUFFIX_FORMATS:
+        raise ValueError(f"지원하지 않는 출력 확장자: {suffix} (.arrow, .parquet)")
+    return _SUFFIX_FORMATS[suffix]
+
+
+# ---------- 컬럼 수집 ----------
+
+def rows_to_columns(variables: list[str], rows: Iterable[tuple]) -> dict[str, list]:
+    """변수 순서대로의 rdflib 용어 행 튜플을 {변수: 파이썬 값 리스트}로 바꾼다."""
+    columns: dict[str, list] = {var: [] for var in variables}
+    targets = list(columns.values())
+    for row in rows:
+        for target, value in zip(targets, row):
+            target.append(to_python_value(value))
+    return columns
+
+
+def select_columns(store, sparql: str) -> dict[str, list]:
+    """SELECT 결과를 {변수: 값 리스트}로 모은다. 값은 TripleStore.query()와 같은 파이썬 값이다.
+
+    로컬 스토어는 select_stream으로 행 dict를 만들지 않고 바로 컬럼에 담는다.
+    """
+    if hasattr(store, "select_stream"):
+        with store.select_stream(sparql) as (variables, rows):
+            return rows_to_columns(variables, rows)
+
+    results = store.query(sparql)
+    names = list(dict.fromkeys(name for row in results for name in row))
+    return {name: [row.get(name) for row in results] for name in names}
+
+
+def _first(graph: Graph, subject, predicate):
+    """값이 여러 개면 문자열 순으로 첫 값을 고른다 (결정적 출력)."""
+    values = list(graph.objects(subject, predicate))
+    if not values:
+        return None
+    return to_python_value(min(values, key=str) if len(values) > 1 else values[0])
+
+
+def element_columns(graph: Graph, cancel_event: threading.Event | None = None) -> dict[str, list]:
+    """물리 요소(bim:PhysicalElement)를 한 행씩 평탄화한 테이블 컬럼을 만든다.
+
+    계층 경로는 sp3d:hasSystemPath가 있으면 그 값을, 없으면 navis:hasParent 조상 이름을
+    PATH_SEPARATOR로 이어 만든다. SP3D 속성(sp3d:*, System Path 제외)은 ``sp3d_<이름>``
+    컬럼으로 피벗하며 값이 없는 요소는 None이다.
+
+    Raises:
+        QueryCancelled: cancel_event가 설정되었을 때 (요소 단위로 확인)
+    """
+    start = time.time()
+    elements = sorted(graph.subjects(RDF.type, BIM.PhysicalElement, unique=True), key=str)
+    paths: dict[Any, str | None] = {}
+
+    def parent_path(node, depth: int = 0) -> str | None:
+        """node까지의 이름 경로 (node 포함)."""
+        if node in paths:
+            return paths[node]
+        name = _first(graph, node, BIM.hasName)
+        parent = graph.value(node, NAVIS.hasParent)
+        prefix = parent_path(parent, depth + 1) if parent is not None and depth < _MAX_PATH_DEPTH else None
+        parts = [p for p in (prefix, name) if p]
+        paths[node] = PATH_SEPARATOR.join(str(p) for p in parts) or None
+        return paths[node]
+
+    rows = []
+    sp3d_columns: dict[str, None] = {}
+    for elem in elements:
+        if cancel_event is not None and cancel_event.is_set():
+            raise QueryCancelled()
+        path = _first(graph, elem, SP3D.hasSystemPath)
+        if path is None:
+            parent = graph.value(elem, NAVIS.hasParent)
+            path = parent_path(parent) if parent is not None else None
+        row = {
+            "uri": str(elem),
+            "object_id": _first(graph, elem, NAVIS.hasObjectId),
+            "global_id": _first(graph, elem, BIM.hasGlobalId),
+            "name": _first(graph, elem, BIM.hasName),
+            "category": _first(graph, elem, BIM.hasCategory),
+            "level": _first(graph, elem, NAVIS.hasLevel),
+            "hierarchy_path": path,
+        }
+        bbox = graph.value(elem, BSO.hasBoundingBox)
+        for column, predicate in _BBOX_COLUMNS:
+            row[column] = _first(graph, bbox, predicate) if bbox is not None else None
+
+        sp3d = {}
+        for predicate, value in graph.predicate_objects(elem):
+            if (isinstance(value, Literal) and str(predicate).startswith(str(SP3D))
+                    and predicate != SP3D.hasSystemPath):
+                column = "sp3d_" + str(predicate)[len(str(SP3D)):]
+                if column not in sp3d or str(value) < str(sp3d[column]):
+                    sp3d[column] = value
+        for column, value in sp3d.items():
+            sp3d_columns[column] = None
+            row[column] = to_python_value(value)
+        rows.append(row)
+
+    base = ["uri", "object_id", "global_id", "name", "category", "level", "hierarchy_path"]
+    names = base + [c for c, _ in _BBOX_COLUMNS] + sorted(sp3d_columns)
+    columns = {name: [row.get(name) for row in rows] for name in names}
+    logger.info("요소 테이블 생성: %d행, SP3D 속성 %d개 (%.2f초)",
+                len(rows), len(sp3d_columns), time.time() - start)
+    return columns
+
+
+# ---------- Arrow / Parquet ----------
+
+def to_table(columns: dict[str, list]):
+    """컬럼을 pyarrow Table로 만든다. 타입이 섞인 컬럼은 문자열 컬럼으로 만든다."""
+    pa = require_pyarrow()
+    arrays = {}
+    for name, values in columns.items():
+        try:
+            arrays[name] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays[name] = pa.array([None if v is None else str(v) for v in values], type=pa.string())
+    return pa.table(arrays)
+
+
+def write_table(table, sink: str | Path | BinaryIO, fmt: str) -> None:
+    """Table을 Arrow IPC 스트림 또는 Parquet으로 쓴다."""
+    pa = require_pyarrow()
+    if fmt == ARROW:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    elif fmt == PARQUET:
+        import pyarrow.parquet as pq
+        pq.write_table(table, sink)
+    else:
+        raise ValueError(f"지원하지 않는 포맷: {fmt} (arrow, parquet)")
+
+
+def to_bytes(columns: dict[str, list], fmt: str) -> bytes:
+    """컬럼을 포맷에 맞춘 바이트로 직렬화한다 (API 응답용)."""
+    if fmt not in MEDIA_TYPES:
+        raise ValueError(f"지원하지 않는 포맷: {fmt} (arrow, parquet)")
+    buf = io.BytesIO()
+    write_table(to_table(columns), buf, fmt)
+    return buf.getvalue()
+
+
+def export_columns(columns: dict[str, list], output_path: str | Path, fmt: str | None = None) -> int:
+    """컬럼을 파일로 쓰고 행 수를 반환한다. fmt가 None이면 확장자로 정한다."""
+    fmt = fmt or format_for_path(output_path)
+    table = to_table(columns)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    write_table(table, str(output_path), fmt)
+    logger.info("컬럼 내보내기: %s (%d행, %d열, %s)", output_path, table.num_rows, table.num_columns, fmt)
+    return table.num_rows
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from ..storage import TripleStore, load_with_snapshot
+
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="RDF → Arrow IPC / Parquet 컬럼 내보내기")
+    parser.add_argument("table", choices=["elements", "query"],
+                        help="elements: 요소 평탄화 테이블, query: SELECT 결과")
+    parser.add_argument("rdf_path", help="입력 RDF 파일 (.ttl, 최신 스냅샷이 있으면 사용)")
+    parser.add_argument("output_path", help="출력 파일 (.arrow 또는 .parquet)")
+    parser.add_argument("--query", default=None, help="SELECT 쿼리 문자열 (table=query)")
+    parser.add_argument("--query-file", default=None, help="SELECT 쿼리 파일 (table=query)")
+    parser.add_argument("--format", choices=[ARROW, PARQUET], default=None,
+                        help="출력 포맷 (기본: 확장자로 결정)")
+    args = parser.parse_args()
+
+    store = TripleStore()
+    load_with_snapshot(store, args.rdf_path, write=False)
+
+    if args.table == "elements":
+        with store.reading():
+            columns = element_columns(store.union_graph())
+    else:
+        sparql = args.query or (Path(args.query_file).read_text(encoding="utf-8") if args.query_file else None)
+        if not sparql:
+            parser.error("table=query에는 --query 또는 --query-file이 필요합니다")
+        columns = select_columns(store, sparql)
+
+    try:
+        rows = export_columns(columns, args.output_path, args.format)
+    except ImportError as e:
+        sys.exit(str(e))
+    print(f"Exported {rows} rows × {len(columns)} columns → {args.output_path}")
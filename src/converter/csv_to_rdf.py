@@ -55,13 +55,22 @@ TYPE_MAP = {
 class CSVToRDFInjector:
     """CSV 데이터를 RDF 그래프에 직접 주입한다."""
 
-    def __init__(self, graph: Graph):
+    def __init__(self, graph: Graph, identifiers=None):
+        """
+        Args:
+            graph: 주입 대상 RDF 그래프
+            identifiers: 식별자 인덱스 (``TripleStore.identifiers``). 없으면 행마다 SPARQL로 찾는다.
+        """
         self._graph = graph
+        self._identifiers = identifiers
         self._globalid_cache: dict[str, URIRef] = {}
         self._objectid_cache: dict[str, URIRef] = {}
 
     def _resolve_element(self, global_id: str = "", object_id: str = "") -> Optional[URIRef]:
         """GlobalId 또는 ObjectId/SyncID로 RDF 그래프에서 요소 URI를 찾는다."""
+        if self._identifiers is not None:
+            return self._identifiers.resolve(global_id, object_id)
+
         if global_id:
             if global_id in self._globalid_cache:
                 return self._globalid_cache[global_id]
@@ -2,11 +2,20 @@
 
 IFC 파일의 엔티티를 ifcOWL 기반 RDF 트리플로 변환합니다.
 공간 구조, 물리적 요소, 속성, 관계를 모두 변환합니다.
+
+``convert_ifc_to_rdf(..., workers=N)``은 변환 단계와 물리 요소 타입을 N개 워커
+프로세스에 나눠 N-Triples/Turtle 샤드로 기록한 뒤 정렬 병합합니다. 각 워커가
+IFC를 직접 다시 열고 같은 분배 계획을 계산하므로 부모 프로세스는 IFC를 열지 않으며,
+결과 트리플 집합은 순차 변환과 같고 출력은 워커 수와 무관하게 동일합니다.
 """
 
+import heapq
 import logging
+import tempfile
 import time
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Optional
 
 from rdflib import Graph, Literal, URIRef, RDF, RDFS, OWL, XSD
 
@@ -21,6 +30,34 @@ from ..parser.ifc_parser import IFCParser, classify_element_name
 
 logger = logging.getLogger(__name__)
 
+# convert_file의 변환 단계 (순서대로 실행)
+CONVERSION_STEPS = (
+    "schema",
+    "spatial_structure",
+    "physical_elements",
+    "aggregation_relations",
+    "containment_relations",
+    "property_sets",
+    "quantities",
+    "materials",
+    "classifications",
+)
+
+# 병렬 분배 시 단계별 작업량 추정에 쓰는 원본 엔티티 타입 (physical_elements는 타입별로 분할)
+STEP_SOURCE_TYPES = {
+    "schema": (),
+    "spatial_structure": ("IfcProject", "IfcSite", "IfcBuilding", "IfcBuildingStorey", "IfcSpace"),
+    "aggregation_relations": ("IfcRelAggregates",),
+    "containment_relations": ("IfcRelContainedInSpatialStructure",),
+    "property_sets": ("IfcRelDefinesByProperties",),
+    "quantities": ("IfcRelDefinesByProperties",),
+    "materials": ("IfcRelAssociatesMaterial",),
+    "classifications": ("IfcRelAssociatesClassification",),
+}
+
+# 병합 시 한 번에 기록하는 줄 수
+MERGE_BATCH_LINES = 10_000
+
 
 class RDFConverter:
     """IFC 엔티티를 RDF 트리플로 변환하는 클래스."""
@@ -60,15 +97,7 @@ class RDFConverter:
         """
         start = time.time()
 
-        self._build_schema()
-        self._convert_spatial_structure(parser)
-        self._convert_physical_elements(parser)
-        self._convert_aggregation_relations(parser)
-        self._convert_containment_relations(parser)
-        self._convert_property_sets(parser)
-        self._convert_quantities(parser)
-        self._convert_materials(parser)
-        self._convert_classifications(parser)
+        self.convert_steps(parser, [(step, None) for step in CONVERSION_STEPS])
 
         self._stats["convert_time"] = time.time() - start
         self._stats["triples_generated"] = len(self._graph)
@@ -81,6 +110,30 @@ class RDFConverter:
         )
         return self._graph
 
+    def convert_steps(
+        self, parser: IFCParser, steps: Iterable[tuple[str, Optional[Iterable[str]]]],
+    ) -> Graph:
+        """지정한 변환 단계만 실행한다 (병렬 변환 워커용).
+
+        Args:
+            parser: 로딩된 IFCParser 인스턴스
+            steps: (단계 이름, IFC 타입 목록) 목록. 타입 목록은 physical_elements에만
+                적용되며 None이면 모든 타입을 변환한다.
+
+        Returns:
+            변환된 rdflib Graph
+        """
+        for step, ifc_types in steps:
+            if step == "schema":
+                self._build_schema()
+            elif step == "physical_elements":
+                self._convert_physical_elements(parser, ifc_types)
+            elif step in CONVERSION_STEPS:
+                getattr(self, f"_convert_{step}")(parser)
+            else:
+                raise ValueError(f"알 수 없는 변환 단계: {step}")
+        return self._graph
+
     def convert_entity(self, entity: Any) -> list[tuple]:
         """단일 IFC 엔티티를 RDF 트리플 리스트로 변환한다."""
         ifc_type = entity.is_a()
@@ -263,21 +316,21 @@ class RDFConverter:
                         Literal(entity.Elevation, datatype=XSD.double),
                     ))
 
-    def _convert_physical_elements(self, parser: IFCParser):
+    def _convert_physical_elements(
+        self, parser: IFCParser, ifc_types: Optional[Iterable[str]] = None,
+    ):
         """물리적 요소를 변환한다.
 
         모든 IfcProduct 하위 타입을 순회하며 변환합니다.
         IfcBuildingElementProxy는 이름 기반 분류를 추가로 수행합니다.
+        ifc_types를 주면 해당 타입만 변환합니다 (병렬 분할용).
         """
         g = self._graph
-        type_counts = parser.get_type_counts()
         category_classes_added = set()
+        if ifc_types is None:
+            ifc_types = physical_element_types(parser.get_type_counts())
 
-        for ifc_type in type_counts:
-            if not is_convertible(ifc_type):
-                continue
-            if ifc_type in SPATIAL_TYPES:
-                continue  # 이미 처리됨
+        for ifc_type in ifc_types:
 
             for entity in parser.get_entities(ifc_type):
                 # GlobalId가 없는 엔티티(IfcPresentationLayerAssignment 등)는 스킵
@@ -325,14 +378,7 @@ class RDFConverter:
         """IfcRelDefinesByProperties를 통한 속성셋을 변환한다."""
         g = self._graph
 
-        for rel in parser.get_entities("IfcRelDefinesByProperties"):
-            pset_def = rel.RelatingPropertyDefinition
-
-            if not hasattr(pset_def, "HasProperties"):
-                continue
-            if not pset_def.HasProperties:
-                continue
-
+        for pset_def, related_objects in parser.get_property_definitions():
             pset_uri = INST[f"pset_{pset_def.GlobalId}"]
             g.add((pset_uri, RDF.type, BIM.PropertySet))
             if pset_def.Name:
@@ -359,7 +405,7 @@ class RDFConverter:
                     g.add((prop_uri, BIM.hasPropertyValue, value))
 
             # 요소 → 속성셋 연결
-            for obj in rel.RelatedObjects:
+            for obj in related_objects:
                 obj_uri = self._entity_uri(obj)
                 g.add((obj_uri, BIM.hasPropertySet, pset_uri))
 
@@ -374,13 +420,7 @@ class RDFConverter:
         }
 
         count = 0
-        for rel in parser.get_entities("IfcRelDefinesByProperties"):
-            qset = rel.RelatingPropertyDefinition
-            if not qset.is_a("IfcElementQuantity"):
-                continue
-            if not hasattr(qset, "Quantities") or not qset.Quantities:
-                continue
-
+        for qset, related_objects in parser.get_quantity_definitions():
             for q in qset.Quantities:
                 q_type = q.is_a()
                 if q_type not in quantity_map:
@@ -390,7 +430,7 @@ class RDFConverter:
                 if value is None:
                     continue
 
-                for obj in rel.RelatedObjects:
+                for obj in related_objects:
                     obj_uri = self._entity_uri(obj)
                     g.add((obj_uri, bim_prop, Literal(value, datatype=XSD.double)))
                     count += 1
@@ -404,8 +444,7 @@ class RDFConverter:
         material_cache: dict[int, URIRef] = {}
         count = 0
 
-        for rel in parser.get_entities("IfcRelAssociatesMaterial"):
-            mat_usage = rel.RelatingMaterial
+        for mat_usage, related_objects in parser.get_material_associations():
             material = None
 
             # IfcMaterial 직접 참조
@@ -438,7 +477,7 @@ class RDFConverter:
                 material_cache[mat_id] = mat_uri
 
             mat_uri = material_cache[mat_id]
-            for obj in rel.RelatedObjects:
+            for obj in related_objects:
                 obj_uri = self._entity_uri(obj)
                 g.add((obj_uri, BIM.hasMaterial, mat_uri))
                 count += 1
@@ -451,11 +490,7 @@ class RDFConverter:
         g = self._graph
         count = 0
 
-        for rel in parser.get_entities("IfcRelAssociatesClassification"):
-            cls_ref = rel.RelatingClassification
-            if cls_ref is None:
-                continue
-
+        for cls_ref, related_objects in parser.get_classification_associations():
             ref_uri = INST[f"classref_{cls_ref.id()}"]
             g.add((ref_uri, RDF.type, BIM.ClassificationReference))
 
@@ -469,7 +504,7 @@ class RDFConverter:
             if ref_source and hasattr(ref_source, "Name") and ref_source.Name:
                 g.add((ref_uri, BIM.hasClassificationSystem, Literal(ref_source.Name)))
 
-            for obj in rel.RelatedObjects:
+            for obj in related_objects:
                 obj_uri = self._entity_uri(obj)
                 g.add((obj_uri, BIM.hasClassification, ref_uri))
                 count += 1
@@ -486,3 +521,198 @@ class RDFConverter:
         if hasattr(entity, "GlobalId") and entity.GlobalId:
             return INST[f"{ifc_type}_{entity.GlobalId}"]
         return INST[f"{ifc_type}_{entity.id()}"]
+
+
+# ---------- 병렬 변환 ----------
+
+def physical_element_types(type_counts: dict[str, int]) -> list[str]:
+    """physical_elements 단계에서 변환하는 IFC 타입 목록 (type_counts 순서 유지)."""
+    return [
+        ifc_type for ifc_type in type_counts
+        if is_convertible(ifc_type) and ifc_type not in SPATIAL_TYPES
+    ]
+
+
+def plan_parallel_conversion(
+    type_counts: dict[str, int], workers: int,
+) -> list[list[tuple[str, Optional[tuple[str, ...]]]]]:
+    """변환 단계와 물리 요소 타입을 워커별 작업 목록으로 나눈다.
+
+    작업 단위(물리 요소 타입 하나 또는 나머지 단계 하나)를 추정 엔티티 수가 큰 순서로
+    가장 덜 찬 워커에 배정한다. 입력이 같으면 항상 같은 계획을 반환하므로
+    각 워커가 독립적으로 계산해도 서로 겹치거나 빠지는 작업이 없다.
+    """
+    units: list[tuple[int, str, Optional[str]]] = []
+    for step in CONVERSION_STEPS:
+        if step == "physical_elements":
+            for ifc_type in physical_element_types(type_counts):
+                units.append((type_counts[ifc_type], step, ifc_type))
+        else:
+            weight = sum(type_counts.get(t, 0) for t in STEP_SOURCE_TYPES[step])
+            units.append((max(weight, 1), step, None))
+    units.sort(key=lambda u: (-u[0], u[1], u[2] or ""))
+
+    loads = [0] * workers
+    assigned: list[list[tuple[str, Optional[str]]]] = [[] for _ in range(workers)]
+    for weight, step, ifc_type in units:
+        target = loads.index(min(loads))
+        loads[target] += weight
+        assigned[target].append((step, ifc_type))
+
+    plans = []
+    for units_for_worker in assigned:
+        plan = []
+        for step in CONVERSION_STEPS:
+            if step == "physical_elements":
+                types = tuple(t for s, t in units_for_worker if s == step)
+                if types:
+                    plan.append((step, types))
+            elif (step, None) in units_for_worker:
+                plan.append((step, None))
+        plans.append(plan)
+    return plans
+
+
+def _convert_ifc_shard(
+    ifc_path: str, worker_index: int, workers: int, shard_path: str, fmt: str,
+) -> dict[str, Any]:
+    """병렬 변환 워커: IFC를 직접 열어 자기 몫의 단계를 변환하고 정렬된 샤드로 기록한다."""
+    from .rdf_writer import TripleWriter
+
+    start = time.time()
+    parser = IFCParser(ifc_path)
+    parser.open()
+    schema = parser.get_schema()
+    plan = plan_parallel_conversion(parser.get_type_counts(), workers)[worker_index]
+
+    converter = RDFConverter(schema=schema)
+    graph = converter.convert_steps(parser, plan)
+    namespaces = list(graph.namespaces())
+
+    # 샤드 내부를 줄 단위로 정렬·중복 제거해 두어야 병합이 결정적이다
+    with TripleWriter(shard_path, fmt=fmt, namespaces=namespaces, header=False) as writer:
+        writer.add_lines(sorted({writer.line(triple) for triple in graph}))
+
+    logger.info(
+        "IFC 변환 워커 %d/%d 완료: %s, %d 트리플 (%.1f초)",
+        worker_index + 1, workers, [step for step, _ in plan], len(graph), time.time() - start,
+    )
+    return {
+        "shard": shard_path,
+        "schema": schema,
+        "namespaces": namespaces,
+        "plan": plan,
+        "entities_converted": converter.stats["entities_converted"],
+    }
+
+
+def _merge_sorted_shards(shard_paths: list[str], writer) -> None:
+    """정렬된 샤드들을 병합하며 워커 간 중복 줄을 한 번만 기록한다."""
+    files = [open(path, "r", encoding="utf-8", newline="\n") for path in shard_paths]
+    try:
+        batch: list[str] = []
+        previous = None
+        for line in heapq.merge(*files):
+            if line == previous:
+                continue
+            previous = line
+            batch.append(line)
+            if len(batch) >= MERGE_BATCH_LINES:
+                writer.add_lines(batch)
+                batch = []
+        writer.add_lines(batch)
+    finally:
+        for f in files:
+            f.close()
+
+
+def convert_ifc_parallel(ifc_path: str, output_path: str, workers: int) -> dict[str, Any]:
+    """IFC 파일을 여러 프로세스에서 변환해 하나의 N-Triples/Turtle 파일로 병합한다.
+
+    Args:
+        ifc_path: IFC 파일 경로
+        output_path: 출력 파일 경로 (.nt면 N-Triples, 그 외 Turtle)
+        workers: 워커 프로세스 수 (1이면 현재 프로세스에서 실행)
+
+    Returns:
+        변환 통계 (schema, workers, entities_converted, total_triples, convert_time)
+    """
+    from .rdf_writer import TripleWriter, format_for_path
+
+    if workers < 1:
+        raise ValueError(f"workers는 1 이상이어야 합니다: {workers}")
+    start = time.time()
+    fmt = format_for_path(output_path)
+    logger.info("병렬 IFC 변환 시작: %s (%d 워커)", ifc_path, workers)
+
+    with tempfile.TemporaryDirectory(prefix="ifc_shards_") as tmp_dir:
+        jobs = [
+            (str(ifc_path), i, workers, str(Path(tmp_dir) / f"shard_{i:03d}"), fmt)
+            for i in range(workers)
+        ]
+        if workers == 1:
+            results = [_convert_ifc_shard(*jobs[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_convert_ifc_shard, *zip(*jobs)))
+
+        with TripleWriter(output_path, fmt=fmt, namespaces=results[0]["namespaces"]) as writer:
+            _merge_sorted_shards([r["shard"] for r in results], writer)
+
+    stats = {
+        "schema": results[0]["schema"],
+        "workers": workers,
+        "entities_converted": sum(r["entities_converted"] for r in results),
+        "total_triples": writer.count,
+        "convert_time": time.time() - start,
+    }
+    logger.info(
+        "병렬 IFC 변환 완료: %d 엔티티, %d 트리플, %.1f초",
+        stats["entities_converted"], stats["total_triples"], stats["convert_time"],
+    )
+    return stats
+
+
+def convert_ifc_to_rdf(
+    ifc_path: str, output_path: str, workers: Optional[int] = None,
+) -> dict[str, Any]:
+    """IFC 파일을 RDF 파일로 변환한다.
+
+    Args:
+        ifc_path: IFC 파일 경로
+        output_path: 출력 파일 경로 (.nt면 N-Triples, 그 외 Turtle)
+        workers: 워커 프로세스 수. None이면 현재 프로세스에서 순차 변환한다.
+
+    Returns:
+        변환 통계
+    """
+    if workers:
+        return convert_ifc_parallel(ifc_path, output_path, workers)
+
+    from .rdf_writer import format_for_path
+
+    parser = IFCParser(ifc_path)
+    parser.open()
+    converter = RDFConverter(schema=parser.get_schema())
+    converter.convert_file(parser)
+    converter.serialize(output_path, fmt=format_for_path(output_path))
+    return {"schema": parser.get_schema(), "workers": None, **converter.stats}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+
+    arg_parser = argparse.ArgumentParser(description="IFC → RDF 변환")
+    arg_parser.add_argument("ifc_path", help="IFC 파일 (IFC4 / IFC2X3)")
+    arg_parser.add_argument("output_path", help="출력 파일 (.ttl 또는 .nt)")
+    arg_parser.add_argument("--workers", type=int, default=None,
+                            help="병렬 변환 워커 프로세스 수 (결과 트리플은 순차 변환과 동일)")
+    args = arg_parser.parse_args()
+
+    result = convert_ifc_to_rdf(args.ifc_path, args.output_path, workers=args.workers)
+    print(f"Schema: {result['schema']}")
+    print(f"Entities converted: {result['entities_converted']}")
+    print(f"Total triples: {result['total_triples']}")
+    print(f"Convert time: {result['convert_time']:.1f}s")
@@ -10,7 +10,7 @@ import csv
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import IO, Callable, Iterable, Iterator, Optional, Union
 
 from rdflib import Graph, Literal, URIRef, RDF, RDFS, XSD, Namespace
 
@@ -20,6 +20,12 @@ logger = logging.getLogger(__name__)
 
 LEAN_SCHEMA_PATH = Path("data/ontology/lean_schema.ttl")
 
+# 진행 상황 콜백 호출 간격 (행)
+PROGRESS_INTERVAL = 10_000
+
+# CSV 입력: 파일 경로 또는 텍스트 스트림 (업로드 본문 등)
+CSVSource = Union[str, Path, IO[str]]
+
 # GlobalId → 요소 URI 매핑 SPARQL
 _FIND_ELEMENT_BY_GLOBALID = """
 PREFIX bim: <http://example.org/bim-ontology/schema#>
@@ -49,37 +55,121 @@ _TYPE_MAP = {
 }
 
 
+class StagingBuffer:
+    """주입할 트리플을 모아 두는 버퍼.
+
+    CSV 주입은 라이브 그래프 대신 이 버퍼에 ``add``하고, commit 시점에
+    한 번의 벌크 쓰기로 반영한다.
+    """
+
+    def __init__(self):
+        self.triples: list[tuple] = []
+
+    def add(self, triple: tuple) -> None:
+        self.triples.append(triple)
+
+    def drain(self) -> list[tuple]:
+        """버퍼의 트리플을 꺼내고 버퍼를 비운다."""
+        triples, self.triples = self.triples, []
+        return triples
+
+    def __len__(self) -> int:
+        return len(self.triples)
+
+
+def commit_to_graph(graph: Graph, triples: Iterable[tuple]) -> int:
+    """트리플을 한 번의 addN으로 그래프에 반영한다. 실패하면 추가분을 되돌린다.
+
+    Returns:
+        새로 추가된 트리플 수
+    """
+    new = [t for t in dict.fromkeys(triples) if t not in graph]
+    try:
+        graph.addN((s, p, o, graph) for s, p, o in new)
+    except Exception:
+        for triple in new:
+            graph.remove(triple)
+        raise
+    return len(new)
+
+
 class LeanLayerInjector:
     """Lean Layer 통합 주입기.
 
     Backbone RDF 그래프에 Schedule/Status/AWP/Equipment 데이터를 주입한다.
+    CSV 주입은 트리플을 스테이징 버퍼에 모은 뒤 한 번에 커밋하므로,
+    행 처리 중 오류가 나면 그래프에는 아무것도 반영되지 않는다.
     """
 
-    def __init__(self, graph: Graph):
+    def __init__(
+        self,
+        graph: Graph,
+        identifiers=None,
+        commit: Optional[Callable[[list[tuple]], int]] = None,
+        progress: Optional[Callable[[int], None]] = None,
+        apply_delta: Optional[Callable[[list[tuple], list[tuple]], object]] = None,
+    ):
+        """
+        Args:
+            graph: 주입 대상 RDF 그래프
+            identifiers: 식별자 인덱스 (``TripleStore.identifiers``). 없으면 행마다 SPARQL로 찾는다.
+            commit: 스테이징된 트리플을 반영하는 함수 (``TripleStore.bulk_insert``).
+                없으면 graph에 직접 addN한다.
+            progress: PROGRESS_INTERVAL 행마다, 그리고 마지막에 읽은 행 수로 호출되는 콜백
+            apply_delta: 상태 업데이트의 (추가, 삭제) 트리플을 반영하는 함수
+                (``TripleStore.apply_delta``). 없으면 graph를 직접 변경한다.
+        """
         self._graph = graph
+        self._identifiers = identifiers
+        self._commit = commit
+        self._progress = progress
+        self._apply_delta = apply_delta
+        self._staging = StagingBuffer()
         self._globalid_cache: dict[str, URIRef] = {}
         self._objectid_cache: dict[str, URIRef] = {}
         self._schema_loaded = False
 
-    def load_lean_schema(self, schema_path: str | None = None) -> int:
+    def commit(self) -> int:
+        """스테이징된 트리플을 한 번의 벌크 쓰기로 반영한다 (전부 또는 전무).
+
+        Returns:
+            새로 추가된 트리플 수
+        """
+        triples = self._staging.drain()
+        if not triples:
+            return 0
+        if self._commit is not None:
+            return self._commit(triples)
+        return commit_to_graph(self._graph, triples)
+
+    def load_lean_schema(self, schema_path: str | None = None, commit: bool = True) -> int:
         """Lean Layer 온톨로지 스키마를 그래프에 로딩한다.
 
+        Args:
+            schema_path: 스키마 TTL 경로 (기본: data/ontology/lean_schema.ttl)
+            commit: False면 스테이징만 하고 다음 CSV 주입과 함께 커밋한다.
+
         Returns:
-            추가된 트리플 수
+            추가(commit=False면 스테이징)된 트리플 수
         """
         path = Path(schema_path) if schema_path else LEAN_SCHEMA_PATH
         if not path.exists():
             raise FileNotFoundError(f"Lean schema not found: {path}")
 
-        before = len(self._graph)
-        self._graph.parse(str(path), format="turtle")
-        added = len(self._graph) - before
+        schema = Graph()
+        schema.parse(str(path), format="turtle")
+        for triple in schema:
+            self._staging.add(triple)
+        added = self.commit() if commit else len(schema)
         self._schema_loaded = True
         logger.info("Lean Layer 스키마 로딩: +%d triples from %s", added, path.name)
         return added
 
     def _resolve_element(self, global_id: str = "", object_id: str = "") -> Optional[URIRef]:
         """GlobalId 또는 ObjectId/SyncID로 RDF 그래프에서 요소 URI를 찾는다."""
+        if self._identifiers is not None:
+            return self._identifiers.resolve(global_id, object_id)
+
         if global_id:
             if global_id in self._globalid_cache:
                 return self._globalid_cache[global_id]
@@ -132,17 +222,33 @@ class LeanLayerInjector:
         except ValueError:
             return None
 
-    def _read_csv(self, csv_path: str) -> list[dict]:
-        """CSV 파일을 읽어 딕셔너리 리스트로 반환한다."""
-        path = Path(csv_path)
-        if not path.exists():
-            raise FileNotFoundError(f"CSV file not found: {csv_path}")
-        with open(path, encoding="utf-8") as f:
-            return list(csv.DictReader(f))
+    def _read_csv(self, source: CSVSource) -> Iterator[dict]:
+        """CSV를 한 행씩 딕셔너리로 읽는다.
+
+        전체 행을 리스트로 만들지 않으므로 메모리는 파일 크기가 아니라 스테이징된
+        트리플 수에 비례한다. source는 파일 경로 또는 텍스트 스트림이다.
+        """
+        if isinstance(source, (str, Path)):
+            path = Path(source)
+            if not path.exists():
+                raise FileNotFoundError(f"CSV file not found: {source}")
+            with open(path, encoding="utf-8", newline="") as f:
+                yield from self._iter_rows(f)
+        else:
+            yield from self._iter_rows(source)
+
+    def _iter_rows(self, stream: IO[str]) -> Iterator[dict]:
+        count = 0
+        for count, row in enumerate(csv.DictReader(stream), 1):
+            yield row
+            if self._progress is not None and count % PROGRESS_INTERVAL == 0:
+                self._progress(count)
+        if self._progress is not None:
+            self._progress(count)
 
     # ── Schedule Injection ──
 
-    def inject_schedule_csv(self, csv_path: str) -> dict:
+    def inject_schedule_csv(self, csv_path: CSVSource) -> dict:
         """일정 CSV를 주입한다. ConstructionTask 인스턴스를 생성하고 요소와 연결한다.
 
         CSV 컬럼:
@@ -151,7 +257,7 @@ class LeanLayerInjector:
         - 기간/비용: Duration, PlannedDuration, ActualDuration, UnitCost, Cost
         """
         rows = self._read_csv(csv_path)
-        g = self._graph
+        g = self._staging
         triples_added = 0
         tasks_created: dict[str, URIRef] = {}
         elements_matched = 0
@@ -244,12 +350,13 @@ class LeanLayerInjector:
             "elements_matched": elements_matched,
             "elements_not_found": not_found,
         }
+        self.commit()
         logger.info("Schedule 주입 완료: %s", result)
         return result
 
     # ── AWP Injection ──
 
-    def inject_awp_csv(self, csv_path: str) -> dict:
+    def inject_awp_csv(self, csv_path: CSVSource) -> dict:
         """AWP CSV를 주입한다. CWA/CWP/IWP 계층을 구축하고 요소를 연결한다.
 
         CSV 컬럼:
@@ -257,7 +364,7 @@ class LeanLayerInjector:
         - AWP: CWA_ID, CWP_ID, IWP_ID, IWP_StartDate, IWP_EndDate, ConstraintStatus
         """
         rows = self._read_csv(csv_path)
-        g = self._graph
+        g = self._staging
         triples_added = 0
         cwa_cache: dict[str, URIRef] = {}
         cwp_cache: dict[str, URIRef] = {}
@@ -337,12 +444,13 @@ class LeanLayerInjector:
             "iwp_count": len(iwp_cache),
             "elements_matched": elements_matched,
         }
+        self.commit()
         logger.info("AWP 주입 완료: %s", result)
         return result
 
     # ── Status Injection ──
 
-    def inject_status_csv(self, csv_path: str) -> dict:
+    def inject_status_csv(self, csv_path: CSVSource) -> dict:
         """상태 CSV를 주입한다. ElementStatus 인스턴스를 생성한다.
 
         CSV 컬럼:
@@ -350,7 +458,7 @@ class LeanLayerInjector:
         - 상태: StatusValue, StatusDate, DeliveryStatus
         """
         rows = self._read_csv(csv_path)
-        g = self._graph
+        g = self._staging
         triples_added = 0
         elements_matched = 0
         not_found = []
@@ -394,19 +502,20 @@ class LeanLayerInjector:
             "elements_matched": elements_matched,
             "elements_not_found": not_found,
         }
+        self.commit()
         logger.info("Status 주입 완료: %s", result)
         return result
 
     # ── Equipment Injection ──
 
-    def inject_equipment_csv(self, csv_path: str) -> dict:
+    def inject_equipment_csv(self, csv_path: CSVSource) -> dict:
         """장비 CSV를 주입한다. ConstructionEquipment 인스턴스를 생성한다.
 
         CSV 컬럼: EquipmentID, Name, Width, Height, TurningRadius,
                   BoomLength, LoadCapacity, AccessZone_CWA_ID
         """
         rows = self._read_csv(csv_path)
-        g = self._graph
+        g = self._staging
         triples_added = 0
         equipment_count = 0
 
@@ -446,6 +555,7 @@ class LeanLayerInjector:
             "triples_added": triples_added,
             "equipment_count": equipment_count,
         }
+        self.commit()
         logger.info("Equipment 주입 완료: %s", result)
         return result
 
@@ -469,29 +579,36 @@ class LeanLayerInjector:
             return {"success": False, "error": f"Element not found: {global_id}"}
 
         g = self._graph
-        triples_added = 0
         now_str = datetime.now(timezone.utc).isoformat()
 
         # ElementStatus 인스턴스 생성
         status_uri = INST[f"status_{global_id.replace('$', '_')}_{now_str[:10]}"]
-        g.add((status_uri, RDF.type, BIM.ElementStatus))
-        g.add((status_uri, BIM.hasStatusValue, Literal(status_value)))
-        g.add((status_uri, BIM.hasStatusDate,
-               Literal(now_str, datatype=XSD.dateTime)))
-        g.add((elem_uri, BIM.hasStatus, status_uri))
-        triples_added += 4
+        added = [
+            (status_uri, RDF.type, BIM.ElementStatus),
+            (status_uri, BIM.hasStatusValue, Literal(status_value)),
+            (status_uri, BIM.hasStatusDate, Literal(now_str, datatype=XSD.dateTime)),
+            (elem_uri, BIM.hasStatus, status_uri),
+        ]
+        removed = []
 
         if delivery_status:
             # 기존 delivery status 제거 후 새로 추가
-            g.remove((elem_uri, BIM.hasDeliveryStatus, None))
-            g.add((elem_uri, BIM.hasDeliveryStatus, Literal(delivery_status)))
-            triples_added += 1
+            removed.extend(g.triples((elem_uri, BIM.hasDeliveryStatus, None)))
+            added.append((elem_uri, BIM.hasDeliveryStatus, Literal(delivery_status)))
 
         # isReady 추론: Installed 또는 OnSite → ready
         ready = status_value in ("Installed", "OnSite", "Inspected")
-        g.remove((elem_uri, BIM.isReady, None))
-        g.add((elem_uri, BIM.isReady, Literal(ready)))
-        triples_added += 1
+        removed.extend(g.triples((elem_uri, BIM.isReady, None)))
+        added.append((elem_uri, BIM.isReady, Literal(ready)))
+        triples_added = len(added)
+
+        if self._apply_delta is not None:
+            self._apply_delta(added, removed)
+        else:
+            for triple in removed:
+                g.remove(triple)
+            for triple in added:
+                g.add(triple)
 
         return {"success": True, "triples_added": triples_added, "global_id": global_id}
 
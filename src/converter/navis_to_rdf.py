@@ -10,11 +10,18 @@ IFC 중간 단계 없이 원본 데이터의 풍부한 속성을 보존합니다
 """
 
 import csv
+import heapq
+import itertools
 import json
 import logging
+import tempfile
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Callable, Dict, Iterator, List, Optional, Set, Any
 
 from rdflib import Graph, Namespace, URIRef, Literal, RDF, RDFS, OWL, XSD
 
@@ -29,6 +36,11 @@ SCHED = Namespace("http://example.org/bim-ontology/schedule#")
 PROP = Namespace("http://example.org/bim-ontology/property#")  # Property-Value 패턴용
 BSO = Namespace("http://example.org/bim-ontology/spatial#")  # BoundingBox/Spatial 정보
 
+NULL_OBJECT_ID = "00000000-0000-0000-0000-000000000000"
+
+# 스트리밍 변환에서 ObjectId가 그룹화되지 않은 CSV를 외부 정렬할 때 청크당 행 수
+SORT_CHUNK_ROWS = 200_000
+
 
 class NavisToRDFConverter:
     """dxtnavis CSV를 RDF로 변환하는 변환기."""
@@ -69,6 +81,13 @@ class NavisToRDFConverter:
         "Nozzle": ["Nozzle", "STNoz"],
     }
 
+    # 출력 그래프에 바인딩하는 네임스페이스 (스트리밍 Turtle 헤더에도 사용)
+    NAMESPACES = [
+        ("bim", BIM), ("inst", INST), ("navis", NAVIS), ("sp3d", SP3D),
+        ("sched", SCHED), ("prop", PROP), ("bso", BSO),
+        ("rdf", RDF), ("rdfs", RDFS), ("owl", OWL), ("xsd", XSD),
+    ]
+
     @staticmethod
     def _parse_int_like(value: str) -> Optional[int]:
         """정수/실수 문자열을 정수로 파싱한다."""
@@ -106,17 +125,8 @@ class NavisToRDFConverter:
 
     def _bind_namespaces(self):
         """네임스페이스를 그래프에 바인딩한다."""
-        self.graph.bind("bim", BIM)
-        self.graph.bind("inst", INST)
-        self.graph.bind("navis", NAVIS)
-        self.graph.bind("sp3d", SP3D)
-        self.graph.bind("sched", SCHED)
-        self.graph.bind("prop", PROP)
-        self.graph.bind("bso", BSO)
-        self.graph.bind("rdf", RDF)
-        self.graph.bind("rdfs", RDFS)
-        self.graph.bind("owl", OWL)
-        self.graph.bind("xsd", XSD)
+        for prefix, namespace in self.NAMESPACES:
+            self.graph.bind(prefix, namespace)
 
     def _add_schema(self):
         """기본 스키마 클래스와 프로퍼티를 추가한다."""
@@ -263,17 +273,21 @@ class NavisToRDFConverter:
         self._object_cache[object_id] = uri
         return uri
 
-    def _get_or_create_path_node(self, system_path: str) -> URIRef:
+    def _get_or_create_path_node(
+        self, system_path: str, add: Optional[Callable[[tuple], None]] = None,
+    ) -> URIRef:
         """System Path에 해당하는 계층 노드를 가져오거나 생성한다.
 
         Args:
             system_path: 전체 시스템 경로 (예: "TRAINING\\Refining Area\\U01")
+            add: 새 노드의 트리플을 받을 함수 (기본: self.graph.add)
 
         Returns:
             해당 경로의 노드 URI
         """
         if system_path in self._path_node_cache:
             return self._path_node_cache[system_path]
+        add = add or self.graph.add
 
         # 경로를 파싱
         parts = system_path.split("\\")
@@ -311,24 +325,212 @@ class NavisToRDFConverter:
                 node_type = NAVIS.System
 
             # 트리플 추가
-            self.graph.add((uri, RDF.type, node_type))
-            self.graph.add((uri, RDF.type, NAVIS.NavisGroup))
-            self.graph.add((uri, RDFS.label, Literal(part)))
-            self.graph.add((uri, BIM.hasName, Literal(part)))
-            self.graph.add((uri, SP3D.hasSystemPath, Literal(current_path)))
-            self.graph.add((uri, NAVIS.hasLevel, Literal(i, datatype=XSD.integer)))
+            add((uri, RDF.type, node_type))
+            add((uri, RDF.type, NAVIS.NavisGroup))
+            add((uri, RDFS.label, Literal(part)))
+            add((uri, BIM.hasName, Literal(part)))
+            add((uri, SP3D.hasSystemPath, Literal(current_path)))
+            add((uri, NAVIS.hasLevel, Literal(i, datatype=XSD.integer)))
 
             # 부모-자식 관계
             if parent_uri:
-                self.graph.add((uri, NAVIS.hasSystemPathParent, parent_uri))
-                self.graph.add((parent_uri, NAVIS.containsElement, uri))
-                self.graph.add((uri, NAVIS.isContainedIn, parent_uri))
+                add((uri, NAVIS.hasSystemPathParent, parent_uri))
+                add((parent_uri, NAVIS.containsElement, uri))
+                add((uri, NAVIS.isContainedIn, parent_uri))
 
             self._path_node_cache[current_path] = uri
             parent_uri = uri
 
         return self._path_node_cache.get(system_path, parent_uri)
 
+    @staticmethod
+    def _new_hierarchy_stats() -> Dict[str, Any]:
+        return {
+            "total_rows": 0,
+            "unique_objects": 0,
+            "sp3d_entities": 0,
+            "groups": 0,
+            "path_nodes": 0,
+            "triples_added": 0,
+            "property_values": 0,  # Property-Value 노드 수
+            "max_level": 0,  # 최대 계층 깊이
+            "categories": {},
+        }
+
+    @staticmethod
+    def _new_hierarchy_object(row: Dict[str, str]) -> Dict[str, Any]:
+        """객체의 첫 행으로 객체 레코드를 만든다."""
+        return {
+            "parent_id": row.get("ParentId", "").strip(),
+            "level": row.get("Level", "0"),
+            "display_name": row.get("DisplayName", ""),
+            "properties": {},
+            "sp3d_properties": {},
+            "all_properties": [],  # 모든 속성 저장 (Property-Value 패턴용)
+            "internal_type": "",
+        }
+
+    @staticmethod
+    def _collect_hierarchy_row(obj: Dict[str, Any], row: Dict[str, str]) -> None:
+        """AllHierarchy CSV의 속성 행 하나를 객체 레코드에 누적한다."""
+        category = row.get("Category", "")
+        prop_name = row.get("PropertyName", "")
+        raw_value = row.get("RawValue", "")
+        data_type = row.get("DataType", "")
+        unit = row.get("Unit", "")
+
+        # 항목 카테고리에서 내부 타입 추출
+        if category == "항목" and prop_name == "내부 유형":
+            obj["internal_type"] = raw_value
+
+        # SmartPlant 3D 속성 수집 (기존 호환성 유지)
+        if category == "SmartPlant 3D":
+            obj["sp3d_properties"][prop_name] = raw_value
+
+        # 기타 속성 (항목 제외)
+        elif category not in ["항목", "재질", "형상"]:
+            if category not in obj["properties"]:
+                obj["properties"][category] = {}
+            obj["properties"][category][prop_name] = raw_value
+
+        # 모든 속성을 Property-Value 패턴으로 저장 (RawValue가 있는 경우만)
+        if raw_value:
+            obj["all_properties"].append({
+                "category": category,
+                "name": prop_name,
+                "raw_value": raw_value,
+                "data_type": data_type,
+                "unit": unit,
+            })
+
+    def _emit_hierarchy_object(
+        self, obj_id: str, obj_data: Dict[str, Any], stats: Dict[str, Any],
+        add: Callable[[tuple], None],
+        path_add: Optional[Callable[[tuple], None]] = None,
+    ) -> None:
+        """객체 하나의 트리플을 생성해 add로 전달한다.
+
+        새 System Path 노드의 트리플은 path_add(기본: add)로 전달한다.
+        """
+        uri = self._get_or_create_element(obj_id, obj_data["display_name"])
+
+        # 타입 결정
+        internal_type = obj_data["internal_type"]
+        if "SP3D" in internal_type:
+            add((uri, RDF.type, NAVIS.SP3DEntity))
+            add((uri, RDF.type, BIM.PhysicalElement))
+            stats["sp3d_entities"] += 1
+        elif "Group" in internal_type or "그룹" in internal_type:
+            add((uri, RDF.type, NAVIS.NavisGroup))
+            stats["groups"] += 1
+        else:
+            add((uri, RDF.type, NAVIS.NavisElement))
+
+        # 기본 속성
+        add((uri, NAVIS.hasObjectId, Literal(obj_id)))
+        add((uri, BIM.hasName, Literal(obj_data["display_name"])))
+        add((uri, RDFS.label, Literal(obj_data["display_name"])))
+        level = int(obj_data["level"])
+        add((uri, NAVIS.hasLevel, Literal(level, datatype=XSD.integer)))
+
+        # 최대 레벨 추적
+        if level > stats["max_level"]:
+            stats["max_level"] = level
+
+        if obj_data["internal_type"]:
+            add((uri, NAVIS.hasInternalType, Literal(obj_data["internal_type"])))
+
+        # 카테고리 분류
+        category_uri = self._classify_element(obj_data["display_name"], internal_type)
+        add((uri, BIM.hasCategory, Literal(category_uri.split("#")[-1])))
+        add((uri, RDF.type, category_uri))
+
+        cat_name = str(category_uri).split("#")[-1]
+        stats["categories"][cat_name] = stats["categories"].get(cat_name, 0) + 1
+
+        # 부모-자식 관계
+        parent_id = obj_data["parent_id"]
+        if parent_id and parent_id != NULL_OBJECT_ID:
+            parent_uri = self._get_or_create_element(parent_id, "")
+            add((uri, NAVIS.hasParent, parent_uri))
+            add((parent_uri, NAVIS.hasChild, uri))
+            add((uri, NAVIS.hasParentId, Literal(parent_id)))
+
+        # SmartPlant 3D 속성 (기존 방식 - 호환성)
+        for prop_name, prop_value in obj_data["sp3d_properties"].items():
+            if prop_name in self.SP3D_PROPERTY_MAP and prop_value:
+                prop_uri, datatype = self.SP3D_PROPERTY_MAP[prop_name]
+                add((uri, prop_uri, Literal(prop_value, datatype=datatype)))
+
+        # 모든 속성을 Property-Value 패턴으로 저장 (동적 조회 지원)
+        for idx, prop_data in enumerate(obj_data.get("all_properties", [])):
+            # PropertyValue 노드 URI 생성
+            prop_node_id = f"{obj_id}_{idx}".replace("-", "_")
+            prop_node = INST[f"prop_{prop_node_id}"]
+
+            add((prop_node, RDF.type, PROP.PropertyValue))
+            add((uri, PROP.hasProperty, prop_node))
+            add((prop_node, PROP.category, Literal(prop_data["category"])))
+            add((prop_node, PROP.propertyName, Literal(prop_data["name"])))
+            add((prop_node, PROP.rawValue, Literal(prop_data["raw_value"])))
+
+            if prop_data["data_type"]:
+                add((prop_node, PROP.dataType, Literal(prop_data["data_type"])))
+            if prop_data["unit"]:
+                add((prop_node, PROP.unit, Literal(prop_data["unit"])))
+
+            stats["property_values"] += 1
+
+        # System Path 기반 계층 연결 + 카운트
+        system_path = obj_data["sp3d_properties"].get("System Path", "")
+        if system_path:
+            path_node = self._get_or_create_path_node(system_path, path_add or add)
+            if path_node:
+                add((uri, NAVIS.isContainedIn, path_node))
+                add((path_node, NAVIS.containsElement, uri))
+
+                # 해당 경로와 모든 상위 경로의 요소 수 증가
+                parts = system_path.split("\\")
+                for i in range(len(parts)):
+                    ancestor_path = "\\".join(parts[: i + 1])
+                    self._path_element_counts[ancestor_path] = (
+                        self._path_element_counts.get(ancestor_path, 0) + 1
+                    )
+
+    def _emit_hierarchy_counts(
+        self, parents: Dict[str, str], add: Callable[[tuple], None],
+    ) -> None:
+        """System Path 요소 수와 ParentId 기반 자식/자손 수 트리플을 생성한다."""
+        # 계층 노드에 미리 계산된 요소 수 추가 (System Path 기반)
+        for path, count in self._path_element_counts.items():
+            if path in self._path_node_cache:
+                node_uri = self._path_node_cache[path]
+                add((node_uri, NAVIS.hasElementCount, Literal(count, datatype=XSD.integer)))
+
+        # ParentId 기반 자식/자손 수 계산
+        logger.info("Computing child and descendant counts...")
+        self._compute_hierarchy_counts(parents)
+
+        # 각 노드에 자식 수와 자손 수 추가
+        for obj_id, child_count in self._child_counts.items():
+            if obj_id in self._object_cache:
+                uri = self._object_cache[obj_id]
+                add((uri, NAVIS.hasChildCount, Literal(child_count, datatype=XSD.integer)))
+
+        for obj_id, desc_count in self._descendant_counts.items():
+            if obj_id in self._object_cache:
+                uri = self._object_cache[obj_id]
+                add((uri, NAVIS.hasDescendantCount, Literal(desc_count, datatype=XSD.integer)))
+
+    @staticmethod
+    def _emit_graph_metadata(stats: Dict[str, Any], add: Callable[[tuple], None]) -> None:
+        """그래프 메타데이터(최대 깊이, 객체 수, 속성값 수)를 생성한다."""
+        graph_uri = URIRef("http://example.org/bim-ontology/graph#metadata")
+        add((graph_uri, RDF.type, OWL.NamedIndividual))
+        add((graph_uri, NAVIS.maxHierarchyLevel, Literal(stats["max_level"], datatype=XSD.integer)))
+        add((graph_uri, NAVIS.totalObjects, Literal(stats["unique_objects"], datatype=XSD.integer)))
+        add((graph_uri, NAVIS.totalPropertyValues, Literal(stats["property_values"], datatype=XSD.integer)))
+
     def convert_hierarchy_csv(self, csv_path: str) -> Dict[str, Any]:
         """AllHierarchy CSV를 RDF로 변환한다.
 
@@ -340,17 +542,7 @@ class NavisToRDFConverter:
         """
         logger.info(f"Converting hierarchy CSV: {csv_path}")
 
-        stats = {
-            "total_rows": 0,
-            "unique_objects": 0,
-            "sp3d_entities": 0,
-            "groups": 0,
-            "path_nodes": 0,
-            "triples_added": 0,
-            "property_values": 0,  # Property-Value 노드 수
-            "max_level": 0,  # 최대 계층 깊이
-            "categories": {},
-        }
+        stats = self._new_hierarchy_stats()
 
         # 1단계: 모든 행을 읽어 객체별로 그룹화
         objects: Dict[str, Dict] = {}
@@ -362,49 +554,12 @@ class NavisToRDFConverter:
                 stats["total_rows"] += 1
 
                 obj_id = row.get("ObjectId", "").strip()
-                if not obj_id or obj_id == "00000000-0000-0000-0000-000000000000":
+                if not obj_id or obj_id == NULL_OBJECT_ID:
                     continue
 
                 if obj_id not in objects:
-                    objects[obj_id] = {
-                        "parent_id": row.get("ParentId", "").strip(),
-                        "level": row.get("Level", "0"),
-                        "display_name": row.get("DisplayName", ""),
-                        "properties": {},
-                        "sp3d_properties": {},
-                        "all_properties": [],  # 모든 속성 저장 (Property-Value 패턴용)
-                        "internal_type": "",
-                    }
-
-                category = row.get("Category", "")
-                prop_name = row.get("PropertyName", "")
-                raw_value = row.get("RawValue", "")
-                data_type = row.get("DataType", "")
-                unit = row.get("Unit", "")
-
-                # 항목 카테고리에서 내부 타입 추출
-                if category == "항목" and prop_name == "내부 유형":
-                    objects[obj_id]["internal_type"] = raw_value
-
-                # SmartPlant 3D 속성 수집 (기존 호환성 유지)
-                if category == "SmartPlant 3D":
-                    objects[obj_id]["sp3d_properties"][prop_name] = raw_value
-
-                # 기타 속성 (항목 제외)
-                elif category not in ["항목", "재질", "형상"]:
-                    if category not in objects[obj_id]["properties"]:
-                        objects[obj_id]["properties"][category] = {}
-                    objects[obj_id]["properties"][category][prop_name] = raw_value
-
-                # 모든 속성을 Property-Value 패턴으로 저장 (RawValue가 있는 경우만)
-                if raw_value:
-                    objects[obj_id]["all_properties"].append({
-                        "category": category,
-                        "name": prop_name,
-                        "raw_value": raw_value,
-                        "data_type": data_type,
-                        "unit": unit,
-                    })
+                    objects[obj_id] = self._new_hierarchy_object(row)
+                self._collect_hierarchy_row(objects[obj_id], row)
 
         stats["unique_objects"] = len(objects)
         logger.info(f"Found {len(objects)} unique objects")
@@ -413,140 +568,249 @@ class NavisToRDFConverter:
         initial_triples = len(self.graph)
 
         for obj_id, obj_data in objects.items():
-            uri = self._get_or_create_element(obj_id, obj_data["display_name"])
+            self._emit_hierarchy_object(obj_id, obj_data, stats, self.graph.add)
 
-            # 타입 결정
-            internal_type = obj_data["internal_type"]
-            if "SP3D" in internal_type:
-                self.graph.add((uri, RDF.type, NAVIS.SP3DEntity))
-                self.graph.add((uri, RDF.type, BIM.PhysicalElement))
-                stats["sp3d_entities"] += 1
-            elif "Group" in internal_type or "그룹" in internal_type:
-                self.graph.add((uri, RDF.type, NAVIS.NavisGroup))
-                stats["groups"] += 1
-            else:
-                self.graph.add((uri, RDF.type, NAVIS.NavisElement))
+        # 3단계: 요소 수 / 자식·자손 수
+        parents = {obj_id: obj_data["parent_id"] for obj_id, obj_data in objects.items()}
+        self._emit_hierarchy_counts(parents, self.graph.add)
 
-            # 기본 속성
-            self.graph.add((uri, NAVIS.hasObjectId, Literal(obj_id)))
-            self.graph.add((uri, BIM.hasName, Literal(obj_data["display_name"])))
-            self.graph.add((uri, RDFS.label, Literal(obj_data["display_name"])))
-            level = int(obj_data["level"])
-            self.graph.add((uri, NAVIS.hasLevel, Literal(level, datatype=XSD.integer)))
+        # 계층 노드 통계
+        stats["path_nodes"] = len(self._path_node_cache)
+        stats["hierarchy_nodes"] = sum(1 for c in self._child_counts.values() if c > 0)
+        stats["triples_added"] = len(self.graph) - initial_triples
 
-            # 최대 레벨 추적
-            if level > stats["max_level"]:
-                stats["max_level"] = level
+        # 그래프 메타데이터에 최대 깊이 저장
+        self._emit_graph_metadata(stats, self.graph.add)
 
-            if obj_data["internal_type"]:
-                self.graph.add((uri, NAVIS.hasInternalType, Literal(obj_data["internal_type"])))
+        logger.info(f"Added {stats['triples_added']} triples, {stats['path_nodes']} path nodes")
+        logger.info(f"Max hierarchy level: {stats['max_level']}, Property values: {stats['property_values']}")
 
-            # 카테고리 분류
-            category_uri = self._classify_element(obj_data["display_name"], internal_type)
-            self.graph.add((uri, BIM.hasCategory, Literal(category_uri.split("#")[-1])))
-            self.graph.add((uri, RDF.type, category_uri))
+        return stats
 
-            cat_name = str(category_uri).split("#")[-1]
-            stats["categories"][cat_name] = stats["categories"].get(cat_name, 0) + 1
+    # ---------- 스트리밍 변환 ----------
 
-            # 부모-자식 관계
-            parent_id = obj_data["parent_id"]
-            if parent_id and parent_id != "00000000-0000-0000-0000-000000000000":
-                parent_uri = self._get_or_create_element(parent_id, "")
-                self.graph.add((uri, NAVIS.hasParent, parent_uri))
-                self.graph.add((parent_uri, NAVIS.hasChild, uri))
-                self.graph.add((uri, NAVIS.hasParentId, Literal(parent_id)))
+    @staticmethod
+    def _valid_object_id(row: Dict[str, str]) -> str:
+        obj_id = (row.get("ObjectId") or "").strip()
+        return "" if obj_id == NULL_OBJECT_ID else obj_id
+
+    @classmethod
+    def _is_grouped_by_object(cls, csv_path: str) -> bool:
+        """같은 ObjectId의 행들이 연속으로 나오는지 확인한다 (dxtnavis 기본 출력)."""
+        finished: Set[str] = set()
+        current = None
+        with open(csv_path, "r", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                obj_id = cls._valid_object_id(row)
+                if not obj_id or obj_id == current:
+                    continue
+                if obj_id in finished:
+                    return False
+                if current is not None:
+                    finished.add(current)
+                current = obj_id
+        return True
+
+    @classmethod
+    def _iter_sorted_rows(
+        cls, csv_path: str, stats: Dict[str, Any], chunk_rows: int,
+    ) -> Iterator[Dict[str, str]]:
+        """ObjectId 기준 외부 정렬: 청크별로 정렬해 임시 파일에 쓰고 병합한다.
+
+        청크 내 정렬과 heapq.merge 모두 안정 정렬이므로 객체 내 속성 순서는
+        원본 파일 순서를 유지한다.
+        """
+        with tempfile.TemporaryDirectory(prefix="navis_sort_") as tmp_dir:
+            runs: List[Path] = []
+            with open(csv_path, "r", encoding="utf-8-sig") as f:
+                reader = csv.DictReader(f)
+                fieldnames = reader.fieldnames or []
+                while True:
+                    rows = list(itertools.islice(reader, chunk_rows))
+                    if not rows:
+                        break
+                    stats["total_rows"] += len(rows)
+                    chunk = [row for row in rows if cls._valid_object_id(row)]
+                    if not chunk:
+                        continue
+                    chunk.sort(key=cls._valid_object_id)
+                    run_path = Path(tmp_dir) / f"run_{len(runs):05d}.csv"
+                    with open(run_path, "w", encoding="utf-8", newline="") as out:
+                        writer = csv.DictWriter(out, fieldnames=fieldnames)
+                        writer.writeheader()
+                        writer.writerows(chunk)
+                    runs.append(run_path)
+            logger.info("외부 정렬: %d개 청크 병합", len(runs))
+
+            files = [open(p, "r", encoding="utf-8", newline="") for p in runs]
+            try:
+                yield from heapq.merge(
+                    *(csv.DictReader(f) for f in files), key=cls._valid_object_id,
+                )
+            finally:
+                for f in files:
+                    f.close()
+
+    def _iter_object_groups(
+        self, csv_path: str, stats: Dict[str, Any], chunk_rows: int,
+    ) -> Iterator[tuple[str, Iterator[Dict[str, str]]]]:
+        """(ObjectId, 해당 객체의 행 iterator)를 객체 단위로 순서대로 생성한다."""
+        if self._is_grouped_by_object(csv_path):
+            def rows():
+                with open(csv_path, "r", encoding="utf-8-sig") as f:
+                    for row in csv.DictReader(f):
+                        stats["total_rows"] += 1
+                        if self._valid_object_id(row):
+                            yield row
+            row_iter = rows()
+        else:
+            logger.info("ObjectId가 그룹화되어 있지 않아 외부 정렬을 수행합니다")
+            row_iter = self._iter_sorted_rows(csv_path, stats, chunk_rows)
+        return itertools.groupby(row_iter, key=self._valid_object_id)
+
+    def convert_hierarchy_csv_streaming(
+        self, csv_path: str, writer, chunk_rows: int = SORT_CHUNK_ROWS,
+    ) -> Dict[str, Any]:
+        """AllHierarchy CSV를 객체 단위로 스트리밍 변환해 writer에 기록한다.
+
+        convert_hierarchy_csv와 같은 트리플을 생성하지만 전체 객체/그래프를 메모리에
+        올리지 않는다. 상주하는 것은 ObjectId→URI, ObjectId→ParentId 맵과
+        System Path 노드 캐시뿐이며, 트리플은 객체마다 writer로 바로 내보낸다.
+        ObjectId 순으로 그룹화되지 않은 CSV는 먼저 외부 정렬한다.
 
-            # SmartPlant 3D 속성 (기존 방식 - 호환성)
-            for prop_name, prop_value in obj_data["sp3d_properties"].items():
-                if prop_name in self.SP3D_PROPERTY_MAP and prop_value:
-                    prop_uri, datatype = self.SP3D_PROPERTY_MAP[prop_name]
-                    self.graph.add((uri, prop_uri, Literal(prop_value, datatype=datatype)))
+        Args:
+            csv_path: AllHierarchy CSV 파일 경로
+            writer: add()/add_all()/count를 제공하는 TripleWriter
+            chunk_rows: 외부 정렬 청크당 행 수
 
-            # 모든 속성을 Property-Value 패턴으로 저장 (동적 조회 지원)
-            for idx, prop_data in enumerate(obj_data.get("all_properties", [])):
-                # PropertyValue 노드 URI 생성
-                prop_node_id = f"{obj_id}_{idx}".replace("-", "_")
-                prop_node = INST[f"prop_{prop_node_id}"]
+        Returns:
+            변환 결과 통계 (convert_hierarchy_csv와 동일한 키)
+        """
+        logger.info(f"Streaming hierarchy CSV: {csv_path}")
 
-                self.graph.add((prop_node, RDF.type, PROP.PropertyValue))
-                self.graph.add((uri, PROP.hasProperty, prop_node))
-                self.graph.add((prop_node, PROP.category, Literal(prop_data["category"])))
-                self.graph.add((prop_node, PROP.propertyName, Literal(prop_data["name"])))
-                self.graph.add((prop_node, PROP.rawValue, Literal(prop_data["raw_value"])))
+        stats = self._new_hierarchy_stats()
+        parents: Dict[str, str] = {}
+        initial_triples = writer.count
 
-                if prop_data["data_type"]:
-                    self.graph.add((prop_node, PROP.dataType, Literal(prop_data["data_type"])))
-                if prop_data["unit"]:
-                    self.graph.add((prop_node, PROP.unit, Literal(prop_data["unit"])))
+        for obj_id, rows in self._iter_object_groups(csv_path, stats, chunk_rows):
+            obj_data = None
+            for row in rows:
+                if obj_data is None:
+                    obj_data = self._new_hierarchy_object(row)
+                self._collect_hierarchy_row(obj_data, row)
+            parents[obj_id] = obj_data["parent_id"]
 
-                stats["property_values"] += 1
+            # 객체 내 중복 트리플 제거 (Graph.add의 집합 의미와 동일하게)
+            batch: List[tuple] = []
+            self._emit_hierarchy_object(obj_id, obj_data, stats, batch.append)
+            writer.add_all(dict.fromkeys(batch))
 
-            # System Path 기반 계층 연결 + 카운트
-            system_path = obj_data["sp3d_properties"].get("System Path", "")
-            if system_path:
-                path_node = self._get_or_create_path_node(system_path)
-                if path_node:
-                    self.graph.add((uri, NAVIS.isContainedIn, path_node))
-                    self.graph.add((path_node, NAVIS.containsElement, uri))
+        stats["unique_objects"] = len(parents)
+        logger.info(f"Found {len(parents)} unique objects")
 
-                    # 해당 경로와 모든 상위 경로의 요소 수 증가
-                    parts = system_path.split("\\")
-                    for i in range(len(parts)):
-                        ancestor_path = "\\".join(parts[: i + 1])
-                        self._path_element_counts[ancestor_path] = (
-                            self._path_element_counts.get(ancestor_path, 0) + 1
-                        )
+        self._emit_hierarchy_counts(parents, writer.add)
 
-        # 계층 노드에 미리 계산된 요소 수 추가 (System Path 기반)
-        for path, count in self._path_element_counts.items():
-            if path in self._path_node_cache:
-                node_uri = self._path_node_cache[path]
-                self.graph.add((node_uri, NAVIS.hasElementCount, Literal(count, datatype=XSD.integer)))
+        stats["path_nodes"] = len(self._path_node_cache)
+        stats["hierarchy_nodes"] = sum(1 for c in self._child_counts.values() if c > 0)
+        stats["triples_added"] = writer.count - initial_triples
 
-        # 3단계: ParentId 기반 자식/자손 수 계산
-        logger.info("Computing child and descendant counts...")
-        self._compute_hierarchy_counts(objects)
+        self._emit_graph_metadata(stats, writer.add)
 
-        # 각 노드에 자식 수와 자손 수 추가
-        for obj_id, child_count in self._child_counts.items():
-            if obj_id in self._object_cache:
-                uri = self._object_cache[obj_id]
-                self.graph.add((uri, NAVIS.hasChildCount, Literal(child_count, datatype=XSD.integer)))
+        logger.info(f"Streamed {stats['triples_added']} triples, {stats['path_nodes']} path nodes")
+        return stats
 
-        for obj_id, desc_count in self._descendant_counts.items():
-            if obj_id in self._object_cache:
-                uri = self._object_cache[obj_id]
-                self.graph.add((uri, NAVIS.hasDescendantCount, Literal(desc_count, datatype=XSD.integer)))
+    def convert_hierarchy_csv_parallel(
+        self, csv_path: str, writer, workers: int, chunk_rows: int = SORT_CHUNK_ROWS,
+    ) -> Dict[str, Any]:
+        """AllHierarchy CSV를 ObjectId 해시 파티션별로 여러 프로세스에서 변환한다.
+
+        각 워커는 자기 파티션의 객체를 ObjectId 순으로 정렬해 샤드로 기록하고,
+        System Path 노드·요소 수·자식/자손 수·메타데이터는 워커 결과를 모아
+        여기서 한 번만 생성한다. 샤드는 ObjectId 순으로 병합되므로 출력은
+        워커 수와 무관하게 바이트 단위로 동일하다.
+
+        Args:
+            csv_path: AllHierarchy CSV 파일 경로
+            writer: 최종 출력 TripleWriter
+            workers: 워커 프로세스 수 (1이면 현재 프로세스에서 실행)
+            chunk_rows: 워커별 외부 정렬 청크당 행 수
+
+        Returns:
+            변환 결과 통계 (convert_hierarchy_csv와 동일한 키)
+        """
+        logger.info(f"Parallel hierarchy CSV conversion: {csv_path} ({workers} workers)")
+        stats = self._new_hierarchy_stats()
+        initial_triples = writer.count
+
+        with tempfile.TemporaryDirectory(prefix="navis_shards_") as tmp_dir:
+            # CSV는 한 번만 파싱해 파티션 파일로 나눈다 (워커마다 전체 파일을 읽지 않도록)
+            partitions, stats["total_rows"] = _split_partitions(csv_path, workers, tmp_dir)
+            jobs = [
+                (partitions[i], str(Path(tmp_dir) / f"shard_{i:03d}"), writer.format, chunk_rows)
+                for i in range(workers)
+            ]
+            if workers == 1:
+                results = [_convert_partition(*jobs[0])]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(_convert_partition, *zip(*jobs)))
+
+            # 샤드 병합: 객체 블록을 ObjectId 순으로
+            shards = [_iter_shard(r["shard"], r["index"]) for r in results]
+            for _, lines in heapq.merge(*shards, key=itemgetter(0)):
+                writer.add_lines(lines)
+
+        # 워커 결과 취합 (정렬해 두어야 이후 생성 순서가 워커 수와 무관해진다)
+        parents: Dict[str, str] = {}
+        path_counts: Counter = Counter()
+        system_paths: Set[str] = set()
+        for r in results:
+            parents.update(r["parents"])
+            path_counts.update(r["path_counts"])
+            system_paths.update(r["paths"])
+            part = r["stats"]
+            for key in ("sp3d_entities", "groups", "property_values"):
+                stats[key] += part[key]
+            stats["max_level"] = max(stats["max_level"], part["max_level"])
+            for cat, count in part["categories"].items():
+                stats["categories"][cat] = stats["categories"].get(cat, 0) + count
+        parents = dict(sorted(parents.items()))
+        stats["unique_objects"] = len(parents)
+        stats["categories"] = dict(sorted(stats["categories"].items()))
+
+        for obj_id, parent_id in parents.items():
+            self._get_or_create_element(obj_id, "")
+            if parent_id and parent_id != NULL_OBJECT_ID:
+                self._get_or_create_element(parent_id, "")
+
+        # 중앙 처리: System Path 노드 → 요소 수 → 자식/자손 수 → 메타데이터
+        for system_path in sorted(system_paths):
+            self._get_or_create_path_node(system_path, writer.add)
+        self._path_element_counts = dict(sorted(path_counts.items()))
+        self._emit_hierarchy_counts(parents, writer.add)
 
-        # 계층 노드 통계
         stats["path_nodes"] = len(self._path_node_cache)
         stats["hierarchy_nodes"] = sum(1 for c in self._child_counts.values() if c > 0)
-        stats["triples_added"] = len(self.graph) - initial_triples
-
-        # 그래프 메타데이터에 최대 깊이 저장
-        graph_uri = URIRef("http://example.org/bim-ontology/graph#metadata")
-        self.graph.add((graph_uri, RDF.type, OWL.NamedIndividual))
-        self.graph.add((graph_uri, NAVIS.maxHierarchyLevel, Literal(stats["max_level"], datatype=XSD.integer)))
-        self.graph.add((graph_uri, NAVIS.totalObjects, Literal(stats["unique_objects"], datatype=XSD.integer)))
-        self.graph.add((graph_uri, NAVIS.totalPropertyValues, Literal(stats["property_values"], datatype=XSD.integer)))
+        stats["triples_added"] = writer.count - initial_triples
 
-        logger.info(f"Added {stats['triples_added']} triples, {stats['path_nodes']} path nodes")
-        logger.info(f"Max hierarchy level: {stats['max_level']}, Property values: {stats['property_values']}")
+        self._emit_graph_metadata(stats, writer.add)
 
+        logger.info(f"Merged {len(results)} shards: {stats['triples_added']} triples")
         return stats
 
-    def _compute_hierarchy_counts(self, objects: Dict[str, Dict]):
-        """ParentId 기반으로 자식 수와 자손 수를 계산한다."""
+    def _compute_hierarchy_counts(self, parents: Dict[str, str]):
+        """ParentId 기반으로 자식 수와 자손 수를 계산한다.
+
+        Args:
+            parents: ObjectId → ParentId 맵
+        """
         from collections import defaultdict
 
         # 부모별 자식 목록 생성
         children_map: Dict[str, List[str]] = defaultdict(list)
-        null_parent = "00000000-0000-0000-0000-000000000000"
 
-        for obj_id, obj_data in objects.items():
-            parent_id = obj_data["parent_id"]
-            if parent_id and parent_id != null_parent:
+        for obj_id, parent_id in parents.items():
+            if parent_id and parent_id != NULL_OBJECT_ID:
                 children_map[parent_id].append(obj_id)
 
         # 직접 자식 수 계산
@@ -609,7 +873,7 @@ class NavisToRDFConverter:
                 stats["total_rows"] += 1
 
                 obj_id = row.get("ObjectId", "").strip()
-                if not obj_id or obj_id == "00000000-0000-0000-0000-000000000000":
+                if not obj_id or obj_id == NULL_OBJECT_ID:
                     continue
 
                 display_name = row.get("DisplayName", "")
@@ -714,7 +978,7 @@ class NavisToRDFConverter:
 
             # 부모-자식 관계
             parent_id = obj_data["parent_id"]
-            if parent_id and parent_id != "00000000-0000-0000-0000-000000000000":
+            if parent_id and parent_id != NULL_OBJECT_ID:
                 parent_uri = self._get_or_create_element(parent_id, "")
                 self.graph.add((uri, NAVIS.hasParent, parent_uri))
                 self.graph.add((parent_uri, NAVIS.hasChild, uri))
@@ -799,25 +1063,9 @@ class NavisToRDFConverter:
                             self._path_element_counts.get(ancestor_path, 0) + 1
                         )
 
-        # System Path 노드에 요소 수 추가
-        for path, count in self._path_element_counts.items():
-            if path in self._path_node_cache:
-                node_uri = self._path_node_cache[path]
-                self.graph.add((node_uri, NAVIS.hasElementCount, Literal(count, datatype=XSD.integer)))
-
-        # ParentId 기반 자식/자손 수 계산
-        logger.info("Computing child and descendant counts...")
-        self._compute_hierarchy_counts(objects)
-
-        for obj_id, child_count in self._child_counts.items():
-            if obj_id in self._object_cache:
-                uri = self._object_cache[obj_id]
-                self.graph.add((uri, NAVIS.hasChildCount, Literal(child_count, datatype=XSD.integer)))
-
-        for obj_id, desc_count in self._descendant_counts.items():
-            if obj_id in self._object_cache:
-                uri = self._object_cache[obj_id]
-                self.graph.add((uri, NAVIS.hasDescendantCount, Literal(desc_count, datatype=XSD.integer)))
+        # System Path 요소 수 + ParentId 기반 자식/자손 수
+        parents = {obj_id: obj_data["parent_id"] for obj_id, obj_data in objects.items()}
+        self._emit_hierarchy_counts(parents, self.graph.add)
 
         # 통계
         stats["path_nodes"] = len(self._path_node_cache)
@@ -948,6 +1196,98 @@ class NavisToRDFConverter:
         return self.graph
 
 
+def _partition_of(obj_id: str, workers: int) -> int:
+    """ObjectId의 파티션 번호. 프로세스마다 달라지는 hash() 대신 crc32를 사용한다."""
+    return zlib.crc32(obj_id.encode("utf-8")) % workers
+
+
+def _split_partitions(csv_path: str, workers: int, out_dir: str) -> tuple[List[str], int]:
+    """CSV 행을 ObjectId 파티션별 CSV 파일로 나눈다.
+
+    Returns:
+        (파티션 파일 경로 목록, 읽은 전체 행 수). ObjectId가 없는 행은 버린다.
+    """
+    paths = [str(Path(out_dir) / f"part_{i:03d}.csv") for i in range(workers)]
+    files = [open(path, "w", encoding="utf-8", newline="") for path in paths]
+    total_rows = 0
+    try:
+        writers = [csv.writer(f) for f in files]
+        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            for writer in writers:
+                writer.writerow(header)
+            col = header.index("ObjectId") if "ObjectId" in header else -1
+            for row in reader:
+                total_rows += 1
+                obj_id = row[col].strip() if 0 <= col < len(row) else ""
+                if obj_id and obj_id != NULL_OBJECT_ID:
+                    writers[_partition_of(obj_id, workers)].writerow(row)
+    finally:
+        for f in files:
+            f.close()
+    return paths, total_rows
+
+
+def _convert_partition(
+    partition_csv: str, shard_path: str, fmt: str, chunk_rows: int,
+) -> Dict[str, Any]:
+    """병렬 변환 워커: 파티션 CSV의 객체 트리플을 ObjectId 순으로 샤드에 기록한다.
+
+    System Path 노드 트리플은 중앙에서 생성하므로 기록하지 않고, 중앙 처리에 필요한
+    ParentId 맵, System Path 목록, 경로별 요소 수를 반환한다. 샤드와 함께 쓰는
+    인덱스 파일에는 객체마다 ``ObjectId<TAB>트리플 수``를 기록한다 (병합 경계).
+    """
+    from .rdf_writer import TripleWriter
+
+    converter = NavisToRDFConverter()
+    stats = converter._new_hierarchy_stats()
+    parents: Dict[str, str] = {}
+    system_paths: Set[str] = set()
+    rows = converter._iter_sorted_rows(partition_csv, stats, chunk_rows)
+    index_path = shard_path + ".idx"
+
+    with TripleWriter(shard_path, fmt=fmt, namespaces=NavisToRDFConverter.NAMESPACES,
+                      header=False) as writer, \
+            open(index_path, "w", encoding="utf-8") as index_file:
+        for obj_id, group in itertools.groupby(rows, key=converter._valid_object_id):
+            obj_data = None
+            for row in group:
+                if obj_data is None:
+                    obj_data = converter._new_hierarchy_object(row)
+                converter._collect_hierarchy_row(obj_data, row)
+            parents[obj_id] = obj_data["parent_id"]
+            system_path = obj_data["sp3d_properties"].get("System Path", "")
+            if system_path:
+                system_paths.add(system_path)
+
+            batch: List[tuple] = []
+            converter._emit_hierarchy_object(
+                obj_id, obj_data, stats, batch.append, path_add=lambda triple: None,
+            )
+            triples = dict.fromkeys(batch)
+            writer.add_all(triples)
+            index_file.write(f"{obj_id}\t{len(triples)}\n")
+
+    return {
+        "shard": shard_path,
+        "index": index_path,
+        "stats": stats,
+        "parents": parents,
+        "paths": sorted(system_paths),
+        "path_counts": converter._path_element_counts,
+    }
+
+
+def _iter_shard(shard_path: str, index_path: str) -> Iterator[tuple[str, List[str]]]:
+    """샤드를 (ObjectId, 해당 객체의 트리플 줄 목록) 단위로 읽는다."""
+    with open(shard_path, "r", encoding="utf-8", newline="\n") as shard, \
+            open(index_path, "r", encoding="utf-8") as index_file:
+        for entry in index_file:
+            obj_id, count = entry.rstrip("\n").split("\t")
+            yield obj_id, [shard.readline() for _ in range(int(count))]
+
+
 def detect_csv_format(csv_path: str) -> str:
     """CSV 파일의 포맷을 자동 감지한다.
 
@@ -962,10 +1302,44 @@ def detect_csv_format(csv_path: str) -> str:
         return "legacy"
 
 
+def _convert_streaming(
+    converter: NavisToRDFConverter,
+    fmt: str,
+    hierarchy_csv: str,
+    schedule_csv: Optional[str],
+    output_path: str,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """계층 트리플은 객체 단위로 바로 기록하고, 스키마/일정 트리플은 마지막에 기록한다."""
+    from .rdf_writer import TripleWriter
+
+    with TripleWriter(output_path, namespaces=NavisToRDFConverter.NAMESPACES) as writer:
+        if fmt == "unified":
+            logger.warning("UnifiedExport 포맷은 스트리밍을 지원하지 않아 메모리에서 변환합니다")
+            result = {"hierarchy": converter.convert_unified_csv(hierarchy_csv)}
+        elif workers:
+            result = {"hierarchy": converter.convert_hierarchy_csv_parallel(
+                hierarchy_csv, writer, workers)}
+        else:
+            result = {"hierarchy": converter.convert_hierarchy_csv_streaming(hierarchy_csv, writer)}
+
+        if schedule_csv and Path(schedule_csv).exists():
+            # 일정 매칭은 상주하는 ObjectId→URI 맵만 사용하므로 스트리밍 후에도 동작한다
+            result["schedule"] = converter.convert_schedule_csv(schedule_csv)
+
+        # 메모리 그래프에 남은 스키마 + 일정 트리플 (출력이 결정적이도록 정렬)
+        writer.add_all(sorted(converter.graph, key=lambda t: tuple(term.n3() for term in t)))
+
+    result["total_triples"] = writer.count
+    return result
+
+
 def convert_navis_to_rdf(
     hierarchy_csv: str,
     schedule_csv: Optional[str] = None,
     output_path: Optional[str] = None,
+    streaming: bool = False,
+    workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """dxtnavis CSV 파일들을 RDF로 변환하는 편의 함수.
 
@@ -976,7 +1350,11 @@ def convert_navis_to_rdf(
     Args:
         hierarchy_csv: AllHierarchy 또는 UnifiedExport CSV 파일 경로
         schedule_csv: Schedule CSV 파일 경로 (선택)
-        output_path: 출력 TTL 파일 경로 (선택)
+        output_path: 출력 TTL 파일 경로 (선택, ``.nt``이면 N-Triples)
+        streaming: True면 계층 CSV를 객체 단위로 스트리밍 변환해 output_path에 바로 기록한다.
+            전체 그래프를 메모리에 올리지 않으므로 대용량 플랜트 export에 사용한다.
+        workers: 지정하면 계층 CSV를 ObjectId 해시로 분할해 워커 프로세스 수만큼 병렬 변환한다
+            (스트리밍 출력). 출력은 워커 수와 무관하게 바이트 단위로 동일하다.
 
     Returns:
         변환 결과 통계
@@ -986,6 +1364,13 @@ def convert_navis_to_rdf(
     fmt = detect_csv_format(hierarchy_csv)
     logger.info(f"Detected CSV format: {fmt}")
 
+    if streaming or workers:
+        if not output_path:
+            raise ValueError("스트리밍 변환에는 output_path가 필요합니다")
+        return _convert_streaming(
+            converter, fmt, hierarchy_csv, schedule_csv, output_path, workers,
+        )
+
     if fmt == "unified":
         result = {"hierarchy": converter.convert_unified_csv(hierarchy_csv)}
     else:
@@ -1003,19 +1388,25 @@ def convert_navis_to_rdf(
 
 
 if __name__ == "__main__":
-    import sys
+    import argparse
 
     logging.basicConfig(level=logging.INFO)
 
-    if len(sys.argv) < 2:
-        print("Usage: python navis_to_rdf.py <hierarchy.csv> [schedule.csv] [output.ttl]")
-        sys.exit(1)
-
-    hierarchy_csv = sys.argv[1]
-    schedule_csv = sys.argv[2] if len(sys.argv) > 2 else None
-    output_path = sys.argv[3] if len(sys.argv) > 3 else "navis_output.ttl"
-
-    result = convert_navis_to_rdf(hierarchy_csv, schedule_csv, output_path)
+    parser = argparse.ArgumentParser(description="dxtnavis CSV → RDF 변환")
+    parser.add_argument("hierarchy_csv", help="AllHierarchy 또는 UnifiedExport CSV")
+    parser.add_argument("schedule_csv", nargs="?", default=None, help="Schedule CSV (선택)")
+    parser.add_argument("output_path", nargs="?", default="navis_output.ttl",
+                        help="출력 파일 (.ttl 또는 .nt)")
+    parser.add_argument("--stream", action="store_true",
+                        help="객체 단위 스트리밍 변환 (대용량 CSV, 메모리 제한)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="ObjectId 파티션 병렬 변환 워커 수 (스트리밍 출력, 결과는 워커 수와 무관)")
+    args = parser.parse_args()
+
+    result = convert_navis_to_rdf(
+        args.hierarchy_csv, args.schedule_csv, args.output_path,
+        streaming=args.stream, workers=args.workers,
+    )
 
     print("\n=== Conversion Results ===")
     h = result['hierarchy']
@@ -0,0 +1,127 @@
+"""스트리밍 RDF 트리플 writer.
+
+변환 결과를 하나의 거대한 rdflib Graph에 모은 뒤 직렬화하는 대신,
+트리플을 생성되는 즉시 N-Triples 또는 Turtle 파일에 한 줄씩 기록합니다.
+피크 메모리가 모델 크기가 아니라 배치 크기에 비례하도록 하기 위한 것입니다.
+
+- N-Triples (``.nt``): 한 줄에 트리플 하나, 샤드 병합/정렬에 적합
+- Turtle (그 외 확장자): 프리픽스 헤더를 먼저 쓰고 트리플을 한 줄씩 기록
+
+두 포맷 모두 리터럴을 N-Triples 이스케이프로 쓰므로 트리플 하나가 항상 정확히 한 줄이다.
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Iterable, Optional
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.plugins.serializers.nt import _nt_row, _quoteLiteral
+
+logger = logging.getLogger(__name__)
+
+# Turtle 프리픽스 이름의 로컬 부분으로 안전하게 쓸 수 있는 문자열 (보수적 부분집합)
+_SAFE_LOCAL = re.compile(r"^[A-Za-z_][A-Za-z0-9_\-]*$")
+
+
+def format_for_path(path: str) -> str:
+    """출력 경로의 확장자로 직렬화 포맷("nt" 또는 "turtle")을 결정한다."""
+    return "nt" if Path(path).suffix.lower() in (".nt", ".ntriples") else "turtle"
+
+
+class TripleWriter:
+    """트리플을 파일에 스트리밍으로 기록하는 writer.
+
+    Example:
+        with TripleWriter("out.nt") as writer:
+            writer.add((s, p, o))
+            writer.add_graph(schema_graph)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fmt: Optional[str] = None,
+        namespaces: Optional[Iterable[tuple[str, URIRef]]] = None,
+        header: bool = True,
+    ):
+        """
+        Args:
+            path: 출력 파일 경로
+            fmt: "nt" 또는 "turtle". None이면 확장자로 결정한다.
+            namespaces: Turtle 헤더에 쓸 (prefix, namespace) 목록
+            header: False면 Turtle 프리픽스 헤더를 쓰지 않는다 (나중에 병합할 샤드용)
+        """
+        self.path = str(path)
+        self.format = fmt or format_for_path(self.path)
+        if self.format not in ("nt", "turtle"):
+            raise ValueError(f"지원하지 않는 스트리밍 포맷: {self.format}")
+        self.count = 0
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8", newline="\n")
+
+        # 긴 네임스페이스부터 매칭해야 중첩 네임스페이스가 올바르게 축약된다
+        self._prefixes: list[tuple[str, str]] = []
+        if self.format == "turtle":
+            for prefix, ns in namespaces or []:
+                if prefix:
+                    if header:
+                        self._file.write(f"@prefix {prefix}: <{ns}> .\n")
+                    self._prefixes.append((prefix, str(ns)))
+            self._prefixes.sort(key=lambda item: -len(item[1]))
+            if header:
+                self._file.write("\n")
+
+    def _turtle_term(self, term) -> str:
+        if isinstance(term, URIRef):
+            uri = str(term)
+            for prefix, ns in self._prefixes:
+                if uri.startswith(ns):
+                    local = uri[len(ns):]
+                    if _SAFE_LOCAL.match(local):
+                        return f"{prefix}:{local}"
+                    break
+            return term.n3()
+        if isinstance(term, Literal):
+            # N-Triples 리터럴 표기는 Turtle에서도 유효하며 줄바꿈을 이스케이프한다
+            return _quoteLiteral(term)
+        return term.n3()
+
+    def line(self, triple: tuple) -> str:
+        """트리플을 이 writer의 포맷으로 직렬화한 한 줄을 반환한다 (기록하지 않음)."""
+        if self.format == "nt":
+            return _nt_row(triple)
+        s, p, o = triple
+        return f"{self._turtle_term(s)} {self._turtle_term(p)} {self._turtle_term(o)} .\n"
+
+    def add(self, triple: tuple) -> None:
+        """트리플 하나를 기록한다."""
+        self._file.write(self.line(triple))
+        self.count += 1
+
+    def add_all(self, triples: Iterable[tuple]) -> None:
+        """트리플 묶음(배치)을 기록한다."""
+        for triple in triples:
+            self.add(triple)
+
+    def add_lines(self, lines: list[str]) -> None:
+        """같은 포맷으로 이미 직렬화된 트리플 줄들을 그대로 기록한다 (샤드 병합용)."""
+        self._file.writelines(lines)
+        self.count += len(lines)
+
+    def add_graph(self, graph: Graph) -> None:
+        """그래프의 모든 트리플을 기록한다 (스키마 등 소형 그래프용)."""
+        self.add_all(graph)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            logger.info("스트리밍 저장 완료: %s (%d 트리플, %s)", self.path, self.count, self.format)
+
+    def __enter__(self) -> "TripleWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
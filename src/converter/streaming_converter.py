@@ -1,6 +1,8 @@
 """대용량 IFC 파일 스트리밍 변환 모듈.
 
 대용량 IFC 파일을 배치 단위로 처리하여 메모리 사용을 제한합니다.
+트리플은 배치 버퍼에 모았다가 배치 크기에 도달할 때마다 파일에 기록하고 버리므로,
+RDF 쪽 피크 메모리는 모델 크기가 아니라 배치 크기에 비례합니다.
 변환 진행률을 콜백으로 보고합니다.
 """
 
@@ -12,6 +14,7 @@ from rdflib import Graph, Literal, URIRef, RDF, RDFS, OWL, XSD
 
 from .namespace_manager import BIM, INST, bind_namespaces, get_ifc_namespace
 from .mapping import GEOMETRY_TYPES, SPATIAL_TYPES, is_convertible, map_ifc_value
+from .rdf_writer import TripleWriter
 from ..parser.ifc_parser import IFCParser, classify_element_name
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,41 @@ logger = logging.getLogger(__name__)
 ProgressCallback = Callable[[int, int, str], None]
 
 
+class TripleBatch:
+    """배치 버퍼. 엔티티 batch_size개 분량의 트리플을 모은 뒤 writer로 내보내고 비운다.
+
+    Graph처럼 add()를 제공하므로 변환 메서드는 Graph 대신 배치에 트리플을 추가한다.
+    배치 안의 중복 트리플은 기록 전에 제거된다.
+    """
+
+    def __init__(self, writer: TripleWriter, batch_size: int, stats: dict):
+        self._writer = writer
+        self._batch_size = batch_size
+        self._stats = stats
+        self._triples: dict = {}
+        self._entities = 0
+
+    def add(self, triple: tuple) -> None:
+        self._triples[triple] = None
+
+    def __len__(self) -> int:
+        return len(self._triples)
+
+    def entity_done(self) -> None:
+        """엔티티 하나의 변환이 끝났음을 알린다. 배치가 차면 기록한다."""
+        self._entities += 1
+        if self._entities >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """버퍼의 트리플을 기록하고 비운다."""
+        if self._triples:
+            self._writer.add_all(self._triples)
+            self._stats["batches"] += 1
+        self._triples = {}
+        self._entities = 0
+
+
 class StreamingConverter:
     """대용량 IFC 파일을 배치 단위로 스트리밍 변환하는 클래스.
 
@@ -30,6 +68,7 @@ class StreamingConverter:
         self._schema = schema
         self._ifc_ns = get_ifc_namespace(schema)
         self._batch_size = batch_size
+        self._declared_classes: set[URIRef] = set()
         self._stats = {
             "entities_processed": 0,
             "entities_skipped": 0,
@@ -48,80 +87,82 @@ class StreamingConverter:
         output_path: str,
         progress_cb: ProgressCallback | None = None,
     ) -> str:
-        """IFC 파일을 스트리밍 방식으로 RDF Turtle 파일로 변환한다.
+        """IFC 파일을 스트리밍 방식으로 RDF 파일로 변환한다.
+
+        프리픽스 헤더와 스키마(TBox)를 먼저 쓰고, 이후 트리플은 batch_size개
+        엔티티마다 파일에 기록한 뒤 버퍼를 비운다.
 
         Args:
             parser: 로딩된 IFCParser
-            output_path: 출력 Turtle 파일 경로
+            output_path: 출력 파일 경로 (``.nt``이면 N-Triples, 그 외는 Turtle)
             progress_cb: 진행률 콜백 (current, total, message)
 
         Returns:
             출력 파일 경로
         """
         start = time.time()
-        g = Graph()
-        bind_namespaces(g, self._schema)
+        self._declared_classes.clear()
 
-        # 스키마(TBox) 구축
-        self._build_schema(g)
+        namespaces = bind_namespaces(Graph(bind_namespaces="none"), self._schema).namespaces()
+        with TripleWriter(output_path, namespaces=namespaces) as writer:
+            # 스키마(TBox) 구축
+            schema = Graph()
+            self._build_schema(schema)
+            writer.add_graph(schema)
 
-        type_counts = parser.get_type_counts()
-        total_types = len(type_counts)
-        convertible_types = [t for t in type_counts if self._should_convert(t)]
+            batch = TripleBatch(writer, self._batch_size, self._stats)
 
-        if progress_cb:
-            progress_cb(0, len(convertible_types), "변환 시작")
+            type_counts = parser.get_type_counts()
+            convertible_types = [t for t in type_counts if self._should_convert(t)]
 
-        # 공간 구조 먼저 변환
-        for spatial_type in ["IfcProject", "IfcSite", "IfcBuilding",
-                             "IfcBuildingStorey", "IfcSpace"]:
-            self._convert_spatial_type(parser, g, spatial_type)
-
-        # 관계 변환
-        self._convert_relations(parser, g)
+            if progress_cb:
+                progress_cb(0, len(convertible_types), "변환 시작")
 
-        # 물리적 요소를 타입 단위 배치로 변환
-        for idx, ifc_type in enumerate(convertible_types):
-            if ifc_type in SPATIAL_TYPES:
-                continue
+            # 공간 구조 먼저 변환
+            for spatial_type in ["IfcProject", "IfcSite", "IfcBuilding",
+                                 "IfcBuildingStorey", "IfcSpace"]:
+                self._convert_spatial_type(parser, batch, spatial_type)
 
-            entities = parser.get_entities(ifc_type)
-            batch_count = 0
+            # 관계 변환
+            self._convert_relations(parser, batch)
 
-            for entity in entities:
-                if not hasattr(entity, "GlobalId") or not entity.GlobalId:
-                    self._stats["entities_skipped"] += 1
+            # 물리적 요소를 타입 단위 배치로 변환
+            for idx, ifc_type in enumerate(convertible_types):
+                if ifc_type in SPATIAL_TYPES:
                     continue
 
-                self._convert_single_entity(g, entity, ifc_type)
-                batch_count += 1
-                self._stats["entities_processed"] += 1
+                entities = parser.get_entities(ifc_type)
+                batch_count = 0
 
-                if batch_count % self._batch_size == 0:
-                    self._stats["batches"] += 1
+                for entity in entities:
+                    if not hasattr(entity, "GlobalId") or not entity.GlobalId:
+                        self._stats["entities_skipped"] += 1
+                        continue
 
-            if progress_cb:
-                progress_cb(
-                    idx + 1,
-                    len(convertible_types),
-                    f"{ifc_type}: {batch_count}개",
-                )
+                    self._convert_single_entity(batch, entity, ifc_type)
+                    batch.entity_done()
+                    batch_count += 1
+                    self._stats["entities_processed"] += 1
 
-        # 속성셋 변환
-        self._convert_property_sets(parser, g)
+                if progress_cb:
+                    progress_cb(
+                        idx + 1,
+                        len(convertible_types),
+                        f"{ifc_type}: {batch_count}개",
+                    )
 
-        # 저장
-        self._stats["triples_generated"] = len(g)
-        self._stats["elapsed"] = time.time() - start
+            # 속성셋 변환
+            self._convert_property_sets(parser, batch)
+            batch.flush()
 
-        from pathlib import Path
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        g.serialize(destination=output_path, format="turtle")
+        self._stats["triples_generated"] = writer.count
+        self._stats["elapsed"] = time.time() - start
 
         logger.info(
-            "스트리밍 변환 완료: %d 엔티티, %d 트리플, %.1f초, %d 스킵",
+            "스트리밍 변환 완료: %d 엔티티, %d 트리플, %d 배치, %.1f초, %d 스킵",
             self._stats["entities_processed"],
             self._stats["triples_generated"],
+            self._stats["batches"],
             self._stats["elapsed"],
             self._stats["entities_skipped"],
         )
@@ -163,7 +204,7 @@ class StreamingConverter:
         g.add((BIM.hasProperty, RDF.type, OWL.ObjectProperty))
         g.add((BIM.hasPropertyValue, RDF.type, OWL.DatatypeProperty))
 
-    def _convert_spatial_type(self, parser: IFCParser, g: Graph, ifc_type: str):
+    def _convert_spatial_type(self, parser: IFCParser, g: TripleBatch, ifc_type: str):
         """공간 요소를 변환한다."""
         bim_class_map = {
             "IfcProject": BIM.Project,
@@ -188,21 +229,24 @@ class StreamingConverter:
             if ifc_type == "IfcBuildingStorey" and entity.Elevation is not None:
                 g.add((uri, BIM.hasElevation,
                        Literal(entity.Elevation, datatype=XSD.double)))
+            g.entity_done()
             self._stats["entities_processed"] += 1
 
-    def _convert_relations(self, parser: IFCParser, g: Graph):
+    def _convert_relations(self, parser: IFCParser, g: TripleBatch):
         """공간 관계를 변환한다."""
         for parent, child in parser.get_aggregation_relations():
             g.add((self._entity_uri(parent), BIM.aggregates, self._entity_uri(child)))
             g.add((self._entity_uri(child), BIM.decomposes, self._entity_uri(parent)))
+            g.entity_done()
 
         for structure, element in parser.get_containment_relations():
             g.add((self._entity_uri(structure), BIM.containsElement,
                    self._entity_uri(element)))
             g.add((self._entity_uri(element), BIM.isContainedIn,
                    self._entity_uri(structure)))
+            g.entity_done()
 
-    def _convert_single_entity(self, g: Graph, entity: Any, ifc_type: str):
+    def _convert_single_entity(self, g: TripleBatch, entity: Any, ifc_type: str):
         """단일 엔티티를 변환한다."""
         uri = self._entity_uri(entity)
         g.add((uri, RDF.type, self._ifc_ns[ifc_type]))
@@ -226,16 +270,15 @@ class StreamingConverter:
             g.add((uri, BIM.hasCategory, Literal(category)))
             cat_class = BIM[category]
             g.add((uri, RDF.type, cat_class))
-            g.add((cat_class, RDF.type, OWL.Class))
-            g.add((cat_class, RDFS.subClassOf, BIM.PhysicalElement))
+            # 카테고리 클래스 선언은 배치를 넘어 반복되지 않도록 한 번만 기록한다
+            if cat_class not in self._declared_classes:
+                self._declared_classes.add(cat_class)
+                g.add((cat_class, RDF.type, OWL.Class))
+                g.add((cat_class, RDFS.subClassOf, BIM.PhysicalElement))
 
-    def _convert_property_sets(self, parser: IFCParser, g: Graph):
+    def _convert_property_sets(self, parser: IFCParser, g: TripleBatch):
         """속성셋을 변환한다."""
-        for rel in parser.get_entities("IfcRelDefinesByProperties"):
-            pset_def = rel.RelatingPropertyDefinition
-            if not hasattr(pset_def, "HasProperties") or not pset_def.HasProperties:
-                continue
-
+        for pset_def, related_objects in parser.get_property_definitions():
             pset_uri = INST[f"pset_{pset_def.GlobalId}"]
             g.add((pset_uri, RDF.type, BIM.PropertySet))
             if pset_def.Name:
@@ -249,8 +292,9 @@ class StreamingConverter:
                 if value is not None:
                     g.add((prop_uri, BIM.hasPropertyValue, value))
 
-            for obj in rel.RelatedObjects:
+            for obj in related_objects:
                 g.add((self._entity_uri(obj), BIM.hasPropertySet, pset_uri))
+            g.entity_done()
 
     def _entity_uri(self, entity: Any) -> URIRef:
         """엔티티 URI를 생성한다."""
@@ -1317,6 +1317,7 @@ function shortenUri(uri) {
 let explorerInited = false;
 let expSelectedType = null;  // null = All
 let expPage = 0;
+let expCursors = [null];  // expCursors[n] = cursor for page n (next_cursor of page n-1)
 const EXP_PAGE_SIZE = 50;
 
 async function initExplorer() {
@@ -1344,6 +1345,7 @@ function refreshExplorer() {
     explorerInited = false;
     expSelectedType = null;
     expPage = 0;
+    expCursors = [null];
     initExplorer();
 }
 
@@ -1385,6 +1387,7 @@ async function loadNodeTypes() {
 function selectNodeType(typeShort, el) {
     expSelectedType = typeShort;
     expPage = 0;
+    expCursors = [null];
     // Update radio visual
     document.querySelectorAll('#exp-types .type-radio').forEach(r => r.classList.remove('selected'));
     if (el) el.classList.add('selected');
@@ -1441,7 +1444,9 @@ async function loadNodes() {
     const file = document.getElementById('exp-ttl-select').value;
     const search = document.getElementById('exp-search').value.trim();
 
-    let url = '/api/reasoning/nodes?limit=' + EXP_PAGE_SIZE + '&offset=' + (expPage * EXP_PAGE_SIZE);
+    let url = '/api/reasoning/nodes?limit=' + EXP_PAGE_SIZE;
+    const cursor = expCursors[expPage];
+    url += cursor ? '&cursor=' + encodeURIComponent(cursor) : '&offset=' + (expPage * EXP_PAGE_SIZE);
     if (file) url += '&ttl_file=' + encodeURIComponent(file);
     if (expSelectedType) url += '&type_filter=' + encodeURIComponent(expSelectedType);
     url += '&columns=' + encodeURIComponent(columns.join(','));
@@ -1475,12 +1480,14 @@ async function loadNodes() {
         return '<tr>' + cells + '</tr>';
     }).join('');
 
+    expCursors[expPage + 1] = data.next_cursor || null;
     const totalPages = Math.ceil(data.total / EXP_PAGE_SIZE);
     info.textContent = formatNumber(data.total) + ' total';
     pageInfo.textContent = 'Page ' + (expPage + 1) + ' of ' + (totalPages || 1);
 }
 
-function expNextPage() { expPage++; loadNodes(); }
+function expNextPage() { if (expCursors[expPage + 1]) { expPage++; loadNodes(); } }
+function expReload() { expPage = 0; expCursors = [null]; loadNodes(); }
 function expPrevPage() { if (expPage > 0) { expPage--; loadNodes(); } }
 
 async function showNodeDetail(subjectShort) {
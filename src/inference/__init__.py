@@ -1,3 +1,4 @@
+from .incremental import IncrementalReasoner
 from .reasoner import OWLReasoner
 
-__all__ = ["OWLReasoner"]
+__all__ = ["IncrementalReasoner", "OWLReasoner"]
@@ -0,0 +1,372 @@
+"""증분(델타) 추론 모듈.
+
+OWLReasoner.run_all()은 변경이 20개 요소뿐이어도 전체 그래프에 DeductiveClosure와
+모든 CONSTRUCT 규칙을 다시 적용합니다. IncrementalReasoner는 subClassOf 타입 추론과
+CUSTOM_RULES의 결과를 (규칙, 초점 노드) 단위로 기록해 두고, 추가/삭제된 트리플이
+영향을 주는 초점 노드만 다시 유도합니다 (semi-naive).
+
+- 초점 노드: 규칙 헤드의 주어 변수 (예: ``?elem``). 규칙은 초점 노드 하나씩 평가할 수 있다.
+- 영향 분석: 변경 트리플을 규칙 본문의 각 트리플 패턴에 매칭하고, 초점 변수가 묶이지 않으면
+  나머지 패턴을 조인해 초점 노드를 찾는다. 삭제는 삭제 전 그래프(현재 그래프 + 삭제분)에서 찾는다.
+- 지지 카운트: 추론 트리플마다 자신을 유도한 (규칙, 초점) 수를 세고, 0이 되면 그래프에서 제거한다.
+  단언(asserted) 트리플과 같은 추론 결과는 그래프에 더하지도 지우지도 않는다.
+- 전파: 추가/제거된 추론 트리플은 다음 라운드의 델타가 되어 고정점까지 반복한다.
+
+규칙은 자기 헤드 술어를 본문에서 읽지 않는다고 가정한다 (CUSTOM_RULES는 모두 해당).
+재귀적인 subClassOf 타입 추론은 자기 자신만 지지하는 타입을 기반에서 제외해 삭제를 처리한다.
+``NOW()``를 쓰는 규칙(infer_delayed_element)은 시간 경과를 델타로 볼 수 없으므로
+주기적으로 materialize()를 다시 실행한다.
+"""
+
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, Iterable, Optional
+
+from rdflib import Graph, RDF, RDFS, Variable
+from rdflib.graph import ReadOnlyGraphAggregate
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.parserutils import CompValue
+
+from .reasoner import CUSTOM_RULES, OWLReasoner
+from .rule_compiler import compile_rule, match_pattern
+
+logger = logging.getLogger(__name__)
+
+SUBCLASS_RULE = "rdfs_subclass_typing"
+
+# 한 규칙의 영향받는 초점 노드가 이보다 많으면 노드별 평가 대신 규칙 전체를 한 번 평가한다
+FULL_EVALUATION_THRESHOLD = 2000
+
+# 전파 라운드 상한 (비재귀 규칙이면 규칙 사슬 길이 + 1 안에 끝난다)
+MAX_ROUNDS = 50
+
+
+def _body_patterns(node) -> list[tuple]:
+    """SPARQL 대수 트리에서 본문 트리플 패턴을 모두 모은다 (FILTER NOT EXISTS 내부 포함)."""
+    patterns = []
+    if isinstance(node, CompValue):
+        if node.name in ("BGP", "TriplesBlock"):
+            patterns.extend(tuple(t) for t in node.triples)
+        for value in node.values():
+            patterns.extend(_body_patterns(value))
+    elif isinstance(node, (list, tuple)):
+        for value in node:
+            patterns.extend(_body_patterns(value))
+    return patterns
+
+
+class _CustomRule:
+    """CONSTRUCT 규칙 하나를 초점 노드 단위로 평가하고 영향 범위를 계산한다."""
+
+    def __init__(self, name: str, construct: str):
+        self.name = name
+        self.evaluator = compile_rule(construct)
+        self.query = self.evaluator.query
+        template = self.query.algebra["template"]
+        subjects = {t[0] for t in template}
+        if len(subjects) != 1 or not isinstance(next(iter(subjects)), Variable):
+            raise ValueError(f"규칙 헤드의 주어가 단일 변수가 아님: {name}")
+        self.focus = next(iter(subjects))
+        self.patterns = _body_patterns(self.query.algebra["p"])
+        predicates = {p for _, p, _ in self.patterns}
+        # 술어가 변수인 패턴이 있으면 모든 변경을 검사한다
+        self.predicates = None if any(isinstance(p, Variable) for p in predicates) else predicates
+        self._joins: dict[int, object] = {}
+
+    def _join_query(self, i: int):
+        """i번째 패턴을 뺀 나머지 패턴으로 초점 노드를 찾는 SELECT (필터/부정은 무시한 상위집합)."""
+        if i not in self._joins:
+            rest = [p for j, p in enumerate(self.patterns) if j != i]
+            body = " . ".join(" ".join(term.n3() for term in p) for p in rest)
+            self._joins[i] = (
+                prepareQuery(f"SELECT DISTINCT {self.focus.n3()} WHERE {{ {body} }}")
+                if rest else None
+            )
+        return self._joins[i]
+
+    def affected(self, triple: tuple, graph: Graph) -> set:
+        """트리플 변경으로 결과가 달라질 수 있는 초점 노드."""
+        foci = set()
+        for i, pattern in enumerate(self.patterns):
+            bindings = match_pattern(pattern, triple)
+            if bindings is None:
+                continue
+            if self.focus in bindings:
+                foci.add(bindings[self.focus])
+                continue
+            query = self._join_query(i)
+            if query is not None:
+                foci.update(row[0] for row in graph.query(query, initBindings=bindings))
+        return foci
+
+    def derive(self, graph: Graph, focus) -> frozenset:
+        return frozenset(self.evaluator.evaluate(graph, {self.focus: focus}))
+
+    def derive_all(self, graph: Graph) -> dict:
+        derived = defaultdict(set)
+        for triple in self.evaluator.evaluate(graph):
+            derived[triple[0]].add(triple)
+        return {focus: frozenset(triples) for focus, triples in derived.items()}
+
+
+class _SubclassRule:
+    """``?x a ?C . ?C rdfs:subClassOf+ ?D → ?x a ?D`` 타입 추론."""
+
+    name = SUBCLASS_RULE
+    predicates = {RDF.type, RDFS.subClassOf}
+
+    def __init__(self, reasoner: "IncrementalReasoner"):
+        self._reasoner = reasoner
+        self._supers: dict = {}
+
+    def rebuild(self, graph: Graph) -> None:
+        """subClassOf 계층의 전이 폐포를 다시 계산한다."""
+        direct = defaultdict(set)
+        for sub, sup in graph.subject_objects(RDFS.subClassOf):
+            if sub != sup:
+                direct[sub].add(sup)
+        supers = {}
+        for cls in direct:
+            seen, stack = set(), list(direct[cls])
+            while stack:
+                sup = stack.pop()
+                if sup not in seen:
+                    seen.add(sup)
+                    stack.extend(direct.get(sup, ()))
+            seen.discard(cls)
+            supers[cls] = frozenset(seen)
+        self._supers = supers
+
+    def affected(self, triple: tuple, graph: Graph) -> Optional[set]:
+        s, p, _ = triple
+        if p == RDFS.subClassOf:
+            self.rebuild(self._reasoner.graph)
+            return None
+        return {s} if p == RDF.type else set()
+
+    def derive(self, graph: Graph, focus) -> frozenset:
+        own = self._reasoner._derived[self.name].get(focus, frozenset())
+        derived = set()
+        for cls in graph.objects(focus, RDF.type):
+            if self._reasoner._self_supported((focus, RDF.type, cls), own):
+                continue
+            derived.update((focus, RDF.type, sup) for sup in self._supers.get(cls, ()))
+        return frozenset(derived)
+
+    def derive_all(self, graph: Graph) -> dict:
+        subjects = {s for cls in self._supers for s in graph.subjects(RDF.type, cls)}
+        derived = {s: self.derive(graph, s) for s in subjects}
+        return {s: triples for s, triples in derived.items() if triples}
+
+
+class IncrementalReasoner:
+    """subClassOf 타입 추론과 커스텀 규칙을 델타 단위로 유지하는 추론기.
+
+    Example:
+        reasoner = IncrementalReasoner(graph)
+        reasoner.materialize()
+        # ... graph 변경 후
+        reasoner.apply_delta(added=[...], removed=[...])
+    """
+
+    def __init__(
+        self, graph: Graph, rule_names: list[str] | None = None, target: Graph | None = None,
+        on_change: Callable[[list, list], Any] | None = None,
+    ):
+        """
+        Args:
+            graph: 추론 대상 그래프 (규칙은 이 그래프를 읽는다)
+            rule_names: 유지할 CUSTOM_RULES 이름 목록. None이면 전체.
+            target: 추론 트리플을 기록할 그래프. None이면 graph에 기록한다.
+                별도 추론 그래프를 쓸 때는 graph로 단언+추론 합집합 뷰(UnionGraph)를 준다.
+            on_change: target에 실제로 추가/삭제한 추론 트리플을 ``on_change(added, removed)``로
+                통지받을 콜백 (스토어의 dirty 노드 추적 등)
+        """
+        self._graph = graph
+        self._target = graph if target is None else target
+        self._on_change = on_change
+        names = list(CUSTOM_RULES) if rule_names is None else rule_names
+        self._rules = [_SubclassRule(self)] + [
+            _CustomRule(name, CUSTOM_RULES[name]["construct"]) for name in names
+        ]
+        self._derived: dict[str, dict] = {rule.name: {} for rule in self._rules}
+        self._support: Counter = Counter()
+        self._inferred: set = set()
+        self._gained = self._lost = 0
+
+    @property
+    def graph(self) -> Graph:
+        return self._graph
+
+    @property
+    def target(self) -> Graph:
+        return self._target
+
+    @property
+    def inferred(self) -> frozenset:
+        """추론기가 그래프에 더한 (단언되지 않은) 트리플."""
+        return frozenset(self._inferred)
+
+    def _self_supported(self, triple: tuple, own: frozenset) -> bool:
+        """추론 트리플이 own 유도만으로 지지되고 있는지 (재귀 규칙의 순환 지지 방지용)."""
+        return triple in self._inferred and self._support[triple] <= (triple in own)
+
+    def materialize(self) -> dict:
+        """기존 추론 결과를 지우고 전체 그래프에서 다시 유도한다.
+
+        Returns:
+            추론 통계 딕셔너리
+        """
+        start = time.time()
+        g = self._graph
+        for triple in self._inferred:
+            self._target.remove(triple)
+        self._inferred.clear()
+        self._support.clear()
+        for derived in self._derived.values():
+            derived.clear()
+
+        OWLReasoner(self._target).add_schema_classes()
+        self._rules[0].rebuild(g)
+        touched = set()
+        for rule in self._rules:
+            touched |= self._rederive(rule, None)
+        added, removed = self._reconcile(touched)
+        rounds = 1 + self._propagate(added, removed)
+
+        logger.info("증분 추론 초기화: 추론 트리플 %d개 (%d 라운드, %.1f초)",
+                    len(self._inferred), rounds, time.time() - start)
+        return {
+            "inferred_triples": len(self._inferred),
+            "total_triples": len(g),
+            "rounds": rounds,
+            "elapsed": time.time() - start,
+        }
+
+    def apply_delta(self, added: Iterable[tuple] = (), removed: Iterable[tuple] = ()) -> dict:
+        """그래프에 이미 반영된 단언 트리플 변경에 맞춰 추론 결과를 갱신한다.
+
+        Args:
+            added: 새로 추가된 단언 트리플
+            removed: 삭제된 단언 트리플. 다른 규칙이 여전히 유도하는 트리플은 추론 트리플로 되살린다.
+
+        Returns:
+            {"inferred_added", "inferred_removed", "rounds", "elapsed"}
+        """
+        start = time.time()
+        added, removed = list(added), list(removed)
+        for triple in added:
+            # 단언된 트리플은 더 이상 추론 트리플이 아니다 (별도 추론 그래프에서는 지운다)
+            if triple in self._inferred:
+                self._inferred.discard(triple)
+                if self._target is not self._graph:
+                    self._target.remove(triple)
+        self._inferred.difference_update(removed)
+        # 삭제됐지만 규칙이 지지하는 트리플은 추론 트리플로 남으므로 유도 결과에 변화가 없다
+        restored = [t for t in removed if self._support[t]]
+        for triple in restored:
+            self._target.add(triple)
+            self._inferred.add(triple)
+        if restored and self._on_change is not None:
+            self._on_change(restored, [])
+        removed = [t for t in removed if not self._support[t]]
+
+        before = len(self._inferred)
+        self._gained = self._lost = 0
+        rounds = self._propagate(added, removed)
+        stats = {
+            "inferred_added": self._gained,
+            "inferred_removed": self._lost,
+            "inferred_triples": len(self._inferred),
+            "rounds": rounds,
+            "elapsed": time.time() - start,
+        }
+        logger.info("증분 추론: 단언 +%d/-%d → 추론 +%d/-%d (%d → %d, %.3f초)",
+                    len(added), len(removed) + len(restored), self._gained, self._lost,
+                    before, len(self._inferred), stats["elapsed"])
+        return stats
+
+    def _propagate(self, added: list, removed: list) -> int:
+        """추론 트리플 변화가 없을 때까지 델타를 전파하고 라운드 수를 반환한다."""
+        rounds = 0
+        while added or removed:
+            rounds += 1
+            if rounds > MAX_ROUNDS:
+                logger.warning("증분 추론이 %d 라운드 안에 수렴하지 않음", MAX_ROUNDS)
+                break
+            touched = set()
+            for rule, foci in self._affected(added, removed).items():
+                touched |= self._rederive(rule, foci)
+            added, removed = self._reconcile(touched)
+        return rounds
+
+    def _affected(self, added: list, removed: list) -> dict:
+        """규칙별로 다시 유도할 초점 노드 집합 (None이면 전체 평가)."""
+        affected: dict = {}
+        old = None
+        if removed:
+            deleted = Graph()
+            for triple in removed:
+                deleted.add(triple)
+            old = ReadOnlyGraphAggregate([self._graph, deleted])
+        for rule in self._rules:
+            foci: Optional[set] = set()
+            for triples, graph in ((removed, old), (added, self._graph)):
+                for triple in triples:
+                    if rule.predicates is not None and triple[1] not in rule.predicates:
+                        continue
+                    found = rule.affected(triple, graph)
+                    if found is None:
+                        foci = None
+                        break
+                    foci |= found
+                if foci is None:
+                    break
+            if foci is None or len(foci) > FULL_EVALUATION_THRESHOLD:
+                affected[rule] = None
+            elif foci:
+                affected[rule] = foci
+        return affected
+
+    def _rederive(self, rule, foci: Optional[set]) -> set:
+        """초점 노드들의 유도 결과를 다시 계산해 지지 카운트를 갱신하고 바뀐 트리플을 반환한다."""
+        derived = self._derived[rule.name]
+        if foci is None:
+            new = rule.derive_all(self._graph)
+            foci = set(new) | set(derived)
+        else:
+            new = {focus: rule.derive(self._graph, focus) for focus in foci}
+
+        touched = set()
+        for focus in foci:
+            old_triples = derived.pop(focus, frozenset())
+            new_triples = new.get(focus, frozenset())
+            if new_triples:
+                derived[focus] = new_triples
+            for triple in new_triples - old_triples:
+                self._support[triple] += 1
+                touched.add(triple)
+            for triple in old_triples - new_triples:
+                self._support[triple] -= 1
+                if not self._support[triple]:
+                    del self._support[triple]
+                touched.add(triple)
+        return touched
+
+    def _reconcile(self, touched: set) -> tuple[list, list]:
+        """지지 카운트에 맞춰 추론 트리플을 그래프에 추가/제거하고 실제 변경분을 반환한다."""
+        g = self._graph
+        gained = [t for t in touched if self._support[t] and t not in g]
+        lost = [t for t in touched if not self._support[t] and t in self._inferred]
+        for triple in lost:
+            self._target.remove(triple)
+            self._inferred.discard(triple)
+        for triple in gained:
+            self._target.add(triple)
+            self._inferred.add(triple)
+        self._gained += len(gained)
+        self._lost += len(lost)
+        if (gained or lost) and self._on_change is not None:
+            self._on_change(gained, lost)
+        return gained, lost
@@ -11,6 +11,8 @@ from rdflib import Graph, Literal, RDF, RDFS, OWL, XSD, URIRef
 import owlrl
 
 from ..converter.namespace_manager import BIM, INST, SCHED, AWP
+from ..storage.triple_store import INFERRED_GRAPH
+from .rule_compiler import compile_rule
 
 logger = logging.getLogger(__name__)
 
@@ -244,10 +246,11 @@ class OWLReasoner:
                 continue
 
             before = len(self._graph)
-            result = self._graph.query(rule["construct"])
+            # 단순 규칙은 인덱스 조회로, 나머지는 SPARQL로 평가 (순회 중 변경을 피하려고 먼저 모은다)
+            triples = list(compile_rule(rule["construct"]).evaluate(self._graph))
 
             # CONSTRUCT 결과를 그래프에 추가
-            for triple in result:
+            for triple in triples:
                 self._graph.add(triple)
 
             added = len(self._graph) - before
@@ -317,3 +320,39 @@ class OWLReasoner:
             "elapsed": total_time,
             "rules_applied": self._rules_applied,
         }
+
+
+def materialize_inferred(store, before_swap=None) -> dict:
+    """스토어의 단언 그래프 복사본에서 run_all()을 실행해 추론 그래프를 다시 만들고 교체한다.
+
+    단언 그래프는 읽기 잠금 하에 복사만 하고 추론은 잠금 밖의 복사본에서 수행하므로,
+    긴 추론 동안에도 조회는 이전 추론 결과로 계속 응답한다. 새 추론 그래프에는 단언 그래프에
+    없는 트리플만 담기며, ``store.swap_inferred()``로 한 번에 교체된다.
+
+    Args:
+        store: TripleStore
+        before_swap: 교체 직전에 호출할 콜백 (백그라운드 작업의 취소 확인 등)
+
+    Returns:
+        run_all() 통계 + 단언/추론 그래프 트리플 수
+    """
+    work = Graph()
+    with store.reading():
+        for prefix, ns in store.graph.namespaces():
+            work.bind(prefix, ns)
+        work.addN((s, p, o, work) for s, p, o in store.graph)
+
+    stats = OWLReasoner(work).run_all()
+
+    inferred = Graph(identifier=INFERRED_GRAPH)
+    with store.reading():
+        asserted = store.graph
+        inferred.addN((s, p, o, inferred) for s, p, o in work if (s, p, o) not in asserted)
+        stats["asserted_triples"] = len(asserted)
+    del work
+
+    if before_swap is not None:
+        before_swap()
+    store.swap_inferred(inferred)
+    stats["inferred_graph_triples"] = len(inferred)
+    return stats
@@ -0,0 +1,208 @@
+"""커스텀 추론 규칙 컴파일러.
+
+CUSTOM_RULES 대부분은 ``?elem bim:hasCategory ?cat FILTER(?cat IN (...)) → ?elem a X``처럼
+트리플 패턴 한두 개와 IN 필터로 이루어진 단순 규칙입니다. 이런 규칙을 매번 rdflib SPARQL
+파서/평가기로 실행하는 대신, 패턴을 ``graph.triples()`` 인덱스 조회의 중첩 루프로 컴파일합니다.
+
+- 컴파일 대상: BGP 트리플 패턴 MAX_COMPILED_PATTERNS개 이하 (술어는 상수),
+  필터는 ``?v IN (상수, ...)``의 AND 결합만, 헤드에 빈 노드 없음
+- IN 값은 조회 상수로 쓴다 (``graph.triples((None, bim:hasCategory, "Beam"))``).
+  값은 IRI와 단순 리터럴로 제한한다 (숫자/언어 태그 리터럴은 SPARQL 값 비교와 달라질 수 있음)
+- 그 밖의 규칙(FILTER NOT EXISTS, NOW(), 비교 연산 등)은 한 번 파싱한 쿼리를 SPARQL로 평가한다
+
+두 평가기는 같은 인터페이스 ``evaluate(graph, bindings=None)``를 제공하며,
+bindings로 초점 변수를 묶어 노드 하나만 평가할 수 있다 (증분 추론용).
+"""
+
+import itertools
+import logging
+from functools import lru_cache
+from typing import Iterator, Optional
+
+from rdflib import Graph, Literal, URIRef, Variable
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.parserutils import CompValue
+
+logger = logging.getLogger(__name__)
+
+# 컴파일하는 규칙 본문의 최대 트리플 패턴 수
+MAX_COMPILED_PATTERNS = 2
+
+
+def match_pattern(pattern: tuple, triple: tuple, bindings: Optional[dict] = None) -> Optional[dict]:
+    """트리플이 패턴과 맞으면 (기존 바인딩을 확장한) 변수 바인딩을, 아니면 None을 반환한다."""
+    result = dict(bindings) if bindings else {}
+    for term, value in zip(pattern, triple):
+        if isinstance(term, Variable):
+            if result.setdefault(term, value) != value:
+                return None
+        elif term != value:
+            return None
+    return result
+
+
+class SparqlRule:
+    """컴파일할 수 없는 규칙. 미리 파싱한 CONSTRUCT 쿼리를 SPARQL 엔진으로 평가한다."""
+
+    compiled = False
+
+    def __init__(self, query):
+        self.query = query
+
+    def evaluate(self, graph: Graph, bindings: Optional[dict] = None) -> Iterator[tuple]:
+        return iter(graph.query(self.query, initBindings=bindings or {}))
+
+
+class CompiledRule:
+    """트리플 패턴 조회의 중첩 루프로 컴파일된 규칙."""
+
+    compiled = True
+
+    def __init__(self, query, patterns: list[tuple], filters: dict, template: list[tuple]):
+        self.query = query
+        self.patterns = patterns
+        self.filters = filters
+        self.template = template
+        self._orders: dict[frozenset, list[tuple]] = {}
+
+    def evaluate(self, graph: Graph, bindings: Optional[dict] = None) -> Iterator[tuple]:
+        """헤드 트리플을 중복 없이 생성한다."""
+        bindings = dict(bindings or {})
+        for var, value in bindings.items():
+            if var in self.filters and value not in self.filters[var]:
+                return
+        seen = set()
+        order = self._order(frozenset(bindings))
+        for solution in self._solutions(graph, order, 0, bindings):
+            for head in self.template:
+                triple = tuple(solution[t] if isinstance(t, Variable) else t for t in head)
+                if triple not in seen:
+                    seen.add(triple)
+                    yield triple
+
+    def _order(self, bound: frozenset) -> list[tuple]:
+        """제약이 많은 패턴부터 평가하도록 순서를 정한다 (묶인 변수 집합별로 캐시)."""
+        if bound not in self._orders:
+            remaining, known, order = list(self.patterns), set(bound), []
+            while remaining:
+                def free(pattern):
+                    return sum(
+                        isinstance(t, Variable) and t not in known and t not in self.filters
+                        for t in pattern
+                    )
+                best = min(remaining, key=free)
+                remaining.remove(best)
+                order.append(best)
+                known.update(t for t in best if isinstance(t, Variable))
+            self._orders[bound] = order
+        return self._orders[bound]
+
+    def _lookups(self, pattern: tuple, bindings: dict):
+        """패턴에 대한 graph.triples() 조회 인자들. 묶이지 않은 IN 변수는 값마다 조회한다."""
+        choices = []
+        for term in pattern:
+            if not isinstance(term, Variable):
+                choices.append((term,))
+            elif term in bindings:
+                choices.append((bindings[term],))
+            elif term in self.filters:
+                choices.append(self.filters[term])
+            else:
+                choices.append((None,))
+        return itertools.product(*choices)
+
+    def _solutions(self, graph: Graph, order: list[tuple], i: int, bindings: dict):
+        if i == len(order):
+            yield bindings
+            return
+        pattern = order[i]
+        for lookup in self._lookups(pattern, bindings):
+            for triple in graph.triples(lookup):
+                extended = match_pattern(pattern, triple, bindings)
+                if extended is not None:
+                    yield from self._solutions(graph, order, i + 1, extended)
+
+
+def _conjuncts(expr) -> list:
+    """AND로 결합된 필터 식을 개별 식 목록으로 편다."""
+    if isinstance(expr, CompValue) and expr.name == "ConditionalAndExpression":
+        return [part for e in [expr.expr, *expr.other] for part in _conjuncts(e)]
+    return [expr]
+
+
+def _is_constant(term) -> bool:
+    return isinstance(term, (URIRef, Literal))
+
+
+def _in_values(expr, variables: set) -> Optional[tuple]:
+    """``?v IN (IRI 또는 단순 리터럴, ...)`` 필터면 (변수, 값 집합)을, 아니면 None을 반환한다."""
+    if not (isinstance(expr, CompValue) and expr.name == "RelationalExpression"):
+        return None
+    if expr.op != "IN" or expr.expr not in variables:
+        return None
+    values = list(expr.other)
+    for value in values:
+        if isinstance(value, Literal):
+            if value.datatype is not None or value.language is not None:
+                return None
+        elif not isinstance(value, URIRef):
+            return None
+    return expr.expr, frozenset(values)
+
+
+def _compile(query) -> Optional[CompiledRule]:
+    """파싱된 CONSTRUCT 쿼리를 컴파일한다. 지원하지 않는 형태면 None."""
+    algebra = query.algebra
+    if algebra.name != "ConstructQuery" or algebra.get("datasetClause"):
+        return None
+    node = algebra.p
+    if node.name != "Project":
+        return None
+    node = node.p
+    exprs = []
+    if node.name == "Filter":
+        exprs = _conjuncts(node.expr)
+        node = node.p
+    if node.name != "BGP" or not 0 < len(node.triples) <= MAX_COMPILED_PATTERNS:
+        return None
+
+    patterns = [tuple(t) for t in node.triples]
+    variables = set()
+    for s, p, o in patterns:
+        if not isinstance(p, URIRef):
+            return None
+        for term in (s, o):
+            if isinstance(term, Variable):
+                variables.add(term)
+            elif not _is_constant(term):
+                return None
+
+    filters: dict = {}
+    for expr in exprs:
+        parsed = _in_values(expr, variables)
+        if parsed is None:
+            return None
+        var, values = parsed
+        filters[var] = filters[var] & values if var in filters else values
+
+    template = [tuple(t) for t in algebra.template]
+    for head in template:
+        for term in head:
+            if not (term in variables or _is_constant(term)):
+                return None
+    return CompiledRule(query, patterns, filters, template)
+
+
+@lru_cache(maxsize=None)
+def compile_rule(construct: str):
+    """CONSTRUCT 규칙을 평가기로 만든다 (같은 쿼리 문자열은 한 번만 파싱).
+
+    Returns:
+        CompiledRule (단순 규칙) 또는 SparqlRule (그 밖의 규칙)
+    """
+    query = prepareQuery(construct)
+    compiled = _compile(query)
+    if compiled is None:
+        logger.debug("규칙을 컴파일할 수 없어 SPARQL로 평가: %s", construct.strip()[:80])
+        return SparqlRule(query)
+    return compiled
@@ -1,18 +1,38 @@
 """SHACL 검증 모듈.
 
 BIM 온톨로지 데이터에 대한 SHACL 형상 제약조건을 검증합니다.
+
+``validate(..., workers=N)``은 형상별 대상(focus) 노드를 모아 N개 샤드로 나누고,
+샤드마다 초점 노드의 CBD(Concise Bounded Description) 부분 그래프만 뽑아 프로세스 풀에서
+병렬로 검증한 뒤 결과를 합칩니다. 초점 노드 하나의 검증 결과가 그 노드의 CBD로 결정되는
+형상(단순 술어 경로, 노드 자신에 대한 제약)만 샤드로 나눌 수 있으며, 그 밖의 형상
+(sh:node, sh:or, SPARQL 제약, 복합 경로 등)이 있으면 전체 그래프를 한 번에 검증합니다.
+
+``IncrementalValidator``는 같은 CBD 부분 그래프 검증으로 스토어가 추적한 dirty 노드만
+다시 검증하면서 전체 검증 보고서를 유지합니다.
 """
 
 import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
-from rdflib import Graph
+from rdflib import BNode, Graph, Literal, RDF, RDFS
+from rdflib.namespace import SH
 
 logger = logging.getLogger(__name__)
 
 SHAPES_FILE = Path("data/ontology/shapes.ttl")
 
+# 초점 노드 밖의 데이터를 참조할 수 있어 샤드 검증 결과가 전체 검증과 달라질 수 있는 술어
+_NON_LOCAL_PREDICATES = (
+    SH.node, SH.qualifiedValueShape, SH["or"], SH["and"], SH.xone, SH["not"],
+    SH.sparql, SH.target, SH.targetObjectsOf,
+)
+
 
 def load_shapes(shapes_path: str | None = None) -> Graph:
     """SHACL 형상 그래프를 로딩한다."""
@@ -26,12 +46,160 @@ def load_shapes(shapes_path: str | None = None) -> Graph:
     return shapes_graph
 
 
+def parse_results(results_graph: Graph) -> list[dict[str, Any]]:
+    """pyshacl 결과 그래프에서 ``?r a sh:ValidationResult`` 노드만 조회해 위반 목록으로 만든다."""
+    violations = []
+    for result_node in results_graph.subjects(RDF.type, SH.ValidationResult):
+        violation = {}
+        for p, o in results_graph.predicate_objects(result_node):
+            if p == SH.focusNode:
+                violation["focus_node"] = str(o)
+            elif p == SH.resultMessage:
+                violation["message"] = str(o)
+            elif p == SH.resultSeverity:
+                violation["severity"] = str(o).split("#")[-1]
+            elif p == SH.sourceConstraintComponent:
+                violation["constraint"] = str(o).split("#")[-1]
+            elif p == SH.resultPath:
+                violation["path"] = str(o)
+        if violation:
+            violations.append(violation)
+    return violations
+
+
+def is_shardable(shapes_graph: Graph) -> bool:
+    """형상 그래프를 초점 노드별 CBD 샤드로 나눠 검증해도 결과가 같은지 판단한다."""
+    for predicate in _NON_LOCAL_PREDICATES:
+        if (None, predicate, None) in shapes_graph:
+            return False
+    # 역방향/시퀀스 경로 등 복합 경로는 빈 노드로 표현된다
+    return not any(isinstance(path, BNode) for path in shapes_graph.objects(None, SH.path))
+
+
+def collect_focus_nodes(data_graph: Graph, shapes_graph: Graph) -> set:
+    """형상들의 대상 선언(targetNode/targetClass/암시적 클래스/targetSubjectsOf)이 가리키는 초점 노드."""
+    focus = set(shapes_graph.objects(None, SH.targetNode))
+
+    classes = set(shapes_graph.objects(None, SH.targetClass))
+    classes.update(s for s in shapes_graph.subjects(RDF.type, SH.NodeShape)
+                   if (s, RDF.type, RDFS.Class) in shapes_graph)
+    for target_class in classes:
+        for cls in data_graph.transitive_subjects(RDFS.subClassOf, target_class):
+            focus.update(data_graph.subjects(RDF.type, cls))
+
+    for predicate in shapes_graph.objects(None, SH.targetSubjectsOf):
+        focus.update(s for s, _ in data_graph.subject_objects(predicate))
+    return focus
+
+
+def _add_cbd(data_graph: Graph, node, shard: Graph) -> None:
+    """node의 CBD(주어 트리플 + 빈 노드 목적어의 재귀 전개)와 값 노드의 타입을 shard에 담는다."""
+    stack, seen = [node], set()
+    while stack:
+        subject = stack.pop()
+        if subject in seen:
+            continue
+        seen.add(subject)
+        for triple in data_graph.triples((subject, None, None)):
+            shard.add(triple)
+            value = triple[2]
+            if isinstance(value, BNode):
+                stack.append(value)
+            elif not isinstance(value, Literal):
+                # sh:class 제약은 값 노드의 rdf:type을 본다
+                for type_triple in data_graph.triples((value, RDF.type, None)):
+                    shard.add(type_triple)
+
+
+def shard_graph(data_graph: Graph, focus_nodes: Iterable) -> Graph:
+    """초점 노드들의 CBD와 rdfs:subClassOf 트리플(클래스 대상 해석용)만 담은 부분 그래프."""
+    shard = Graph()
+    for triple in data_graph.triples((None, RDFS.subClassOf, None)):
+        shard.add(triple)
+    for node in focus_nodes:
+        _add_cbd(data_graph, node, shard)
+    return shard
+
+
+def build_shards(data_graph: Graph, focus_nodes: Iterable, shards: int) -> list[tuple[str, list[str]]]:
+    """초점 노드를 shards개로 나누고 샤드별 (N-Triples 부분 그래프, 초점 노드 IRI 목록)을 만든다."""
+    ordered = sorted(focus_nodes)
+    result = []
+    for i in range(shards):
+        members = ordered[i::shards]
+        if members:
+            data_nt = shard_graph(data_graph, members).serialize(format="nt")
+            result.append((data_nt, [str(node) for node in members]))
+    return result
+
+
+def _check_focus_nodes(shard: Graph, shapes_graph: Graph, focus_nodes: Iterable) -> list[dict[str, Any]]:
+    """부분 그래프를 검증하고 지정한 초점 노드에 대한 결과만 남긴다.
+
+    부분 그래프에는 값 노드의 타입도 들어 있어 다른 노드가 대상으로 잡힐 수 있기 때문이다.
+    (pyshacl의 focus_nodes 옵션은 노드마다 목록을 선형 탐색해 대형 샤드에서 느리다.)
+    """
+    import pyshacl
+
+    _, results_graph, _ = pyshacl.validate(
+        shard,
+        shacl_graph=shapes_graph,
+        inference="none",
+        abort_on_first=False,
+    )
+    members = {str(node) for node in focus_nodes}
+    return [v for v in parse_results(results_graph) if v.get("focus_node") in members]
+
+
+def _validate_shard(data_nt: str, shapes_ttl: str, focus_nodes: list[str]) -> list[dict[str, Any]]:
+    """워커 프로세스에서 샤드 하나를 검증한다."""
+    data_graph = Graph()
+    data_graph.parse(data=data_nt, format="nt")
+    shapes_graph = Graph()
+    shapes_graph.parse(data=shapes_ttl, format="turtle")
+    return _check_focus_nodes(data_graph, shapes_graph, focus_nodes)
+
+
+def _validate_sharded(data_graph: Graph, shapes_graph: Graph, workers: int) -> dict[str, Any] | None:
+    focus = collect_focus_nodes(data_graph, shapes_graph)
+    if any(isinstance(node, BNode) for node in focus):
+        # 빈 노드 초점은 샤드 간에 식별할 수 없다
+        return None
+    shards = build_shards(data_graph, focus, workers)
+    shapes_ttl = shapes_graph.serialize(format="turtle")
+    logger.info("SHACL 샤드 검증: 초점 노드 %d개, 샤드 %d개", len(focus), len(shards))
+
+    jobs = [(data_nt, shapes_ttl, members) for data_nt, members in shards]
+    if workers == 1 or len(jobs) <= 1:
+        results = [_validate_shard(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_validate_shard, *zip(*jobs)))
+
+    violations = [v for shard in results for v in shard]
+    violations.sort(key=lambda v: (v.get("focus_node", ""), v.get("path", ""), v.get("constraint", "")))
+    return {
+        "conforms": not violations,
+        "violations_count": len(violations),
+        "violations": violations,
+        "shards": len(shards),
+        "focus_nodes": len(focus),
+    }
+
+
 def validate(
     data_graph: Graph,
     shapes_path: str | None = None,
+    workers: int | None = None,
 ) -> dict[str, Any]:
     """데이터 그래프를 SHACL shapes로 검증한다.
 
+    Args:
+        data_graph: 검증 대상 그래프
+        shapes_path: 형상 파일 경로 (None이면 기본 shapes.ttl)
+        workers: 샤드 검증 워커 프로세스 수. None이면 전체 그래프를 한 번에 검증한다.
+            형상이 샤드 검증을 지원하지 않으면 전체 검증으로 대체한다.
+
     Returns:
         검증 결과 딕셔너리:
         - conforms: 전체 적합 여부
@@ -57,48 +225,132 @@ def validate(
             "error": "No SHACL shapes found",
         }
 
+    if workers is not None:
+        if workers < 1:
+            raise ValueError(f"workers는 1 이상이어야 합니다: {workers}")
+        result = _validate_sharded(data_graph, shapes_graph, workers) if is_shardable(shapes_graph) else None
+        if result is not None:
+            return result
+        logger.info("형상 또는 초점 노드가 샤드 검증을 지원하지 않아 전체 그래프를 검증합니다")
+
     conforms, results_graph, results_text = pyshacl.validate(
         data_graph,
         shacl_graph=shapes_graph,
         inference="none",
         abort_on_first=False,
     )
-
-    # 위반 사항 파싱
-    violations = []
-    SH = "http://www.w3.org/ns/shacl#"
-    for result_node in results_graph.subjects(
-        predicate=None, object=None
-    ):
-        result_type = None
-        for _, _, o in results_graph.triples((result_node, None, None)):
-            if str(o).endswith("ValidationResult"):
-                result_type = result_node
-                break
-
-        if result_type is None:
-            continue
-
-        violation = {}
-        for p, o in results_graph.predicate_objects(result_node):
-            p_name = str(p).replace(SH, "sh:")
-            if "focusNode" in str(p):
-                violation["focus_node"] = str(o)
-            elif "resultMessage" in str(p):
-                violation["message"] = str(o)
-            elif "resultSeverity" in str(p):
-                violation["severity"] = str(o).split("#")[-1]
-            elif "sourceConstraintComponent" in str(p):
-                violation["constraint"] = str(o).split("#")[-1]
-            elif "resultPath" in str(p):
-                violation["path"] = str(o)
-
-        if violation:
-            violations.append(violation)
-
+    violations = parse_results(results_graph)
     return {
         "conforms": conforms,
         "violations_count": len(violations),
         "violations": violations,
         "results_text": results_text[:2000] if results_text else "",
     }
+
+
+class IncrementalValidator:
+    """바뀐 노드만 다시 검증하면서 초점 노드별로 캐시한 전체 검증 보고서를 유지한다.
+
+    dirty 노드와, 형상 경로(sh:path)로 dirty 노드를 가리키는 노드(sh:class 등 값 노드를 보는
+    제약) 중 현재 대상인 것만 CBD 부분 그래프로 검증해 해당 항목을 바꾼다. dirty가 None이거나
+    클래스 계층이 바뀌었거나 형상이 샤드 검증을 지원하지 않으면 전체를 다시 검증한다.
+    """
+
+    def __init__(self, shapes_path: str | None = None):
+        self._shapes_path = shapes_path
+        self._shapes = load_shapes(shapes_path)
+        self._local = is_shardable(self._shapes)
+        self._paths = set(self._shapes.objects(None, SH.path))
+        self._target_nodes = set(self._shapes.objects(None, SH.targetNode))
+        self._subjects_of = set(self._shapes.objects(None, SH.targetSubjectsOf))
+        self._classes: set = set()
+        self._supers: dict = {}
+        self._by_focus: dict[str, list[dict[str, Any]]] | None = None
+        self._report: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def report(self) -> dict[str, Any] | None:
+        """마지막 검증 후의 전체 보고서. 아직 검증하지 않았으면 None."""
+        return self._report
+
+    def validate(self, data_graph: Graph, dirty: set | None) -> dict[str, Any]:
+        """dirty 노드만 다시 검증하고 갱신된 전체 보고서를 반환한다.
+
+        Args:
+            data_graph: 검증 대상 그래프 (변경이 이미 반영된 상태)
+            dirty: 마지막 검증 이후 바뀐 노드 (``TripleStore.take_dirty()``). None이면 전체 검증.
+        """
+        with self._lock:
+            start = time.time()
+            if self._needs_full(data_graph, dirty):
+                result = validate(data_graph, self._shapes_path)
+                if "error" in result:
+                    return result
+                self._classes = self._target_classes(data_graph)
+                self._by_focus = defaultdict(list)
+                for violation in result["violations"]:
+                    self._by_focus[violation.get("focus_node", "")].append(violation)
+                mode, checked = "full", None
+            else:
+                nodes = set(dirty)
+                for node in list(nodes):
+                    for path in self._paths:
+                        nodes.update(data_graph.subjects(path, node))
+                focus = [node for node in nodes if self._is_target(data_graph, node)]
+                violations = []
+                if focus:
+                    violations = _check_focus_nodes(shard_graph(data_graph, focus), self._shapes, focus)
+                for node in nodes:
+                    self._by_focus.pop(str(node), None)
+                for violation in violations:
+                    self._by_focus[violation["focus_node"]].append(violation)
+                mode, checked = "incremental", len(focus)
+
+            violations = sorted(
+                (v for group in self._by_focus.values() for v in group),
+                key=lambda v: (v.get("focus_node", ""), v.get("path", ""), v.get("constraint", "")),
+            )
+            self._report = {
+                "conforms": not violations,
+                "violations_count": len(violations),
+                "violations": violations,
+                "mode": mode,
+                "revalidated_nodes": checked,
+                "elapsed": time.time() - start,
+            }
+            logger.info("SHACL %s 검증: 위반 %d건 (재검증 노드 %s, %.3f초)",
+                        mode, len(violations), checked if checked is not None else "전체",
+                        self._report["elapsed"])
+            return self._report
+
+    def _needs_full(self, data_graph: Graph, dirty: set | None) -> bool:
+        if dirty is None or self._by_focus is None or not self._local:
+            return True
+        # 대상 클래스 계층이 바뀌면 어떤 노드가 대상인지부터 달라진다.
+        # 인스턴스의 rdf:type 변경도 클래스 노드를 dirty로 만드므로 상위 클래스 집합을 비교한다
+        for node in dirty:
+            supers = frozenset(data_graph.objects(node, RDFS.subClassOf))
+            if supers != self._supers.get(node, frozenset()):
+                return True
+        return False
+
+    def _target_classes(self, data_graph: Graph) -> set:
+        shapes = self._shapes
+        roots = set(shapes.objects(None, SH.targetClass))
+        roots.update(s for s in shapes.subjects(RDF.type, SH.NodeShape) if (s, RDF.type, RDFS.Class) in shapes)
+        classes = set()
+        for target_class in roots:
+            classes.update(data_graph.transitive_subjects(RDFS.subClassOf, target_class))
+        supers = defaultdict(set)
+        for sub, sup in data_graph.subject_objects(RDFS.subClassOf):
+            supers[sub].add(sup)
+        self._supers = {cls: frozenset(values) for cls, values in supers.items()}
+        return classes
+
+    def _is_target(self, data_graph: Graph, node) -> bool:
+        if node in self._target_nodes:
+            return True
+        if any((node, RDF.type, cls) in data_graph for cls in self._classes):
+            return True
+        return any((node, predicate, None) in data_graph for predicate in self._subjects_of)
@@ -0,0 +1,277 @@
+"""RDF 그래프 품질 검증 리포트 엔진.
+
+/reasoning/validation-report와 scripts/validate_rdf.py가 공유하는 8개 카테고리 검증
+(스키마 완전성, 공간 계층, 요소 통계, URI 일관성, PropertySet 커버리지, 필수 속성,
+분류 품질, 관계 무결성)을 계산합니다.
+
+카테고리마다 ``FILTER NOT EXISTS``가 포함된 COUNT 쿼리를 따로 실행하면 쿼리마다 그래프를
+다시 훑으므로, 검증에 필요한 술어(rdf:type, bim:aggregates, bim:containsElement 등)의
+트리플을 술어 인덱스 조회로 한 번씩만 읽어 집합/카운터로 모은 뒤 모든 항목을 계산합니다.
+결과 수치는 기존 SPARQL 쿼리의 결과 행 수와 같습니다.
+"""
+
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Any
+
+from rdflib import Graph, Literal, OWL, RDF
+
+from ..converter.namespace_manager import BIM
+from ..storage.graph_index import to_python_value
+
+logger = logging.getLogger(__name__)
+
+# 분류 품질: Other 비율이 이 값 이하면 pass, WARN_OTHER_RATIO 이하면 warn
+OTHER_THRESHOLD = 0.15
+WARN_OTHER_RATIO = 0.30
+# PropertySet 커버리지가 이 비율 미만이면 warn
+MIN_PSET_COVERAGE = 0.3
+# 스키마 완전성: 최소 OWL 클래스 수 (공간 5 + PhysicalElement + SpatialElement + BIMElement)
+MIN_OWL_CLASSES = 8
+MIN_DATA_PROPERTIES = 6
+# orphan/unlinked 요소 샘플 수
+SAMPLE_SIZE = 5
+
+CHECK_NAMES = (
+    "schema_completeness",
+    "spatial_hierarchy",
+    "element_statistics",
+    "uri_consistency",
+    "property_set_coverage",
+    "required_properties",
+    "classification_quality",
+    "relationship_integrity",
+)
+
+_SCHEMA_NS = str(BIM)
+_OTHER = Literal("Other")
+
+
+class _GraphFacts:
+    """검증에 필요한 술어의 트리플을 한 번씩 읽어 모은 집합/카운터."""
+
+    def __init__(self, graph: Graph):
+        self.types: dict[Any, set] = defaultdict(set)
+        for s, _, o in graph.triples((None, RDF.type, None)):
+            self.types[o].add(s)
+
+        self.aggregates: dict[Any, list] = defaultdict(list)
+        self.aggregation_pairs = 0
+        for s, _, o in graph.triples((None, BIM.aggregates, None)):
+            self.aggregates[s].append(o)
+            self.aggregation_pairs += 1
+
+        self.contains: set = set(graph.subject_objects(BIM.containsElement))
+        self.contained_in: list = list(graph.subject_objects(BIM.isContainedIn))
+
+        self.category_counts: Counter = Counter()
+        self.other_subjects: set = set()
+        self.categorized_rows = 0
+        for s, _, o in graph.triples((None, BIM.hasCategory, None)):
+            self.category_counts[o] += 1
+            self.categorized_rows += 1
+            if o == _OTHER:
+                self.other_subjects.add(s)
+
+        self.with_pset = set(graph.subjects(BIM.hasPropertySet, None))
+        self.with_global_id = set(graph.subjects(BIM.hasGlobalId, None))
+        self.names: dict[Any, list] = defaultdict(list)
+        for s, _, o in graph.triples((None, BIM.hasName, None)):
+            self.names[s].append(o)
+
+    def of_type(self, cls) -> set:
+        return self.types.get(cls, set())
+
+
+def _schema_completeness(facts: _GraphFacts) -> dict[str, Any]:
+    classes = sorted(str(c) for c in facts.of_type(OWL.Class) if str(c).startswith(_SCHEMA_NS))
+    data_props = len(facts.of_type(OWL.DatatypeProperty))
+    passed = len(classes) >= MIN_OWL_CLASSES and data_props >= MIN_DATA_PROPERTIES
+    return {
+        "status": "pass" if passed else "fail",
+        "details": {
+            "owl_classes": len(classes),
+            "class_names": sorted(c.split("#")[-1] for c in classes),
+            "data_properties": data_props,
+            "object_properties": len(facts.of_type(OWL.ObjectProperty)),
+        },
+    }
+
+
+def _spatial_hierarchy(facts: _GraphFacts) -> dict[str, Any]:
+    projects, sites = facts.of_type(BIM.Project), facts.of_type(BIM.Site)
+    buildings, storeys = facts.of_type(BIM.Building), facts.of_type(BIM.BuildingStorey)
+    aggregates = facts.aggregates
+
+    chains = 0
+    for project in projects:
+        for site in aggregates.get(project, ()):
+            if site not in sites:
+                continue
+            for building in aggregates.get(site, ()):
+                if building not in buildings:
+                    continue
+                chains += sum(1 for storey in aggregates.get(building, ()) if storey in storeys)
+
+    # 층 이름별 요소 수 (isContainedIn 기준)
+    per_name: Counter = Counter()
+    for _, storey in facts.contained_in:
+        if storey in storeys:
+            for name in facts.names.get(storey, ()):
+                per_name[name] += 1
+    storey_elements = sorted(per_name.items(), key=lambda kv: (-kv[1], str(kv[0])))
+
+    return {
+        "status": "pass" if chains > 0 else "fail",
+        "details": {
+            "complete_chains": chains,
+            "projects": len(projects),
+            "sites": len(sites),
+            "buildings": len(buildings),
+            "storeys": len(storeys),
+            "storey_elements": [
+                {"storey": to_python_value(name), "elements": count}
+                for name, count in storey_elements
+            ],
+        },
+    }
+
+
+def _element_statistics(facts: _GraphFacts) -> dict[str, Any]:
+    categories = sorted(facts.category_counts.items(), key=lambda kv: (-kv[1], str(kv[0])))
+    return {
+        "status": "info",
+        "details": {
+            "total_elements": len(facts.of_type(BIM.PhysicalElement)),
+            "category_count": len(categories),
+            "categories": [
+                {"name": to_python_value(category), "count": count}
+                for category, count in categories
+            ],
+        },
+    }
+
+
+def _uri_consistency(facts: _GraphFacts) -> dict[str, Any]:
+    elements = facts.of_type(BIM.PhysicalElement)
+    orphans = [e for e, _ in facts.contained_in if e not in elements]
+    linked = {e for e, _ in facts.contained_in}
+    unlinked = sorted(str(e) for e in elements if e not in linked)
+    if not orphans and not unlinked:
+        status = "pass"
+    elif orphans:
+        status = "fail"
+    else:
+        status = "warn"
+    return {
+        "status": status,
+        "details": {
+            "orphan_elements": len(orphans),
+            "orphan_samples": [str(e).split("/")[-1] for e in sorted(set(orphans), key=str)[:SAMPLE_SIZE]],
+            "unlinked_elements": len(unlinked),
+            "unlinked_samples": [e.split("/")[-1] for e in unlinked[:SAMPLE_SIZE]],
+        },
+    }
+
+
+def _property_set_coverage(facts: _GraphFacts) -> dict[str, Any]:
+    elements = facts.of_type(BIM.PhysicalElement)
+    total_psets = len(facts.of_type(BIM.PropertySet))
+    with_pset = len(elements & facts.with_pset)
+    ratio = with_pset / len(elements) if elements else 0
+    if total_psets == 0:
+        status = "fail"
+    elif ratio < MIN_PSET_COVERAGE:
+        status = "warn"
+    else:
+        status = "pass"
+    return {
+        "status": status,
+        "details": {
+            "total_property_sets": total_psets,
+            "plant_property_sets": len(facts.of_type(BIM.PlantPropertySet)),
+            "elements_with_pset": with_pset,
+            "total_elements": len(elements),
+            "coverage_ratio": round(ratio, 3),
+        },
+    }
+
+
+def _required_properties(facts: _GraphFacts) -> dict[str, Any]:
+    elements = facts.of_type(BIM.PhysicalElement)
+    missing_gid = len(elements - facts.with_global_id)
+    return {
+        "status": "pass" if missing_gid == 0 else "fail",
+        "details": {
+            "missing_global_id": missing_gid,
+            "missing_name": sum(1 for e in elements if e not in facts.names),
+        },
+    }
+
+
+def _classification_quality(facts: _GraphFacts) -> dict[str, Any]:
+    other = len(facts.other_subjects & facts.of_type(BIM.PhysicalElement))
+    total = facts.categorized_rows
+    ratio = other / total if total > 0 else 0
+    if ratio <= OTHER_THRESHOLD:
+        status = "pass"
+    elif ratio <= WARN_OTHER_RATIO:
+        status = "warn"
+    else:
+        status = "fail"
+    return {
+        "status": status,
+        "details": {
+            "other_count": other,
+            "total_categorized": total,
+            "other_ratio": round(ratio, 4),
+            "threshold": OTHER_THRESHOLD,
+        },
+    }
+
+
+def _relationship_integrity(facts: _GraphFacts) -> dict[str, Any]:
+    contains_n = len(facts.contains)
+    contained_n = len(facts.contained_in)
+    asymmetric = sum(1 for e, s in facts.contained_in if (s, e) not in facts.contains)
+    symmetric = contains_n == contained_n and asymmetric == 0
+    return {
+        "status": "pass" if symmetric and contains_n > 0 else "warn",
+        "details": {
+            "aggregation_pairs": facts.aggregation_pairs,
+            "contains_element": contains_n,
+            "is_contained_in": contained_n,
+            "asymmetric_pairs": asymmetric,
+            "symmetric": symmetric,
+        },
+    }
+
+
+_CHECKS = {
+    "schema_completeness": _schema_completeness,
+    "spatial_hierarchy": _spatial_hierarchy,
+    "element_statistics": _element_statistics,
+    "uri_consistency": _uri_consistency,
+    "property_set_coverage": _property_set_coverage,
+    "required_properties": _required_properties,
+    "classification_quality": _classification_quality,
+    "relationship_integrity": _relationship_integrity,
+}
+
+
+def run_validation_checks(graph: Graph) -> list[dict[str, Any]]:
+    """8개 카테고리 검증을 실행하고 ``{"name", "status", "details"}`` 리스트를 반환한다."""
+    start = time.time()
+    facts = _GraphFacts(graph)
+    checks = [{"name": name, **_CHECKS[name](facts)} for name in CHECK_NAMES]
+    logger.info("품질 검증 리포트 계산: %d개 항목 (%.2f초)", len(checks), time.time() - start)
+    return checks
+
+
+def summarize(checks: list[dict[str, Any]]) -> dict[str, int]:
+    """상태별 항목 수를 센다."""
+    summary = {"pass": 0, "warn": 0, "info": 0, "fail": 0}
+    for check in checks:
+        summary[check["status"]] += 1
+    return summary
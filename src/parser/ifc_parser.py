@@ -53,6 +53,69 @@ CATEGORY_PATTERNS: dict[str, list[str]] = {
 
 SUPPORTED_SCHEMAS = {"IFC4", "IFC2X3"}
 
+# 역인덱스 요소별 관계 종류
+RELATION_KINDS = ("psets", "qsets", "materials", "classifications")
+
+
+class RelationIndex:
+    """속성/수량/재료/분류 관계 역인덱스.
+
+    IfcRelDefinesByProperties, IfcRelAssociatesMaterial, IfcRelAssociatesClassification을
+    한 번씩만 순회하여 관계 종류별 (정의, 대상 요소들) 목록과
+    요소 id → 관계 정의 목록 맵을 만든다.
+    """
+
+    def __init__(self):
+        # 종류별 (RelatingXxx, RelatedObjects) 목록 (원본 관계 순서 유지)
+        self.psets: list[tuple[Any, tuple]] = []
+        self.qsets: list[tuple[Any, tuple]] = []
+        self.materials: list[tuple[Any, tuple]] = []
+        self.classifications: list[tuple[Any, tuple]] = []
+        # 요소 id() → {종류: [정의, ...]}
+        self.by_element: dict[int, dict[str, list]] = {}
+
+    @classmethod
+    def build(cls, ifc_file: "ifcopenshell.file") -> "RelationIndex":
+        start = time.time()
+        index = cls()
+
+        for rel in ifc_file.by_type("IfcRelDefinesByProperties"):
+            definition = rel.RelatingPropertyDefinition
+            if getattr(definition, "HasProperties", None):
+                index._add("psets", definition, rel.RelatedObjects)
+            elif definition.is_a("IfcElementQuantity") and getattr(definition, "Quantities", None):
+                index._add("qsets", definition, rel.RelatedObjects)
+
+        for rel in ifc_file.by_type("IfcRelAssociatesMaterial"):
+            index._add("materials", rel.RelatingMaterial, rel.RelatedObjects)
+
+        for rel in ifc_file.by_type("IfcRelAssociatesClassification"):
+            if rel.RelatingClassification is not None:
+                index._add("classifications", rel.RelatingClassification, rel.RelatedObjects)
+
+        logger.info(
+            "관계 역인덱스 생성: 요소 %d개, 속성셋 %d, 수량셋 %d, 재료 %d, 분류 %d (%.2f초)",
+            len(index.by_element), len(index.psets), len(index.qsets),
+            len(index.materials), len(index.classifications), time.time() - start,
+        )
+        return index
+
+    def _add(self, kind: str, definition: Any, related: tuple) -> None:
+        related = tuple(related or ())
+        getattr(self, kind).append((definition, related))
+        for obj in related:
+            entry = self.by_element.get(obj.id())
+            if entry is None:
+                entry = self.by_element[obj.id()] = {k: [] for k in RELATION_KINDS}
+            entry[kind].append(definition)
+
+    def for_element(self, element: Any) -> dict[str, list]:
+        """요소에 연결된 관계 정의를 종류별로 반환한다."""
+        entry = self.by_element.get(element.id())
+        if entry is None:
+            return {k: [] for k in RELATION_KINDS}
+        return entry
+
 
 class IFCParser:
     """IFC 파일 파싱 및 엔티티 추출 클래스."""
@@ -61,6 +124,7 @@ class IFCParser:
         self.file_path = Path(file_path)
         self._ifc_file: Optional[ifcopenshell.file] = None
         self._load_time: float = 0.0
+        self._relation_index: Optional[RelationIndex] = None
 
     def open(self) -> "ifcopenshell.file":
         """IFC 파일을 로딩한다.
@@ -78,6 +142,7 @@ class IFCParser:
         start = time.time()
         self._ifc_file = ifcopenshell.open(str(self.file_path))
         self._load_time = time.time() - start
+        self._relation_index = None
 
         schema = self.get_schema()
         if schema not in SUPPORTED_SCHEMAS:
@@ -195,18 +260,45 @@ class IFCParser:
                 relations.append((rel.RelatingStructure, element))
         return relations
 
+    @property
+    def relation_index(self) -> RelationIndex:
+        """속성/수량/재료/분류 관계 역인덱스 (최초 접근 시 한 번 생성)."""
+        if self._relation_index is None:
+            self._relation_index = RelationIndex.build(self.ifc_file)
+        return self._relation_index
+
+    def get_property_definitions(self) -> list[tuple[Any, tuple]]:
+        """HasProperties가 있는 속성셋 정의와 대상 요소 목록을 반환한다."""
+        return self.relation_index.psets
+
+    def get_quantity_definitions(self) -> list[tuple[Any, tuple]]:
+        """IfcElementQuantity 정의와 대상 요소 목록을 반환한다."""
+        return self.relation_index.qsets
+
+    def get_material_associations(self) -> list[tuple[Any, tuple]]:
+        """IfcRelAssociatesMaterial의 (RelatingMaterial, 대상 요소들) 목록을 반환한다."""
+        return self.relation_index.materials
+
+    def get_classification_associations(self) -> list[tuple[Any, tuple]]:
+        """IfcRelAssociatesClassification의 (분류 참조, 대상 요소들) 목록을 반환한다."""
+        return self.relation_index.classifications
+
+    def get_element_relations(self, element: Any) -> dict[str, list]:
+        """특정 요소의 속성셋/수량셋/재료/분류 정의를 종류별로 반환한다."""
+        return self.relation_index.for_element(element)
+
     def get_property_sets(self, element: Any) -> list[dict]:
-        """특정 요소의 속성셋 목록을 반환한다."""
+        """특정 요소의 속성셋 목록을 반환한다.
+
+        관계 역인덱스를 사용하므로 요소당 조회 비용은 연결된 속성셋 수에만 비례한다.
+        """
         psets = []
-        for rel in self.get_entities("IfcRelDefinesByProperties"):
-            if element in rel.RelatedObjects:
-                pset_def = rel.RelatingPropertyDefinition
-                if hasattr(pset_def, "HasProperties") and pset_def.HasProperties:
-                    props = {}
-                    for prop in pset_def.HasProperties:
-                        val = getattr(prop, "NominalValue", None)
-                        props[prop.Name] = val.wrappedValue if val else None
-                    psets.append({"name": pset_def.Name, "properties": props})
+        for pset_def in self.get_element_relations(element)["psets"]:
+            props = {}
+            for prop in pset_def.HasProperties:
+                val = getattr(prop, "NominalValue", None)
+                props[prop.Name] = val.wrappedValue if val else None
+            psets.append({"name": pset_def.Name, "properties": props})
         return psets
 
     def validate(self) -> dict[str, Any]:
@@ -1,14 +1,15 @@
 import os
 
 from .base_store import BaseTripleStore
-from .triple_store import TripleStore
+from .triple_store import INFERRED_GRAPH, QueryCancelled, TripleStore, UnionGraph
+from .snapshot import inferred_path_for, load_with_snapshot, snapshot_path_for
 
 
 def create_store(backend: str | None = None) -> BaseTripleStore:
     """백엔드 설정에 따라 적절한 TripleStore를 생성한다.
 
     Args:
-        backend: "local" (기본값) 또는 "graphdb"
+        backend: "local" (기본값), "compact" (정수 ID 인코딩, numpy 필요) 또는 "graphdb"
 
     Returns:
         BaseTripleStore 구현체
@@ -19,7 +20,19 @@ def create_store(backend: str | None = None) -> BaseTripleStore:
         from .graphdb_store import GraphDBStore
         return GraphDBStore()
 
+    if backend == "compact":
+        try:
+            from .compact_store import CompactTripleStore
+        except ImportError as e:
+            raise ImportError(
+                "compact 백엔드에는 numpy가 필요합니다. Install with: pip install 'bim-ontology[compact]'"
+            ) from e
+        return CompactTripleStore()
+
     return TripleStore()
 
 
-__all__ = ["BaseTripleStore", "TripleStore", "create_store"]
+__all__ = [
+    "BaseTripleStore", "TripleStore", "QueryCancelled", "UnionGraph", "INFERRED_GRAPH",
+    "create_store", "inferred_path_for", "load_with_snapshot", "snapshot_path_for",
+]
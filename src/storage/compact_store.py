@@ -0,0 +1,374 @@
+"""정수 ID 사전 인코딩 기반 컴팩트 트리플 스토어.
+
+rdflib 기본 Memory 스토어는 트리플마다 중첩 dict 항목을 세 벌씩 만들기 때문에
+대형 그래프(v3)에서 수 GB의 메모리를 사용합니다. 이 모듈은 용어(URIRef/Literal/BNode)를
+한 번만 사전에 등록(intern)하고, 트리플은 정수 ID로 SPO/POS/OSP 세 가지 순서로 정렬된
+NumPy 배열에 저장하는 rdflib ``Store`` 구현을 제공합니다.
+
+- 패턴 조회: 정렬 배열에 대한 이진 탐색(searchsorted)
+- 삽입/삭제: 소형 델타 인덱스와 삭제 표시(tombstone)에 누적 후 일정 크기에서 배열로 병합
+- SPARQL: rdflib 쿼리 엔진이 ``triples()`` 를 통해 그대로 동작
+
+CompactTripleStore는 TripleStore와 동일한 API(query/insert/count/load/save)를 제공합니다.
+"""
+
+import logging
+
+import numpy as np
+from rdflib import Graph
+from rdflib.store import Store
+from rdflib.util import _coalesce
+
+from .triple_store import TripleStore
+
+logger = logging.getLogger(__name__)
+
+_ID_DTYPE = np.uint32
+
+# 정렬 순서: 각 순서의 열 구성 (0=S, 1=P, 2=O)
+_SPO = (0, 1, 2)
+_POS = (1, 2, 0)
+_OSP = (2, 0, 1)
+
+# 델타 병합 기준: 최소 크기, 또는 기본 배열 크기의 1/4
+_MIN_DELTA = 50_000
+_DELTA_RATIO = 4
+
+# 전체 스캔 시 파이썬 객체로 변환하는 청크 크기
+_SCAN_CHUNK = 65_536
+
+
+def _search(cols: tuple, key: tuple) -> tuple[int, int]:
+    """정렬된 열 배열에서 접두 키에 해당하는 [lo, hi) 구간을 찾는다."""
+    lo, hi = 0, len(cols[0])
+    for col, val in zip(cols, key):
+        if lo >= hi:
+            break
+        # 파이썬 int로 검색하면 배열 전체가 int64로 변환되므로 같은 dtype으로 맞춘다
+        val = _ID_DTYPE(val)
+        window = col[lo:hi]
+        lo, hi = (
+            lo + int(window.searchsorted(val, "left")),
+            lo + int(window.searchsorted(val, "right")),
+        )
+    return lo, hi
+
+
+def _sorted_cols(spo: np.ndarray, order: tuple) -> tuple:
+    """(N, 3) SPO 배열을 지정 순서로 정렬한 연속 열 배열 3개를 반환한다."""
+    a, b, c = (spo[:, i] for i in order)
+    perm = np.lexsort((c, b, a))
+    return tuple(np.ascontiguousarray(col[perm]) for col in (a, b, c))
+
+
+class CompactMemory(Store):
+    """정수 ID + 정렬 NumPy 배열 기반 rdflib Store.
+
+    컨텍스트를 구분하지 않는 단일 그래프 스토어입니다 (SimpleMemory와 동일한 범위).
+    """
+
+    context_aware = False
+    formula_aware = False
+    graph_aware = False
+
+    def __init__(self, configuration=None, identifier=None):
+        super().__init__(configuration)
+        self.identifier = identifier
+
+        # 용어 사전
+        self._terms: list = []
+        self._ids: dict = {}
+
+        # 정렬된 기본 배열: 순서 -> (열0, 열1, 열2)
+        empty = np.empty(0, dtype=_ID_DTYPE)
+        self._base = {order: (empty, empty, empty) for order in (_SPO, _POS, _OSP)}
+
+        # 병합 전 델타 (정수 ID 중첩 인덱스)와 기본 배열 삭제 표시
+        self._add_spo: dict = {}
+        self._add_pos: dict = {}
+        self._add_osp: dict = {}
+        self._added = 0
+        self._removed: set = set()
+        # 마지막 병합 시점의 용어 수: 이후 등록된 용어를 포함한 트리플은 기본 배열에 없다
+        self._base_terms = 0
+
+        self.__namespace: dict = {}
+        self.__prefix: dict = {}
+
+    # ---------- 용어 사전 ----------
+
+    def _intern(self, term) -> int:
+        tid = self._ids.get(term)
+        if tid is None:
+            tid = self._ids[term] = len(self._terms)
+            self._terms.append(term)
+        return tid
+
+    @property
+    def term_count(self) -> int:
+        """등록된 고유 용어 수."""
+        return len(self._terms)
+
+    @property
+    def nbytes(self) -> int:
+        """정렬 배열이 차지하는 바이트 수 (용어 사전 제외)."""
+        return sum(col.nbytes for cols in self._base.values() for col in cols)
+
+    # ---------- 기본 배열 / 델타 ----------
+
+    def _base_len(self) -> int:
+        return len(self._base[_SPO][0])
+
+    def _in_base(self, ids: tuple) -> bool:
+        if max(ids) >= self._base_terms:
+            return False
+        lo, hi = _search(self._base[_SPO], ids)
+        return lo < hi
+
+    def _delta_add(self, s: int, p: int, o: int) -> bool:
+        objects = self._add_spo.setdefault(s, {}).setdefault(p, set())
+        if o in objects:
+            return False
+        objects.add(o)
+        self._add_pos.setdefault(p, {}).setdefault(o, set()).add(s)
+        self._add_osp.setdefault(o, {}).setdefault(s, set()).add(p)
+        self._added += 1
+        return True
+
+    @staticmethod
+    def _discard(index: dict, a: int, b: int, c: int):
+        inner = index[a]
+        leaf = inner[b]
+        leaf.discard(c)
+        if not leaf:
+            del inner[b]
+            if not inner:
+                del index[a]
+
+    def _delta_remove(self, s: int, p: int, o: int) -> bool:
+        if o not in self._add_spo.get(s, {}).get(p, ()):
+            return False
+        self._discard(self._add_spo, s, p, o)
+        self._discard(self._add_pos, p, o, s)
+        self._discard(self._add_osp, o, s, p)
+        self._added -= 1
+        return True
+
+    def _delta_matches(self, s, p, o) -> list[tuple[int, int, int]]:
+        if not self._added:
+            return []
+        if s is not None:
+            po = self._add_spo.get(s, {})
+            if p is not None:
+                objs = po.get(p, ())
+                if o is not None:
+                    return [(s, p, o)] if o in objs else []
+                return [(s, p, x) for x in objs]
+            return [(s, pp, oo) for pp, objs in po.items() for oo in objs
+                    if o is None or oo == o]
+        if p is not None:
+            os_ = self._add_pos.get(p, {})
+            if o is not None:
+                return [(x, p, o) for x in os_.get(o, ())]
+            return [(ss, p, oo) for oo, subs in os_.items() for ss in subs]
+        if o is not None:
+            return [(ss, pp, o) for ss, preds in self._add_osp.get(o, {}).items()
+                    for pp in preds]
+        return [(ss, pp, oo) for ss, po in self._add_spo.items()
+                for pp, objs in po.items() for oo in objs]
+
+    def _maybe_compact(self):
+        pending = self._added + len(self._removed)
+        if pending >= max(_MIN_DELTA, self._base_len() // _DELTA_RATIO):
+            self.compact()
+
+    def compact(self):
+        """델타와 삭제 표시를 정렬 배열에 병합한다."""
+        if not self._added and not self._removed:
+            return
+        spo_cols = self._base[_SPO]
+        base = np.column_stack(spo_cols) if len(spo_cols[0]) else np.empty((0, 3), _ID_DTYPE)
+
+        if self._removed:
+            drop = [_search(spo_cols, ids)[0] for ids in self._removed]
+            base = np.delete(base, drop, axis=0)
+
+        if self._added:
+            delta = np.array(self._delta_matches(None, None, None), dtype=_ID_DTYPE)
+            base = np.concatenate([base, delta.reshape(-1, 3)])
+
+        self._rebuild(base)
+        self._add_spo, self._add_pos, self._add_osp = {}, {}, {}
+        self._added = 0
+        self._removed = set()
+
+    def _rebuild(self, spo: np.ndarray):
+        self._base = {order: _sorted_cols(spo, order) for order in (_SPO, _POS, _OSP)}
+        self._base_terms = len(self._terms)
+
+    def add_encoded(self, terms: list, ids) -> int:
+        """사전 인코딩된 트리플(용어 목록 + 평탄화된 SPO ID 버퍼)을 일괄 추가한다.
+
+        바이너리 스냅샷 로딩 시 트리플 단위 add()를 거치지 않고 배열을 직접 구성합니다.
+
+        Returns:
+            추가 후 전체 트리플 수
+        """
+        self.compact()
+        mapping = np.fromiter((self._intern(t) for t in terms), dtype=_ID_DTYPE, count=len(terms))
+        incoming = mapping[np.frombuffer(ids, dtype=_ID_DTYPE)].reshape(-1, 3)
+
+        # 기존 배열이 비어 있어도 정렬 후 중복 행을 제거한다 (버퍼 자체에 중복이 있을 수 있음)
+        if self._base_len():
+            incoming = np.concatenate([np.column_stack(self._base[_SPO]), incoming])
+        cols = _sorted_cols(incoming, _SPO)
+        keep = np.ones(len(incoming), dtype=bool)
+        keep[1:] = (np.diff(cols[0].astype(np.int64)) != 0) | \
+                   (np.diff(cols[1].astype(np.int64)) != 0) | \
+                   (np.diff(cols[2].astype(np.int64)) != 0)
+        self._rebuild(np.column_stack([col[keep] for col in cols]))
+        return len(self)
+
+    # ---------- rdflib Store 인터페이스 ----------
+
+    def add(self, triple, context, quoted=False):
+        ids = tuple(self._intern(term) for term in triple)
+        if ids in self._removed:
+            self._removed.discard(ids)
+            return
+        if self._in_base(ids):
+            return
+        if self._delta_add(*ids):
+            self._maybe_compact()
+
+    def addN(self, quads):  # noqa: N802
+        for s, p, o, _ in quads:
+            self.add((s, p, o), None)
+
+    def remove(self, triple_pattern, context=None):
+        get = self._ids.get
+        for (s, p, o), _ in list(self.triples(triple_pattern)):
+            ids = (get(s), get(p), get(o))
+            if not self._delta_remove(*ids):
+                self._removed.add(ids)
+        self._maybe_compact()
+
+    def triples(self, triple_pattern, context=None):
+        key = []
+        for term in triple_pattern:
+            if term is None:
+                key.append(None)
+                continue
+            tid = self._ids.get(term)
+            if tid is None:
+                return
+            key.append(tid)
+        s, p, o = key
+        terms = self._terms
+        for ids in self._match_ids(s, p, o):
+            yield (terms[ids[0]], terms[ids[1]], terms[ids[2]]), iter(())
+
+    def _match_ids(self, s, p, o):
+        """정수 ID 패턴(None=와일드카드)에 일치하는 (s, p, o) ID 튜플을 생성한다."""
+        delta = self._delta_matches(s, p, o)
+        removed = self._removed
+
+        if s is not None and p is not None and o is not None:
+            if (s, p, o) not in removed and self._in_base((s, p, o)):
+                yield (s, p, o)
+        else:
+            if s is not None:
+                order, key = (_OSP, (o, s)) if o is not None else (_SPO, (s, p) if p is not None else (s,))
+            elif p is not None:
+                order, key = _POS, (p, o) if o is not None else (p,)
+            elif o is not None:
+                order, key = _OSP, (o,)
+            else:
+                order, key = _SPO, ()
+            cols = self._base[order]
+            lo, hi = _search(cols, key)
+            pos = [order.index(i) for i in range(3)]
+            for start in range(lo, hi, _SCAN_CHUNK):
+                end = min(start + _SCAN_CHUNK, hi)
+                chunk = [col[start:end].tolist() for col in cols]
+                for row in zip(*chunk):
+                    ids = (row[pos[0]], row[pos[1]], row[pos[2]])
+                    if removed and ids in removed:
+                        continue
+                    yield ids
+        yield from delta
+
+    def __len__(self, context=None) -> int:
+        return self._base_len() - len(self._removed) + self._added
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    # ---------- 네임스페이스 (SimpleMemory와 동일) ----------
+
+    def bind(self, prefix, namespace, override=True):
+        bound_namespace = self.__namespace.get(prefix)
+        bound_prefix = _coalesce(
+            self.__prefix.get(namespace),
+            self.__prefix.get(bound_namespace),
+        )
+        if override:
+            if bound_prefix is not None:
+                del self.__namespace[bound_prefix]
+            if bound_namespace is not None:
+                del self.__prefix[bound_namespace]
+            self.__prefix[namespace] = prefix
+            self.__namespace[prefix] = namespace
+        else:
+            self.__prefix[_coalesce(bound_namespace, namespace)] = _coalesce(
+                bound_prefix, default=prefix
+            )
+            self.__namespace[_coalesce(bound_prefix, prefix)] = _coalesce(
+                bound_namespace, default=namespace
+            )
+
+    def namespace(self, prefix):
+        return self.__namespace.get(prefix, None)
+
+    def prefix(self, namespace):
+        return self.__prefix.get(namespace, None)
+
+    def namespaces(self):
+        yield from list(self.__namespace.items())
+
+
+class CompactTripleStore(TripleStore):
+    """CompactMemory 기반 저메모리 로컬 트리플 스토어.
+
+    TripleStore와 동일한 API를 제공하며, 노드당 여러 프로젝트 그래프를 올려야 하는
+    환경에서 사용합니다 (TRIPLESTORE_BACKEND=compact).
+    """
+
+    def __init__(self, graph: Graph | None = None):
+        super().__init__()
+        if graph is not None:
+            self.insert_graph(graph)
+
+    def _new_graph(self) -> Graph:
+        return Graph(store=CompactMemory())
+
+    def load(self, filepath: str, fmt: str | None = None) -> int:
+        loaded = super().load(filepath, fmt)
+        with self._lock.write():
+            self._graph.store.compact()
+        return loaded
+
+    def load_snapshot(self, filepath: str) -> int:
+        loaded = super().load_snapshot(filepath)
+        with self._lock.write():
+            self._graph.store.compact()
+        return loaded
+
+    def memory_stats(self) -> dict:
+        """용어 사전/정렬 배열 크기 통계를 반환한다."""
+        store: CompactMemory = self._graph.store
+        return {
+            "triples": len(store),
+            "terms": store.term_count,
+            "array_bytes": store.nbytes,
+        }
@@ -0,0 +1,372 @@
+"""대시보드 핫 경로용 인메모리 그래프 인덱스.
+
+/api/statistics, /api/statistics/categories, /api/storeys, /api/elements 는
+GROUP BY/OPTIONAL이 포함된 SPARQL을 rdflib 순수 파이썬 평가기로 실행하므로
+대형 그래프에서 요청마다 수백 ms가 걸립니다. GraphIndex는 다음 매핑을 미리 계산해
+해당 라우트가 SPARQL 없이 동일한 결과 행을 만들 수 있게 합니다.
+
+- rdf:type → subject 집합
+- bim:hasCategory → subject 집합 (및 subject → 카테고리)
+- bim:containsElement → 포함 요소 집합 (층별 요소 수)
+
+인덱스는 TripleStore가 로딩 후 지연 생성하고, insert()로 추가되는 트리플은 증분 반영하며,
+그래프를 직접 수정하는 경로(mark_modified)에서는 폐기 후 다음 요청에 재생성합니다.
+
+IdentifierIndex는 bim:hasGlobalId / navis:hasObjectId → 요소 URI 맵으로, Lean 주입처럼
+식별자를 바꾸지 않는 변경에서는 폐기되지 않고 유지됩니다.
+"""
+
+import bisect
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from rdflib import Graph, Literal, RDF, URIRef
+
+from ..converter.namespace_manager import BIM
+
+logger = logging.getLogger(__name__)
+
+# 인덱스가 추적하는 프레디킷
+_INDEXED_PREDICATES = (RDF.type, BIM.hasCategory, BIM.containsElement)
+
+# 요소 식별자 프레디킷
+NAVIS_OBJECT_ID = URIRef("http://example.org/bim-ontology/navis#hasObjectId")
+_IDENTIFIER_PREDICATES = (BIM.hasGlobalId, NAVIS_OBJECT_ID)
+
+
+def to_python_value(val) -> Any:
+    """SPARQL 결과 값을 TripleStore.query()와 동일한 파이썬 값으로 변환한다."""
+    if isinstance(val, Literal):
+        return val.toPython()
+    if isinstance(val, URIRef):
+        return str(val)
+    return val
+
+
+def _sort_key(val) -> tuple:
+    """SPARQL ORDER BY와 같이 미바인딩 값을 앞에 두는 정렬 키."""
+    return (0, "") if val is None else (1, str(val))
+
+
+def element_row_key(row: dict) -> tuple:
+    """element_rows 정렬 키 (카테고리, 이름, URI, 원본 타입). 커서 페이지네이션에 사용한다."""
+    return (_sort_key(row["category"]), _sort_key(row["name"]), row["uri"],
+            _sort_key(row["originalType"]))
+
+
+def category_element_row_key(row: dict) -> tuple:
+    """elements_by_category 정렬 키 (이름, URI, GlobalId)."""
+    return (_sort_key(row["name"]), row["uri"], _sort_key(row["globalId"]))
+
+
+def _page(rows: list, keys: list, limit: int, offset: int, after: tuple | None) -> list:
+    """정렬된 행에서 after 키 다음(없으면 offset)부터 limit개를 자른다."""
+    start = bisect.bisect_right(keys, after) if after is not None else offset
+    return rows[start:start + limit]
+
+
+class GraphIndex:
+    """타입/카테고리/층 포함 관계 인덱스."""
+
+    def __init__(self, graph: Graph):
+        self._graph = graph
+        self.by_type: dict[Any, set] = {}
+        self.by_category: dict[Any, set] = {}
+        self.categories_of: dict[Any, set] = {}
+        self.contained: dict[Any, set] = {}
+        # 정렬된 요소 행과 정렬 키 캐시 (변경 시 폐기)
+        self._element_rows: tuple[list[dict], list[tuple]] | None = None
+        self._category_rows: dict[str, tuple[list[dict], list[tuple]]] = {}
+
+    @classmethod
+    def build(cls, graph: Graph) -> "GraphIndex":
+        """그래프 전체를 한 번 순회하여 인덱스를 생성한다."""
+        start = time.time()
+        index = cls(graph)
+        for predicate in _INDEXED_PREDICATES:
+            for triple in graph.triples((None, predicate, None)):
+                index.add(triple)
+        logger.info(
+            "그래프 인덱스 생성: 타입 %d, 카테고리 %d, 포함 관계 %d (%.2f초)",
+            len(index.by_type), len(index.by_category), len(index.contained),
+            time.time() - start,
+        )
+        return index
+
+    # ---------- 증분 갱신 ----------
+
+    def add(self, triple: tuple):
+        """트리플 하나를 인덱스에 반영한다."""
+        s, p, o = triple
+        if p == RDF.type:
+            self.by_type.setdefault(o, set()).add(s)
+        elif p == BIM.hasCategory:
+            self.by_category.setdefault(o, set()).add(s)
+            self.categories_of.setdefault(s, set()).add(o)
+        elif p == BIM.containsElement:
+            self.contained.setdefault(s, set()).add(o)
+        self._element_rows = None
+        self._category_rows.clear()
+
+    def remove(self, triple: tuple):
+        """트리플 하나를 인덱스에서 제거한다."""
+        s, p, o = triple
+        if p == RDF.type:
+            self._discard(self.by_type, o, s)
+        elif p == BIM.hasCategory:
+            self._discard(self.by_category, o, s)
+            self._discard(self.categories_of, s, o)
+        elif p == BIM.containsElement:
+            self._discard(self.contained, s, o)
+        self._element_rows = None
+        self._category_rows.clear()
+
+    @staticmethod
+    def _discard(mapping: dict, key, value):
+        members = mapping.get(key)
+        if members is not None:
+            members.discard(value)
+            if not members:
+                del mapping[key]
+
+    # ---------- 조회 (SPARQL 결과 행과 동일한 형식) ----------
+
+    def _values(self, subject, predicate) -> list:
+        """OPTIONAL 패턴처럼 값이 없으면 [None]을 반환한다."""
+        return list(self._graph.objects(subject, predicate)) or [None]
+
+    def category_counts(self) -> list[dict[str, Any]]:
+        """물리 요소의 카테고리별 개수 (get_component_statistics 대응)."""
+        elements = self.by_type.get(BIM.PhysicalElement, set())
+        rows = []
+        for category, subjects in self.by_category.items():
+            num = len(subjects & elements)
+            if num:
+                rows.append({"category": to_python_value(category), "num": num})
+        rows.sort(key=lambda r: (-r["num"], str(r["category"])))
+        return rows
+
+    def overall_counts(self) -> dict[str, int]:
+        """전체 통계 (get_overall_statistics 대응)."""
+        elements = self.by_type.get(BIM.PhysicalElement, set())
+        categorized = [s for s in elements if s in self.categories_of]
+        categories = set()
+        for s in categorized:
+            categories |= self.categories_of[s]
+        return {
+            "totalElements": len(categorized),
+            "totalCategories": len(categories),
+            "buildings": len(self.by_type.get(BIM.Building, ())),
+            "storeys": len(self.by_type.get(BIM.BuildingStorey, ())),
+        }
+
+    def storey_rows(self) -> list[dict[str, Any]]:
+        """층 목록과 포함 요소 수 (/api/storeys SPARQL 대응)."""
+        rows = []
+        for storey in self.by_type.get(BIM.BuildingStorey, ()):
+            num = len(self.contained.get(storey, ()))
+            for name in self._values(storey, BIM.hasName):
+                for global_id in self._values(storey, BIM.hasGlobalId):
+                    for elevation in self._values(storey, BIM.hasElevation):
+                        rows.append({
+                            "uri": str(storey),
+                            "name": to_python_value(name),
+                            "globalId": to_python_value(global_id),
+                            "elevation": to_python_value(elevation),
+                            "num": num,
+                        })
+        rows.sort(key=lambda r: (_sort_key(r["name"]), r["uri"]))
+        return rows
+
+    def element_rows(
+        self, limit: int, offset: int = 0, after: tuple | None = None,
+    ) -> list[dict[str, Any]]:
+        """전체 물리 요소 목록 (카테고리/이름 정렬, /api/elements 대응).
+
+        after에 직전 페이지 마지막 행의 element_row_key를 주면 offset 대신 그 다음 행부터 반환한다.
+        """
+        rows, keys = self._sorted_element_rows()
+        return _page(rows, keys, limit, offset, after)
+
+    def element_count(self) -> int:
+        """element_rows 전체 행 수."""
+        return len(self._sorted_element_rows()[0])
+
+    def _sorted_element_rows(self) -> tuple[list[dict], list[tuple]]:
+        if self._element_rows is None:
+            rows = []
+            for elem in self.by_type.get(BIM.PhysicalElement, ()):
+                categories = list(self.categories_of.get(elem, ())) or [None]
+                for name in self._values(elem, BIM.hasName):
+                    for category in categories:
+                        for original_type in self._values(elem, BIM.hasOriginalType):
+                            rows.append({
+                                "uri": str(elem),
+                                "name": to_python_value(name),
+                                "category": to_python_value(category),
+                                "originalType": to_python_value(original_type),
+                            })
+            rows.sort(key=element_row_key)
+            self._element_rows = (rows, [element_row_key(r) for r in rows])
+        return self._element_rows
+
+    def elements_by_category(
+        self, category: str, limit: int, offset: int = 0, after: tuple | None = None,
+    ) -> list[dict[str, Any]]:
+        """특정 카테고리 요소 목록 (get_all_elements_by_category 대응).
+
+        after는 category_element_row_key 기준 커서다 (element_rows와 같은 의미).
+        """
+        rows, keys = self._sorted_category_rows(category)
+        return _page(rows, keys, limit, offset, after)
+
+    def category_element_count(self, category: str) -> int:
+        """elements_by_category 전체 행 수."""
+        return len(self._sorted_category_rows(category)[0])
+
+    def _sorted_category_rows(self, category: str) -> tuple[list[dict], list[tuple]]:
+        cached = self._category_rows.get(category)
+        if cached is None:
+            rows = []
+            for elem in self.by_category.get(Literal(category), ()):
+                for name in self._values(elem, BIM.hasName):
+                    for global_id in self._values(elem, BIM.hasGlobalId):
+                        rows.append({
+                            "uri": str(elem),
+                            "name": to_python_value(name),
+                            "globalId": to_python_value(global_id),
+                        })
+            rows.sort(key=category_element_row_key)
+            cached = self._category_rows[category] = (rows, [category_element_row_key(r) for r in rows])
+        return cached
+
+
+class SubjectIndex:
+    """노드 탐색용 정렬된 subject 인덱스 (/reasoning/nodes 대응).
+
+    ``ORDER BY ?subject LIMIT/OFFSET``은 페이지마다 전체 결과를 정렬하고 COUNT 쿼리를 따로
+    실행하므로, 타입 필터별로 URI 문자열 순으로 정렬한 subject 목록을 한 번 만들고
+    검색어 필터 결과(및 전체 개수)는 최근 FILTER_CACHE_SIZE개까지 보관한다.
+    페이지는 직전 페이지 마지막 subject 다음부터 이분 탐색으로 찾는다.
+    만들어진 시점의 그래프 세대(generation)를 기록하며, 세대가 바뀌면 스토어가 새로 만든다.
+    """
+
+    FILTER_CACHE_SIZE = 32
+
+    def __init__(self, graph: Graph, generation: int = 0):
+        self._graph = graph
+        self.generation = generation
+        self._by_type: dict[Any, tuple[list, list[str]]] = {}
+        self._filtered: OrderedDict[tuple, tuple[list, list[str]]] = OrderedDict()
+
+    def _sorted(self, type_uri) -> tuple[list, list[str]]:
+        cached = self._by_type.get(type_uri)
+        if cached is None:
+            if type_uri is None:
+                subjects = set(self._graph.subjects(unique=True))
+            else:
+                subjects = set(self._graph.subjects(RDF.type, type_uri))
+            pairs = sorted((str(s), s) for s in subjects)
+            cached = self._by_type[type_uri] = ([s for _, s in pairs], [k for k, _ in pairs])
+        return cached
+
+    def subjects(self, type_uri=None, search: str | None = None, search_predicate=None) -> tuple[list, list[str]]:
+        """(정렬된 subject 목록, URI 문자열 키)를 반환한다.
+
+        search가 있으면 URI 또는 search_predicate 값에 검색어가 (대소문자 무시) 포함된 subject만 남긴다.
+        """
+        subjects, keys = self._sorted(type_uri)
+        if not search:
+            return subjects, keys
+        cache_key = (type_uri, search.lower(), search_predicate)
+        cached = self._filtered.get(cache_key)
+        if cached is not None:
+            self._filtered.move_to_end(cache_key)
+            return cached
+        needle = search.lower()
+        matched = [
+            (subject, key) for subject, key in zip(subjects, keys)
+            if needle in key.lower() or (
+                search_predicate is not None and any(
+                    needle in str(v).lower() for v in self._graph.objects(subject, search_predicate)
+                )
+            )
+        ]
+        cached = ([s for s, _ in matched], [k for _, k in matched])
+        self._filtered[cache_key] = cached
+        if len(self._filtered) > self.FILTER_CACHE_SIZE:
+            self._filtered.popitem(last=False)
+        return cached
+
+    def page(
+        self, type_uri=None, search: str | None = None, search_predicate=None,
+        limit: int = 50, offset: int = 0, after: str | None = None,
+    ) -> tuple[list, int]:
+        """(페이지 subject 목록, 필터 전체 개수)를 반환한다. after는 직전 페이지 마지막 subject URI."""
+        subjects, keys = self.subjects(type_uri, search, search_predicate)
+        return _page(subjects, keys, limit, offset, after), len(subjects)
+
+
+class IdentifierIndex:
+    """GlobalId / ObjectId(SyncID) → 요소 URI 인덱스.
+
+    CSV 주입이 행마다 ``SELECT ?elem WHERE { ?elem bim:hasGlobalId "..." } LIMIT 1``을
+    실행하는 대신 사전 조회로 요소를 찾도록 한다.
+    """
+
+    def __init__(self, graph: Graph):
+        self._graph = graph
+        self.by_global_id: dict[str, URIRef] = {}
+        self.by_object_id: dict[str, URIRef] = {}
+
+    @classmethod
+    def build(cls, graph: Graph) -> "IdentifierIndex":
+        """식별자 트리플만 한 번 순회하여 인덱스를 생성한다."""
+        start = time.time()
+        index = cls(graph)
+        for predicate in _IDENTIFIER_PREDICATES:
+            for triple in graph.triples((None, predicate, None)):
+                index.add(triple)
+        logger.info(
+            "식별자 인덱스 생성: GlobalId %d, ObjectId %d (%.2f초)",
+            len(index.by_global_id), len(index.by_object_id), time.time() - start,
+        )
+        return index
+
+    def _mapping(self, predicate) -> dict[str, URIRef] | None:
+        if predicate == BIM.hasGlobalId:
+            return self.by_global_id
+        if predicate == NAVIS_OBJECT_ID:
+            return self.by_object_id
+        return None
+
+    def add(self, triple: tuple):
+        """트리플 하나를 인덱스에 반영한다. 같은 식별자는 먼저 본 요소를 유지한다."""
+        s, p, o = triple
+        mapping = self._mapping(p)
+        if mapping is not None and isinstance(o, Literal):
+            mapping.setdefault(str(o), s)
+
+    def remove(self, triple: tuple):
+        """트리플 하나를 인덱스에서 제거한다. 같은 식별자를 가진 다른 요소가 있으면 대체한다."""
+        s, p, o = triple
+        mapping = self._mapping(p)
+        if mapping is None or mapping.get(str(o)) != s:
+            return
+        replacement = next(self._graph.subjects(p, o), None)
+        if replacement is None:
+            del mapping[str(o)]
+        else:
+            mapping[str(o)] = replacement
+
+    def resolve(self, global_id: str = "", object_id: str = "") -> URIRef | None:
+        """GlobalId를 먼저, 없으면 ObjectId/SyncID로 요소 URI를 찾는다."""
+        if global_id:
+            uri = self.by_global_id.get(global_id)
+            if uri is not None:
+                return uri
+        if object_id:
+            return self.by_object_id.get(object_id)
+        return None
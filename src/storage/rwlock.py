@@ -0,0 +1,81 @@
+"""읽기/쓰기 잠금.
+
+SPARQL 쿼리는 작업 스레드 풀에서 동시에 실행되고, Lean 주입·추론·스키마 적용은
+같은 rdflib 그래프를 변경합니다. rdflib Memory 스토어는 순회 중 변경을 허용하지 않으므로
+읽기는 공유, 쓰기는 배타적으로 직렬화합니다.
+
+- 쓰기 우선: 대기 중인 쓰기가 있으면 새 읽기는 기다린다.
+- 재진입: 읽기/쓰기 잠금을 가진 스레드는 읽기 잠금을 다시 얻을 수 있다.
+"""
+
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """쓰기 우선, 스레드 재진입 가능한 읽기/쓰기 잠금."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer: int | None = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def _read_depth(self) -> int:
+        return getattr(self._local, "depth", 0)
+
+    @contextmanager
+    def read(self):
+        """공유 읽기 잠금."""
+        depth = self._read_depth()
+        if depth or self._writer == threading.get_ident():
+            # 이미 잠금을 가진 스레드: 재진입
+            self._local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.depth = depth
+            return
+
+        with self._cond:
+            while self._writer is not None or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        self._local.depth = 1
+        try:
+            yield
+        finally:
+            self._local.depth = 0
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        """배타적 쓰기 잠금."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+            else:
+                if self._read_depth():
+                    raise RuntimeError("읽기 잠금을 가진 스레드는 쓰기 잠금으로 승격할 수 없습니다")
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = me
+                self._writer_depth = 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._cond.notify_all()
@@ -0,0 +1,266 @@
+"""바이너리 그래프 스냅샷 모듈.
+
+TTL 재파싱 없이 그래프를 빠르게 복원하기 위한 사전 인코딩(dictionary-encoded)
+바이너리 포맷을 제공합니다. 스냅샷은 원본 TTL 옆에 ``<원본>.snap`` 으로 저장되며,
+원본보다 최신일 때 자동으로 선택됩니다.
+
+파일 구조 (little-endian):
+    MAGIC(8) | 헤더(<QQQQ: 네임스페이스 수, 용어 수, 트리플 수, SPO 오프셋)
+    | 네임스페이스 바인딩 | 용어 사전 | SPO 정수 배열 (uint32 x 3N, 4바이트 정렬)
+
+SPO 배열은 mmap으로 복사 없이 읽습니다.
+"""
+
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rdflib import BNode, Graph, Literal, URIRef
+
+if TYPE_CHECKING:
+    from .triple_store import TripleStore
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"BIMSNAP\x01"
+SNAPSHOT_SUFFIX = ".snap"
+# 추론 그래프 사이드카 파일 (Turtle): ``<원본>.ttl.inferred``
+INFERRED_SUFFIX = ".inferred"
+# 바이너리 스냅샷 사용 여부 ("0"이면 스냅샷을 읽거나 쓰지 않고 항상 원본을 파싱)
+USE_SNAPSHOT = os.getenv("BIM_RDF_SNAPSHOT", "1") != "0"
+
+_HEADER = struct.Struct("<QQQQ")
+_LEN = struct.Struct("<I")
+
+# 용어 종류 코드
+_URI, _BNODE, _LITERAL, _TYPED_LITERAL, _LANG_LITERAL = range(5)
+
+
+def snapshot_path_for(source: str | Path) -> Path:
+    """원본 RDF 파일에 대응하는 스냅샷 경로를 반환한다."""
+    source = Path(source)
+    return source.with_name(source.name + SNAPSHOT_SUFFIX)
+
+
+def inferred_path_for(source: str | Path) -> Path:
+    """원본 RDF 파일에 대응하는 추론 그래프 사이드카 경로를 반환한다."""
+    source = Path(source)
+    return source.with_name(source.name + INFERRED_SUFFIX)
+
+
+def is_snapshot_fresh(snapshot: str | Path, source: str | Path) -> bool:
+    """스냅샷이 존재하고 원본보다 최신인지 확인한다."""
+    snapshot, source = Path(snapshot), Path(source)
+    if not snapshot.is_file():
+        return False
+    if not source.exists():
+        return True
+    return snapshot.stat().st_mtime >= source.stat().st_mtime
+
+
+def _pack_str(buf: bytearray, text: str):
+    data = text.encode("utf-8")
+    buf += _LEN.pack(len(data))
+    buf += data
+
+
+def _unpack_str(mm, pos: int) -> tuple[str, int]:
+    (length,) = _LEN.unpack_from(mm, pos)
+    pos += _LEN.size
+    return mm[pos:pos + length].decode("utf-8"), pos + length
+
+
+def _encode_term(buf: bytearray, term):
+    if isinstance(term, Literal):
+        if term.language:
+            buf.append(_LANG_LITERAL)
+            _pack_str(buf, str(term))
+            _pack_str(buf, term.language)
+        elif term.datatype:
+            buf.append(_TYPED_LITERAL)
+            _pack_str(buf, str(term))
+            _pack_str(buf, str(term.datatype))
+        else:
+            buf.append(_LITERAL)
+            _pack_str(buf, str(term))
+    elif isinstance(term, BNode):
+        buf.append(_BNODE)
+        _pack_str(buf, str(term))
+    else:
+        buf.append(_URI)
+        _pack_str(buf, str(term))
+
+
+def _decode_term(mm, pos: int):
+    kind = mm[pos]
+    value, pos = _unpack_str(mm, pos + 1)
+    if kind == _URI:
+        return URIRef(value), pos
+    if kind == _BNODE:
+        return BNode(value), pos
+    if kind == _LITERAL:
+        return Literal(value), pos
+    extra, pos = _unpack_str(mm, pos)
+    if kind == _TYPED_LITERAL:
+        return Literal(value, datatype=URIRef(extra)), pos
+    if kind == _LANG_LITERAL:
+        return Literal(value, lang=extra), pos
+    raise ValueError(f"알 수 없는 용어 코드: {kind}")
+
+
+def write_snapshot(graph: Graph, filepath: str | Path) -> Path:
+    """그래프를 바이너리 스냅샷으로 저장한다.
+
+    임시 파일에 먼저 기록한 뒤 교체하므로 중간 실패 시에도 기존 스냅샷이 유지됩니다.
+
+    Returns:
+        저장된 스냅샷 경로
+    """
+    start = time.time()
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    term_ids: dict = {}
+    term_buf = bytearray()
+    spo = array("I")
+
+    for triple in graph.triples((None, None, None)):
+        for term in triple:
+            tid = term_ids.get(term)
+            if tid is None:
+                tid = term_ids[term] = len(term_ids)
+                _encode_term(term_buf, term)
+            spo.append(tid)
+
+    ns_buf = bytearray()
+    namespaces = list(graph.namespaces())
+    for prefix, uri in namespaces:
+        _pack_str(ns_buf, prefix)
+        _pack_str(ns_buf, str(uri))
+
+    body_offset = len(MAGIC) + _HEADER.size
+    spo_offset = body_offset + len(ns_buf) + len(term_buf)
+    padding = (-spo_offset) % spo.itemsize
+    spo_offset += padding
+    if sys.byteorder != "little":
+        spo.byteswap()
+
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER.pack(len(namespaces), len(term_ids), len(spo) // 3, spo_offset))
+        f.write(ns_buf)
+        f.write(term_buf)
+        f.write(b"\x00" * padding)
+        spo.tofile(f)
+    os.replace(tmp_path, filepath)
+
+    logger.info(
+        "스냅샷 저장: %s (%d 용어, %d 트리플, %.1f초)",
+        filepath, len(term_ids), len(spo) // 3, time.time() - start,
+    )
+    return filepath
+
+
+def read_snapshot(filepath: str | Path, graph: Graph) -> int:
+    """바이너리 스냅샷을 읽어 그래프에 트리플을 추가한다.
+
+    Returns:
+        스냅샷에 기록된 트리플 수
+    """
+    start = time.time()
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"스냅샷 포맷이 아닙니다: {filepath}")
+        n_ns, n_terms, n_triples, spo_offset = _HEADER.unpack_from(mm, len(MAGIC))
+        pos = len(MAGIC) + _HEADER.size
+
+        for _ in range(n_ns):
+            prefix, pos = _unpack_str(mm, pos)
+            uri, pos = _unpack_str(mm, pos)
+            graph.bind(prefix, URIRef(uri), override=True, replace=True)
+
+        terms = []
+        for _ in range(n_terms):
+            term, pos = _decode_term(mm, pos)
+            terms.append(term)
+
+        view = memoryview(mm)[spo_offset:spo_offset + n_triples * 12]
+        ids = None
+        try:
+            if sys.byteorder == "little":
+                ids = view.cast("I")
+            else:
+                ids = array("I", view)
+                ids.byteswap()
+            add_encoded = getattr(graph.store, "add_encoded", None)
+            if add_encoded is not None:
+                # 사전 인코딩 스토어(CompactMemory)는 ID 배열을 그대로 받는다
+                add_encoded(terms, ids)
+            else:
+                # 용어는 이미 검증된 rdflib 노드이므로 Graph.addN의 노드 검사를 건너뛰고
+                # 스토어에 직접 추가한다.
+                store_add = graph.store.add
+                for i in range(0, n_triples * 3, 3):
+                    store_add((terms[ids[i]], terms[ids[i + 1]], terms[ids[i + 2]]), graph, False)
+        finally:
+            if isinstance(ids, memoryview):
+                ids.release()
+            view.release()
+
+    logger.info(
+        "스냅샷 로딩: %s (%d 트리플, %.1f초)", filepath, n_triples, time.time() - start,
+    )
+    return n_triples
+
+
+def load_with_snapshot(store: "TripleStore", source: str | Path, write: bool = True) -> int:
+    """원본 RDF 파일을 로딩하되, 최신 스냅샷이 있으면 스냅샷을 사용한다.
+
+    스냅샷이 없거나 오래되었으면 원본을 파싱한 뒤 (write=True일 때) 스냅샷을 생성합니다.
+    USE_SNAPSHOT(BIM_RDF_SNAPSHOT=0)이 꺼져 있으면 스냅샷을 읽지도 쓰지도 않습니다.
+    추론 그래프 사이드카(``<원본>.inferred``)가 있으면 추론 그래프로 함께 로딩합니다.
+
+    Args:
+        store: 로딩 대상 TripleStore
+        source: 원본 TTL 파일 경로
+        write: 원본 파싱 후 스냅샷 생성 여부
+
+    Returns:
+        로딩된 트리플 수
+    """
+    loaded = _load_asserted(store, source, write)
+    inferred = inferred_path_for(source)
+    if inferred.is_file():
+        try:
+            store.load_inferred(str(inferred))
+        except Exception as e:
+            logger.warning("추론 그래프 로딩 실패, 추론 없이 시작: %s (%s)", inferred, e)
+    return loaded
+
+
+def _load_asserted(store: "TripleStore", source: str | Path, write: bool) -> int:
+    """단언 트리플을 스냅샷 또는 원본에서 로딩한다."""
+    if not USE_SNAPSHOT:
+        return store.load(str(source))
+    snapshot = snapshot_path_for(source)
+    if is_snapshot_fresh(snapshot, source):
+        try:
+            return store.load_snapshot(str(snapshot))
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning("스냅샷 로딩 실패, 원본 파싱으로 대체: %s (%s)", snapshot, e)
+            store.clear()
+
+    loaded = store.load(str(source))
+    if write:
+        try:
+            store.save_snapshot(str(snapshot))
+        except OSError as e:
+            logger.warning("스냅샷 저장 실패: %s (%s)", snapshot, e)
+    return loaded
@@ -5,24 +5,126 @@ SPARQL 쿼리 실행, 그래프 저장/로딩, 배치 처리를 지원합니다.
 BaseTripleStore를 상속하여 GraphDB와 동일한 인터페이스를 제공합니다.
 """
 
+import itertools
 import logging
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
 from rdflib import Graph, URIRef, Literal, Namespace
+from rdflib.paths import Path as PropertyPath
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.evaluate import evalQuery
 from rdflib.query import Result
 
 from .base_store import BaseTripleStore
+from .graph_index import GraphIndex, IdentifierIndex, SubjectIndex, to_python_value
+from .rwlock import ReadWriteLock
+from .snapshot import read_snapshot, write_snapshot
 
 logger = logging.getLogger(__name__)
 
+# 취소 여부를 확인하는 triples() 결과 간격
+_CANCEL_CHECK_INTERVAL = 1024
+
+# dirty 노드를 이 수보다 많이 모으면 개별 추적을 포기하고 전체 변경으로 본다
+DIRTY_NODE_LIMIT = 100_000
+
+# 추론 트리플 그래프(named graph)의 식별자
+INFERRED_GRAPH = URIRef("http://example.org/bim-ontology/graph/inferred")
+
+
+class QueryCancelled(RuntimeError):
+    """실행 중인 쿼리가 취소되었을 때 발생한다."""
+
+
+class _CancellableGraph(Graph):
+    """같은 스토어를 공유하면서 triples() 순회 중 취소 여부를 확인하는 그래프 뷰.
+
+    rdflib SPARQL 평가기는 BGP마다 graph.triples()를 호출하므로,
+    여기서 이벤트를 확인하면 평가 도중에도 쿼리를 중단할 수 있다.
+    """
+
+    def __init__(self, graph: Graph, cancel_event: threading.Event):
+        super().__init__(
+            store=graph.store,
+            identifier=graph.identifier,
+            namespace_manager=graph.namespace_manager,
+        )
+        self._source = graph
+        self._cancel_event = cancel_event
+
+    def triples(self, triple):
+        event = self._cancel_event
+        if event.is_set():
+            raise QueryCancelled()
+        for i, t in enumerate(self._source.triples(triple)):
+            if not i % _CANCEL_CHECK_INTERVAL and event.is_set():
+                raise QueryCancelled()
+            yield t
+
+
+class UnionGraph(Graph):
+    """단언 그래프와 추론 그래프를 하나로 보여 주는 읽기 전용 뷰.
+
+    SPARQL 평가기와 증분 추론기는 triples()로만 그래프를 읽으므로, 두 그래프를 차례로
+    순회하면서 단언 그래프에도 있는 추론 트리플을 건너뛰면 합집합이 된다.
+    프로퍼티 경로는 그래프마다 따로 평가하면 두 그래프에 걸친 경로가 끊기므로 합집합 위에서 평가한다.
+    """
+
+    def __init__(self, asserted: Graph, inferred: Graph):
+        super().__init__(
+            store=asserted.store,
+            identifier=asserted.identifier,
+            namespace_manager=asserted.namespace_manager,
+        )
+        self.asserted = asserted
+        self.inferred = inferred
+
+    def triples(self, triple):
+        s, p, o = triple
+        if isinstance(p, PropertyPath):
+            for s_, o_ in p.eval(self, s, o):
+                yield s_, p, o_
+            return
+        asserted = self.asserted
+        yield from asserted.triples(triple)
+        for t in self.inferred.triples(triple):
+            if t not in asserted:
+                yield t
+
+    def __len__(self) -> int:
+        asserted = self.asserted
+        return len(asserted) + sum(1 for t in self.inferred if t not in asserted)
+
+    def add(self, triple):
+        raise TypeError("UnionGraph는 읽기 전용입니다")
+
+    def remove(self, triple):
+        raise TypeError("UnionGraph는 읽기 전용입니다")
+
 
 class TripleStore(BaseTripleStore):
     """rdflib 기반 로컬 트리플 스토어."""
 
     def __init__(self, graph: Graph | None = None):
-        self._graph = graph if graph is not None else Graph()
+        self._graph = graph if graph is not None else self._new_graph()
+        self._index: GraphIndex | None = None
+        self._subjects: SubjectIndex | None = None
+        self._identifiers: IdentifierIndex | None = None
+        self._generation = 0
+        self._lock = ReadWriteLock()
+        self._listeners: list[Callable[[list, list], Any]] = []
+        self._inferred: Graph | None = None
+        # 마지막 take_dirty() 이후 바뀐 노드. _dirty_all이면 어떤 노드가 바뀌었는지 모른다
+        self._dirty: set = set()
+        self._dirty_all = True
+
+    def _new_graph(self) -> Graph:
+        """빈 그래프를 생성한다. 하위 클래스에서 스토어 백엔드를 바꿀 때 재정의한다."""
+        return Graph()
 
     @property
     def graph(self) -> Graph:
@@ -31,6 +133,233 @@ class TripleStore(BaseTripleStore):
     def __len__(self) -> int:
         return len(self._graph)
 
+    @property
+    def inferred(self) -> Graph | None:
+        """추론 트리플 그래프 (materialized view). 없으면 None.
+
+        ``graph``와 len(store), save()는 단언 트리플만 다루고, SPARQL 쿼리는 두 그래프의 합집합을 본다.
+        """
+        return self._inferred
+
+    def union_graph(self) -> Graph:
+        """단언 + 추론 트리플 뷰. 추론 그래프가 비어 있으면 단언 그래프 자체를 반환한다."""
+        inferred = self._inferred
+        if inferred is None or not len(inferred):
+            return self._graph
+        return UnionGraph(self._graph, inferred)
+
+    def swap_inferred(self, inferred: Graph | None) -> Graph | None:
+        """추론 그래프를 원자적으로 교체한다 (None이면 제거).
+
+        새 추론 결과는 잠금 밖에서 미리 계산해 두므로 쓰기 잠금은 참조 교체 동안만 잡는다.
+        식별자 인덱스는 그대로 두고 타입/카테고리 인덱스만 폐기하며, 세대를 올려 쿼리 캐시를 무효화한다.
+        어떤 노드의 추론 결과가 바뀌었는지 모르므로 모든 노드를 dirty로 본다.
+
+        Returns:
+            이전 추론 그래프
+        """
+        with self._lock.write():
+            previous, self._inferred = self._inferred, inferred
+            self._index = None
+            self._dirty_all = True
+            self._dirty.clear()
+            self._generation += 1
+        logger.info("추론 그래프 교체: %d → %d 트리플",
+                    len(previous) if previous is not None else 0,
+                    len(inferred) if inferred is not None else 0)
+        return previous
+
+    def save_inferred(self, filepath: str, fmt: str = "turtle") -> str:
+        """추론 그래프를 단언 그래프와 별도 파일로 저장한다."""
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with self._lock.read():
+            inferred = self._inferred if self._inferred is not None else Graph()
+            inferred.serialize(destination=filepath, format=fmt)
+        logger.info("추론 그래프 저장: %s (%d 트리플)", filepath, len(inferred))
+        return filepath
+
+    def load_inferred(self, filepath: str, fmt: str | None = None) -> int:
+        """저장된 추론 그래프를 파싱한 뒤 현재 추론 그래프와 교체한다."""
+        inferred = Graph(identifier=INFERRED_GRAPH)
+        inferred.parse(filepath, format=fmt or "turtle")
+        self.swap_inferred(inferred)
+        return len(inferred)
+
+    @property
+    def generation(self) -> int:
+        """그래프 변경 세대 번호. 변경될 때마다 증가하며 쿼리 캐시 무효화에 사용된다."""
+        return self._generation
+
+    @property
+    def index(self) -> GraphIndex:
+        """단언 + 추론 그래프의 타입/카테고리/층 포함 관계 인덱스 (최초 접근 시 생성).
+
+        SPARQL 대체 경로와 같은 결과를 내도록 union_graph()로 만들며, 추론 그래프가 바뀌면 폐기한다.
+        """
+        if self._index is None:
+            self._index = GraphIndex.build(self.union_graph())
+        return self._index
+
+    @property
+    def subject_index(self) -> SubjectIndex:
+        """단언 + 추론 그래프의 정렬된 subject 인덱스 (세대가 바뀌면 다시 생성)."""
+        subjects = self._subjects
+        if subjects is None or subjects.generation != self._generation:
+            subjects = self._subjects = SubjectIndex(self.union_graph(), self._generation)
+        return subjects
+
+    @property
+    def identifiers(self) -> IdentifierIndex:
+        """GlobalId/ObjectId → 요소 URI 인덱스 (최초 접근 시 생성, 식별자 변경 시에만 폐기)."""
+        if self._identifiers is None:
+            self._identifiers = IdentifierIndex.build(self._graph)
+        return self._identifiers
+
+    def reading(self):
+        """공유 읽기 잠금. 작업 스레드에서 그래프를 직접 순회할 때 사용한다."""
+        return self._lock.read()
+
+    def draining(self):
+        """진행 중인 읽기/쓰기가 모두 끝날 때까지 기다린 뒤 배타 잠금을 잡는다.
+
+        그래프를 바꾸지 않으므로 세대 번호는 그대로 둔다. 스토어 교체 직전에 사용한다.
+        """
+        return self._lock.write()
+
+    @contextmanager
+    def writing(self, identifiers_changed: bool = True, changes_tracked: bool = False):
+        """배타적 쓰기 잠금 하에 그래프를 변경한다.
+
+        블록이 끝나면 (예외가 발생해도) mark_modified()를 호출한다.
+
+        Args:
+            identifiers_changed: False면 블록이 bim:hasGlobalId / navis:hasObjectId
+                트리플을 바꾸지 않는다고 보고 식별자 인덱스를 유지한다.
+            changes_tracked: True면 블록 안의 변경이 모두 apply_delta/bulk_insert를 거쳐
+                dirty 노드로 기록된다고 보고, 블록 전체를 dirty로 표시하지 않는다.
+
+        Example:
+            with store.writing() as graph:
+                graph.add((s, p, o))
+        """
+        with self._lock.write():
+            try:
+                yield self._graph
+            finally:
+                self.mark_modified(identifiers_changed, changed=() if changes_tracked else None)
+
+    def mark_modified(self, identifiers_changed: bool = True, changed: Iterable[tuple] | None = None):
+        """그래프가 store API 밖에서 직접 수정되었음을 알린다.
+
+        lean 주입, 추론, 스키마 적용처럼 ``store.graph``를 직접 변경하는 경로에서 호출하며,
+        세대 번호를 올리고 파생 인덱스를 폐기해 다음 조회 시 재생성되도록 한다.
+        식별자 인덱스는 identifiers_changed가 True일 때만 폐기한다.
+        changed로 바뀐 트리플을 알려 주지 않으면 모든 노드를 dirty로 본다.
+        """
+        if changed is None:
+            self._dirty_all = True
+            self._dirty.clear()
+        else:
+            self.mark_dirty(changed)
+        self._generation += 1
+        self._index = None
+        if identifiers_changed:
+            self._identifiers = None
+
+    def mark_dirty(self, added: Iterable[tuple] = (), removed: Iterable[tuple] = ()) -> None:
+        """바뀐 트리플의 주어와 (리터럴이 아닌) 목적어를 dirty 노드로 기록한다.
+
+        변경 리스너와 같은 ``(added, removed)`` 시그니처라 증분 추론기의 추론 트리플 변경
+        통지에도 그대로 쓸 수 있다. 쓰기 잠금 하에서 호출해야 한다.
+        """
+        if self._dirty_all:
+            return
+        dirty = self._dirty
+        for s, _, o in itertools.chain(added, removed):
+            dirty.add(s)
+            if not isinstance(o, Literal):
+                dirty.add(o)
+        if len(dirty) > DIRTY_NODE_LIMIT:
+            self._dirty_all = True
+            dirty.clear()
+
+    def take_dirty(self) -> set | None:
+        """마지막 호출 이후 바뀐 노드 집합을 반환하고 추적을 초기화한다.
+
+        어떤 노드가 바뀌었는지 알 수 없는 변경(직접 수정, 로딩, 추론 그래프 교체 등)이
+        있었거나 스토어가 처음 만들어진 뒤 처음 호출하면 None을 반환한다 (전체 재검증 필요).
+        증분 SHACL 검증처럼 소비자 하나가 읽기 잠금 하에서 호출하는 것을 전제로 한다.
+        """
+        dirty = None if self._dirty_all else self._dirty
+        self._dirty, self._dirty_all = set(), False
+        return dirty
+
+    def add_change_listener(self, listener: Callable[[list, list], Any]) -> None:
+        """apply_delta/bulk_insert로 반영된 변경을 통지받을 리스너를 등록한다.
+
+        리스너는 쓰기 잠금 하에서 ``listener(added, removed)``로 호출되며 (이미 그래프에 반영된
+        실제 변경분), 증분 추론처럼 파생 트리플을 그래프에 직접 더하거나 지울 수 있다.
+        """
+        with self._lock.write():
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[list, list], Any]) -> None:
+        with self._lock.write():
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self, added: list, removed: list) -> None:
+        """리스너에 변경을 알린다 (쓰기 잠금 보유 상태에서 호출).
+
+        리스너가 그래프를 바꿀 수 있으므로 타입/카테고리 인덱스는 폐기한다.
+        리스너 오류는 이미 반영된 변경을 되돌리지 않고 기록만 한다.
+        """
+        if not self._listeners:
+            return
+        for listener in list(self._listeners):
+            try:
+                listener(added, removed)
+            except Exception:
+                logger.exception("변경 리스너 실패: %r", listener)
+        self._index = None
+
+    def apply_delta(
+        self,
+        added: Iterable[tuple] = (),
+        removed: Iterable[tuple] = (),
+        identifiers_changed: bool = True,
+    ) -> dict:
+        """트리플 추가/삭제를 쓰기 잠금 하에 한 번에 반영하고 변경 리스너에 알린다.
+
+        없는 트리플의 삭제와 이미 있는 트리플의 추가는 건너뛰며, 같은 트리플을 지웠다가
+        다시 추가하는 경우는 변경으로 보지 않는다.
+
+        Args:
+            added: 추가할 트리플
+            removed: 삭제할 트리플 (패턴이 아닌 구체 트리플)
+            identifiers_changed: False면 식별자 인덱스를 유지한다 (writing()과 같은 의미)
+
+        Returns:
+            {"added": 실제 추가 수, "removed": 실제 삭제 수}
+        """
+        with self._lock.write():
+            graph = self._graph
+            added = list(dict.fromkeys(added))
+            keep = set(added)
+            removed = [t for t in dict.fromkeys(removed) if t not in keep and t in graph]
+            added = [t for t in added if t not in graph]
+            try:
+                for triple in removed:
+                    graph.remove(triple)
+                for triple in added:
+                    graph.add(triple)
+            finally:
+                self.mark_modified(identifiers_changed, changed=itertools.chain(added, removed))
+            if added or removed:
+                self._notify(added, removed)
+        return {"added": len(added), "removed": len(removed)}
+
     def insert(self, triples: list[tuple]) -> int:
         """트리플 리스트를 삽입한다.
 
@@ -41,11 +370,52 @@ class TripleStore(BaseTripleStore):
             삽입된 트리플 수
         """
         count = 0
-        for s, p, o in triples:
-            self._graph.add((s, p, o))
-            count += 1
+        with self._lock.write():
+            index = self._index
+            identifiers = self._identifiers
+            for s, p, o in triples:
+                self._graph.add((s, p, o))
+                if index is not None:
+                    index.add((s, p, o))
+                if identifiers is not None:
+                    identifiers.add((s, p, o))
+                count += 1
+            if count:
+                self.mark_dirty(triples)
+                self._generation += 1
         return count
 
+    def bulk_insert(self, triples: list[tuple]) -> int:
+        """트리플을 쓰기 잠금 하에 한 번의 addN으로 원자적으로 삽입한다.
+
+        이미 있는 트리플은 건너뛰고, 삽입 중 오류가 나면 추가분을 되돌려 그래프를
+        원래 상태로 둔다. 인덱스는 증분 갱신하고 세대는 한 번만 올리므로
+        쿼리 캐시도 한 번만 무효화된다.
+
+        Returns:
+            새로 추가된 트리플 수
+        """
+        with self._lock.write():
+            graph = self._graph
+            new = [t for t in dict.fromkeys(triples) if t not in graph]
+            if not new:
+                return 0
+            try:
+                graph.addN((s, p, o, graph) for s, p, o in new)
+            except Exception:
+                for triple in new:
+                    graph.remove(triple)
+                raise
+            for index in (self._index, self._identifiers):
+                if index is not None:
+                    for triple in new:
+                        index.add(triple)
+            self.mark_dirty(new)
+            self._notify(new, [])
+            self._generation += 1
+        logger.info("벌크 삽입: %d 트리플 추가 (총 %d)", len(new), len(self._graph))
+        return len(new)
+
     def insert_graph(self, graph: Graph) -> int:
         """다른 Graph의 모든 트리플을 삽입한다.
 
@@ -53,7 +423,8 @@ class TripleStore(BaseTripleStore):
             삽입된 트리플 수
         """
         before = len(self._graph)
-        self._graph += graph
+        with self.writing():
+            self._graph += graph
         inserted = len(self._graph) - before
         logger.info("그래프 삽입: %d 트리플 추가 (총 %d)", inserted, len(self._graph))
         return inserted
@@ -78,45 +449,99 @@ class TripleStore(BaseTripleStore):
                 logger.debug("배치 진행: %d / %d", total, len(triples))
         return total
 
-    def query(self, sparql: str) -> list[dict[str, Any]]:
+    def _query_graph(self, cancel_event: threading.Event | None) -> Graph:
+        graph = self.union_graph()
+        if cancel_event is None:
+            return graph
+        return _CancellableGraph(graph, cancel_event)
+
+    def query(
+        self, sparql: str, cancel_event: threading.Event | None = None,
+    ) -> list[dict[str, Any]]:
         """SPARQL SELECT 쿼리를 실행하고 결과를 딕셔너리 리스트로 반환한다.
 
         Args:
             sparql: SPARQL 쿼리 문자열
+            cancel_event: 설정되면 평가를 중단하고 QueryCancelled를 발생시키는 이벤트
 
         Returns:
             결과 행의 리스트. 각 행은 {변수명: 값} 딕셔너리.
         """
         start = time.time()
-        result: Result = self._graph.query(sparql)
-        elapsed = time.time() - start
-
         rows = []
-        if result.type == "SELECT":
-            vars_ = [str(v) for v in result.vars]
-            for row in result:
-                row_dict = {}
-                for i, var in enumerate(vars_):
-                    val = row[i]
-                    if isinstance(val, Literal):
-                        row_dict[var] = val.toPython()
-                    elif isinstance(val, URIRef):
-                        row_dict[var] = str(val)
-                    else:
-                        row_dict[var] = val
-                rows.append(row_dict)
+        with self._lock.read():
+            result: Result = self._query_graph(cancel_event).query(sparql)
+            if result.type == "SELECT":
+                vars_ = [(str(v), v) for v in result.vars]
+                # Result 순회는 모든 변수가 미바인딩인 행을 건너뛰므로 바인딩을 직접 읽는다 (select_stream과 같은 행 수)
+                for binding in result.bindings:
+                    rows.append({name: to_python_value(binding.get(var)) for name, var in vars_})
+        elapsed = time.time() - start
 
         logger.debug("SPARQL 쿼리 실행: %d 결과, %.3f초", len(rows), elapsed)
         return rows
 
+    @contextmanager
+    def select_stream(
+        self, sparql: str, cancel_event: threading.Event | None = None,
+    ) -> Iterator[tuple[list[str], Iterator[tuple]]]:
+        """SELECT 결과를 모으지 않고 한 행씩 순회한다 (읽기 잠금은 블록이 끝날 때까지 유지).
+
+        ``graph.query()``의 Result는 순회한 행을 내부 리스트에 쌓으므로, 쿼리를 직접 평가해
+        바인딩 제너레이터를 그대로 넘긴다. 블록은 한 스레드 안에서 끝까지 소비해야 한다.
+
+        Yields:
+            (변수명 리스트, 변수 순서대로 rdflib 용어(미바인딩은 None) 튜플의 이터레이터)
+
+        Raises:
+            ValueError: SELECT 쿼리가 아닐 때
+
+        Example:
+            with store.select_stream(sparql) as (vars_, rows):
+                for row in rows:
+                    ...
+        """
+        with self._lock.read():
+            graph = self._query_graph(cancel_event)
+            prepared = prepareQuery(sparql, initNs=dict(graph.namespaces()))
+            if prepared.algebra.name != "SelectQuery":
+                raise ValueError("SELECT 쿼리만 스트리밍할 수 있습니다")
+            result = evalQuery(graph, prepared, {})
+            variables = result["vars_"]
+            # 모든 변수가 미바인딩인 행도 query()와 같이 한 행으로 유지한다
+            rows = (tuple(b.get(v) for v in variables) for b in result["bindings"])
+            yield [str(v) for v in variables], rows
+
+    def select_rows(
+        self, sparql: str, cancel_event: threading.Event | None = None,
+    ) -> tuple[list[str], list[tuple]]:
+        """SELECT 결과를 (변수명 리스트, 행 튜플 리스트)로 반환한다. 읽기 잠금은 평가하는 동안만 잡는다.
+
+        행 dict를 만들지 않으므로, 스트리밍 응답이나 컬럼 내보내기가 잠금을 놓은 뒤 결과를 직렬화할 때 사용한다.
+
+        Raises:
+            ValueError: SELECT 쿼리가 아닐 때
+        """
+        with self.select_stream(sparql, cancel_event) as (variables, rows):
+            return variables, list(rows)
+
+    def query_rows(self, sparql: str, cancel_event: threading.Event | None = None) -> list:
+        """SPARQL SELECT 쿼리를 실행하고 rdflib ResultRow 리스트를 반환한다.
+
+        결과 행을 속성 이름(``row.name``)으로 접근하는 라우트에서 사용한다.
+        """
+        with self._lock.read():
+            return list(self._query_graph(cancel_event).query(sparql))
+
     def query_raw(self, sparql: str) -> Result:
         """SPARQL 쿼리를 실행하고 rdflib Result 원본을 반환한다."""
-        return self._graph.query(sparql)
+        return self.union_graph().query(sparql)
 
     def ask(self, sparql: str) -> bool:
         """SPARQL ASK 쿼리를 실행한다."""
-        result = self._graph.query(sparql)
-        return bool(result.askAnswer)
+        with self._lock.read():
+            result = self.union_graph().query(sparql)
+            return bool(result.askAnswer)
 
     def count(self) -> int:
         """스토어의 전체 트리플 수를 반환한다."""
@@ -133,7 +558,11 @@ class TripleStore(BaseTripleStore):
 
     def clear(self):
         """모든 트리플을 삭제한다."""
-        self._graph = Graph()
+        with self.writing():
+            self._graph = self._new_graph()
+            self._inferred = None
+            # 리스너는 이전 그래프에 묶여 있으므로 함께 해제한다
+            self._listeners.clear()
         # 네임스페이스 바인딩 복원
         for prefix, ns in list(self._graph.namespaces()):
             self._graph.bind(prefix, ns)
@@ -150,7 +579,8 @@ class TripleStore(BaseTripleStore):
             저장된 파일 경로
         """
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        self._graph.serialize(destination=filepath, format=fmt)
+        with self._lock.read():
+            self._graph.serialize(destination=filepath, format=fmt)
         size_kb = Path(filepath).stat().st_size / 1024
         logger.info("저장 완료: %s (%.1f KB, %s 포맷)", filepath, size_kb, fmt)
         return filepath
@@ -166,11 +596,39 @@ class TripleStore(BaseTripleStore):
             로딩된 트리플 수
         """
         before = len(self._graph)
-        self._graph.parse(filepath, format=fmt)
+        with self.writing():
+            self._graph.parse(filepath, format=fmt)
         loaded = len(self._graph) - before
         logger.info("로딩 완료: %s (%d 트리플)", filepath, loaded)
         return loaded
 
+    def save_snapshot(self, filepath: str) -> str:
+        """그래프를 바이너리 스냅샷(용어 사전 + 정수 SPO 배열)으로 저장한다.
+
+        Args:
+            filepath: 출력 스냅샷 경로 (관례상 ``<원본>.ttl.snap``)
+
+        Returns:
+            저장된 파일 경로
+        """
+        with self._lock.read():
+            return str(write_snapshot(self._graph, filepath))
+
+    def load_snapshot(self, filepath: str) -> int:
+        """바이너리 스냅샷에서 트리플을 로딩한다.
+
+        TTL 파싱을 거치지 않으므로 대용량 그래프의 콜드 스타트가 빨라집니다.
+
+        Returns:
+            로딩된 트리플 수
+        """
+        before = len(self._graph)
+        with self.writing():
+            read_snapshot(filepath, self._graph)
+        loaded = len(self._graph) - before
+        logger.info("스냅샷 로딩 완료: %s (%d 트리플)", filepath, loaded)
+        return loaded
+
     def get_subjects_of_type(self, type_uri: str) -> list[str]:
         """특정 타입의 모든 subject URI를 반환한다."""
         rows = self.query(f"""
@@ -24,3 +24,61 @@ def rdf_store():
     if RDF_PATH.exists():
         store.load(str(RDF_PATH))
     return store
+
+
+@pytest.fixture
+def small_ifc(tmp_path) -> Path:
+    """ifcopenshell로 만든 소형 IFC4 파일 (프로젝트/사이트/건물/층 + 요소 + 속성/수량셋, 재료, 분류)."""
+    ifcopenshell = pytest.importorskip("ifcopenshell")
+    guid = ifcopenshell.guid.new
+
+    f = ifcopenshell.file(schema="IFC4")
+    project = f.createIfcProject(guid(), Name="Test Project")
+    site = f.createIfcSite(guid(), Name="Site")
+    building = f.createIfcBuilding(guid(), Name="Plant")
+    storeys = [
+        f.createIfcBuildingStorey(guid(), Name=f"Level {i}", Elevation=float(i * 3000))
+        for i in range(2)
+    ]
+    f.createIfcRelAggregates(guid(), RelatingObject=project, RelatedObjects=[site])
+    f.createIfcRelAggregates(guid(), RelatingObject=site, RelatedObjects=[building])
+    f.createIfcRelAggregates(guid(), RelatingObject=building, RelatedObjects=storeys)
+
+    steel = f.createIfcMaterial("Steel")
+    classification = f.createIfcClassification(Name="Uniclass")
+    pipe_ref = f.createIfcClassificationReference(
+        Identification="Pr_65_52_63", Name="Pipes", ReferencedSource=classification,
+    )
+
+    names = ["Pipe-100", "41P-001 Pump", "Beam_A1", "Unknown part", "Valve-7"]
+    for i, storey in enumerate(storeys):
+        proxies = [
+            f.createIfcBuildingElementProxy(guid(), Name=name, ObjectType="Proxy")
+            for name in names
+        ]
+        beam = f.createIfcBeam(guid(), Name=f"B-{i}")
+        elements = proxies + [beam]
+        f.createIfcRelContainedInSpatialStructure(
+            guid(), RelatedElements=elements, RelatingStructure=storey,
+        )
+        pset = f.createIfcPropertySet(guid(), Name="Pset_Test", HasProperties=[
+            f.createIfcPropertySingleValue("Weight", None, f.createIfcReal(12.5 + i), None),
+            f.createIfcPropertySingleValue("Material", None, f.createIfcLabel("Steel"), None),
+        ])
+        f.createIfcRelDefinesByProperties(
+            guid(), RelatedObjects=elements, RelatingPropertyDefinition=pset,
+        )
+        qset = f.createIfcElementQuantity(guid(), Name="Qto_BeamBaseQuantities", Quantities=[
+            f.createIfcQuantityLength("Length", None, None, 6000.0 + i),
+        ])
+        f.createIfcRelDefinesByProperties(
+            guid(), RelatedObjects=[beam], RelatingPropertyDefinition=qset,
+        )
+        f.createIfcRelAssociatesMaterial(guid(), RelatedObjects=[beam], RelatingMaterial=steel)
+        f.createIfcRelAssociatesClassification(
+            guid(), RelatedObjects=[proxies[0]], RelatingClassification=pipe_ref,
+        )
+
+    path = tmp_path / "small.ifc"
+    f.write(str(path))
+    return path
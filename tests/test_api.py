@@ -222,3 +222,55 @@ class TestReasoning:
         assert "total_inferred" in data
         assert data["total_inferred"] > 0
         assert "rules_applied" in data
+
+
+# ---------- Fast-path index (IFC 불필요) ----------
+
+@pytest.fixture
+def small_client():
+    """소형 인메모리 그래프로 구성한 TestClient."""
+    from rdflib import Graph, Literal, RDF
+    from src.converter.namespace_manager import BIM, INST
+
+    g = Graph()
+    storey = INST["storey_1"]
+    g.add((storey, RDF.type, BIM.BuildingStorey))
+    g.add((storey, BIM.hasName, Literal("L1")))
+    g.add((INST["bldg_1"], RDF.type, BIM.Building))
+    for i, category in enumerate(["Pipe", "Pipe", "Beam"]):
+        elem = INST[f"e{i}"]
+        g.add((elem, RDF.type, BIM.PhysicalElement))
+        g.add((elem, BIM.hasCategory, Literal(category)))
+        g.add((elem, BIM.hasName, Literal(f"{category}-{i}")))
+        g.add((storey, BIM.containsElement, elem))
+    return TestClient(create_app(store=TripleStore(g)))
+
+
+class TestFastPathIndex:
+    ENDPOINTS = [
+        "/api/statistics",
+        "/api/statistics/categories",
+        "/api/storeys",
+        "/api/elements",
+        "/api/elements?category=Pipe",
+    ]
+
+    def test_index_matches_sparql_fallback(self, small_client, monkeypatch):
+        from src.api.routes import buildings, statistics
+
+        fast = {url: small_client.get(url).json() for url in self.ENDPOINTS}
+        async def no_index(*args):
+            return None
+
+        monkeypatch.setattr(buildings, "query_index", no_index)
+        monkeypatch.setattr(statistics, "query_index", no_index)
+        slow = {url: small_client.get(url).json() for url in self.ENDPOINTS}
+
+        assert fast["/api/statistics"]["total_elements"] == 3
+        assert fast["/api/storeys"][0]["element_count"] == 3
+        for url in self.ENDPOINTS:
+            if url.endswith("categories"):
+                key = lambda c: c["category"]
+                assert sorted(fast[url], key=key) == sorted(slow[url], key=key)
+            else:
+                assert fast[url] == slow[url], url
@@ -0,0 +1,162 @@
+"""컬럼 내보내기 테스트: 요소 테이블 평탄화, SELECT 결과 컬럼, Arrow/Parquet 엔드포인트.
+
+컬럼 수집은 pyarrow 없이 검증하고, Arrow/Parquet 쓰기는 pyarrow가 있을 때만 실행합니다.
+"""
+
+import csv
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from rdflib import BNode, Graph, Literal, RDF, XSD
+
+from src.api.server import create_app
+from src.api.utils import query_executor
+from src.converter import columnar_export
+from src.converter.navis_to_rdf import BIM, BSO, INST, NAVIS, SP3D, NavisToRDFConverter
+from src.storage import QueryCancelled, TripleStore
+
+HEADER = ["ObjectId", "ParentId", "Level", "DisplayName", "Category",
+          "PropertyName", "RawValue", "DataType", "Unit"]
+ROOT = "aaaaaaaa-0000-0000-0000-000000000001"
+PIPE = "bbbbbbbb-0000-0000-0000-000000000002"
+NULL = "00000000-0000-0000-0000-000000000000"
+ROWS = [
+    [ROOT, NULL, "0", "Plant", "항목", "내부 유형", "Group", "", ""],
+    [PIPE, ROOT, "1", "Pipe-100", "항목", "내부 유형", "SP3D Pipe", "", ""],
+    [PIPE, ROOT, "1", "Pipe-100", "SmartPlant 3D", "System Path", "TRAINING\\Area A\\U02", "", ""],
+    [PIPE, ROOT, "1", "Pipe-100", "SmartPlant 3D", "Name", 'Pipe "100", 2"', "", ""],
+]
+
+QUERY = """
+PREFIX bim: <http://example.org/bim-ontology/schema#>
+SELECT ?e ?id ?missing WHERE {
+    ?e bim:hasGlobalId ?id . OPTIONAL { ?e bim:hasNothing ?missing }
+} ORDER BY ?e
+"""
+
+
+def _small_store() -> TripleStore:
+    g = Graph()
+    for i in range(3):
+        elem = INST[f"e{i}"]
+        g.add((elem, RDF.type, BIM.PhysicalElement))
+        g.add((elem, BIM.hasGlobalId, Literal(f"GID{i}")))
+        g.add((elem, BIM.hasName, Literal(f"Elem-{i}")))
+    return TripleStore(g)
+
+
+@pytest.fixture
+def graph(tmp_path):
+    csv_path = tmp_path / "hierarchy.csv"
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(ROWS)
+    converter = NavisToRDFConverter()
+    converter.convert_hierarchy_csv(str(csv_path))
+    g = converter.graph
+    # System Path가 없는 하위 요소: 계층 경로는 navis:hasParent 이름 체인으로 만든다
+    pipe = next(g.subjects(NAVIS.hasObjectId, Literal(PIPE)))
+    child = INST["navis_child"]
+    g.add((child, RDF.type, BIM.PhysicalElement))
+    g.add((child, BIM.hasName, Literal("Flange")))
+    g.add((child, NAVIS.hasParent, pipe))
+    g.add((child, SP3D.hasStatus, Literal("Working")))
+    bbox = BNode()
+    g.add((child, BSO.hasBoundingBox, bbox))
+    g.add((bbox, BSO.minX, Literal(1.5, datatype=XSD.double)))
+    g.add((bbox, BSO.maxX, Literal(2.5, datatype=XSD.double)))
+    return g
+
+
+class TestColumns:
+    def test_element_columns(self, graph):
+        cols = columnar_export.element_columns(graph)
+        rows = [dict(zip(cols, values)) for values in zip(*cols.values())]
+        by_name = {row["name"]: row for row in rows}
+        assert set(by_name) == {"Pipe-100", "Flange"}
+        assert len({len(v) for v in cols.values()}) == 1
+
+        pipe = by_name["Pipe-100"]
+        assert pipe["object_id"] == PIPE and pipe["category"] == "Pipe" and pipe["level"] == 1
+        assert pipe["hierarchy_path"] == "TRAINING\\Area A\\U02"
+        assert pipe["sp3d_hasName"] == 'Pipe "100", 2"' and pipe["sp3d_hasStatus"] is None
+        assert pipe["bbox_min_x"] is None
+
+        flange = by_name["Flange"]
+        assert flange["hierarchy_path"] == "Plant\\Pipe-100"
+        assert flange["sp3d_hasStatus"] == "Working" and flange["sp3d_hasName"] is None
+        assert (flange["bbox_min_x"], flange["bbox_max_x"], flange["volume"]) == (1.5, 2.5, None)
+        assert "sp3d_hasSystemPath" not in cols
+
+    def test_element_columns_cancel(self, graph):
+        cancel = threading.Event()
+        cancel.set()
+        with pytest.raises(QueryCancelled):
+            columnar_export.element_columns(graph, cancel)
+
+    def test_select_columns_match_json_results(self):
+        store = _small_store()
+        cols = columnar_export.select_columns(store, QUERY)
+        assert list(cols) == ["e", "id", "missing"]
+        assert cols["id"] == ["GID0", "GID1", "GID2"] and cols["missing"] == [None] * 3
+        assert [dict(zip(cols, row)) for row in zip(*cols.values())] == store.query(QUERY)
+        assert columnar_export.rows_to_columns(*store.select_rows(QUERY)) == cols
+
+    def test_format_for_path(self):
+        assert columnar_export.format_for_path("out/elements.PARQUET") == columnar_export.PARQUET
+        assert columnar_export.format_for_path("result.arrow") == columnar_export.ARROW
+        with pytest.raises(ValueError):
+            columnar_export.format_for_path("result.csv")
+
+    def test_parquet_round_trip(self, graph, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        cols = columnar_export.element_columns(graph)
+        out = tmp_path / "elements.parquet"
+        assert columnar_export.export_columns(cols, out) == 2
+        assert pq.read_table(out).to_pydict() == cols
+
+
+class TestExportEndpoints:
+    @pytest.fixture
+    def client(self):
+        return TestClient(create_app(store=_small_store()))
+
+    def test_export_endpoints(self, client):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            r = client.post("/api/sparql/export", json={"query": QUERY})
+            assert r.status_code == 501 and "pyarrow" in r.json()["detail"]
+            assert client.get("/api/elements/export").status_code == 501
+            return
+        import pyarrow.parquet as pq
+
+        r = client.post("/api/sparql/export?format=arrow", json={"query": QUERY})
+        assert r.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(r.content).read_all()
+        assert table.column("id").to_pylist() == ["GID0", "GID1", "GID2"]
+
+        r = client.get("/api/elements/export?format=parquet")
+        table = pq.read_table(pa.BufferReader(r.content))
+        assert table.column("global_id").to_pylist() == ["GID0", "GID1", "GID2"]
+
+    def test_export_rejects_bad_format_and_query(self, client, monkeypatch):
+        assert client.post("/api/sparql/export?format=csv", json={"query": QUERY}).status_code == 422
+        # 쿼리 오류는 pyarrow 유무와 관계없이 직렬화 전에 드러난다
+        monkeypatch.setattr(columnar_export, "require_pyarrow", lambda: None)
+        assert client.post("/api/sparql/export", json={"query": "ASK { ?s ?p ?o }"}).status_code == 400
+
+    def test_export_query_timeout_returns_504(self, monkeypatch):
+        store = _small_store()
+        store.insert([(INST[f"x{i}"], BIM.hasName, Literal(i)) for i in range(200)])
+        client = TestClient(create_app(store=store))
+        monkeypatch.setattr(columnar_export, "require_pyarrow", lambda: None)
+        monkeypatch.setattr(query_executor, "QUERY_TIMEOUT", 0.05)
+        start = time.time()
+        r = client.post("/api/sparql/export", json={
+            "query": "SELECT ?a ?b ?c WHERE { ?a ?p ?x . ?b ?q ?y . ?c ?r ?z } ORDER BY ?a"})
+        assert r.status_code == 504
+        assert time.time() - start < 5
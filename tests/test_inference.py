@@ -0,0 +1,496 @@
+"""추론 테스트: 증분 갱신과 컴파일된 규칙이 전체 재유도/SPARQL 평가와 같은 결과를 내는지 검증."""
+
+import pytest
+from fastapi.testclient import TestClient
+from rdflib import Graph, Literal, OWL, RDF, RDFS, XSD, Variable
+
+from src.api.server import create_app
+from src.converter.namespace_manager import AWP, BIM, INST
+from src.inference.incremental import IncrementalReasoner
+from src.inference.reasoner import CUSTOM_RULES, OWLReasoner
+from src.inference.rule_compiler import compile_rule
+from src.inference.shacl_validator import IncrementalValidator, validate as shacl_validate
+from src.inference.validation_report import CHECK_NAMES, run_validation_checks, summarize
+from src.storage import TripleStore, UnionGraph
+
+BUILDING = INST["building_001"]
+STOREY = INST["storey_001"]
+IWP = INST["iwp_001"]
+
+
+def _graph() -> Graph:
+    g = Graph()
+    g.add((BUILDING, RDF.type, BIM.Building))
+    g.add((BUILDING, BIM.aggregates, STOREY))
+    g.add((STOREY, RDF.type, BIM.BuildingStorey))
+    for i, category in enumerate(["Beam", "Pipe", "Valve", "Stair", "Hanger"]):
+        elem = INST[f"elem_{i}"]
+        g.add((elem, BIM.hasCategory, Literal(category)))
+        g.add((elem, BIM.hasGlobalId, Literal(f"GID{i}")))
+        g.add((STOREY, BIM.containsElement, elem))
+        g.add((IWP, AWP.includesElement, elem))
+        g.add((elem, BIM.hasDeliveryStatus, Literal("OnSite")))
+    g.add((IWP, RDF.type, AWP.InstallationWorkPackage))
+    g.add((IWP, AWP.hasConstraintStatus, Literal("AllCleared")))
+    return g
+
+
+def _expected(reasoner: IncrementalReasoner) -> frozenset:
+    """현재 단언 트리플만으로 전체 재유도한 추론 결과."""
+    asserted = Graph()
+    for triple in set(reasoner.graph) - reasoner.inferred:
+        asserted.add(triple)
+    fresh = IncrementalReasoner(asserted)
+    fresh.materialize()
+    return fresh.inferred
+
+
+def _apply(reasoner, added=(), removed=()):
+    g = reasoner.graph
+    for triple in removed:
+        g.remove(triple)
+    for triple in added:
+        g.add(triple)
+    return reasoner.apply_delta(added, removed)
+
+
+class TestIncrementalReasoner:
+    @pytest.fixture
+    def reasoner(self):
+        reasoner = IncrementalReasoner(_graph())
+        reasoner.materialize()
+        return reasoner
+
+    def test_materialize(self, reasoner):
+        g = reasoner.graph
+        beam, pipe = INST["elem_0"], INST["elem_1"]
+        assert (beam, RDF.type, BIM.StructuralElement) in g
+        assert (beam, RDF.type, BIM.PhysicalElement) in g  # subClassOf 타입 추론
+        assert (pipe, RDF.type, BIM.PipingElement) in g
+        assert (pipe, BIM.isInBuilding, BUILDING) in g
+        assert (IWP, AWP.isExecutable, Literal(True)) in g
+        assert (beam, RDF.type, BIM.PhysicalElement) in reasoner.inferred
+
+    def test_category_change_retracts_and_derives(self, reasoner):
+        beam = INST["elem_0"]
+        stats = _apply(
+            reasoner,
+            added=[(beam, BIM.hasCategory, Literal("Pipe"))],
+            removed=[(beam, BIM.hasCategory, Literal("Beam"))],
+        )
+        g = reasoner.graph
+        assert (beam, RDF.type, BIM.StructuralElement) not in g
+        assert (beam, RDF.type, BIM.MEPElement) in g
+        assert (beam, RDF.type, BIM.PhysicalElement) in g  # 다른 상위 클래스가 계속 지지
+        assert stats["inferred_added"] and stats["inferred_removed"]
+        assert reasoner.inferred == _expected(reasoner)
+
+    def test_delete_cascades_through_subclass_typing(self, reasoner):
+        stair = INST["elem_3"]
+        _apply(reasoner, removed=[(stair, BIM.hasCategory, Literal("Stair"))])
+        g = reasoner.graph
+        assert (stair, RDF.type, BIM.AccessElement) not in g
+        assert (stair, RDF.type, BIM.PhysicalElement) not in g
+        assert reasoner.inferred == _expected(reasoner)
+
+    def test_negated_pattern_and_joins(self, reasoner):
+        valve = INST["elem_2"]
+        _apply(
+            reasoner,
+            added=[(valve, BIM.hasDeliveryStatus, Literal("Shipped"))],
+            removed=[(valve, BIM.hasDeliveryStatus, Literal("OnSite"))],
+        )
+        assert (IWP, AWP.isExecutable, Literal(True)) not in reasoner.graph
+        assert (valve, BIM.isReady, Literal(True)) not in reasoner.graph
+
+        _apply(reasoner, removed=[(BUILDING, BIM.aggregates, STOREY)])
+        assert not list(reasoner.graph.triples((None, BIM.isInBuilding, None)))
+        assert reasoner.inferred == _expected(reasoner)
+
+        _apply(reasoner, removed=[(IWP, AWP.includesElement, valve)])
+        assert (IWP, AWP.isExecutable, Literal(True)) in reasoner.graph
+        assert reasoner.inferred == _expected(reasoner)
+
+    def test_asserted_triples_are_never_retracted(self, reasoner):
+        pipe = INST["elem_1"]
+        asserted = (pipe, RDF.type, BIM.MEPElement)
+        _apply(reasoner, added=[asserted])
+        _apply(reasoner, removed=[(pipe, BIM.hasCategory, Literal("Pipe"))])
+        assert asserted in reasoner.graph
+        assert asserted not in reasoner.inferred
+
+        # 단언을 지워도 규칙이 지지하면 추론 트리플로 남는다
+        beam = INST["elem_0"]
+        _apply(reasoner, removed=[(beam, RDF.type, BIM.StructuralElement)])
+        assert (beam, RDF.type, BIM.StructuralElement) in reasoner.graph
+        assert reasoner.inferred == _expected(reasoner)
+
+    def test_schema_change_reevaluates_hierarchy(self, reasoner):
+        _apply(reasoner, added=[(BIM.PipingElement, RDFS.subClassOf, BIM.MEPElement)])
+        assert (INST["elem_1"], RDF.type, BIM.MEPElement) in reasoner.graph
+        assert reasoner.inferred == _expected(reasoner)
+
+    def test_rematerialize_is_idempotent(self, reasoner):
+        before, size = reasoner.inferred, len(reasoner.graph)
+        reasoner.materialize()
+        assert reasoner.inferred == before
+        assert len(reasoner.graph) == size
+
+
+class TestIncrementalStore:
+    def test_store_listener_receives_deltas(self):
+        store = TripleStore(_graph())
+        reasoner = IncrementalReasoner(store.graph)
+        reasoner.materialize()
+        store.add_change_listener(reasoner.apply_delta)
+
+        elem = INST["elem_9"]
+        store.bulk_insert([(elem, BIM.hasCategory, Literal("Column"))])
+        assert (elem, RDF.type, BIM.StructuralElement) in store.graph
+
+        result = store.apply_delta(removed=[(elem, BIM.hasCategory, Literal("Column"))])
+        assert result == {"added": 0, "removed": 1}
+        assert (elem, RDF.type, BIM.StructuralElement) not in store.graph
+        assert store.count_by_type(str(BIM.StructuralElement)) == 1
+
+    def test_status_update_triggers_incremental_reasoning(self):
+        store = TripleStore(_graph())
+        client = TestClient(create_app(store=store))
+        r = client.post("/api/reasoning/incremental")
+        assert r.status_code == 200
+        assert r.json()["inferred_triples"] > 0
+        assert client.get("/api/reasoning/incremental").json()["enabled"]
+        executable = (IWP, AWP.isExecutable, Literal(True))
+        assert executable in store.inferred and executable not in store.graph
+        assert executable in store.union_graph()
+
+        r = client.put("/api/lean/status/GID2",
+                       json={"status_value": "Shipped", "delivery_status": "Shipped"})
+        assert r.status_code == 200
+        assert executable not in store.union_graph()
+
+    def test_separate_target_matches_single_graph(self):
+        store = TripleStore(_graph())
+        store.swap_inferred(Graph())
+        reasoner = IncrementalReasoner(UnionGraph(store.graph, store.inferred),
+                                       target=store.inferred)
+        reasoner.materialize()
+        store.add_change_listener(reasoner.apply_delta)
+        asserted = set(store.graph)
+
+        pipe = INST["elem_1"]
+        store.apply_delta(added=[(pipe, RDF.type, BIM.MEPElement)])
+        store.apply_delta(removed=[(pipe, BIM.hasCategory, Literal("Pipe"))])
+        assert (pipe, RDF.type, BIM.MEPElement) not in store.inferred
+        assert not set(store.inferred) & set(store.graph)
+        assert reasoner.inferred == _expected(reasoner)
+        assert set(store.graph) - asserted == {(pipe, RDF.type, BIM.MEPElement)}
+
+
+class TestInferredGraphEndpoints:
+    @pytest.fixture
+    def store(self):
+        return TripleStore(_graph())
+
+    @pytest.fixture
+    def client(self, store):
+        return TestClient(create_app(store=store))
+
+    def test_full_reasoning_keeps_asserted_graph(self, client, store):
+        before = len(store)
+        r = client.post("/api/reasoning")
+        assert r.status_code == 200
+        assert len(store) == before
+        assert r.json()["inferred_graph_triples"] == len(store.inferred) > 0
+
+        counts = client.get("/api/reasoning/inferred").json()
+        assert counts["asserted_triples"] == before
+        assert counts["total_triples"] == before + counts["inferred_triples"]
+
+        # 합집합 조회로 추론된 타입이 보인다
+        r = client.post("/api/sparql", json={"query": (
+            "SELECT ?e WHERE { ?e a <%s> }" % BIM.StructuralElement
+        )})
+        assert r.status_code == 200
+        assert r.json()["results"]
+
+        r = client.delete("/api/reasoning/inferred")
+        assert r.json()["removed_triples"] == counts["inferred_triples"]
+        assert store.inferred is None
+        assert client.get("/api/reasoning/inferred").json()["inferred_triples"] == 0
+
+    def test_full_reasoning_detaches_incremental(self, client):
+        client.post("/api/reasoning/incremental")
+        assert client.get("/api/reasoning/incremental").json()["enabled"]
+        client.post("/api/reasoning")
+        assert not client.get("/api/reasoning/incremental").json()["enabled"]
+
+    def test_save_requires_ttl_name(self, client):
+        client.post("/api/reasoning")
+        assert client.post("/api/reasoning/inferred/save",
+                           params={"file_name": "../model.ttl"}).status_code == 400
+
+
+class TestRuleCompiler:
+    @pytest.fixture
+    def graph(self):
+        g = _graph()
+        odd = INST["odd"]
+        # 컴파일된 평가가 SPARQL IN 비교와 같게 동작해야 하는 경계 값들
+        g.add((odd, BIM.hasCategory, Literal("Beam", lang="en")))
+        g.add((odd, BIM.hasCategory, Literal("Beam", datatype=XSD.string)))
+        g.add((odd, BIM.hasCategory, Literal(5)))
+        g.add((STOREY, BIM.containsElement, Literal("not-a-node")))
+        g.add((INST["storey_002"], BIM.containsElement, odd))
+        return g
+
+    def test_simple_rules_are_compiled(self):
+        compiled = {name for name, rule in CUSTOM_RULES.items()
+                    if compile_rule(rule["construct"]).compiled}
+        assert {"infer_structural_element", "infer_storey_has_elements",
+                "infer_element_in_building", "infer_element_ready"} <= compiled
+        assert "infer_iwp_executable" not in compiled
+        assert "infer_delayed_element" not in compiled
+
+    @pytest.mark.parametrize("name", list(CUSTOM_RULES))
+    def test_matches_sparql(self, graph, name):
+        construct = CUSTOM_RULES[name]["construct"]
+        evaluator = compile_rule(construct)
+        assert set(evaluator.evaluate(graph)) == set(graph.query(construct))
+
+        focus = Variable("elem") if "?elem" in construct.split("WHERE")[0] else None
+        if focus is not None:
+            for node in (INST["elem_0"], INST["elem_1"], INST["odd"]):
+                expected = set(graph.query(construct, initBindings={focus: node}))
+                assert set(evaluator.evaluate(graph, {focus: node})) == expected
+
+    def test_owl_reasoner_uses_compiled_rules(self, graph):
+        expected = Graph()
+        for triple in graph:
+            expected.add(triple)
+        for rule in CUSTOM_RULES.values():
+            for triple in list(expected.query(rule["construct"])):
+                expected.add(triple)
+
+        OWLReasoner(graph).apply_custom_rules()
+        assert set(graph) == set(expected)
+
+
+def _shacl_graph() -> Graph:
+    """BIMElement/PhysicalElement 형상 위반이 섞인 검증용 그래프."""
+    g = Graph()
+    g.add((BIM.PhysicalElement, RDFS.subClassOf, BIM.BIMElement))
+    for i in range(12):
+        elem = INST[f"elem_{i}"]
+        g.add((elem, RDF.type, BIM.PhysicalElement))
+        if i % 3:
+            g.add((elem, BIM.hasGlobalId, Literal(f"GID{i}")))
+        if i % 4:
+            g.add((elem, BIM.hasOriginalType, Literal("IfcBeam")))
+        if i == 5:
+            g.add((elem, BIM.hasGlobalId, Literal(5)))  # 잘못된 데이터타입
+    g.add((STOREY, RDF.type, BIM.BuildingStorey))
+    return g
+
+
+class TestShardedShacl:
+    @pytest.fixture
+    def graph(self):
+        return _shacl_graph()
+
+    @staticmethod
+    def _key(result):
+        return sorted(tuple(sorted(v.items())) for v in result["violations"])
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_full_validation(self, graph, workers):
+        full = shacl_validate(graph)
+        sharded = shacl_validate(graph, workers=workers)
+        assert sharded["shards"] == workers
+        assert sharded["focus_nodes"] == 13
+        assert sharded["conforms"] is full["conforms"] is False
+        assert self._key(sharded) == self._key(full)
+        assert {v["constraint"] for v in sharded["violations"]} >= {
+            "MinCountConstraintComponent", "DatatypeConstraintComponent"}
+
+    def test_non_local_shapes_fall_back_to_full_validation(self, graph, tmp_path):
+        shapes = tmp_path / "shapes.ttl"
+        shapes.write_text("""
+            @prefix sh: <http://www.w3.org/ns/shacl#> .
+            @prefix bim: <http://example.org/bim-ontology/schema#> .
+            bim:ContainerShape a sh:NodeShape ;
+                sh:targetClass bim:BuildingStorey ;
+                sh:property [ sh:path bim:containsElement ; sh:node bim:GidShape ] .
+            bim:GidShape a sh:NodeShape ;
+                sh:property [ sh:path bim:hasGlobalId ; sh:minCount 1 ] .
+        """)
+        graph.add((STOREY, BIM.containsElement, INST["elem_0"]))
+        result = shacl_validate(graph, shapes_path=str(shapes), workers=2)
+        assert "shards" not in result
+        assert not result["conforms"]
+        # sh:node 위반은 값 노드 elem_0의 데이터를 봐야 잡힌다 (sh:detail 결과 포함)
+        assert (str(STOREY), "NodeConstraintComponent") in {
+            (v["focus_node"], v["constraint"]) for v in result["violations"]}
+
+
+class TestIncrementalShacl:
+    @staticmethod
+    def _violations(result):
+        return sorted(tuple(sorted(v.items())) for v in result["violations"])
+
+    def _check(self, validator, store):
+        report = validator.validate(store.union_graph(), store.take_dirty())
+        assert self._violations(report) == self._violations(shacl_validate(store.union_graph()))
+        return report
+
+    def test_revalidates_only_dirty_nodes(self):
+        g = _shacl_graph()
+        store = TripleStore(g)
+        validator = IncrementalValidator()
+        assert self._check(validator, store)["mode"] == "full"
+
+        elem = INST["elem_3"]  # hasGlobalId와 hasOriginalType이 없다
+        store.apply_delta(added=[(elem, BIM.hasGlobalId, Literal("GID3"))])
+        report = self._check(validator, store)
+        assert report["mode"] == "incremental"
+        assert report["revalidated_nodes"] == 1
+
+        store.apply_delta(removed=[(INST["elem_1"], BIM.hasGlobalId, Literal("GID1"))],
+                          added=[(INST["elem_new"], RDF.type, BIM.PhysicalElement)])
+        assert self._check(validator, store)["revalidated_nodes"] == 2
+
+        # 대상에서 빠진 노드의 위반은 보고서에서 사라진다
+        store.apply_delta(removed=[(INST["elem_new"], RDF.type, BIM.PhysicalElement)])
+        self._check(validator, store)
+
+        store.apply_delta(added=[(BIM.Pipe, RDFS.subClassOf, BIM.PhysicalElement)])
+        assert self._check(validator, store)["mode"] == "full"
+
+    def test_referencing_nodes_are_revalidated(self, tmp_path):
+        shapes = tmp_path / "shapes.ttl"
+        shapes.write_text("""
+            @prefix sh: <http://www.w3.org/ns/shacl#> .
+            @prefix bim: <http://example.org/bim-ontology/schema#> .
+            bim:StoreyShape a sh:NodeShape ;
+                sh:targetClass bim:BuildingStorey ;
+                sh:property [ sh:path bim:containsElement ; sh:class bim:PhysicalElement ] .
+        """)
+        store = TripleStore(_graph())
+        for i in range(5):
+            store.graph.add((INST[f"elem_{i}"], RDF.type, BIM.PhysicalElement))
+        validator = IncrementalValidator(str(shapes))
+        assert validator.validate(store.union_graph(), store.take_dirty())["conforms"]
+
+        store.apply_delta(removed=[(INST["elem_2"], RDF.type, BIM.PhysicalElement)])
+        report = validator.validate(store.union_graph(), store.take_dirty())
+        assert report["mode"] == "incremental"
+        assert [v["focus_node"] for v in report["violations"]] == [str(STOREY)]
+
+    def test_status_update_then_incremental_endpoint(self):
+        store = TripleStore(_graph())
+        client = TestClient(create_app(store=store))
+        assert client.get("/api/reasoning/validate/report").status_code in (200, 404)
+
+        first = client.post("/api/reasoning/validate", params={"incremental": "true"}).json()
+        assert first["mode"] == "full"
+        r = client.put("/api/lean/status/GID2",
+                       json={"status_value": "Shipped", "delivery_status": "Shipped"})
+        assert r.status_code == 200
+
+        second = client.post("/api/reasoning/validate", params={"incremental": "true"}).json()
+        assert second["mode"] == "incremental"
+        assert second["violations_count"] == len(
+            shacl_validate(store.union_graph())["violations"])
+        assert client.get("/api/reasoning/validate/report").json() == second
+
+
+def _report_graph() -> Graph:
+    """공간 계층, 비대칭 포함 관계, orphan, Other 분류가 섞인 품질 검증용 그래프."""
+    g = Graph()
+    for name in ["Project", "Site", "Building", "BuildingStorey", "Space",
+                 "PhysicalElement", "SpatialElement", "BIMElement", "PropertySet"]:
+        g.add((BIM[name], RDF.type, OWL.Class))
+    for name in ["hasGlobalId", "hasName", "hasCategory", "hasElevation",
+                 "hasOriginalType", "hasDescription"]:
+        g.add((BIM[name], RDF.type, OWL.DatatypeProperty))
+    g.add((BIM.aggregates, RDF.type, OWL.ObjectProperty))
+    project, site = INST["project"], INST["site"]
+    g.add((project, RDF.type, BIM.Project))
+    g.add((site, RDF.type, BIM.Site))
+    g.add((BUILDING, RDF.type, BIM.Building))
+    g.add((project, BIM.aggregates, site))
+    g.add((site, BIM.aggregates, BUILDING))
+    storeys = [INST["storey_1"], INST["storey_2"]]
+    for i, storey in enumerate(storeys):
+        g.add((storey, RDF.type, BIM.BuildingStorey))
+        g.add((storey, BIM.hasName, Literal(f"Level {i + 1}")))
+        g.add((BUILDING, BIM.aggregates, storey))
+    for i, category in enumerate(["Pipe", "Pipe", "Beam", "Other", "Valve", "Other", "Pipe", "Beam"]):
+        elem = INST[f"elem_{i}"]
+        g.add((elem, RDF.type, BIM.PhysicalElement))
+        g.add((elem, BIM.hasCategory, Literal(category)))
+        if i != 3:
+            g.add((elem, BIM.hasGlobalId, Literal(f"GID{i}")))
+        if i % 2:
+            g.add((elem, BIM.hasName, Literal(f"E{i}")))
+        if i < 6:
+            g.add((elem, BIM.isContainedIn, storeys[i % 2]))
+            if i != 4:
+                g.add((storeys[i % 2], BIM.containsElement, elem))
+        if i < 3:
+            g.add((INST[f"pset_{i}"], RDF.type, BIM.PropertySet))
+            g.add((elem, BIM.hasPropertySet, INST[f"pset_{i}"]))
+    g.add((INST["ghost"], BIM.isContainedIn, storeys[0]))
+    g.add((INST["ghost"], BIM.hasCategory, Literal("Other")))
+    return g
+
+
+class TestValidationReport:
+    PREFIXES = "PREFIX bim: <http://example.org/bim-ontology/schema#>\n"
+
+    @pytest.fixture
+    def checks(self):
+        return {c["name"]: c for c in run_validation_checks(_report_graph())}
+
+    def _count(self, where: str) -> int:
+        rows = _report_graph().query(self.PREFIXES + f"SELECT (COUNT(*) AS ?c) WHERE {{ {where} }}")
+        return int(next(iter(rows))[0])
+
+    def test_all_categories_in_order(self, checks):
+        assert list(checks) == list(CHECK_NAMES)
+        assert summarize(list(checks.values())) == {"pass": 3, "warn": 2, "info": 1, "fail": 2}
+
+    def test_counts_match_sparql(self, checks):
+        uri = checks["uri_consistency"]["details"]
+        assert uri["orphan_elements"] == self._count(
+            "?o bim:isContainedIn ?s . FILTER NOT EXISTS { ?o a bim:PhysicalElement }") == 1
+        assert uri["unlinked_elements"] == self._count(
+            "?u a bim:PhysicalElement . FILTER NOT EXISTS { ?u bim:isContainedIn ?any }") == 2
+        assert uri["unlinked_samples"] == ["instance#elem_6", "instance#elem_7"]
+
+        rel = checks["relationship_integrity"]["details"]
+        assert rel["asymmetric_pairs"] == self._count(
+            "?e bim:isContainedIn ?s . FILTER NOT EXISTS { ?s bim:containsElement ?e }") == 2
+        assert rel["aggregation_pairs"] == 4 and not rel["symmetric"]
+
+        hierarchy = checks["spatial_hierarchy"]["details"]
+        assert hierarchy["complete_chains"] == self._count(
+            "?p a bim:Project ; bim:aggregates ?s . ?s a bim:Site ; bim:aggregates ?b . "
+            "?b a bim:Building ; bim:aggregates ?st . ?st a bim:BuildingStorey") == 2
+        assert hierarchy["storey_elements"] == [{"storey": "Level 1", "elements": 4},
+                                                {"storey": "Level 2", "elements": 3}]
+
+        required = checks["required_properties"]["details"]
+        assert required == {"missing_global_id": 1, "missing_name": 4}
+        quality = checks["classification_quality"]["details"]
+        assert (quality["other_count"], quality["total_categorized"]) == (2, 9)
+        pset = checks["property_set_coverage"]["details"]
+        assert (pset["elements_with_pset"], pset["total_elements"]) == (3, 8)
+        categories = checks["element_statistics"]["details"]["categories"]
+        assert categories[0]["count"] == 3 and {"name": "Valve", "count": 1} in categories
+
+    def test_endpoint_uses_engine(self):
+        client = TestClient(create_app(store=TripleStore(_report_graph())))
+        report = client.get("/api/reasoning/validation-report").json()
+        assert [c["name"] for c in report["checks"]] == list(CHECK_NAMES)
+        assert report["summary"]["fail"] == 2
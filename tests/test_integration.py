@@ -101,6 +101,130 @@ class TestIFCParser:
             _ = parser.ifc_file
 
 
+class TestRelationIndex:
+    """소형 합성 IFC로 관계 역인덱스를 검증한다 (IFC 원본 불필요)."""
+
+    @pytest.fixture
+    def parser(self, small_ifc):
+        parser = IFCParser(str(small_ifc))
+        parser.open()
+        return parser
+
+    @staticmethod
+    def _scan_property_sets(parser, element):
+        """역인덱스 도입 전의 전체 관계 순회 방식."""
+        psets = []
+        for rel in parser.get_entities("IfcRelDefinesByProperties"):
+            if element in rel.RelatedObjects:
+                pset_def = rel.RelatingPropertyDefinition
+                if hasattr(pset_def, "HasProperties") and pset_def.HasProperties:
+                    props = {}
+                    for prop in pset_def.HasProperties:
+                        val = getattr(prop, "NominalValue", None)
+                        props[prop.Name] = val.wrappedValue if val else None
+                    psets.append({"name": pset_def.Name, "properties": props})
+        return psets
+
+    def test_property_sets_match_full_scan(self, parser):
+        for element in parser.get_entities("IfcElement"):
+            assert parser.get_property_sets(element) == self._scan_property_sets(parser, element)
+
+    def test_element_relations(self, parser):
+        beam = parser.get_entities("IfcBeam")[0]
+        relations = parser.get_element_relations(beam)
+        assert [p.Name for p in relations["psets"]] == ["Pset_Test"]
+        assert [q.Name for q in relations["qsets"]] == ["Qto_BeamBaseQuantities"]
+        assert [m.Name for m in relations["materials"]] == ["Steel"]
+        assert relations["classifications"] == []
+
+        storey = parser.get_entities("IfcBuildingStorey")[0]
+        assert parser.get_element_relations(storey) == {
+            "psets": [], "qsets": [], "materials": [], "classifications": [],
+        }
+
+    def test_index_is_built_once(self, parser, monkeypatch):
+        from src.parser import ifc_parser
+
+        builds = []
+        build = ifc_parser.RelationIndex.build.__func__
+
+        def counting_build(cls, ifc_file):
+            builds.append(ifc_file)
+            return build(cls, ifc_file)
+
+        monkeypatch.setattr(ifc_parser.RelationIndex, "build", classmethod(counting_build))
+        for element in parser.get_entities("IfcElement"):
+            parser.get_property_sets(element)
+        parser.get_material_associations()
+        assert len(builds) == 1
+
+        parser.open()
+        parser.get_quantity_definitions()
+        assert len(builds) == 2
+
+    def test_converter_uses_index(self, parser):
+        converter = RDFConverter(schema="IFC4")
+        graph = converter.convert_file(parser)
+        beam_uris = [converter._entity_uri(b) for b in parser.get_entities("IfcBeam")]
+        pipe_uris = [
+            converter._entity_uri(p) for p in parser.get_entities("IfcBuildingElementProxy")
+            if p.Name == "Pipe-100"
+        ]
+
+        assert {graph.value(u, BIM.hasLength).toPython() for u in beam_uris} == {6000.0, 6001.0}
+        assert {s for s, _, _ in graph.triples((None, BIM.hasMaterial, None))} == set(beam_uris)
+        assert {s for s, _, _ in graph.triples((None, BIM.hasClassification, None))} == set(pipe_uris)
+        assert len(list(graph.triples((None, BIM.hasPropertySet, None)))) == 12
+
+
+class TestParallelConversion:
+    """병렬 IFC 변환이 순차 변환과 같은 트리플을 만드는지 검증한다."""
+
+    def test_plan_covers_every_unit_once(self, small_ifc):
+        from src.converter.ifc_to_rdf import (
+            CONVERSION_STEPS, physical_element_types, plan_parallel_conversion,
+        )
+
+        parser = IFCParser(str(small_ifc))
+        parser.open()
+        type_counts = parser.get_type_counts()
+        units = [(step, None) for step in CONVERSION_STEPS if step != "physical_elements"]
+        units += [("physical_elements", t) for t in physical_element_types(type_counts)]
+        expected = sorted(units, key=str)
+
+        for workers in (1, 2, 5, 32):
+            plans = plan_parallel_conversion(type_counts, workers)
+            assert len(plans) == workers
+            units = [
+                (step, t) for plan in plans for step, types in plan
+                for t in (types if types else [None])
+            ]
+            assert sorted(units, key=str) == expected
+
+    @pytest.mark.parametrize("suffix,fmt", [(".nt", "nt"), (".ttl", "turtle")])
+    def test_matches_sequential_graph(self, small_ifc, tmp_path, suffix, fmt):
+        from rdflib import Graph
+        from src.converter.ifc_to_rdf import convert_ifc_to_rdf
+
+        parser = IFCParser(str(small_ifc))
+        parser.open()
+        converter = RDFConverter(schema="IFC4")
+        expected = converter.convert_file(parser)
+
+        outputs = {}
+        for workers in (1, 2, 3):
+            out = tmp_path / f"out_{workers}{suffix}"
+            stats = convert_ifc_to_rdf(str(small_ifc), str(out), workers=workers)
+            assert stats["schema"] == "IFC4"
+            assert stats["total_triples"] == len(expected)
+            assert stats["entities_converted"] == converter.stats["entities_converted"]
+            outputs[workers] = out.read_bytes()
+
+        assert outputs[1] == outputs[2] == outputs[3]
+        parsed = Graph().parse(str(tmp_path / f"out_3{suffix}"), format=fmt)
+        assert set(parsed) == set(expected)
+
+
 # ---------- RDF Converter 테스트 ----------
 
 @requires_ifc
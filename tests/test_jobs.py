@@ -0,0 +1,166 @@
+"""백그라운드 작업 관리자 및 /api/jobs 엔드포인트 테스트."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from rdflib import Graph, Literal, RDF
+
+from src.api.server import create_app
+from src.api.utils.jobs import JobManager, get_job_manager
+from src.converter.namespace_manager import BIM, INST, SCHED
+from src.storage import TripleStore
+
+
+def _small_store() -> TripleStore:
+    g = Graph()
+    for i in range(3):
+        elem = INST[f"e{i}"]
+        g.add((elem, RDF.type, BIM.PhysicalElement))
+        g.add((elem, BIM.hasGlobalId, Literal(f"GID{i}")))
+    return TripleStore(g)
+
+
+@pytest.fixture
+def manager():
+    return JobManager(workers=1, history=2)
+
+
+class TestJobManager:
+    def test_result_and_progress(self, manager):
+        def work(job, n):
+            job.report(done=n)
+            return {"value": n * 2}
+
+        job = manager.submit("test", work, 21)
+        manager.wait(job.id, timeout=5)
+        info = job.to_dict()
+        assert info["status"] == "succeeded"
+        assert info["result"] == {"value": 42}
+        assert info["progress"] == {"done": 21}
+
+    def test_failure_is_reported(self, manager):
+        def work(job):
+            raise ValueError("bad row")
+
+        job = manager.submit("test", work)
+        manager.wait(job.id, timeout=5)
+        assert job.status == "failed"
+        assert job.to_dict()["error"] == "bad row"
+        assert "result" not in job.to_dict()
+
+    def test_dedupe_returns_running_job(self, manager):
+        release = threading.Event()
+        started = threading.Event()
+
+        def work(job):
+            started.set()
+            release.wait(5)
+            return "done"
+
+        first = manager.submit("reasoning", work, dedupe_key="reasoning")
+        started.wait(5)
+        assert manager.submit("reasoning", work, dedupe_key="reasoning") is first
+        release.set()
+        manager.wait(first.id, timeout=5)
+
+        second = manager.submit("reasoning", work, dedupe_key="reasoning")
+        assert second is not first
+        manager.wait(second.id, timeout=5)
+
+    def test_cancel_pending_and_running(self, manager):
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking(job):
+            started.set()
+            while not release.wait(0.01):
+                job.check_cancelled()
+            return "finished"
+
+        running = manager.submit("test", blocking)
+        pending = manager.submit("test", lambda job: "never")
+        started.wait(5)
+
+        assert manager.cancel(pending.id).status == "cancelled"
+        manager.cancel(running.id)
+        manager.wait(running.id, timeout=5)
+        assert running.status == "cancelled"
+        assert running.cancel_requested
+
+    def test_history_is_bounded(self, manager):
+        jobs = [manager.submit("test", lambda job: None) for _ in range(4)]
+        for job in jobs:
+            manager.wait(job.id, timeout=5)
+        manager.submit("test", lambda job: None)
+        assert manager.get(jobs[0].id) is None
+        assert len(manager.list()) <= 3
+
+
+class TestJobEndpoints:
+    @pytest.fixture
+    def store(self):
+        return _small_store()
+
+    @pytest.fixture
+    def client(self, store):
+        return TestClient(create_app(store=store))
+
+    def test_background_reasoning(self, client, store):
+        before = len(store)
+        r = client.post("/api/reasoning", params={"background": "true"})
+        assert r.status_code == 202
+        job_id = r.json()["id"]
+        assert r.json()["status_url"] == f"/api/jobs/{job_id}"
+
+        get_job_manager().wait(job_id, timeout=60)
+        info = client.get(f"/api/jobs/{job_id}").json()
+        assert info["status"] == "succeeded"
+        # 추론 트리플은 단언 그래프가 아닌 별도 추론 그래프에 담긴다
+        assert len(store) == before
+        assert info["result"]["total_triples"] > before
+        assert len(store.inferred) == info["result"]["inferred_graph_triples"] > 0
+        assert any(j["id"] == job_id for j in client.get("/api/jobs").json())
+
+    def test_background_reload(self, client, store, tmp_path, monkeypatch):
+        from src.api.routes import reasoning as reasoning_routes
+
+        ttl = tmp_path / "nightly.ttl"
+        g = Graph()
+        g.add((INST["x"], RDF.type, BIM.PhysicalElement))
+        g.serialize(destination=str(ttl), format="turtle")
+        monkeypatch.setattr(reasoning_routes, "_RDF_DIR", tmp_path)
+
+        r = client.post("/api/reasoning/reload",
+                        params={"file_name": "nightly.ttl", "background": "true"})
+        assert r.status_code == 202
+        job_id = r.json()["id"]
+        get_job_manager().wait(job_id, timeout=60)
+
+        status = client.get("/api/reasoning/reload").json()
+        assert status["triples"] == 1
+        assert status["job"]["id"] == job_id and status["job"]["status"] == "succeeded"
+        assert status["job"]["progress"]["phase"] == "swapped"
+        assert status["job"]["result"] == {"status": "success", "file": "nightly.ttl", "triples": 1}
+
+    def test_background_injection(self, client, store):
+        csv_text = "GlobalId,TaskName\nGID0,Install\nGID1,Install\n"
+        r = client.post("/api/lean/inject/schedule", params={"background": "true"},
+                        files={"file": ("schedule.csv", csv_text, "text/csv")})
+        assert r.status_code == 202
+        job_id = r.json()["id"]
+
+        get_job_manager().wait(job_id, timeout=60)
+        info = client.get(f"/api/jobs/{job_id}").json()
+        assert info["status"] == "succeeded"
+        assert info["result"]["elements_matched"] == 2
+        assert info["progress"]["rows"] == 2
+        assert len(list(store.graph.subjects(RDF.type, SCHED.ConstructionTask))) == 1
+
+    def test_unknown_and_finished_jobs(self, client):
+        assert client.get("/api/jobs/missing").status_code == 404
+        assert client.post("/api/jobs/missing/cancel").status_code == 404
+
+        job = get_job_manager().submit("test", lambda job: None)
+        get_job_manager().wait(job.id, timeout=5)
+        assert client.post(f"/api/jobs/{job.id}/cancel").status_code == 409
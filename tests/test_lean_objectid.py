@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import pytest
 from rdflib import Graph, Literal, Namespace, RDF, URIRef, XSD
 
 from src.converter.lean_layer_injector import LeanLayerInjector
@@ -193,3 +194,109 @@ def test_lean_stats_kpi_with_duration_fallback_priority(tmp_path: Path):
     assert stats["total_unit_cost"] == 1500.0
     assert stats["avg_consume_duration"] == 7.0  # (8 + 6) / 2
     assert stats["avg_task_duration_effective"] == 7.0  # Actual 8 우선, legacy 6 사용
+
+
+def test_identifier_index_resolves_without_sparql(tmp_path: Path, monkeypatch):
+    from src.storage import TripleStore
+
+    graph = Graph()
+    for i in range(3):
+        elem = URIRef(f"http://example.org/bim-ontology/instance#elem_{i}")
+        graph.add((elem, RDF.type, BIM.PhysicalElement))
+        graph.add((elem, BIM.hasGlobalId, Literal(f"GID{i}")))
+        graph.add((elem, NAVIS.hasObjectId, Literal(f"obj-{i}")))
+    store = TripleStore(graph)
+
+    csv_path = tmp_path / "status.csv"
+    _write_csv(
+        csv_path,
+        ["GlobalId", "ObjectId", "StatusValue", "DeliveryStatus"],
+        [
+            ["GID0", "", "Installed", "Installed"],
+            ["", "obj-2", "OnSite", "OnSite"],
+            ["", "obj-9", "OnSite", "OnSite"],
+        ],
+    )
+
+    def fail_query(*args, **kwargs):
+        raise AssertionError("식별자 인덱스가 있으면 SPARQL을 실행하지 않아야 함")
+
+    monkeypatch.setattr(graph, "query", fail_query)
+    injector = LeanLayerInjector(graph, identifiers=store.identifiers)
+    result = injector.inject_status_csv(str(csv_path))
+
+    assert result["elements_matched"] == 2
+    assert result["elements_not_found"] == ["obj-9"]
+    elem_2 = URIRef("http://example.org/bim-ontology/instance#elem_2")
+    assert (elem_2, BIM.hasDeliveryStatus, Literal("OnSite")) in graph
+
+
+def test_failed_injection_leaves_graph_untouched(tmp_path: Path):
+    graph = Graph()
+    before = set(graph)
+
+    csv_path = tmp_path / "equipment.csv"
+    _write_csv(
+        csv_path,
+        ["EquipmentID", "Name", "Width"],
+        [["EQ-1", "Crane", "2.5"], ["EQ-2", "Forklift", "wide"]],
+    )
+
+    injector = LeanLayerInjector(graph)
+    with pytest.raises(ValueError):
+        injector.inject_equipment_csv(str(csv_path))
+
+    # 첫 행(EQ-1)도 반영되지 않아야 한다 (전부 또는 전무)
+    assert set(graph) == before
+
+
+def test_store_bulk_commit_is_single_write(tmp_path: Path):
+    from src.storage import TripleStore
+
+    graph = Graph()
+    elem = URIRef("http://example.org/bim-ontology/instance#elem_1")
+    graph.add((elem, BIM.hasGlobalId, Literal("GID1")))
+    store = TripleStore(graph)
+    identifiers = store.identifiers
+    generation = store.generation
+
+    csv_path = tmp_path / "schedule.csv"
+    _write_csv(
+        csv_path,
+        ["GlobalId", "TaskName", "PlannedStart", "Cost"],
+        [["GID1", "Task A", "2026-02-01", "100"], ["GID1", "Task A", "2026-02-01", "100"]],
+    )
+
+    injector = LeanLayerInjector(graph, identifiers=identifiers, commit=store.bulk_insert)
+    staged = injector.load_lean_schema(commit=False)
+    result = injector.inject_schedule_csv(str(csv_path))
+
+    assert staged > 0
+    assert result["elements_matched"] == 2
+    assert store.generation == generation + 1
+    assert store.identifiers is identifiers
+    task_uri = next(graph.subjects(RDF.type, SCHED.ConstructionTask))
+    assert (elem, SCHED.assignedToTask, task_uri) in graph
+    assert (elem, BIM.hasUnitCost, Literal(100.0, datatype=XSD.double)) in graph
+
+
+def test_injection_streams_rows_with_progress(monkeypatch):
+    import io
+
+    from src.converter import lean_layer_injector
+
+    monkeypatch.setattr(lean_layer_injector, "PROGRESS_INTERVAL", 2)
+    graph = Graph()
+    for i in range(5):
+        graph.add((URIRef(f"http://example.org/bim-ontology/instance#e{i}"),
+                   NAVIS.hasObjectId, Literal(f"obj-{i}")))
+
+    stream = io.StringIO(
+        "ObjectId,DeliveryStatus\n" + "".join(f"obj-{i},OnSite\n" for i in range(5))
+    )
+    progress = []
+    injector = LeanLayerInjector(graph, progress=progress.append)
+    result = injector.inject_status_csv(stream)
+
+    assert result["elements_matched"] == 5
+    assert progress == [2, 4, 5]
@@ -0,0 +1,114 @@
+"""Navis CSV 변환기 테스트: 스트리밍 변환이 메모리 변환과 같은 그래프를 만드는지 검증."""
+
+import csv
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+
+from src.converter.navis_to_rdf import NavisToRDFConverter, convert_navis_to_rdf
+from src.converter.rdf_writer import TripleWriter
+
+HEADER = ["ObjectId", "ParentId", "Level", "DisplayName", "Category",
+          "PropertyName", "RawValue", "DataType", "Unit"]
+
+ROOT = "aaaaaaaa-0000-0000-0000-000000000001"
+PIPE = "bbbbbbbb-0000-0000-0000-000000000002"
+PUMP = "cccccccc-0000-0000-0000-000000000003"
+NULL = "00000000-0000-0000-0000-000000000000"
+
+# 의도적으로 ObjectId가 섞인 순서 (PIPE 행이 PUMP 행 사이에 끼어 있음)
+ROWS = [
+    [ROOT, NULL, "0", "Plant", "항목", "내부 유형", "Group", "", ""],
+    [PIPE, ROOT, "1", "Pipe-100", "항목", "내부 유형", "SP3D Pipe", "", ""],
+    [PUMP, ROOT, "1", "41P-001 Pump", "SmartPlant 3D", "System Path", "TRAINING\\Area A\\U01", "", ""],
+    [PIPE, ROOT, "1", "Pipe-100", "SmartPlant 3D", "System Path", "TRAINING\\Area A\\U02", "", ""],
+    [PIPE, ROOT, "1", "Pipe-100", "SmartPlant 3D", "Name", 'Pipe "100", 2"', "", ""],
+    [PUMP, ROOT, "1", "41P-001 Pump", "치수", "Weight", "1,200", "Double", "kg"],
+    [NULL, NULL, "0", "ignored", "항목", "내부 유형", "Group", "", ""],
+    [PIPE, ROOT, "1", "Pipe-100", "치수", "Length", "3.5\nm", "Double", "m"],
+]
+
+
+def _write_csv(path: Path, rows) -> str:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+    return str(path)
+
+
+def _write_schedule(path: Path) -> str:
+    path.write_text(
+        "SyncID,TaskName,PlannedStart,PlannedEnd,Cost\n"
+        f"{PIPE},Install Pipe,2026-02-01,2026-02-05,2500\n",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+def _in_memory(csv_path: str, schedule_csv: str):
+    converter = NavisToRDFConverter()
+    stats = converter.convert_hierarchy_csv(csv_path)
+    converter.convert_schedule_csv(schedule_csv)
+    return converter.graph, stats
+
+
+class TestStreamingConversion:
+    @pytest.mark.parametrize("suffix", [".nt", ".ttl"])
+    def test_matches_in_memory_graph(self, tmp_path, suffix):
+        csv_path = _write_csv(tmp_path / "hierarchy.csv", ROWS)
+        schedule_csv = _write_schedule(tmp_path / "schedule.csv")
+        expected, expected_stats = _in_memory(csv_path, schedule_csv)
+
+        out = tmp_path / f"out{suffix}"
+        result = convert_navis_to_rdf(csv_path, schedule_csv, str(out), streaming=True)
+
+        streamed = Graph().parse(str(out), format="nt" if suffix == ".nt" else "turtle")
+        assert set(streamed) == set(expected)
+        assert result["total_triples"] == len(expected)
+        assert result["hierarchy"] == expected_stats
+        assert result["schedule"]["matched_elements"] == 1
+
+    def test_external_sort_with_small_chunks(self, tmp_path):
+        csv_path = _write_csv(tmp_path / "hierarchy.csv", ROWS)
+        assert not NavisToRDFConverter._is_grouped_by_object(csv_path)
+
+        expected = NavisToRDFConverter()
+        expected.convert_hierarchy_csv(csv_path)
+
+        converter = NavisToRDFConverter()
+        out = tmp_path / "out.nt"
+        with TripleWriter(str(out)) as writer:
+            stats = converter.convert_hierarchy_csv_streaming(csv_path, writer, chunk_rows=2)
+            writer.add_graph(converter.graph)
+
+        assert set(Graph().parse(str(out), format="nt")) == set(expected.graph)
+        assert stats["total_rows"] == len(ROWS)
+        assert stats["unique_objects"] == 3
+
+    def test_grouped_csv_is_streamed_without_sort(self, tmp_path):
+        grouped = sorted(ROWS, key=lambda r: r[0])
+        csv_path = _write_csv(tmp_path / "grouped.csv", grouped)
+        assert NavisToRDFConverter._is_grouped_by_object(csv_path)
+
+
+class TestParallelConversion:
+    @pytest.mark.parametrize("suffix", [".nt", ".ttl"])
+    def test_output_is_identical_for_any_worker_count(self, tmp_path, suffix):
+        csv_path = _write_csv(tmp_path / "hierarchy.csv", ROWS)
+        schedule_csv = _write_schedule(tmp_path / "schedule.csv")
+        expected, expected_stats = _in_memory(csv_path, schedule_csv)
+
+        outputs = {}
+        for workers in (1, 2, 3):
+            out = tmp_path / f"out_{workers}{suffix}"
+            result = convert_navis_to_rdf(csv_path, schedule_csv, str(out), workers=workers)
+            assert result["hierarchy"] == expected_stats
+            assert result["total_triples"] == len(expected)
+            outputs[workers] = out.read_bytes()
+
+        assert outputs[1] == outputs[2] == outputs[3]
+        parsed = Graph().parse(str(tmp_path / f"out_3{suffix}"),
+                               format="nt" if suffix == ".nt" else "turtle")
+        assert set(parsed) == set(expected)
@@ -95,6 +95,14 @@ class TestQueryCache:
         result = cache.get("SELECT ?s WHERE { ?s ?p ?o }")
         assert result == "result"
 
+    def test_literal_whitespace_is_preserved(self):
+        """문자열 리터럴 안의 공백과 주석 뒤 줄바꿈은 키에서 정규화되지 않는지 확인."""
+        cache = QueryCache(max_size=10, ttl=60)
+        cache.put('SELECT ?s WHERE { ?s ?p "a b" }', "a b")
+        assert cache.get('SELECT ?s WHERE { ?s ?p "a  b" }') is None
+        assert cache.get('SELECT  ?s WHERE { ?s ?p "a b" }') == "a b"
+        assert cache._key("SELECT ?s # c\nWHERE { ?s ?p ?o }") != cache._key("SELECT ?s # c WHERE { ?s ?p ?o }")
+
     def test_lru_access_reorder(self):
         """접근된 항목이 LRU 순서에서 최근으로 이동하는지 확인."""
         cache = QueryCache(max_size=3, ttl=0)
@@ -312,6 +320,49 @@ class TestStreamingConverter:
         assert converter is not None
 
 
+class TestStreamingConverterBatches:
+    """IFC 원본 없이 소형 합성 IFC로 배치 기록 동작을 검증한다."""
+
+    @pytest.mark.parametrize("suffix,fmt", [(".ttl", "turtle"), (".nt", "nt")])
+    def test_batches_are_flushed_to_file(self, small_ifc, tmp_path, suffix, fmt):
+        parser = IFCParser(str(small_ifc))
+        parser.open()
+        converter = StreamingConverter(schema="IFC4", batch_size=3)
+        output_path = str(tmp_path / f"out{suffix}")
+        converter.convert(parser, output_path)
+
+        g = Graph().parse(output_path, format=fmt)
+        stats = converter.stats
+        assert stats["batches"] > 1
+        # 배치 경계를 넘는 카테고리 클래스 선언도 중복 기록되지 않는다
+        assert stats["triples_generated"] == len(g)
+
+        assert len(list(g.subjects(RDF.type, BIM.Building))) == 1
+        assert len(list(g.subjects(RDF.type, BIM.BuildingStorey))) == 2
+        assert (BIM.Pipe, RDFS.subClassOf, BIM.PhysicalElement) in g
+        assert len(list(g.subjects(RDF.type, BIM.Pipe))) == 2
+        assert len(list(g.triples((None, BIM.isContainedIn, None)))) == 12
+        assert Literal(12.5) in set(g.objects(None, BIM.hasPropertyValue))
+
+    def test_batch_buffer_is_bounded(self, small_ifc, tmp_path, monkeypatch):
+        from src.converter import streaming_converter
+
+        peak = []
+        flush = streaming_converter.TripleBatch.flush
+
+        def tracking_flush(batch):
+            peak.append(len(batch))
+            flush(batch)
+
+        monkeypatch.setattr(streaming_converter.TripleBatch, "flush", tracking_flush)
+        parser = IFCParser(str(small_ifc))
+        parser.open()
+        converter = StreamingConverter(schema="IFC4", batch_size=2)
+        converter.convert(parser, str(tmp_path / "out.ttl"))
+
+        assert max(peak) < converter.stats["triples_generated"] / 2
+
+
 # ---------- 통합 테스트: 추론 + 캐시 ----------
 
 @requires_ifc
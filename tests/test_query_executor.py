@@ -0,0 +1,500 @@
+"""쿼리 실행기 테스트: 세대 기반 쿼리 캐시, 파일 스토어 레지스트리, 작업 풀 실행과 제한 시간.
+
+IFC 데이터 없이 소형 인메모리 그래프로 캐시 적중/무효화를 검증합니다.
+"""
+
+import asyncio
+import csv
+import io
+import json
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from rdflib import Graph, Literal, RDF
+
+from src.api.server import create_app
+from src.api.routes import reasoning as reasoning_routes
+from src.api.utils import query_executor
+from src.cache import GraphRegistry
+from src.converter.namespace_manager import BIM, INST
+from src.storage import QueryCancelled, TripleStore, snapshot
+from src.storage.rwlock import ReadWriteLock
+
+COUNT_QUERY = """
+PREFIX bim: <http://example.org/bim-ontology/schema#>
+SELECT (COUNT(?e) AS ?num) WHERE { ?e a bim:PhysicalElement }
+"""
+
+# 교차 조인으로 결과가 폭증해 제한 시간 안에 끝나지 않는 쿼리
+SLOW_QUERY = """
+SELECT ?a ?b ?c WHERE { ?a ?p ?x . ?b ?q ?y . ?c ?r ?z }
+"""
+
+
+def _small_store() -> TripleStore:
+    g = Graph()
+    for i in range(3):
+        elem = INST[f"e{i}"]
+        g.add((elem, RDF.type, BIM.PhysicalElement))
+        g.add((elem, BIM.hasGlobalId, Literal(f"GID{i}")))
+        g.add((elem, BIM.hasName, Literal(f"Elem-{i}")))
+    return TripleStore(g)
+
+
+@pytest.fixture
+def store():
+    store = _small_store()
+    query_executor.init_store(store)
+    return store
+
+
+class TestQueryCache:
+    def test_repeated_query_hits_cache(self, store):
+        before = query_executor.cache_stats()
+        first = query_executor.execute_sparql(COUNT_QUERY)
+        second = query_executor.execute_sparql(COUNT_QUERY)
+        stats = query_executor.cache_stats()
+        assert first == second == [{"num": 3}]
+        assert second is first
+        assert stats["hits"] == before["hits"] + 1
+
+    def test_mutation_invalidates_once(self, store):
+        query_executor.execute_sparql(COUNT_QUERY)
+        invalidations = query_executor.cache_stats()["invalidations"]
+
+        store.insert([(INST["e9"], RDF.type, BIM.PhysicalElement)])
+        assert query_executor.execute_sparql(COUNT_QUERY) == [{"num": 4}]
+        assert query_executor.execute_sparql(COUNT_QUERY) == [{"num": 4}]
+        assert query_executor.cache_stats()["invalidations"] == invalidations + 1
+
+        store.graph.remove((INST["e9"], None, None))
+        store.mark_modified()
+        assert query_executor.execute_sparql(COUNT_QUERY) == [{"num": 3}]
+
+    def test_literal_whitespace_is_part_of_key(self, store):
+        store.insert([(INST["a"], BIM.hasName, Literal("a b"))])
+        query = 'SELECT ?s WHERE {{ ?s <http://example.org/bim-ontology/schema#hasName> "{}" }}'
+        assert query_executor.execute_sparql(query.format("a b")) == [{"s": str(INST["a"])}]
+        assert query_executor.execute_sparql(query.format("a  b")) == []
+        # 리터럴 밖의 공백 차이는 같은 캐시 항목을 쓴다
+        before = query_executor.cache_stats()["hits"]
+        query_executor.execute_sparql(query.format("a b").replace(" ?s", "   ?s"))
+        assert query_executor.cache_stats()["hits"] == before + 1
+
+    def test_reload_store_invalidates(self, store, tmp_path):
+        query_executor.execute_sparql(COUNT_QUERY)
+        ttl = tmp_path / "other.ttl"
+        g = Graph()
+        g.add((INST["x"], RDF.type, BIM.PhysicalElement))
+        g.serialize(destination=str(ttl), format="turtle")
+
+        query_executor.reload_store(str(ttl))
+        assert query_executor.execute_sparql(COUNT_QUERY) == [{"num": 1}]
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_reload_store_follows_snapshot_setting(self, store, tmp_path, monkeypatch, enabled):
+        monkeypatch.setattr(snapshot, "USE_SNAPSHOT", enabled)
+        ttl = self._one_element_ttl(tmp_path)
+        snap = snapshot.snapshot_path_for(ttl)
+
+        assert query_executor.reload_store(str(ttl)) == 1
+        assert snap.exists() is enabled
+        # 끈 상태에서는 최신 스냅샷이 있어도 읽지 않는다
+        TripleStore().save_snapshot(str(snap))
+        assert query_executor.reload_store(str(ttl)) == (0 if enabled else 1)
+
+    def _one_element_ttl(self, tmp_path):
+        ttl = tmp_path / "other.ttl"
+        g = Graph()
+        g.add((INST["x"], RDF.type, BIM.PhysicalElement))
+        g.serialize(destination=str(ttl), format="turtle")
+        return ttl
+
+    def test_reload_serves_old_store_until_swap(self, store, tmp_path):
+        ttl = self._one_element_ttl(tmp_path)
+        seen = []
+
+        def progress(phase, **info):
+            # 새 스토어 로딩/인덱싱 중에도 기존 스토어가 쿼리를 처리한다
+            seen.append((phase, query_executor.execute_sparql(COUNT_QUERY)[0]["num"]))
+
+        query_executor.reload_store(str(ttl), progress=progress)
+        assert [p for p, _ in seen] == ["loading", "indexing", "draining", "swapped"]
+        assert [n for _, n in seen] == [3, 3, 3, 1]
+
+    def test_reload_waits_for_in_flight_reads(self, store, tmp_path):
+        ttl = self._one_element_ttl(tmp_path)
+        reading, release = threading.Event(), threading.Event()
+
+        def reader():
+            with store.reading():
+                reading.set()
+                release.wait(5)
+
+        t = threading.Thread(target=reader)
+        t.start()
+        reading.wait(5)
+        reload = threading.Thread(target=query_executor.reload_store, args=(str(ttl),))
+        reload.start()
+        reload.join(0.3)
+        assert reload.is_alive() and query_executor.get_store() is store
+        release.set()
+        reload.join(5)
+        t.join()
+        assert query_executor.get_store() is not store
+
+    def test_cancelled_reload_keeps_store(self, store, tmp_path):
+        ttl = self._one_element_ttl(tmp_path)
+
+        def cancel():
+            raise RuntimeError("cancelled")
+
+        with pytest.raises(RuntimeError):
+            query_executor.reload_store(str(ttl), before_swap=cancel)
+        assert query_executor.get_store() is store
+
+
+class TestCacheEndpoint:
+    def test_status_update_is_never_stale(self):
+        client = TestClient(create_app(store=_small_store()))
+        ready_query = """
+        PREFIX bim: <http://example.org/bim-ontology/schema#>
+        SELECT ?ready WHERE { ?e bim:hasGlobalId "GID1" ; bim:isReady ?ready }
+        """
+        assert client.post("/api/sparql", json={"query": ready_query}).json()["count"] == 0
+
+        r = client.put("/api/lean/status/GID1", json={"status_value": "Installed"})
+        assert r.status_code == 200
+
+        results = client.post("/api/sparql", json={"query": ready_query}).json()["results"]
+        assert results == [{"ready": True}]
+
+        stats = client.get("/api/cache/stats").json()
+        assert {"size", "hits", "misses", "invalidations", "generation"} <= stats.keys()
+
+
+    def test_csv_injection_commits_once(self, tmp_path):
+        store = _small_store()
+        client = TestClient(create_app(store=store))
+        task_query = """
+        PREFIX sched: <http://example.org/bim-ontology/schedule#>
+        SELECT ?t WHERE { ?t a sched:ConstructionTask }
+        """
+        assert client.post("/api/sparql", json={"query": task_query}).json()["count"] == 0
+        generation = store.generation
+
+        csv_text = "GlobalId,TaskName,PlannedStart\nGID0,Install,2026-02-01\nGID1,Install,2026-02-01\n"
+        r = client.post("/api/lean/inject/schedule",
+                        files={"file": ("schedule.csv", csv_text, "text/csv")})
+        assert r.status_code == 200
+        assert r.json()["elements_matched"] == 2
+
+        assert store.generation == generation + 1
+        assert client.post("/api/sparql", json={"query": task_query}).json()["count"] == 1
+
+
+class TestGraphRegistry:
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"g{i}.ttl"
+            _small_store().save(str(path))
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def _loader(calls):
+        def load(path):
+            calls.append(path.name)
+            store = TripleStore()
+            store.load(str(path))
+            return store
+        return load
+
+    def test_reuses_loaded_store(self, files):
+        calls = []
+        registry = GraphRegistry(self._loader(calls), budget_bytes=10**9)
+        first = registry.get(files[0])
+        assert registry.get(files[0]) is first
+        assert calls == ["g0.ttl"]
+        stats = registry.stats
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+    def test_reloads_when_file_changes(self, files):
+        calls = []
+        registry = GraphRegistry(self._loader(calls), budget_bytes=10**9)
+        first = registry.get(files[0])
+        with open(files[0], "a") as f:
+            f.write('<http://example.org/x> <http://example.org/p> "changed" .\n')
+        second = registry.get(files[0])
+        assert second is not first and len(second) == len(first) + 1
+        assert registry.stats["size"] == 1
+
+    def test_evicts_least_recently_used(self, files):
+        calls = []
+        # 스토어 하나(9 트리플)만 예산에 들어간다
+        registry = GraphRegistry(self._loader(calls), budget_bytes=15, bytes_per_triple=1)
+        registry.get(files[0])
+        registry.get(files[1])
+        registry.get(files[0])
+        assert calls == ["g0.ttl", "g1.ttl", "g0.ttl"]
+        assert registry.stats["evictions"] == 2
+
+        registry = GraphRegistry(self._loader(calls), budget_bytes=20, bytes_per_triple=1)
+        for i in (0, 1, 0, 2):
+            registry.get(files[i])
+        assert [e["file"] for e in registry.stats["entries"]] == ["g2.ttl", "g0.ttl"]
+
+    def test_concurrent_requests_share_one_load(self, files):
+        calls, release = [], threading.Event()
+        load = self._loader(calls)
+
+        def slow_load(path):
+            release.wait(5)
+            return load(path)
+
+        registry = GraphRegistry(slow_load, budget_bytes=10**9)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get(files[0])))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        while registry.stats["shared_loads"] < 3:
+            time.sleep(0.01)
+        release.set()
+        for t in threads:
+            t.join()
+        assert calls == ["g0.ttl"]
+        assert len(results) == 4 and all(r is results[0] for r in results)
+
+    def test_failed_load_is_not_cached(self, files):
+        registry = GraphRegistry(lambda path: 1 / 0, budget_bytes=10**9)
+        for _ in range(2):
+            with pytest.raises(ZeroDivisionError):
+                registry.get(files[0])
+        assert registry.stats["misses"] == 2 and registry.stats["loading"] == 0
+
+    def test_ttl_file_endpoints_use_registry(self, store, files, monkeypatch):
+        registry = GraphRegistry(reasoning_routes._load_file_store, budget_bytes=10**9)
+        monkeypatch.setattr(reasoning_routes, "_RDF_DIR", files[0].parent)
+        monkeypatch.setattr(reasoning_routes, "_file_stores", registry)
+        client = TestClient(create_app(store=store))
+        for _ in range(2):
+            resp = client.get("/api/reasoning/node-types", params={"ttl_file": "g1.ttl"})
+            assert resp.status_code == 200
+        stats = client.get("/api/reasoning/ttl-files/cache").json()
+        assert (stats["misses"], stats["hits"]) == (1, 1)
+        assert stats["entries"][0]["file"] == "g1.ttl"
+        assert client.delete("/api/reasoning/ttl-files/cache").json() == {"removed": 1}
+
+
+class TestCursorEndpoints:
+    @pytest.fixture
+    def client(self):
+        g = Graph()
+        for i in range(7):
+            elem = INST[f"e{i}"]
+            g.add((elem, RDF.type, BIM.PhysicalElement))
+            g.add((elem, BIM.hasName, Literal(f"Elem-{i}")))
+            g.add((elem, BIM.hasCategory, Literal("Pipe" if i % 2 else "Beam")))
+        return TestClient(create_app(store=TripleStore(g)))
+
+    def test_elements_cursor_headers(self, client):
+        everything = client.get("/api/elements", params={"limit": 100}).json()
+        seen, params = [], {"limit": 3}
+        while True:
+            resp = client.get("/api/elements", params=params)
+            assert resp.headers["X-Total-Count"] == "7"
+            seen.extend(resp.json())
+            if "X-Next-Cursor" not in resp.headers:
+                break
+            params = {"limit": 3, "cursor": resp.headers["X-Next-Cursor"]}
+        assert seen == everything
+
+        pipes = client.get("/api/elements", params={"category": "Pipe", "limit": 2})
+        assert pipes.headers["X-Total-Count"] == "3"
+        rest = client.get("/api/elements", params={
+            "category": "Pipe", "limit": 2, "cursor": pipes.headers["X-Next-Cursor"]})
+        assert [e["name"] for e in pipes.json() + rest.json()] == ["Elem-1", "Elem-3", "Elem-5"]
+        assert client.get("/api/elements", params={"cursor": "!!"}).status_code == 400
+
+    def test_malformed_cursors_are_rejected(self, client):
+        import base64
+
+        def token(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+        element_cursor = client.get("/api/elements", params={"limit": 1}).headers["X-Next-Cursor"]
+        bad = [token({"after": 5}), token({"after": [[1, "a"], "x"]}), token({"after": None}),
+               token({"offset": True}), token({"offset": -1}), token([1, 2]), token("after"), "é", "%%%"]
+        for cursor in bad:
+            assert client.get("/api/elements", params={"cursor": cursor}).status_code == 400, cursor
+            assert client.get("/api/reasoning/nodes", params={"cursor": cursor}).status_code == 400, cursor
+        # 다른 목록의 정렬 키 커서
+        assert client.get("/api/elements", params={"category": "Pipe", "cursor": element_cursor}).status_code == 400
+        assert client.get("/api/reasoning/nodes", params={"cursor": element_cursor}).status_code == 400
+
+    def test_nodes_cursor_matches_offset(self, client):
+        params = {"type_filter": "bim:PhysicalElement", "columns": "bim:hasName", "limit": 3}
+        first = client.get("/api/reasoning/nodes", params=params).json()
+        assert first["total"] == 7 and len(first["rows"]) == 3
+        second = client.get("/api/reasoning/nodes", params={**params, "cursor": first["next_cursor"]}).json()
+        by_offset = client.get("/api/reasoning/nodes", params={**params, "offset": 3}).json()
+        assert second["rows"] == by_offset["rows"]
+        assert [r["values"] for r in second["rows"]] == [["Elem-3"], ["Elem-4"], ["Elem-5"]]
+        last = client.get("/api/reasoning/nodes", params={**params, "cursor": second["next_cursor"]}).json()
+        assert len(last["rows"]) == 1 and last["next_cursor"] is None
+
+        found = client.get("/api/reasoning/nodes", params={**params, "search": "elem-6"}).json()
+        assert found["total"] == 1 and found["rows"][0]["values"] == ["Elem-6"]
+
+
+class TestQueryPool:
+    def test_preset_cancel_event_stops_query(self, store):
+        event = threading.Event()
+        event.set()
+        with pytest.raises(QueryCancelled):
+            store.query(COUNT_QUERY, cancel_event=event)
+
+    def test_timeout_returns_504(self, monkeypatch):
+        store = _small_store()
+        store.insert([(INST[f"x{i}"], BIM.hasName, Literal(i)) for i in range(200)])
+        client = TestClient(create_app(store=store))
+        monkeypatch.setattr(query_executor, "QUERY_TIMEOUT", 0.05)
+
+        start = time.time()
+        r = client.post("/api/sparql", json={"query": SLOW_QUERY})
+        assert r.status_code == 504
+        assert time.time() - start < 5
+
+        # 시간 초과 후에도 다른 요청은 정상 처리된다
+        monkeypatch.setattr(query_executor, "QUERY_TIMEOUT", 30)
+        r = client.post("/api/sparql", json={"query": COUNT_QUERY})
+        assert r.status_code == 200
+        assert r.json()["results"] == [{"num": 3}]
+
+
+class TestStreamingFormats:
+    QUERY = """
+    PREFIX bim: <http://example.org/bim-ontology/schema#>
+    SELECT ?e ?name ?missing WHERE {
+        ?e bim:hasName ?name . OPTIONAL { ?e bim:hasNothing ?missing }
+    } ORDER BY ?e
+    """
+
+    @pytest.fixture
+    def client(self):
+        store = _small_store()
+        store.insert([(INST["e0"], BIM.hasName, Literal('tab\tquote" ,comma', lang="ko"))])
+        return TestClient(create_app(store=store))
+
+    def _post(self, client, accept, query=None):
+        return client.post("/api/sparql", json={"query": query or self.QUERY}, headers={"Accept": accept})
+
+    def test_ndjson_matches_json_results(self, client):
+        expected = client.post("/api/sparql", json={"query": self.QUERY}).json()["results"]
+        r = self._post(client, "application/x-ndjson")
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        assert [json.loads(line) for line in r.text.splitlines()] == expected
+
+    def test_csv_tsv_and_sparql_json(self, client):
+        rows = list(csv.reader(io.StringIO(self._post(client, "text/csv").text)))
+        assert rows[0] == ["e", "name", "missing"] and len(rows) == 5
+        assert [str(INST["e0"]), 'tab\tquote" ,comma', ""] in rows
+
+        lines = self._post(client, "text/tab-separated-values").text.splitlines()
+        assert lines[0] == "?e\t?name\t?missing" and len(lines) == 5
+        assert f'<{INST["e0"]}>\t"tab\\tquote\\" ,comma"@ko\t' in lines
+
+        data = self._post(client, "application/sparql-results+json").json()
+        assert data["head"]["vars"] == ["e", "name", "missing"]
+        bindings = data["results"]["bindings"]
+        assert len(bindings) == 4 and all("missing" not in b for b in bindings)
+        assert {"type": "literal", "value": 'tab\tquote" ,comma', "xml:lang": "ko"} in [b["name"] for b in bindings]
+
+    def test_negotiation(self, client):
+        assert self._post(client, "text/csv;q=0.5, application/x-ndjson").headers["content-type"] \
+            .startswith("application/x-ndjson")
+        assert self._post(client, "application/json, text/csv;q=0.9").json()["status"] == "success"
+        assert self._post(client, "text/csv", "ASK { ?s ?p ?o }").status_code == 400
+
+    def test_timeout_before_first_row_returns_504(self, monkeypatch):
+        store = _small_store()
+        store.insert([(INST[f"x{i}"], BIM.hasName, Literal(i)) for i in range(200)])
+        client = TestClient(create_app(store=store))
+        monkeypatch.setattr(query_executor, "QUERY_TIMEOUT", 0.05)
+        start = time.time()
+        r = self._post(client, "text/csv", SLOW_QUERY + " ORDER BY ?a")
+        assert r.status_code == 504
+        assert time.time() - start < 5
+
+    def test_empty_binding_rows_are_kept(self, client):
+        query = "SELECT ?x WHERE { OPTIONAL { ?s <urn:missing> ?x } }"
+        expected = client.post("/api/sparql", json={"query": query}).json()["count"]
+        assert expected == 1
+        assert len(self._post(client, "application/x-ndjson", query).text.splitlines()) == expected
+        assert len(self._post(client, "text/csv", query).text.splitlines()) == expected + 1
+
+    def test_open_stream_does_not_hold_read_lock(self, store):
+        # TestClient는 응답 본문을 끝까지 읽으므로 느린 클라이언트는 이터레이터를 직접 다뤄 재현한다
+        store.insert([(INST[f"x{i}"], BIM.hasName, Literal(i)) for i in range(100)])
+        query = "SELECT ?a ?b WHERE { ?a ?p ?x . ?b ?q ?y }"
+
+        async def read_first_then_write():
+            body = await query_executor.stream_sparql_async(query, "application/x-ndjson")
+            chunk = await body.__anext__()
+            # 클라이언트가 더 읽지 않는 동안에도 쓰기가 진행된다
+            written = await asyncio.to_thread(store.insert, [(INST["y"], BIM.hasName, Literal("y"))])
+            await body.aclose()
+            return chunk, written
+
+        first, written = asyncio.run(read_first_then_write())
+        assert json.loads(first.splitlines()[0]) and written == 1
+
+    def test_idle_client_is_aborted(self, store, monkeypatch):
+        store.insert([(INST[f"x{i}"], BIM.hasName, Literal(i)) for i in range(100)])
+        query = "SELECT ?a ?b WHERE { ?a ?p ?x . ?b ?q ?y }"
+        monkeypatch.setattr(query_executor, "STREAM_IDLE_TIMEOUT", 0.2)
+        monkeypatch.setattr(query_executor, "STREAM_QUEUE_CHUNKS", 1)
+
+        async def stall():
+            body = await query_executor.stream_sparql_async(query, "text/csv")
+            await body.__anext__()
+            await asyncio.sleep(1)
+            with pytest.raises(QueryCancelled):
+                async for _ in body:
+                    pass
+
+        asyncio.run(stall())
+
+
+class TestReadWriteLock:
+    def test_writer_waits_for_readers(self):
+        lock = ReadWriteLock()
+        events = []
+        reading = threading.Event()
+
+        def writer():
+            reading.wait()
+            with lock.write():
+                events.append("write")
+
+        t = threading.Thread(target=writer)
+        t.start()
+        with lock.read():
+            reading.set()
+            time.sleep(0.05)
+            with lock.read():  # 재진입
+                events.append("read")
+        t.join(timeout=5)
+        assert events == ["read", "write"]
+
+    def test_read_to_write_upgrade_is_rejected(self):
+        lock = ReadWriteLock()
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                with lock.write():
+                    pass
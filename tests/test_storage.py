@@ -0,0 +1,413 @@
+"""스토리지 계층 테스트: 바이너리 스냅샷.
+
+IFC 데이터 없이 소형 그래프로 TripleStore 확장 기능을 검증합니다.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Graph, Literal, Namespace, RDF, RDFS, URIRef, XSD
+
+from src.converter.namespace_manager import BIM, INST, bind_namespaces
+from src.storage import (
+    INFERRED_GRAPH,
+    TripleStore,
+    inferred_path_for,
+    load_with_snapshot,
+    snapshot_path_for,
+)
+
+NAVIS = Namespace("http://example.org/bim-ontology/navis#")
+
+
+@pytest.fixture
+def sample_graph() -> Graph:
+    g = Graph()
+    bind_namespaces(g, "IFC4")
+    g.bind("navis", NAVIS)
+    storey = INST["storey_001"]
+    g.add((storey, RDF.type, BIM.BuildingStorey))
+    g.add((storey, BIM.hasName, Literal("Level 1")))
+    g.add((storey, BIM.hasElevation, Literal(3.5, datatype=XSD.double)))
+    for i, category in enumerate(["Pipe", "Pipe", "Beam", "Valve"]):
+        elem = INST[f"elem_{i:03d}"]
+        g.add((elem, RDF.type, BIM.PhysicalElement))
+        g.add((elem, BIM.hasCategory, Literal(category)))
+        g.add((elem, BIM.hasName, Literal(f"{category}-{i}")))
+        g.add((elem, BIM.hasGlobalId, Literal(f"GID{i:03d}")))
+        g.add((elem, NAVIS.hasObjectId, Literal(f"obj-{i}")))
+        g.add((storey, BIM.containsElement, elem))
+    g.add((INST["elem_000"], BIM.hasDescription, Literal("배관", lang="ko")))
+    g.add((INST["elem_000"], BIM.hasBoundingBox, BNode("bbox0")))
+    return g
+
+
+# ---------- 바이너리 스냅샷 ----------
+
+class TestSnapshot:
+    def test_roundtrip_preserves_triples(self, sample_graph, tmp_path):
+        snap = tmp_path / "model.ttl.snap"
+        TripleStore(sample_graph).save_snapshot(str(snap))
+
+        restored = TripleStore()
+        loaded = restored.load_snapshot(str(snap))
+        assert loaded == len(sample_graph)
+        assert set(restored.graph) == set(sample_graph)
+
+    def test_roundtrip_preserves_namespaces(self, sample_graph, tmp_path):
+        snap = tmp_path / "model.ttl.snap"
+        TripleStore(sample_graph).save_snapshot(str(snap))
+
+        restored = TripleStore()
+        restored.load_snapshot(str(snap))
+        namespaces = dict(restored.graph.namespaces())
+        assert URIRef(str(NAVIS)) == namespaces["navis"]
+
+    def test_rejects_non_snapshot(self, tmp_path):
+        bogus = tmp_path / "bogus.snap"
+        bogus.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            TripleStore().load_snapshot(str(bogus))
+
+    def test_load_with_snapshot_creates_and_reuses(self, sample_graph, tmp_path):
+        ttl = tmp_path / "model.ttl"
+        sample_graph.serialize(destination=str(ttl), format="turtle")
+        snap = snapshot_path_for(ttl)
+        assert snap.name == "model.ttl.snap"
+
+        first = TripleStore()
+        load_with_snapshot(first, ttl)
+        assert snap.exists()
+
+        second = TripleStore()
+        loaded = load_with_snapshot(second, ttl)
+        assert loaded == len(sample_graph)
+        assert set(second.graph) == set(first.graph)
+
+    def test_stale_snapshot_is_ignored(self, sample_graph, tmp_path):
+        ttl = tmp_path / "model.ttl"
+        sample_graph.serialize(destination=str(ttl), format="turtle")
+        snap = snapshot_path_for(ttl)
+        TripleStore(Graph()).save_snapshot(str(snap))
+        # 원본이 더 최신이면 스냅샷을 무시하고 재생성한다
+        os.utime(snap, (1, 1))
+
+        store = TripleStore()
+        load_with_snapshot(store, ttl)
+        assert len(store) == len(sample_graph)
+        assert snap.stat().st_mtime >= ttl.stat().st_mtime
+
+
+# ---------- 정수 ID 컴팩트 스토어 ----------
+
+class TestCompactStore:
+    PATTERNS = [
+        (None, None, None),
+        (INST["elem_000"], None, None),
+        (INST["elem_000"], BIM.hasCategory, None),
+        (INST["elem_000"], BIM.hasCategory, Literal("Pipe")),
+        (None, BIM.hasCategory, None),
+        (None, BIM.hasCategory, Literal("Pipe")),
+        (None, None, Literal("Pipe")),
+        (INST["storey_001"], None, INST["elem_002"]),
+        (INST["missing"], None, None),
+    ]
+
+    @pytest.fixture
+    def compact(self, sample_graph):
+        from src.storage.compact_store import CompactTripleStore
+        return CompactTripleStore(sample_graph)
+
+    def test_create_store_backend(self):
+        from src.storage.compact_store import CompactTripleStore
+        from src.storage import create_store
+        assert isinstance(create_store("compact"), CompactTripleStore)
+
+    def test_patterns_match_memory_store(self, compact, sample_graph):
+        compact.graph.store.compact()
+        for pattern in self.PATTERNS:
+            assert set(compact.graph.triples(pattern)) == set(sample_graph.triples(pattern)), pattern
+        assert len(compact) == len(sample_graph)
+
+    def test_sparql_query(self, compact):
+        rows = compact.query("""
+            PREFIX bim: <http://example.org/bim-ontology/schema#>
+            SELECT ?cat (COUNT(?e) AS ?n) WHERE { ?e bim:hasCategory ?cat }
+            GROUP BY ?cat ORDER BY ?cat
+        """)
+        assert [(r["cat"], r["n"]) for r in rows] == [("Beam", 1), ("Pipe", 2), ("Valve", 1)]
+
+    def test_insert_remove_across_compaction(self, compact, sample_graph):
+        store = compact.graph.store
+        store.compact()
+        elem = INST["elem_001"]
+        compact.graph.remove((elem, None, None))
+        compact.insert([(elem, BIM.hasCategory, Literal("Duct"))])
+        # 델타 상태와 병합 이후 모두 동일한 결과
+        for _ in range(2):
+            assert set(compact.graph.objects(elem, BIM.hasCategory)) == {Literal("Duct")}
+            assert len(compact) == len(sample_graph) - 5 + 1
+            store.compact()
+        # 삭제 후 재삽입 (삭제 표시 해제)
+        compact.insert([(elem, BIM.hasName, Literal("Pipe-1"))])
+        compact.insert([(elem, BIM.hasName, Literal("Pipe-1"))])
+        assert len(compact) == len(sample_graph) - 3
+
+    def test_snapshot_fast_path(self, sample_graph, tmp_path):
+        from src.storage.compact_store import CompactTripleStore
+        snap = tmp_path / "model.ttl.snap"
+        TripleStore(sample_graph).save_snapshot(str(snap))
+
+        store = CompactTripleStore()
+        assert store.load_snapshot(str(snap)) == len(sample_graph)
+        assert set(store.graph) == set(sample_graph)
+        stats = store.memory_stats()
+        assert stats["triples"] == len(sample_graph)
+        assert stats["array_bytes"] == len(sample_graph) * 3 * 3 * 4
+
+    def test_add_encoded_dedupes_into_empty_store(self):
+        import numpy as np
+        from src.storage.compact_store import CompactTripleStore
+        terms = [INST["elem_000"], BIM.hasCategory, Literal("Pipe"), Literal("Beam")]
+        ids = np.array([0, 1, 2, 0, 1, 3, 0, 1, 2], dtype=np.uint32).tobytes()
+
+        store = CompactTripleStore()
+        assert store.graph.store.add_encoded(terms, ids) == 2
+        assert len(store) == 2
+        assert set(store.graph.objects(INST["elem_000"], BIM.hasCategory)) == {Literal("Pipe"), Literal("Beam")}
+
+
+# ---------- 핫 경로 인덱스 ----------
+
+class TestGraphIndex:
+    @pytest.fixture
+    def store(self, sample_graph):
+        return TripleStore(sample_graph)
+
+    def test_category_counts_match_sparql(self, store):
+        from src.api.queries.templates import get_component_statistics
+        expected = {(r["category"], r["num"]) for r in store.query(get_component_statistics())}
+        rows = store.index.category_counts()
+        assert {(r["category"], r["num"]) for r in rows} == expected
+        assert rows[0] == {"category": "Pipe", "num": 2}
+
+    def test_overall_counts_match_sparql(self, store):
+        from src.api.queries.templates import get_overall_statistics
+        expected = store.query(get_overall_statistics())[0]
+        assert store.index.overall_counts() == expected
+
+    def test_element_rows_match_sparql_order(self, store):
+        sparql = store.query("""
+            PREFIX bim: <http://example.org/bim-ontology/schema#>
+            SELECT ?uri ?name ?category ?originalType WHERE {
+                ?uri a bim:PhysicalElement .
+                OPTIONAL { ?uri bim:hasName ?name }
+                OPTIONAL { ?uri bim:hasCategory ?category }
+                OPTIONAL { ?uri bim:hasOriginalType ?originalType }
+            } ORDER BY ?category ?name LIMIT 3 OFFSET 1
+        """)
+        rows = store.index.element_rows(limit=3, offset=1)
+        assert [(r["uri"], r["category"]) for r in rows] == \
+               [(r["uri"], r["category"]) for r in sparql]
+
+    def test_storey_and_category_lookup(self, store):
+        storeys = store.index.storey_rows()
+        assert storeys == [{
+            "uri": str(INST["storey_001"]), "name": "Level 1",
+            "globalId": None, "elevation": 3.5, "num": 4,
+        }]
+        pipes = store.index.elements_by_category("Pipe", limit=10, offset=0)
+        assert [r["name"] for r in pipes] == ["Pipe-0", "Pipe-1"]
+
+    def test_insert_updates_and_mark_modified_rebuilds(self, store):
+        index = store.index
+        store.insert([(INST["elem_new"], RDF.type, BIM.PhysicalElement),
+                      (INST["elem_new"], BIM.hasCategory, Literal("Beam"))])
+        assert store.index is index
+        assert {"category": "Beam", "num": 2} in index.category_counts()
+
+        store.graph.remove((INST["elem_new"], None, None))
+        store.mark_modified()
+        assert store.index is not index
+        assert {"category": "Beam", "num": 1} in store.index.category_counts()
+
+
+class TestCursorPagination:
+    @pytest.fixture
+    def store(self, sample_graph):
+        return TripleStore(sample_graph)
+
+    def test_element_cursor_walks_all_rows(self, store):
+        from src.storage.graph_index import element_row_key
+        expected = store.index.element_rows(limit=100)
+        pages, after = [], None
+        while True:
+            page = store.index.element_rows(limit=2, after=after)
+            if not page:
+                break
+            pages.extend(page)
+            after = element_row_key(page[-1])
+        assert pages == expected
+        assert store.index.element_count() == len(expected)
+
+    def test_category_cursor_and_invalidation(self, store):
+        from src.storage.graph_index import category_element_row_key
+        first = store.index.elements_by_category("Pipe", limit=1)
+        rest = store.index.elements_by_category("Pipe", limit=10, after=category_element_row_key(first[0]))
+        assert [r["name"] for r in first + rest] == ["Pipe-0", "Pipe-1"]
+
+        store.insert([(INST["elem_p2"], BIM.hasCategory, Literal("Pipe")),
+                      (INST["elem_p2"], BIM.hasName, Literal("Pipe-2"))])
+        assert store.index.category_element_count("Pipe") == 3
+
+    def test_subject_index_pages_and_filters(self, store):
+        index = store.subject_index
+        elements, total = index.page(BIM.PhysicalElement, limit=100)
+        assert elements == sorted(elements, key=str) and total == len(elements)
+
+        first, _ = index.page(BIM.PhysicalElement, limit=2)
+        second, _ = index.page(BIM.PhysicalElement, limit=2, after=str(first[-1]))
+        assert first + second == elements[:4]
+
+        by_name, count = index.page(BIM.PhysicalElement, search="PIPE-1", search_predicate=BIM.hasName)
+        assert (by_name, count) == ([INST["elem_001"]], 1)
+        assert store.subject_index is index
+
+        store.insert([(INST["elem_zz"], RDF.type, BIM.PhysicalElement)])
+        assert store.subject_index is not index
+        assert store.subject_index.page(BIM.PhysicalElement, limit=100)[1] == total + 1
+
+
+class TestIdentifierIndex:
+    @pytest.fixture
+    def store(self, sample_graph):
+        return TripleStore(sample_graph)
+
+    def test_resolve_prefers_global_id(self, store):
+        ids = store.identifiers
+        assert ids.resolve(global_id="GID002") == INST["elem_002"]
+        assert ids.resolve(object_id="obj-3") == INST["elem_003"]
+        assert ids.resolve(global_id="missing", object_id="obj-1") == INST["elem_001"]
+        assert ids.resolve(global_id="missing") is None
+
+    def test_kept_across_non_identifier_writes(self, store):
+        ids = store.identifiers
+        with store.writing(identifiers_changed=False) as graph:
+            graph.add((INST["elem_000"], BIM.hasDeliveryStatus, Literal("OnSite")))
+        assert store.identifiers is ids
+
+        store.insert([(INST["elem_new"], BIM.hasGlobalId, Literal("GID-NEW"))])
+        assert store.identifiers is ids
+        assert ids.resolve(global_id="GID-NEW") == INST["elem_new"]
+
+        with store.writing() as graph:
+            graph.remove((INST["elem_new"], None, None))
+        assert store.identifiers is not ids
+        assert store.identifiers.resolve(global_id="GID-NEW") is None
+
+    def test_remove_falls_back_to_other_subject(self, store):
+        ids = store.identifiers
+        store.graph.add((INST["dup"], BIM.hasGlobalId, Literal("GID000")))
+        ids.add((INST["dup"], BIM.hasGlobalId, Literal("GID000")))
+        assert ids.resolve(global_id="GID000") == INST["elem_000"]
+
+        store.graph.remove((INST["elem_000"], BIM.hasGlobalId, Literal("GID000")))
+        ids.remove((INST["elem_000"], BIM.hasGlobalId, Literal("GID000")))
+        assert ids.resolve(global_id="GID000") == INST["dup"]
+
+
+# ---------- 분리된 추론 그래프 ----------
+
+class TestInferredGraph:
+    INFERRED = (INST["elem_000"], RDF.type, BIM.MEPElement)
+
+    @pytest.fixture
+    def store(self, sample_graph):
+        store = TripleStore(sample_graph)
+        inferred = Graph(identifier=INFERRED_GRAPH)
+        inferred.add(self.INFERRED)
+        inferred.add((INST["elem_000"], RDF.type, BIM.PhysicalElement))  # 단언과 중복
+        store.swap_inferred(inferred)
+        return store
+
+    def test_queries_see_union(self, store, sample_graph):
+        assert len(store) == len(sample_graph)
+        assert self.INFERRED not in store.graph
+        assert store.ask(
+            "ASK { <%s> a <%s> }" % (INST["elem_000"], BIM.MEPElement)
+        )
+        rows = store.query(
+            "SELECT ?e WHERE { ?e a <%s> }" % BIM.PhysicalElement
+        )
+        assert len(rows) == 4  # 중복 트리플은 한 번만 보인다
+        assert len(store.union_graph()) == len(sample_graph) + 1
+
+    def test_property_path_spans_both_graphs(self):
+        ex = Namespace("http://ex/")
+        asserted = Graph()
+        asserted.add((ex.a, RDF.type, ex.A))
+        asserted.add((ex.A, RDFS.subClassOf, ex.B))
+        inferred = Graph(identifier=INFERRED_GRAPH)
+        inferred.add((ex.B, RDFS.subClassOf, ex.C))
+        store = TripleStore(asserted)
+        store.swap_inferred(inferred)
+
+        query = "SELECT ?c WHERE { <%s> a/<%s>* ?c }" % (ex.a, RDFS.subClassOf)
+        expected = {str(ex.A), str(ex.B), str(ex.C)}
+        assert {row["c"] for row in store.query(query)} == expected
+        assert {str(row.c) for row in store.union_graph().query(query)} == expected
+
+    def test_index_matches_union_queries(self, store):
+        from src.api.queries.templates import get_overall_statistics
+        assert INST["elem_000"] in store.index.by_type[BIM.MEPElement]
+        assert store.index.overall_counts() == store.query(get_overall_statistics())[0]
+        store.swap_inferred(None)
+        assert BIM.MEPElement not in store.index.by_type
+
+    def test_swap_is_atomic_and_bumps_generation(self, store):
+        generation = store.generation
+        previous = store.swap_inferred(None)
+        assert self.INFERRED in previous
+        assert store.generation > generation
+        assert store.union_graph() is store.graph
+        assert not store.ask("ASK { <%s> a <%s> }" % (INST["elem_000"], BIM.MEPElement))
+
+    def test_sidecar_roundtrip(self, store, sample_graph, tmp_path):
+        ttl = tmp_path / "model.ttl"
+        sample_graph.serialize(destination=str(ttl), format="turtle")
+        sidecar = inferred_path_for(ttl)
+        assert sidecar.name == "model.ttl.inferred"
+        store.save_inferred(str(sidecar))
+
+        restored = TripleStore()
+        load_with_snapshot(restored, ttl)
+        assert len(restored) == len(sample_graph)
+        assert self.INFERRED in restored.inferred
+        assert restored.inferred.identifier == INFERRED_GRAPH
+
+
+class TestDirtyTracking:
+    def test_tracks_subjects_and_node_objects(self, sample_graph):
+        store = TripleStore(sample_graph)
+        assert store.take_dirty() is None  # 처음에는 전체 검증이 필요하다
+        assert store.take_dirty() == set()
+
+        elem, storey = INST["elem_001"], INST["storey_001"]
+        store.apply_delta(added=[(elem, BIM.hasDeliveryStatus, Literal("OnSite"))],
+                          removed=[(storey, BIM.containsElement, INST["elem_002"])])
+        store.bulk_insert([(INST["elem_new"], BIM.hasName, Literal("New"))])
+        assert store.take_dirty() == {elem, storey, INST["elem_002"], INST["elem_new"]}
+
+    def test_untracked_writes_mark_everything(self, sample_graph):
+        store = TripleStore(sample_graph)
+        store.take_dirty()
+        with store.writing(changes_tracked=True):
+            store.apply_delta(added=[(INST["elem_000"], BIM.hasName, Literal("x"))])
+        assert store.take_dirty() == {INST["elem_000"]}
+
+        with store.writing() as graph:
+            graph.add((INST["elem_000"], BIM.hasName, Literal("y")))
+        assert store.take_dirty() is None
+        store.swap_inferred(Graph())
+        assert store.take_dirty() is None